@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-import requests
+import asyncio
 import json
 import time
 import sys
@@ -7,19 +7,49 @@ import os
 from datetime import datetime, timedelta
 import getpass
 
+from flashcard_client import DEFAULT_BASE_URL, ConnectionPool, FlashcardClient
+
 
 class FlashcardAPITester:
-    def __init__(self):
-        self.base_url = "http://localhost:3000"
-        self.access_token = None
-        self.refresh_token = None
-        self.user_data = None
+    """Interactive menu over FlashcardClient.
+
+    The tester owns one event loop and one keep-alive ConnectionPool for the
+    whole session, so every menu action reuses the same connections.
+    """
+
+    def __init__(self, pool=None):
+        self.loop = asyncio.new_event_loop()
+        self.pool = pool or ConnectionPool(DEFAULT_BASE_URL)
+        self.client = FlashcardClient(self.pool)
         self.current_deck_id = None
         self.current_card_ids = []
         self.current_session_id = None
 
+    @property
+    def base_url(self):
+        return self.pool.base_url
+
+    @property
+    def access_token(self):
+        return self.client.access_token
+
+    @property
+    def refresh_token(self):
+        return self.client.refresh_token
+
+    @property
+    def user_data(self):
+        return self.client.user
+
+    def call(self, coro):
+        return self.loop.run_until_complete(coro)
+
+    def close(self):
+        self.call(self.pool.close())
+        self.loop.close()
+
     def set_base_url(self, url):
-        self.base_url = url.rstrip("/")
+        self.pool.base_url = url.rstrip("/")
         print(f"Base URL set to: {self.base_url}")
 
     def clear_terminal(self):
@@ -31,21 +61,17 @@ class FlashcardAPITester:
         print("=" * 80)
 
     def print_response(self, response):
-        print(f"\nStatus Code: {response.status_code}")
-        try:
-            json_response = response.json()
+        print(f"\nStatus Code: {response.status}")
+        timing = f"Time: {response.elapsed * 1000:.1f} ms"
+        if response.ttfb is not None:
+            timing += f" (connect {response.connect * 1000:.1f} ms, TTFB {response.ttfb * 1000:.1f} ms)"
+        print(f"{timing}, {response.response_bytes} bytes")
+        if response.data is not None:
             print("Response:")
-            print(json.dumps(json_response, indent=2))
-            return json_response
-        except:
-            print(f"Raw Response: {response.text}")
-            return None
-
-    def get_headers(self):
-        headers = {"Content-Type": "application/json"}
-        if self.access_token:
-            headers["Authorization"] = f"Bearer {self.access_token}"
-        return headers
+            print(json.dumps(response.data, indent=2))
+            return response.data
+        print(f"Raw Response: {response.text}")
+        return None
 
     def refresh_auth_token(self):
         if not self.refresh_token:
@@ -53,26 +79,18 @@ class FlashcardAPITester:
             return False
 
         print("Refreshing access token...")
-        response = requests.post(
-            f"{self.base_url}/api/auth/refresh",
-            headers={"Content-Type": "application/json"},
-            json={"refreshToken": self.refresh_token},
-        )
+        response = self.call(self.client.refresh())
 
-        if response.status_code == 200:
-            data = response.json()
-            self.access_token = data.get("accessToken")
+        if response.status == 200:
             print("Access token refreshed successfully!")
             return True
         else:
             print("Failed to refresh access token. Please log in again.")
-            self.access_token = None
-            self.refresh_token = None
             return False
 
     def check_api_health(self):
         self.print_header("Check API Health")
-        response = requests.get(f"{self.base_url}/health")
+        response = self.call(self.client.health())
         self.print_response(response)
 
     # Flow 1: User Registration & Verification
@@ -82,14 +100,10 @@ class FlashcardAPITester:
         email = input("Enter email: ")
         password = getpass.getpass("Enter password: ")
 
-        response = requests.post(
-            f"{self.base_url}/api/auth/signup",
-            headers={"Content-Type": "application/json"},
-            json={"username": username, "email": email, "password": password},
-        )
+        response = self.call(self.client.signup(username, email, password))
 
-        result = self.print_response(response)
-        if response.status_code == 201:
+        self.print_response(response)
+        if response.status == 201:
             print(
                 "\nUser registration successful! Check your email for verification code."
             )
@@ -99,33 +113,22 @@ class FlashcardAPITester:
         self.print_header("Email Verification")
         token = input("Enter the verification token from email: ")
 
-        response = requests.post(
-            f"{self.base_url}/api/auth/verify-email",
-            headers={"Content-Type": "application/json"},
-            json={"token": token},
-        )
+        response = self.call(self.client.verify_email(token))
 
         self.print_response(response)
-        if response.status_code == 200:
+        if response.status == 200:
             print("\nEmail verification successful! You can now log in.")
 
     # Flow 2: Login & Authentication
     def login(self):
         self.print_header("Login")
-        email = input("Enter email: ")
+        username = input("Enter username: ")
         password = getpass.getpass("Enter password: ")
 
-        response = requests.post(
-            f"{self.base_url}/api/auth/login",
-            headers={"Content-Type": "application/json"},
-            json={"email": email, "password": password},
-        )
+        response = self.call(self.client.login(username, password))
 
-        result = self.print_response(response)
-        if response.status_code == 200:
-            self.access_token = result.get("accessToken")
-            self.refresh_token = result.get("refreshToken")
-            self.user_data = result.get("user")
+        self.print_response(response)
+        if response.status == 200:
             print("\nLogin successful!")
 
     def logout(self):
@@ -134,17 +137,10 @@ class FlashcardAPITester:
             print("You are not logged in.")
             return
 
-        response = requests.post(
-            f"{self.base_url}/api/auth/logout",
-            headers={"Content-Type": "application/json"},
-            json={"refreshToken": self.refresh_token},
-        )
+        response = self.call(self.client.logout())
 
         self.print_response(response)
-        if response.status_code == 200:
-            self.access_token = None
-            self.refresh_token = None
-            self.user_data = None
+        if response.status == 200:
             print("\nLogout successful!")
 
     def logout_all_devices(self):
@@ -153,15 +149,10 @@ class FlashcardAPITester:
             print("You are not logged in.")
             return
 
-        response = requests.post(
-            f"{self.base_url}/api/auth/logout-all", headers=self.get_headers()
-        )
+        response = self.call(self.client.logout_all())
 
         self.print_response(response)
-        if response.status_code == 200:
-            self.access_token = None
-            self.refresh_token = None
-            self.user_data = None
+        if response.status == 200:
             print("\nLogged out from all devices!")
 
     # Flow 3: Password Recovery
@@ -169,14 +160,10 @@ class FlashcardAPITester:
         self.print_header("Forgot Password")
         email = input("Enter your email: ")
 
-        response = requests.post(
-            f"{self.base_url}/api/auth/forgot-password",
-            headers={"Content-Type": "application/json"},
-            json={"email": email},
-        )
+        response = self.call(self.client.forgot_password(email))
 
         self.print_response(response)
-        if response.status_code == 200:
+        if response.status == 200:
             print("\nIf the email exists, a password reset link has been sent.")
             self.reset_password()
 
@@ -185,11 +172,7 @@ class FlashcardAPITester:
         token = input("Enter the password reset token from email: ")
         new_password = getpass.getpass("Enter new password: ")
 
-        response = requests.post(
-            f"{self.base_url}/api/auth/reset-password",
-            headers={"Content-Type": "application/json"},
-            json={"token": token, "newPassword": new_password},
-        )
+        response = self.call(self.client.reset_password(token, new_password))
 
         self.print_response(response)
 
@@ -200,9 +183,7 @@ class FlashcardAPITester:
             print("You must be logged in to perform this action.")
             return
 
-        response = requests.get(
-            f"{self.base_url}/api/decks", headers=self.get_headers()
-        )
+        response = self.call(self.client.list_decks())
 
         result = self.print_response(response)
         if result and isinstance(result, list) and len(result) > 0:
@@ -227,17 +208,12 @@ class FlashcardAPITester:
         description = input("Enter deck description: ")
         tags = input("Enter tags (comma-separated): ")
 
-        payload = {"name": name, "description": description}
+        tag_list = [tag.strip() for tag in tags.split(",")] if tags.strip() else None
 
-        if tags.strip():
-            payload["tags"] = [tag.strip() for tag in tags.split(",")]
-
-        response = requests.post(
-            f"{self.base_url}/api/decks", headers=self.get_headers(), json=payload
-        )
+        response = self.call(self.client.create_deck(name, description, tag_list))
 
         result = self.print_response(response)
-        if response.status_code == 201 and result:
+        if response.status == 201 and result:
             self.current_deck_id = result.get("id")
             print(f"\nDeck created successfully! Current deck set to: {name}")
 
@@ -251,10 +227,7 @@ class FlashcardAPITester:
             print("No deck selected. Please get all decks first and select one.")
             return
 
-        response = requests.get(
-            f"{self.base_url}/api/decks/{self.current_deck_id}",
-            headers=self.get_headers(),
-        )
+        response = self.call(self.client.get_deck(self.current_deck_id))
 
         self.print_response(response)
 
@@ -286,11 +259,7 @@ class FlashcardAPITester:
             print("No changes to make.")
             return
 
-        response = requests.put(
-            f"{self.base_url}/api/decks/{self.current_deck_id}",
-            headers=self.get_headers(),
-            json=payload,
-        )
+        response = self.call(self.client.update_deck(self.current_deck_id, **payload))
 
         self.print_response(response)
 
@@ -309,13 +278,10 @@ class FlashcardAPITester:
             print("Deletion cancelled.")
             return
 
-        response = requests.delete(
-            f"{self.base_url}/api/decks/{self.current_deck_id}",
-            headers=self.get_headers(),
-        )
+        response = self.call(self.client.delete_deck(self.current_deck_id))
 
         self.print_response(response)
-        if response.status_code == 200:
+        if response.status == 200:
             print("\nDeck deleted successfully!")
             self.current_deck_id = None
             self.current_card_ids = []
@@ -331,18 +297,15 @@ class FlashcardAPITester:
             print("No deck selected. Please get all decks first and select one.")
             return
 
-        response = requests.get(
-            f"{self.base_url}/api/decks/{self.current_deck_id}/cards",
-            headers=self.get_headers(),
-        )
+        response = self.call(self.client.list_cards(self.current_deck_id))
 
         result = self.print_response(response)
 
         # Extract card IDs for later use
         self.current_card_ids = []
-        if result and "content" in result and len(result["content"]) > 0:
+        if result and "cards" in result and len(result["cards"]) > 0:
             print("\nCards in this deck:")
-            for i, card in enumerate(result["content"]):
+            for i, card in enumerate(result["cards"]):
                 self.current_card_ids.append(card.get("id"))
                 print(
                     f"{i+1}. Front: {card.get('front')} | Back: {card.get('back')} (ID: {card.get('id')})"
@@ -365,21 +328,16 @@ class FlashcardAPITester:
         notes = input("Enter notes (optional): ")
         tags = input("Enter tags (comma-separated, optional): ")
 
-        payload = {"front": front, "back": back}
-
-        if notes.strip():
-            payload["notes"] = notes
-        if tags.strip():
-            payload["tags"] = [tag.strip() for tag in tags.split(",")]
+        tag_list = [tag.strip() for tag in tags.split(",")] if tags.strip() else None
 
-        response = requests.post(
-            f"{self.base_url}/api/decks/{self.current_deck_id}/cards",
-            headers=self.get_headers(),
-            json=payload,
+        response = self.call(
+            self.client.create_card(
+                self.current_deck_id, front, back, notes.strip() or None, tag_list
+            )
         )
 
         result = self.print_response(response)
-        if response.status_code == 201 and result:
+        if response.status == 201 and result:
             card_id = result.get("id")
             if card_id:
                 self.current_card_ids.append(card_id)
@@ -409,10 +367,7 @@ class FlashcardAPITester:
             return
 
         card_id = self.current_card_ids[int(choice) - 1]
-        response = requests.get(
-            f"{self.base_url}/api/decks/{self.current_deck_id}/cards/{card_id}",
-            headers=self.get_headers(),
-        )
+        response = self.call(self.client.get_card(self.current_deck_id, card_id))
 
         self.print_response(response)
 
@@ -459,10 +414,8 @@ class FlashcardAPITester:
             print("No changes to make.")
             return
 
-        response = requests.put(
-            f"{self.base_url}/api/decks/{self.current_deck_id}/cards/{card_id}",
-            headers=self.get_headers(),
-            json=payload,
+        response = self.call(
+            self.client.update_card(self.current_deck_id, card_id, **payload)
         )
 
         self.print_response(response)
@@ -498,13 +451,10 @@ class FlashcardAPITester:
             print("Deletion cancelled.")
             return
 
-        response = requests.delete(
-            f"{self.base_url}/api/decks/{self.current_deck_id}/cards/{card_id}",
-            headers=self.get_headers(),
-        )
+        response = self.call(self.client.delete_card(self.current_deck_id, card_id))
 
         self.print_response(response)
-        if response.status_code == 200:
+        if response.status == 200:
             print(f"\nCard {card_id} deleted successfully!")
             self.current_card_ids.pop(card_index)
 
@@ -523,10 +473,7 @@ class FlashcardAPITester:
         if not limit.isdigit():
             limit = "10"
 
-        response = requests.get(
-            f"{self.base_url}/api/decks/{self.current_deck_id}/review-cards?limit={limit}",
-            headers=self.get_headers(),
-        )
+        response = self.call(self.client.review_cards(self.current_deck_id, limit))
 
         result = self.print_response(response)
         return result
@@ -541,13 +488,10 @@ class FlashcardAPITester:
             print("No deck selected. Please get all decks first and select one.")
             return
 
-        response = requests.post(
-            f"{self.base_url}/api/decks/{self.current_deck_id}/study-sessions",
-            headers=self.get_headers(),
-        )
+        response = self.call(self.client.start_session(self.current_deck_id))
 
         result = self.print_response(response)
-        if response.status_code == 201 and result:
+        if response.status == 201 and result:
             self.current_session_id = result.get("sessionId")
             print(f"\nStudy session started with ID: {self.current_session_id}")
 
@@ -568,6 +512,8 @@ class FlashcardAPITester:
         review_cards = cards["cards"]
         card_count = len(review_cards)
         reviewed_count = 0
+        correct_count = 0
+        total_time_seconds = 0
 
         print(f"\nBeginning review of {card_count} cards...\n")
 
@@ -575,6 +521,7 @@ class FlashcardAPITester:
             card_id = card.get("id")
             self.print_header(f"Reviewing Card ({reviewed_count + 1}/{card_count})")
 
+            start_time = time.time()
             print(f"Question: {card.get('front')}")
             input("\nPress Enter to show answer...")
 
@@ -590,28 +537,33 @@ class FlashcardAPITester:
                     break
                 print("Please enter a number between 0 and 5.")
 
-            start_time = time.time()
-            time_spent_ms = int((time.time() - start_time) * 1000)
-
-            response = requests.post(
-                f"{self.base_url}/api/study-sessions/{self.current_session_id}/reviews",
-                headers=self.get_headers(),
-                json={
-                    "cardId": card_id,
-                    "result": int(rating),
-                    "timeSpentMs": time_spent_ms,
-                },
+            time_spent_seconds = int(time.time() - start_time)
+
+            response = self.call(
+                self.client.submit_review(
+                    self.current_session_id, card_id, int(rating), time_spent_seconds
+                )
             )
 
-            if response.status_code != 201:
+            if response.status != 201:
                 print("Failed to submit review:")
                 self.print_response(response)
 
             reviewed_count += 1
+            total_time_seconds += time_spent_seconds
+            if int(rating) > 0:
+                correct_count += 1
+
+        self.complete_study_session(
+            reviewed_count,
+            correct_count,
+            reviewed_count - correct_count,
+            total_time_seconds,
+        )
 
-        self.complete_study_session()
-
-    def complete_study_session(self):
+    def complete_study_session(
+        self, cards_reviewed=0, correct=0, incorrect=0, total_time_seconds=0
+    ):
         self.print_header("Complete Study Session")
         if not self.access_token:
             print("You must be logged in to perform this action.")
@@ -621,14 +573,18 @@ class FlashcardAPITester:
             print("No active study session. Please start a study session first.")
             return
 
-        response = requests.put(
-            f"{self.base_url}/api/study-sessions/{self.current_session_id}/complete",
-            headers=self.get_headers(),
-            json={"timeSpentMs": 900000},  # Example: 15 minutes in milliseconds
+        response = self.call(
+            self.client.complete_session(
+                self.current_session_id,
+                cards_reviewed,
+                correct,
+                incorrect,
+                total_time_seconds,
+            )
         )
 
         self.print_response(response)
-        if response.status_code == 200:
+        if response.status == 200:
             print("\nStudy session completed successfully!")
             self.current_session_id = None
 
@@ -639,29 +595,26 @@ class FlashcardAPITester:
             print("You must be logged in to perform this action.")
             return
 
-        response = requests.get(
-            f"{self.base_url}/api/study-sessions", headers=self.get_headers()
-        )
+        response = self.call(self.client.list_sessions())
 
         result = self.print_response(response)
-        if result and "content" in result and len(result["content"]) > 0:
+        if result and "sessions" in result and len(result["sessions"]) > 0:
             print("\nStudy sessions:")
-            for i, session in enumerate(result["content"]):
-                print(f"{i+1}. Deck: {session.get('deckName')}")
-                print(f"   Started: {session.get('startedAt')}")
-                print(f"   Cards studied: {session.get('cardsStudied')}")
-                print(f"   Correct: {session.get('cardsCorrect')}")
+            for i, session in enumerate(result["sessions"]):
+                print(f"{i+1}. Started: {session.get('startedAt')}")
+                print(f"   Cards studied: {session.get('cardsReviewed')}")
+                print(f"   Correct: {session.get('correctResponses')}")
                 print(
-                    f"   Time spent: {session.get('timeSpentMs')/1000/60:.1f} minutes"
+                    f"   Time spent: {(session.get('totalTimeSeconds') or 0)/60:.1f} minutes"
                 )
-                print(f"   ID: {session.get('id')}")
+                print(f"   ID: {session.get('sessionId')}")
                 print("")
 
             choice = input(
                 "Select a session number for details (or press Enter to skip): "
             )
-            if choice.isdigit() and 1 <= int(choice) <= len(result["content"]):
-                session_id = result["content"][int(choice) - 1].get("id")
+            if choice.isdigit() and 1 <= int(choice) <= len(result["sessions"]):
+                session_id = result["sessions"][int(choice) - 1].get("sessionId")
                 self.get_study_session_details(session_id)
 
     def get_study_session_details(self, session_id=None):
@@ -673,10 +626,7 @@ class FlashcardAPITester:
         if not session_id:
             session_id = input("Enter session ID: ")
 
-        response = requests.get(
-            f"{self.base_url}/api/study-sessions/{session_id}",
-            headers=self.get_headers(),
-        )
+        response = self.call(self.client.get_session(session_id))
 
         self.print_response(response)
 
@@ -690,10 +640,7 @@ class FlashcardAPITester:
         if not days.isdigit():
             days = "7"
 
-        response = requests.get(
-            f"{self.base_url}/api/stats/study-activity?days={days}",
-            headers=self.get_headers(),
-        )
+        response = self.call(self.client.study_activity(int(days)))
 
         self.print_response(response)
 
@@ -722,9 +669,7 @@ class FlashcardAPITester:
             return
 
         card_id = self.current_card_ids[int(choice) - 1]
-        response = requests.get(
-            f"{self.base_url}/api/cards/{card_id}/reviews", headers=self.get_headers()
-        )
+        response = self.call(self.client.card_reviews(card_id))
 
         self.print_response(response)
 
@@ -740,9 +685,7 @@ class FlashcardAPITester:
             print("Search term cannot be empty.")
             return
 
-        response = requests.get(
-            f"{self.base_url}/api/decks?search={query}", headers=self.get_headers()
-        )
+        response = self.call(self.client.list_decks(search=query))
 
         result = self.print_response(response)
         if result and isinstance(result, list) and len(result) > 0:
@@ -965,6 +908,11 @@ class FlashcardAPITester:
 
 
 def main():
+    if "--load" in sys.argv[1:]:
+        from load_generator import main as load_main
+
+        sys.exit(load_main(sys.argv[1:]))
+
     tester = FlashcardAPITester()
 
     # Welcome message
@@ -976,7 +924,7 @@ def main():
     )
 
     # Set base URL
-    default_url = "http://localhost:3000"
+    default_url = DEFAULT_BASE_URL
     url = input(f"Enter API base URL (default: {default_url}): ")
     if not url:
         url = default_url
@@ -1020,6 +968,8 @@ def main():
         input("\nPress Enter to continue...")
         tester.clear_terminal()
 
+    tester.close()
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,708 @@
+#!/usr/bin/env python3
+"""Asyncio client for the Flashcard API.
+
+One ConnectionPool wraps a single aiohttp session with a bounded,
+keep-alive connection pool. Any number of FlashcardClient instances (one per
+logical user, each with its own tokens) can share that pool, so a single
+process can drive hundreds of concurrent users without opening a new TCP
+connection per request.
+"""
+
+import asyncio
+import base64
+import json
+import time
+
+import aiohttp
+
+from request_trace import aiohttp_trace_config, current_trace
+
+DEFAULT_BASE_URL = "http://localhost:3000"
+
+
+class ApiResponse:
+    """Fully read HTTP response returned by every client call.
+
+    ``elapsed`` covers the whole exchange, ``ttfb`` ends when the response
+    headers arrived and ``connect`` is the part spent opening a new
+    connection (0 on a reused one); all in seconds. Byte counts are body sizes.
+    """
+
+    __slots__ = (
+        "method",
+        "route",
+        "status",
+        "headers",
+        "text",
+        "data",
+        "elapsed",
+        "ttfb",
+        "connect",
+        "request_bytes",
+        "response_bytes",
+    )
+
+    def __init__(
+        self,
+        method,
+        route,
+        status,
+        headers,
+        text,
+        data,
+        elapsed=0.0,
+        ttfb=None,
+        connect=None,
+        request_bytes=0,
+        response_bytes=0,
+    ):
+        self.method = method
+        self.route = route
+        self.status = status
+        self.headers = headers
+        self.text = text
+        self.data = data
+        self.elapsed = elapsed
+        self.ttfb = ttfb
+        self.connect = connect
+        self.request_bytes = request_bytes
+        self.response_bytes = response_bytes
+
+    @property
+    def status_code(self):
+        return self.status
+
+    @property
+    def ok(self):
+        return 200 <= self.status < 300
+
+    def json(self):
+        return self.data
+
+    def __repr__(self):
+        return f"<ApiResponse {self.method} {self.route} {self.status}>"
+
+
+class ConnectionPool:
+    """Shared aiohttp session with a bounded keep-alive connection pool.
+
+    ``listeners`` are called with every ApiResponse (status 0 for transport
+    errors), and an optional ``rate_limiter`` with an async ``acquire()`` is
+    awaited before each request is sent. When FLASHCARD_TRACE is set every
+    response is also appended to the request trace.
+    """
+
+    def __init__(
+        self,
+        base_url=DEFAULT_BASE_URL,
+        max_connections=100,
+        keepalive_timeout=30,
+        timeout=30,
+        rate_limiter=None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.max_connections = max_connections
+        self.keepalive_timeout = keepalive_timeout
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.listeners = []
+        self._session = None
+        trace = current_trace()
+        if trace is not None:
+            self.listeners.append(trace.record_response)
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def open(self):
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                limit_per_host=self.max_connections,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                json_serialize=json.dumps,
+                trace_configs=[aiohttp_trace_config()],
+            )
+        return self._session
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def request(
+        self,
+        method,
+        path,
+        route=None,
+        json_body=None,
+        params=None,
+        headers=None,
+        data=None,
+    ):
+        """Send a request and return an ApiResponse with the body already read.
+
+        ``route`` is the path template (e.g. ``/api/decks/{deckId}``) used to
+        group requests that hit the same endpoint; it defaults to ``path``.
+        ``data`` is sent as the raw body instead of ``json_body``.
+        """
+        session = await self.open()
+        route = route or path
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire()
+
+        timings = {}
+        started = time.perf_counter()
+        try:
+            async with session.request(
+                method,
+                self.base_url + path,
+                json=json_body,
+                data=data,
+                params=params,
+                headers=headers,
+                trace_request_ctx=timings,
+            ) as resp:
+                body = await resp.read()
+                text = await resp.text()
+                status = resp.status
+                response_headers = resp.headers
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            self._notify(
+                ApiResponse(
+                    method,
+                    route,
+                    0,
+                    {},
+                    "",
+                    None,
+                    time.perf_counter() - started,
+                    connect=timings.get("connect"),
+                    request_bytes=timings.get("request_bytes", 0),
+                )
+            )
+            raise
+        elapsed = time.perf_counter() - started
+
+        try:
+            data = json.loads(text) if text else None
+        except ValueError:
+            data = None
+
+        response = ApiResponse(
+            method,
+            route,
+            status,
+            response_headers,
+            text,
+            data,
+            elapsed,
+            ttfb=timings.get("ttfb"),
+            connect=timings.get("connect"),
+            request_bytes=timings.get("request_bytes", 0),
+            response_bytes=len(body),
+        )
+        self._notify(response)
+        return response
+
+    def _notify(self, response):
+        for listener in self.listeners:
+            listener(response)
+
+
+def jwt_expiry(token):
+    """Return the ``exp`` claim of a JWT as epoch seconds, or None.
+
+    The signature is not checked; this only tells the client when the server
+    will start rejecting the token.
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+    except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+class FlashcardClient:
+    """One logical API user: holds tokens and exposes every API flow.
+
+    The access token is refreshed ``refresh_margin`` seconds before its
+    ``exp`` claim, and once more on a 401. Coroutines sharing a client share
+    a single in-flight refresh call.
+    """
+
+    def __init__(self, pool, refresh_margin=60):
+        self.pool = pool
+        self.refresh_margin = refresh_margin
+        self.access_token = None
+        self.access_expires_at = None
+        self.refresh_token = None
+        self.user = None
+        self._refresh_task = None
+
+    @property
+    def is_authenticated(self):
+        return self.access_token is not None
+
+    def clear_tokens(self):
+        self.set_access_token(None)
+        self.refresh_token = None
+        self.user = None
+
+    def set_access_token(self, token):
+        self.access_token = token
+        self.access_expires_at = jwt_expiry(token) if token else None
+
+    def access_token_expiring(self):
+        return (
+            self.access_expires_at is not None
+            and time.time() >= self.access_expires_at - self.refresh_margin
+        )
+
+    def auth_headers(self):
+        if not self.access_token:
+            return None
+        return {"Authorization": f"Bearer {self.access_token}"}
+
+    def _headers(self, auth, content_type):
+        headers = dict(self.auth_headers() or {}) if auth else {}
+        if content_type:
+            headers["Content-Type"] = content_type
+        return headers or None
+
+    async def _request(
+        self,
+        method,
+        path,
+        route=None,
+        json_body=None,
+        params=None,
+        auth=True,
+        data=None,
+        content_type=None,
+    ):
+        if auth and self.refresh_token and self.access_token_expiring():
+            await self.refresh()
+
+        token = self.access_token
+        response = await self.pool.request(
+            method,
+            path,
+            route=route,
+            json_body=json_body,
+            params=params,
+            headers=self._headers(auth, content_type),
+            data=data,
+        )
+        if response.status != 401 or not auth or not token or not self.refresh_token:
+            return response
+
+        # Refresh unless another coroutine already replaced the rejected token
+        if self.access_token == token:
+            refreshed = await self.refresh()
+            if not refreshed.ok:
+                return response
+        return await self.pool.request(
+            method,
+            path,
+            route=route,
+            json_body=json_body,
+            params=params,
+            headers=self._headers(True, content_type),
+            data=data,
+        )
+
+    async def health(self):
+        return await self._request("GET", "/health", auth=False)
+
+    # Authentication
+
+    async def signup(self, username, email, password, roles=None):
+        payload = {"username": username, "email": email, "password": password}
+        if roles:
+            payload["role"] = list(roles)
+        return await self._request(
+            "POST", "/api/auth/signup", json_body=payload, auth=False
+        )
+
+    async def verify_email(self, token):
+        return await self._request(
+            "POST", "/api/auth/verify-email", json_body={"token": token}, auth=False
+        )
+
+    async def resend_verification(self, email):
+        return await self._request(
+            "POST",
+            "/api/auth/resend-verification",
+            json_body={"email": email},
+            auth=False,
+        )
+
+    async def login(self, username, password):
+        response = await self._request(
+            "POST",
+            "/api/auth/login",
+            json_body={"username": username, "password": password},
+            auth=False,
+        )
+        if response.status == 200 and response.data:
+            self.set_access_token(response.data.get("accessToken"))
+            self.refresh_token = response.data.get("refreshToken")
+            self.user = response.data.get("user")
+        return response
+
+    async def refresh(self):
+        """Refresh the access token, joining a refresh already in flight."""
+        task = self._refresh_task
+        if task is None:
+            task = self._refresh_task = asyncio.ensure_future(self._refresh())
+            task.add_done_callback(self._refresh_done)
+        # Shield so one cancelled caller does not cancel the shared refresh
+        return await asyncio.shield(task)
+
+    def _refresh_done(self, task):
+        if self._refresh_task is task:
+            self._refresh_task = None
+
+    async def _refresh(self):
+        response = await self._request(
+            "POST",
+            "/api/auth/refresh",
+            json_body={"refreshToken": self.refresh_token},
+            auth=False,
+        )
+        if response.status == 200 and response.data:
+            self.set_access_token(response.data.get("accessToken"))
+            if response.data.get("refreshToken"):
+                self.refresh_token = response.data["refreshToken"]
+        else:
+            self.clear_tokens()
+        return response
+
+    async def logout(self):
+        response = await self._request(
+            "POST",
+            "/api/auth/logout",
+            json_body={"refreshToken": self.refresh_token},
+            auth=False,
+        )
+        if response.status == 200:
+            self.clear_tokens()
+        return response
+
+    async def logout_all(self):
+        response = await self._request("POST", "/api/auth/logout-all")
+        if response.status == 200:
+            self.clear_tokens()
+        return response
+
+    async def forgot_password(self, email):
+        return await self._request(
+            "POST",
+            "/api/auth/forgot-password",
+            json_body={"email": email},
+            auth=False,
+        )
+
+    async def reset_password(self, token, new_password):
+        return await self._request(
+            "POST",
+            "/api/auth/reset-password",
+            json_body={"token": token, "newPassword": new_password},
+            auth=False,
+        )
+
+    # Decks
+
+    async def list_decks(self, search=None, limit=None, offset=None):
+        """All decks, or with ``search`` a page of matching decks.
+
+        A search page that is not the last carries the next ``offset`` in the
+        ``X-Next-Offset`` response header.
+        """
+        params = {"search": search} if search else {}
+        if search and limit is not None:
+            params["limit"] = limit
+        if search and offset is not None:
+            params["offset"] = offset
+        return await self._request("GET", "/api/decks", params=params or None)
+
+    async def get_deck(self, deck_id):
+        return await self._request(
+            "GET", f"/api/decks/{deck_id}", route="/api/decks/{deckId}"
+        )
+
+    async def create_deck(self, name, description=None, tags=None):
+        payload = {"name": name, "description": description}
+        if tags:
+            payload["tags"] = list(tags)
+        return await self._request("POST", "/api/decks", json_body=payload)
+
+    async def update_deck(self, deck_id, **fields):
+        return await self._request(
+            "PUT",
+            f"/api/decks/{deck_id}",
+            route="/api/decks/{deckId}",
+            json_body=fields,
+        )
+
+    async def delete_deck(self, deck_id):
+        return await self._request(
+            "DELETE", f"/api/decks/{deck_id}", route="/api/decks/{deckId}"
+        )
+
+    # Cards
+
+    async def list_cards(
+        self,
+        deck_id,
+        page=0,
+        size=10,
+        sort=None,
+        after=None,
+        limit=None,
+        include_total=False,
+    ):
+        """Page/size listing, or cursor paging when ``limit`` or ``after`` is
+        given; pass ``nextCursor`` back as ``after``."""
+        params = _listing_params(page, size, sort, after, limit, include_total)
+        return await self._request(
+            "GET",
+            f"/api/decks/{deck_id}/cards",
+            route="/api/decks/{deckId}/cards",
+            params=params,
+        )
+
+    async def list_cards_simple(self, deck_id, page=0, size=10):
+        return await self._request(
+            "GET",
+            f"/api/decks/{deck_id}/cards/simple",
+            route="/api/decks/{deckId}/cards/simple",
+            params={"page": page, "size": size},
+        )
+
+    async def get_card(self, deck_id, card_id):
+        return await self._request(
+            "GET",
+            f"/api/decks/{deck_id}/cards/{card_id}",
+            route="/api/decks/{deckId}/cards/{id}",
+        )
+
+    async def get_card_simple(self, deck_id, card_id):
+        return await self._request(
+            "GET",
+            f"/api/decks/{deck_id}/cards/{card_id}/simple",
+            route="/api/decks/{deckId}/cards/{id}/simple",
+        )
+
+    async def create_card(self, deck_id, front, back, notes=None, tags=None):
+        return await self._request(
+            "POST",
+            f"/api/decks/{deck_id}/cards",
+            route="/api/decks/{deckId}/cards",
+            json_body=_card_payload(front, back, notes, tags),
+        )
+
+    async def create_card_simple(self, deck_id, front, back, notes=None, tags=None):
+        return await self._request(
+            "POST",
+            f"/api/decks/{deck_id}/cards/simple",
+            route="/api/decks/{deckId}/cards/simple",
+            json_body=_card_payload(front, back, notes, tags),
+        )
+
+    async def create_cards_batch(self, deck_id, cards):
+        """Create many cards at once; ``cards`` holds dicts with front/back/notes.
+
+        The response carries only the new ids, in request order.
+        """
+        return await self._request(
+            "POST",
+            f"/api/decks/{deck_id}/cards/batch",
+            route="/api/decks/{deckId}/cards/batch",
+            json_body={"cards": list(cards)},
+        )
+
+    async def import_cards_csv(self, deck_id, csv_text):
+        """Import cards from CSV text with a front,back[,notes] header.
+
+        Sent as a ``text/csv`` body, which the server streams, so it is not
+        subject to the multipart upload limit.
+        """
+        return await self._request(
+            "POST",
+            f"/api/decks/{deck_id}/import",
+            route="/api/decks/{deckId}/import",
+            data=csv_text.encode("utf-8"),
+            content_type="text/csv; charset=UTF-8",
+        )
+
+    async def export_cards_csv(self, deck_id):
+        """The deck's cards as CSV; the text is in ``response.text``."""
+        return await self._request(
+            "GET",
+            f"/api/decks/{deck_id}/export",
+            route="/api/decks/{deckId}/export",
+        )
+
+    async def update_card(self, deck_id, card_id, **fields):
+        return await self._request(
+            "PUT",
+            f"/api/decks/{deck_id}/cards/{card_id}",
+            route="/api/decks/{deckId}/cards/{id}",
+            json_body=fields,
+        )
+
+    async def delete_card(self, deck_id, card_id):
+        return await self._request(
+            "DELETE",
+            f"/api/decks/{deck_id}/cards/{card_id}",
+            route="/api/decks/{deckId}/cards/{id}",
+        )
+
+    async def review_cards(self, deck_id, limit=10):
+        return await self._request(
+            "GET",
+            f"/api/decks/{deck_id}/review-cards",
+            route="/api/decks/{deckId}/review-cards",
+            params={"limit": limit},
+        )
+
+    async def review_queue(self, limit=20, cursor=None, include_total=False):
+        """Due cards across all decks; pass ``nextCursor`` back as ``cursor``."""
+        params = {"limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        if include_total:
+            params["includeTotal"] = "true"
+        return await self._request(
+            "GET", "/api/review-queue", route="/api/review-queue", params=params
+        )
+
+    async def search_cards(self, query, limit=20, offset=0):
+        """Ranked full-text search; pass ``nextOffset`` back as ``offset``."""
+        return await self._request(
+            "GET",
+            "/api/cards/search",
+            route="/api/cards/search",
+            params={"q": query, "limit": limit, "offset": offset},
+        )
+
+    # Study sessions and reviews
+
+    async def start_session(self, deck_id):
+        return await self._request(
+            "POST",
+            f"/api/decks/{deck_id}/study-sessions",
+            route="/api/decks/{deckId}/study-sessions",
+        )
+
+    async def submit_review(self, session_id, card_id, result, time_spent_seconds=0):
+        return await self._request(
+            "POST",
+            f"/api/study-sessions/{session_id}/reviews",
+            route="/api/study-sessions/{sessionId}/reviews",
+            json_body={
+                "card": {"id": card_id},
+                "result": result,
+                "timeSpentSeconds": time_spent_seconds,
+            },
+        )
+
+    async def submit_reviews_batch(self, session_id, reviews):
+        """Submit many reviews of one session in a single transaction.
+
+        ``reviews`` holds dicts with cardId, result, timeSpentSeconds and an
+        optional ISO ``reviewedAt``; the server applies them oldest first.
+        """
+        return await self._request(
+            "POST",
+            f"/api/study-sessions/{session_id}/reviews/batch",
+            route="/api/study-sessions/{sessionId}/reviews/batch",
+            json_body={"reviews": list(reviews)},
+        )
+
+    async def complete_session(
+        self,
+        session_id,
+        cards_reviewed=0,
+        correct_responses=0,
+        incorrect_responses=0,
+        total_time_seconds=0,
+    ):
+        return await self._request(
+            "PUT",
+            f"/api/study-sessions/{session_id}/complete",
+            route="/api/study-sessions/{sessionId}/complete",
+            json_body={
+                "cardsReviewed": cards_reviewed,
+                "correctResponses": correct_responses,
+                "incorrectResponses": incorrect_responses,
+                "totalTimeSeconds": total_time_seconds,
+            },
+        )
+
+    async def list_sessions(
+        self, page=0, size=10, sort=None, after=None, limit=None, include_total=False
+    ):
+        """Same paging modes as :meth:`list_cards`."""
+        params = _listing_params(page, size, sort, after, limit, include_total)
+        return await self._request("GET", "/api/study-sessions", params=params)
+
+    async def get_session(self, session_id):
+        return await self._request(
+            "GET",
+            f"/api/study-sessions/{session_id}",
+            route="/api/study-sessions/{sessionId}",
+        )
+
+    async def card_reviews(self, card_id, limit=20, cursor=None):
+        """Newest reviews first; pass ``nextCursor`` back as ``cursor``."""
+        params = {"limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        return await self._request(
+            "GET",
+            f"/api/cards/{card_id}/reviews",
+            route="/api/cards/{cardId}/reviews",
+            params=params,
+        )
+
+    # Statistics
+
+    async def study_activity(self, days=7):
+        return await self._request(
+            "GET", "/api/stats/study-activity", params={"days": days}
+        )
+
+
+def _card_payload(front, back, notes=None, tags=None):
+    payload = {"front": front, "back": back}
+    if notes:
+        payload["notes"] = notes
+    if tags:
+        payload["tags"] = list(tags)
+    return payload
+
+
+def _listing_params(page, size, sort, after, limit, include_total):
+    if after is None and limit is None:
+        params = {"page": page, "size": size}
+    else:
+        params = {"limit": limit or size}
+        if after:
+            params["after"] = after
+        if include_total:
+            params["includeTotal"] = "true"
+    if sort:
+        params["sort"] = sort
+    return params
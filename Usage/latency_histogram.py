@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Fixed-memory latency histogram with logarithmic buckets.
+
+Values are counted in buckets whose width grows geometrically, so every
+recorded latency is reported within ``precision`` (1% by default) of its true
+value whatever its magnitude. Recording is O(1), memory is one array of
+counters sized by the configured range (about 1,100 buckets for 1 µs to one
+hour at 1%), and histograms with the same configuration merge by adding
+their counters. ``encode()`` packs the non-empty buckets into a short string
+that can travel through JSON or between processes.
+"""
+
+import base64
+import math
+import struct
+import zlib
+from array import array
+
+DEFAULT_LOWEST = 1e-6
+DEFAULT_HIGHEST = 3600.0
+DEFAULT_PRECISION = 0.01
+
+_HEADER = struct.Struct("<dddQddd")
+
+
+class LatencyHistogram:
+    """Counts latencies in seconds between ``lowest`` and ``highest``.
+
+    Values outside the range land in the first or last bucket; the exact
+    minimum, maximum and sum are tracked separately.
+    """
+
+    __slots__ = (
+        "lowest",
+        "highest",
+        "precision",
+        "count",
+        "total",
+        "min",
+        "max",
+        "_log_base",
+        "_counts",
+    )
+
+    def __init__(
+        self,
+        lowest=DEFAULT_LOWEST,
+        highest=DEFAULT_HIGHEST,
+        precision=DEFAULT_PRECISION,
+    ):
+        if not 0 < lowest < highest or not 0 < precision < 1:
+            raise ValueError("need 0 < lowest < highest and 0 < precision < 1")
+        self.lowest = lowest
+        self.highest = highest
+        self.precision = precision
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        # Bucket i covers [lowest * base**i, lowest * base**(i + 1)); its
+        # geometric midpoint is within ``precision`` of both edges
+        self._log_base = math.log((1 + precision) / (1 - precision))
+        size = int(math.log(highest / lowest) / self._log_base) + 2
+        self._counts = array("Q", bytes(8 * size))
+
+    def _index(self, value):
+        if value <= self.lowest:
+            return 0
+        index = int(math.log(value / self.lowest) / self._log_base)
+        return min(index, len(self._counts) - 1)
+
+    def _value(self, index):
+        return self.lowest * math.exp((index + 0.5) * self._log_base)
+
+    def record(self, value, count=1):
+        self._counts[self._index(value)] += count
+        self.count += count
+        self.total += value * count
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, pct):
+        """Nearest-rank percentile, accurate to ``precision``."""
+        if not self.count:
+            return 0.0
+        rank = max(1, int(math.ceil(pct / 100.0 * self.count)))
+        seen = 0
+        for index, bucket in enumerate(self._counts):
+            seen += bucket
+            if seen >= rank:
+                return min(self.max, max(self.min, self._value(index)))
+        return self.max
+
+    def same_layout(self, other):
+        return (self.lowest, self.highest, self.precision) == (
+            other.lowest,
+            other.highest,
+            other.precision,
+        )
+
+    def merge(self, other):
+        """Add ``other``'s counts to this histogram and return self."""
+        if not self.same_layout(other):
+            raise ValueError("cannot merge histograms with different bucket layouts")
+        counts = self._counts
+        for index, bucket in enumerate(other._counts):
+            if bucket:
+                counts[index] += bucket
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def encode(self):
+        """Serialize to a compact ASCII string.
+
+        The layout and summary fields are followed by (index gap, count)
+        varint pairs for the non-empty buckets, deflated and base64 encoded.
+        """
+        out = bytearray(
+            _HEADER.pack(
+                self.lowest,
+                self.highest,
+                self.precision,
+                self.count,
+                self.total,
+                self.min if self.count else 0.0,
+                self.max,
+            )
+        )
+        previous = -1
+        for index, bucket in enumerate(self._counts):
+            if bucket:
+                _write_varint(out, index - previous)
+                _write_varint(out, bucket)
+                previous = index
+        return base64.b64encode(zlib.compress(bytes(out))).decode("ascii")
+
+    @classmethod
+    def decode(cls, encoded):
+        data = zlib.decompress(base64.b64decode(encoded))
+        lowest, highest, precision, count, total, minimum, maximum = (
+            _HEADER.unpack_from(data)
+        )
+        histogram = cls(lowest, highest, precision)
+        histogram.count = count
+        histogram.total = total
+        histogram.min = minimum if count else math.inf
+        histogram.max = maximum
+        position = _HEADER.size
+        index = -1
+        while position < len(data):
+            gap, position = _read_varint(data, position)
+            bucket, position = _read_varint(data, position)
+            index += gap
+            histogram._counts[index] = bucket
+        return histogram
+
+    def __reduce__(self):
+        return (self.decode, (self.encode(),))
+
+    def __repr__(self):
+        return (
+            f"<LatencyHistogram count={self.count} "
+            f"p50={self.percentile(50):.6f} max={self.max:.6f}>"
+        )
+
+
+def _write_varint(out, value):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data, position):
+    value = 0
+    shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
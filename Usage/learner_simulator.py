@@ -0,0 +1,531 @@
+#!/usr/bin/env python3
+"""Non-interactive learner simulator.
+
+Models learners who forget along an exponential forgetting curve and drives
+complete study sessions with them. Two modes:
+
+``live``
+    Thousands of concurrent learners on one keep-alive ConnectionPool. Each
+    learner logs in, creates a deck, then repeatedly starts a session, pulls
+    /review-cards, answers every card after a realistic think time, submits
+    the reviews and completes the session. Reports the latency of the review
+    write path and the difficulty/interval mix the server handed back.
+
+``project``
+    Offline projection, no server needed. Simulates the same learners for N
+    days with the server's difficulty and interval rules (review_schedule)
+    and prints the resulting daily review workload.
+
+    python learner_simulator.py live --learners 2000 --speed 20 --smtp-sink 2525
+    python learner_simulator.py project --learners 1000 --days 180
+"""
+
+import argparse
+import asyncio
+import heapq
+import json
+import math
+import random
+import sys
+import time
+from collections import Counter
+
+from flashcard_client import DEFAULT_BASE_URL, ConnectionPool
+from load_generator import (
+    EndpointStats,
+    VirtualUser,
+    load_accounts,
+    provision_account,
+)
+from mail_tokens import MailHogTokenSource
+from review_schedule import next_difficulty, review_interval
+from smtp_sink import SmtpTokenSink, parse_listen_address
+
+WRITE_PATH = {
+    ("POST", "/api/decks/{deckId}/study-sessions"),
+    ("POST", "/api/study-sessions/{sessionId}/reviews"),
+    ("POST", "/api/study-sessions/{sessionId}/reviews/batch"),
+    ("PUT", "/api/study-sessions/{sessionId}/complete"),
+}
+
+# Memory stability (days until recall drops to 1/e) after the first exposure
+INITIAL_STABILITY = 0.5
+MIN_STABILITY = 0.1
+# Chance of recalling a card that has never been seen
+FIRST_RECALL = 0.5
+# Median seconds to answer a card that is recalled with certainty
+MEDIAN_THINK_SECONDS = 6.0
+MAX_THINK_SECONDS = 120
+
+
+class LearnerModel:
+    """Per-card memory with an exponential forgetting curve.
+
+    Recall probability after ``elapsed`` days is ``exp(-elapsed / stability)``.
+    A recalled card is rated higher the more certain the recall was and its
+    stability grows with the rating and the learner's ability; a forgotten
+    card is rated 0 and loses most of its stability.
+    """
+
+    def __init__(self, rng, ability=None):
+        self.rng = rng
+        self.ability = ability if ability is not None else rng.uniform(0.5, 1.5)
+        # card id -> [stability in days, day last reviewed]
+        self.memory = {}
+
+    def recall_probability(self, card_id, now):
+        state = self.memory.get(card_id)
+        if state is None:
+            return FIRST_RECALL
+        stability, last_seen = state
+        return math.exp(-max(0.0, now - last_seen) / stability)
+
+    def answer(self, card_id, now):
+        """Review ``card_id`` at day ``now``; return (rating, think seconds)."""
+        p = self.recall_probability(card_id, now)
+        if self.rng.random() < p:
+            rating = min(5, max(1, int(round(self.rng.gauss(1 + 4 * p, 0.7)))))
+        else:
+            rating = 0
+
+        stability = self.memory.get(card_id, [INITIAL_STABILITY])[0]
+        if rating == 0:
+            stability = max(MIN_STABILITY, stability * 0.4)
+        else:
+            stability *= 1 + self.ability * rating / 2.5
+        self.memory[card_id] = [stability, now]
+
+        # Uncertain recall takes longer
+        think = self.rng.lognormvariate(
+            math.log(MEDIAN_THINK_SECONDS) + (1 - p) * 0.8, 0.5
+        )
+        return rating, min(think, MAX_THINK_SECONDS)
+
+
+class LiveContext:
+    def __init__(self, args):
+        self.args = args
+        self.started = time.monotonic()
+        self.sessions = 0
+        self.reviews = 0
+        self.failed_learners = 0
+        self.ratings = Counter()
+        self.difficulties = Counter()
+
+    def now(self):
+        """Simulated days since the run started."""
+        return (time.monotonic() - self.started) * self.args.speed / 86400
+
+
+class Learner(VirtualUser):
+    def __init__(self, index, pool, account, rng):
+        super().__init__(index, pool, account, rng)
+        self.model = LearnerModel(rng)
+
+    async def setup(self, ctx):
+        if not await self.login():
+            return False
+        response = await self.client.create_deck(
+            f"Learner deck {self.index}", "Created by the learner simulator"
+        )
+        if response.status != 201 or not response.data:
+            return False
+        self.deck_id = response.data.get("id")
+        await self.add_cards(ctx.args.initial_cards)
+        return True
+
+    async def study_session(self, ctx):
+        batch = ctx.args.review_batch
+        due = await self.client.review_cards(self.deck_id, limit=batch)
+        cards = (due.data or {}).get("cards") or []
+        if not cards:
+            # Nothing is due yet; learn new material instead
+            await self.add_cards(ctx.args.new_cards)
+            due = await self.client.review_cards(self.deck_id, limit=batch)
+            cards = (due.data or {}).get("cards") or []
+            if not cards:
+                return
+
+        session = await self.client.start_session(self.deck_id)
+        if session.status != 201 or not session.data:
+            return
+        session_id = session.data.get("sessionId")
+
+        correct = 0
+        total_seconds = 0
+        answered = []
+        for card in cards:
+            rating, think = self.model.answer(card.get("id"), ctx.now())
+            await asyncio.sleep(think / ctx.args.speed)
+            if ctx.args.batch_reviews:
+                # Study offline and upload the whole session at the end
+                answered.append(
+                    {
+                        "cardId": card.get("id"),
+                        "result": rating,
+                        "timeSpentSeconds": int(think),
+                    }
+                )
+            else:
+                response = await self.client.submit_review(
+                    session_id, card.get("id"), rating, int(think)
+                )
+                if response.status == 201 and response.data:
+                    ctx.reviews += 1
+                    ctx.ratings[rating] += 1
+                    ctx.difficulties[response.data.get("newDifficulty")] += 1
+            correct += 1 if rating > 0 else 0
+            total_seconds += int(think)
+
+        if answered:
+            response = await self.client.submit_reviews_batch(session_id, answered)
+            if response.status == 201 and response.data:
+                for review in response.data.get("reviews") or []:
+                    ctx.reviews += 1
+                    ctx.ratings[review.get("result")] += 1
+                    ctx.difficulties[review.get("newDifficulty")] += 1
+
+        response = await self.client.complete_session(
+            session_id, len(cards), correct, len(cards) - correct, total_seconds
+        )
+        if response.ok:
+            ctx.sessions += 1
+
+
+async def run_learner(learner, ctx, start_delay, stop_at):
+    await asyncio.sleep(start_delay)
+    try:
+        if not await learner.setup(ctx):
+            ctx.failed_learners += 1
+            return
+        while time.monotonic() < stop_at:
+            await learner.study_session(ctx)
+            gap = learner.rng.expovariate(1.0 / ctx.args.session_gap)
+            await asyncio.sleep(
+                min(gap / ctx.args.speed, max(0, stop_at - time.monotonic()))
+            )
+    except Exception as e:
+        ctx.failed_learners += 1
+        print(f"Learner {learner.index} stopped: {e!r}")
+
+
+async def run_live(args):
+    rng = random.Random(args.seed)
+    stats = EndpointStats()
+    if args.smtp_sink:
+        token_source = await SmtpTokenSink(
+            *parse_listen_address(args.smtp_sink)
+        ).start()
+    else:
+        token_source = MailHogTokenSource(args.mailhog_url)
+
+    async with ConnectionPool(
+        args.base_url, max_connections=args.max_connections
+    ) as pool:
+        if args.accounts:
+            accounts = load_accounts(args.accounts)[: args.learners]
+        else:
+            print(f"Provisioning {args.learners} verified learners...")
+            semaphore = asyncio.Semaphore(args.provision_concurrency)
+
+            async def provision():
+                async with semaphore:
+                    return await provision_account(
+                        pool, token_source, rng, prefix="learner"
+                    )
+
+            accounts = [
+                a
+                for a in await asyncio.gather(
+                    *(provision() for _ in range(args.learners))
+                )
+                if a
+            ]
+        if not accounts:
+            print("No usable accounts; aborting simulation.")
+            await token_source.close()
+            return 1
+
+        pool.listeners.append(stats.record)
+        ctx = LiveContext(args)
+        stop_at = ctx.started + args.ramp_up + args.duration
+        learners = [
+            Learner(i, pool, account, random.Random(rng.random()))
+            for i, account in enumerate(accounts)
+        ]
+        print(
+            f"Simulating {len(learners)} learners for {args.duration}s "
+            f"at {args.speed:g}x speed..."
+        )
+        await asyncio.gather(
+            *(
+                run_learner(learner, ctx, args.ramp_up * i / len(learners), stop_at)
+                for i, learner in enumerate(learners)
+            )
+        )
+        elapsed = time.monotonic() - ctx.started
+
+    await token_source.close()
+    rows = stats.rows(elapsed)
+    print_live_report(ctx, rows, elapsed)
+    if args.report_json:
+        with open(args.report_json, "w") as f:
+            json.dump(
+                {
+                    "elapsedSeconds": elapsed,
+                    "learners": len(learners),
+                    "failedLearners": ctx.failed_learners,
+                    "sessions": ctx.sessions,
+                    "reviews": ctx.reviews,
+                    "ratings": {str(k): v for k, v in sorted(ctx.ratings.items())},
+                    "difficulties": {
+                        str(k): v for k, v in sorted(ctx.difficulties.items())
+                    },
+                    "endpoints": rows,
+                    "histograms": stats.to_json(),
+                },
+                f,
+                indent=2,
+            )
+    return 0
+
+
+def print_live_report(ctx, rows, elapsed):
+    print(f"\nSimulation finished in {elapsed:.1f}s")
+    if ctx.failed_learners:
+        print(f"{ctx.failed_learners} learners failed")
+    print(
+        f"Sessions completed: {ctx.sessions}  Reviews written: {ctx.reviews} "
+        f"({ctx.reviews / elapsed if elapsed else 0:.1f}/s)"
+    )
+    print_distribution("Ratings", ctx.ratings)
+    print_distribution("New difficulty", ctx.difficulties, interval=True)
+
+    header = (
+        f"{'Review write path':<52}{'Count':>8}{'Err':>6}{'Req/s':>9}"
+        f"{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}"
+    )
+    print("\n" + header)
+    print("-" * len(header))
+    for row in rows:
+        method, route = row["endpoint"].split(" ", 1)
+        if (method, route) not in WRITE_PATH:
+            continue
+        print(
+            f"{row['endpoint']:<52}{row['count']:>8}{row['errors']:>6}"
+            f"{row['throughput']:>9.1f}{row['p50_ms']:>9.1f}{row['p95_ms']:>9.1f}"
+            f"{row['p99_ms']:>9.1f}{row['max_ms']:>9.1f}"
+        )
+    print("(latencies in ms)")
+
+
+def print_distribution(title, counts, interval=False):
+    total = sum(counts.values())
+    if not total:
+        return
+    print(f"\n{title}:")
+    for key in sorted(counts, key=lambda k: (k is None, k)):
+        label = f"{key}"
+        if interval and key is not None:
+            label += f" ({format_interval(review_interval(key))})"
+        share = counts[key] / total
+        print(f"  {label:<16}{counts[key]:>9}  {share:6.1%}  {'#' * int(share * 40)}")
+
+
+def format_interval(seconds):
+    if seconds < 86400:
+        return f"{seconds // 3600}h"
+    return f"{seconds // 86400}d"
+
+
+# Offline projection
+
+
+def project(args):
+    """Simulate ``args.days`` days of study.
+
+    Returns one stats dict per day and the final card count per difficulty.
+
+    Every active learner studies ``sessions_per_day`` times a day at evenly
+    spaced hours, reviews whatever the server would return as due (up to
+    ``max_reviews``) and learns ``new_per_day`` new cards a day until the deck
+    holds ``deck_size`` cards.
+    """
+    rng = random.Random(args.seed)
+    learners = []
+    for _ in range(args.learners):
+        model = LearnerModel(random.Random(rng.random()))
+        # Card difficulties by id, and a heap of (due day, card id)
+        learners.append((model, {}, []))
+
+    days = []
+    for day in range(args.days):
+        stats = {"day": day, "reviews": 0, "new": 0, "failed": 0, "learners": 0}
+        for model, difficulties, queue in learners:
+            if model.rng.random() >= args.activity:
+                continue
+            stats["learners"] += 1
+            for session in range(args.sessions_per_day):
+                now = day + (session + 0.5) / args.sessions_per_day
+                if session == 0:
+                    learn = min(args.new_per_day, args.deck_size - len(difficulties))
+                    for _ in range(learn):
+                        card_id = len(difficulties)
+                        difficulties[card_id] = 0
+                        heapq.heappush(queue, (now, card_id))
+                    stats["new"] += learn
+
+                # The server returns due cards oldest first
+                due = []
+                while queue and queue[0][0] <= now:
+                    if args.max_reviews and len(due) == args.max_reviews:
+                        break
+                    due.append(heapq.heappop(queue)[1])
+                for card_id in due:
+                    rating, _ = model.answer(card_id, now)
+                    difficulty = next_difficulty(difficulties[card_id], rating)
+                    difficulties[card_id] = difficulty
+                    heapq.heappush(
+                        queue, (now + review_interval(difficulty) / 86400, card_id)
+                    )
+                    stats["reviews"] += 1
+                    stats["failed"] += rating == 0
+        days.append(stats)
+
+    final = Counter(d for _, difficulties, _ in learners for d in difficulties.values())
+    return days, final
+
+
+def print_projection(days, final, learners):
+    header = (
+        f"{'Day':>5}{'Active':>8}{'New':>9}{'Reviews':>10}"
+        f"{'Per learner':>13}{'Failed':>8}"
+    )
+    print(header)
+    print("-" * len(header))
+    step = max(1, len(days) // 30)
+    for stats in days:
+        if stats["day"] % step and stats["day"] != len(days) - 1:
+            continue
+        per_learner = stats["reviews"] / stats["learners"] if stats["learners"] else 0
+        failed = stats["failed"] / stats["reviews"] if stats["reviews"] else 0
+        print(
+            f"{stats['day']:>5}{stats['learners']:>8}{stats['new']:>9}"
+            f"{stats['reviews']:>10}{per_learner:>13.1f}{failed:>8.1%}"
+        )
+
+    reviews = sorted(stats["reviews"] for stats in days)
+    print(
+        f"\nDaily reviews for {learners} learners: "
+        f"median {reviews[len(reviews) // 2]}, max {reviews[-1]}, "
+        f"total {sum(reviews)}"
+    )
+    print_distribution("Card difficulty at the end", final, interval=True)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Simulate learners studying with the flashcard API"
+    )
+    # Shared by both modes so they go after the mode name, as in the usage
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--learners", type=int, default=100)
+    common.add_argument("--seed", type=int, default=None)
+    common.add_argument("--report-json", help="Also write the results to this file")
+    modes = parser.add_subparsers(dest="mode", required=True)
+
+    live = modes.add_parser(
+        "live", parents=[common], help="Drive study sessions against the API"
+    )
+    live.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    live.add_argument(
+        "--duration", type=float, default=300, help="Seconds to run after ramp-up"
+    )
+    live.add_argument(
+        "--ramp-up", type=float, default=30, help="Seconds to start all learners"
+    )
+    live.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="Simulated time runs this many times faster than wall time",
+    )
+    live.add_argument(
+        "--session-gap",
+        type=float,
+        default=600,
+        help="Mean simulated seconds between a learner's sessions",
+    )
+    live.add_argument("--initial-cards", type=int, default=20)
+    live.add_argument(
+        "--new-cards", type=int, default=10, help="Cards learned when nothing is due"
+    )
+    live.add_argument(
+        "--review-batch", type=int, default=20, help="Cards pulled per session"
+    )
+    live.add_argument(
+        "--batch-reviews",
+        action="store_true",
+        help="Submit each session's reviews in one batch request at the end",
+    )
+    live.add_argument("--max-connections", type=int, default=200)
+    live.add_argument(
+        "--accounts",
+        help="CSV with username,email,password of verified users to reuse",
+    )
+    live.add_argument("--mailhog-url", default="http://localhost:8025")
+    live.add_argument(
+        "--smtp-sink",
+        metavar="[HOST:]PORT",
+        help="Capture email with a built-in SMTP server instead of polling MailHog",
+    )
+    live.add_argument("--provision-concurrency", type=int, default=20)
+
+    proj = modes.add_parser(
+        "project", parents=[common], help="Project daily workload offline"
+    )
+    proj.add_argument("--days", type=int, default=90)
+    proj.add_argument("--new-per-day", type=int, default=10)
+    proj.add_argument("--deck-size", type=int, default=500)
+    proj.add_argument(
+        "--sessions-per-day",
+        type=int,
+        default=1,
+        help="Sessions per active day; cards due within the day wait for the next one",
+    )
+    proj.add_argument(
+        "--activity",
+        type=float,
+        default=0.8,
+        help="Probability that a learner studies on a given day",
+    )
+    proj.add_argument(
+        "--max-reviews",
+        type=int,
+        default=0,
+        help="Cap on reviews per session (default: review everything due)",
+    )
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.mode == "live":
+        return asyncio.run(run_live(args))
+
+    started = time.monotonic()
+    days, final = project(args)
+    print_projection(days, final, args.learners)
+    print(f"\nProjected in {time.monotonic() - started:.1f}s")
+    if args.report_json:
+        with open(args.report_json, "w") as f:
+            json.dump(
+                {"days": days, "difficulties": {str(k): v for k, v in final.items()}},
+                f,
+                indent=2,
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
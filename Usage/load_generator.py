@@ -0,0 +1,581 @@
+#!/usr/bin/env python3
+"""Headless load generator for the 12 UsageFlow flows.
+
+Runs a weighted mix of the flows across N virtual users that share one
+keep-alive ConnectionPool, ramps the users up linearly, optionally caps the
+total request rate, and reports per-endpoint throughput and latency
+percentiles. Started through ``python UsageFlow.py --load ...``.
+"""
+
+import argparse
+import asyncio
+import csv
+import json
+import random
+import string
+import sys
+import time
+from collections import Counter, defaultdict, namedtuple
+from types import SimpleNamespace
+
+import aiohttp
+
+from flashcard_client import DEFAULT_BASE_URL, ConnectionPool, FlashcardClient
+from latency_histogram import LatencyHistogram
+from mail_tokens import MailHogTokenSource
+from request_trace import enable_trace
+from smtp_sink import SmtpTokenSink, parse_listen_address
+
+FLOW_NAMES = {
+    1: "User Registration & Verification",
+    2: "Login & Authentication",
+    3: "Password Recovery",
+    4: "Deck Creation & Management",
+    5: "Card Creation & Management",
+    6: "Study Session",
+    7: "Performance Tracking",
+    8: "Card Review History",
+    9: "Multiple Device Management",
+    10: "Deck Browsing & Search",
+    11: "Spaced Repetition Learning",
+    12: "Study Session Analysis",
+}
+
+# Study traffic dominates real usage; account flows are comparatively rare.
+DEFAULT_MIX = "1=1,2=1,3=1,4=2,5=3,6=5,7=2,8=2,9=1,10=2,11=5,12=2"
+
+# Probability of each 0-5 rating when a virtual user answers a card
+RATING_WEIGHTS = [15, 5, 10, 30, 25, 15]
+
+Account = namedtuple("Account", ["username", "email", "password"])
+
+
+class RateLimiter:
+    """Token bucket shared by every request sent through a pool."""
+
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)
+        self.capacity = float(burst or max(1.0, self.rate / 10))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class EndpointStats:
+    """Per-endpoint latency histograms collected from pool listeners.
+
+    Memory stays constant however long the run is, and stats from separate
+    processes or runs combine with ``merge``.
+    """
+
+    def __init__(self):
+        self.latencies = defaultdict(LatencyHistogram)
+        self.errors = Counter()
+
+    def record(self, response):
+        self.add(response.method, response.route, response.status, response.elapsed)
+
+    def add(self, method, route, status, seconds):
+        key = (method, route)
+        self.latencies[key].record(seconds)
+        if not 200 <= status < 400:
+            self.errors[key] += 1
+
+    def merge(self, other):
+        for key, histogram in other.latencies.items():
+            self.latencies[key].merge(histogram)
+        self.errors.update(other.errors)
+        return self
+
+    def to_json(self):
+        return {
+            f"{method} {route}": {
+                "errors": self.errors[(method, route)],
+                "histogram": histogram.encode(),
+            }
+            for (method, route), histogram in sorted(self.latencies.items())
+        }
+
+    @classmethod
+    def from_json(cls, data):
+        stats = cls()
+        for endpoint, item in data.items():
+            key = tuple(endpoint.split(" ", 1))
+            stats.latencies[key] = LatencyHistogram.decode(item["histogram"])
+            stats.errors[key] = item["errors"]
+        return stats
+
+    def rows(self, elapsed):
+        rows = []
+        for (method, route), histogram in sorted(self.latencies.items()):
+            rows.append(
+                {
+                    "endpoint": f"{method} {route}",
+                    "count": histogram.count,
+                    "errors": self.errors[(method, route)],
+                    "throughput": histogram.count / elapsed if elapsed else 0.0,
+                    "p50_ms": histogram.percentile(50) * 1000,
+                    "p95_ms": histogram.percentile(95) * 1000,
+                    "p99_ms": histogram.percentile(99) * 1000,
+                    "max_ms": histogram.max * 1000,
+                }
+            )
+        return rows
+
+
+def random_suffix(rng, length=10):
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(length))
+
+
+class LoadContext:
+    def __init__(self, args, pool, token_source):
+        self.args = args
+        self.pool = pool
+        self.token_source = token_source
+        self.flow_ids, self.weights = parse_mix(args.mix)
+        self.flow_counts = Counter()
+        self.flow_errors = Counter()
+        self.failed_users = 0
+
+
+class VirtualUser:
+    def __init__(self, index, pool, account, rng):
+        self.index = index
+        self.client = FlashcardClient(pool)
+        self.account = account
+        self.rng = rng
+        self.deck_id = None
+        self.card_ids = []
+
+    async def login(self):
+        response = await self.client.login(self.account.username, self.account.password)
+        return response.ok
+
+    async def setup(self, ctx):
+        if not await self.login():
+            return False
+        response = await self.client.create_deck(
+            f"Load deck {self.index}", "Created by the load generator"
+        )
+        if response.status != 201 or not response.data:
+            return False
+        self.deck_id = response.data.get("id")
+        await self.add_cards(ctx.args.cards_per_deck)
+        return True
+
+    async def add_cards(self, count):
+        for _ in range(count):
+            word = random_suffix(self.rng, 6)
+            response = await self.client.create_card_simple(
+                self.deck_id, f"What is {word}?", f"{word} is a test answer"
+            )
+            if response.status == 201 and response.data:
+                self.card_ids.append(response.data.get("id"))
+
+
+async def provision_account(pool, token_source, rng, prefix="load"):
+    """Sign up a fresh user and verify it through the token source."""
+    suffix = random_suffix(rng)
+    account = Account(
+        f"{prefix}_{suffix}", f"{prefix}_{suffix}@example.com", f"Password123!{suffix}"
+    )
+    client = FlashcardClient(pool)
+    response = await client.signup(account.username, account.email, account.password)
+    if response.status != 201 or token_source is None:
+        return None
+    token = await token_source.wait_for_token(account.email, "verification")
+    if not token:
+        return None
+    response = await client.verify_email(token)
+    return account if response.ok else None
+
+
+# Headless flows. Each mirrors the FlashcardAPITester flow with the same id.
+
+
+async def flow_registration(vu, ctx):
+    await provision_account(ctx.pool, ctx.token_source, vu.rng)
+
+
+async def flow_login(vu, ctx):
+    device = FlashcardClient(ctx.pool)
+    await device.login(vu.account.username, vu.account.password)
+    await device.refresh()
+    await device.logout()
+
+
+async def flow_password_recovery(vu, ctx):
+    await vu.client.forgot_password(vu.account.email)
+    if ctx.token_source is None:
+        return
+    token = await ctx.token_source.wait_for_token(vu.account.email, "reset")
+    if token:
+        await vu.client.reset_password(token, vu.account.password)
+
+
+async def flow_deck_management(vu, ctx):
+    await vu.client.list_decks()
+    response = await vu.client.create_deck(
+        f"Scratch deck {random_suffix(vu.rng, 6)}", "Temporary load deck"
+    )
+    if response.status != 201 or not response.data:
+        return
+    deck_id = response.data.get("id")
+    await vu.client.get_deck(deck_id)
+    await vu.client.update_deck(deck_id, name="Renamed scratch deck")
+    await vu.client.delete_deck(deck_id)
+
+
+async def flow_card_management(vu, ctx):
+    await vu.client.list_cards(vu.deck_id)
+    response = await vu.client.create_card(vu.deck_id, "Temporary front", "Back")
+    if response.status != 201 or not response.data:
+        return
+    card_id = response.data.get("id")
+    await vu.client.get_card(vu.deck_id, card_id)
+    await vu.client.update_card(
+        vu.deck_id, card_id, front="Updated front", back="Updated back"
+    )
+    await vu.client.delete_card(vu.deck_id, card_id)
+
+
+async def flow_study_session(vu, ctx):
+    due = await vu.client.review_cards(vu.deck_id, limit=ctx.args.review_batch)
+    cards = (due.data or {}).get("cards") or []
+    if not cards:
+        # Everything is scheduled ahead; learn new cards instead
+        await vu.add_cards(ctx.args.review_batch)
+        due = await vu.client.review_cards(vu.deck_id, limit=ctx.args.review_batch)
+        cards = (due.data or {}).get("cards") or []
+
+    session = await vu.client.start_session(vu.deck_id)
+    if session.status != 201 or not session.data:
+        return
+    session_id = session.data.get("sessionId")
+
+    correct = 0
+    total_seconds = 0
+    for card in cards:
+        result = vu.rng.choices(range(6), weights=RATING_WEIGHTS)[0]
+        seconds = vu.rng.randint(2, 20)
+        await vu.client.submit_review(session_id, card.get("id"), result, seconds)
+        correct += 1 if result > 0 else 0
+        total_seconds += seconds
+    await vu.client.complete_session(
+        session_id, len(cards), correct, len(cards) - correct, total_seconds
+    )
+
+
+async def flow_performance_tracking(vu, ctx):
+    await vu.client.list_sessions()
+    await vu.client.study_activity(vu.rng.choice([7, 30]))
+
+
+async def flow_card_review_history(vu, ctx):
+    if vu.card_ids:
+        await vu.client.card_reviews(vu.rng.choice(vu.card_ids))
+
+
+async def flow_multiple_devices(vu, ctx):
+    device = FlashcardClient(ctx.pool)
+    await device.login(vu.account.username, vu.account.password)
+    await device.logout()
+    await device.login(vu.account.username, vu.account.password)
+    await device.logout_all()
+    # Logging out everywhere also ends this user's main session
+    await vu.login()
+
+
+async def flow_deck_browsing(vu, ctx):
+    await vu.client.list_decks()
+    await vu.client.list_decks(search="Load")
+
+
+async def flow_session_analysis(vu, ctx):
+    response = await vu.client.list_sessions()
+    sessions = (response.data or {}).get("sessions") or []
+    if sessions:
+        await vu.client.get_session(vu.rng.choice(sessions).get("sessionId"))
+
+
+FLOWS = {
+    1: flow_registration,
+    2: flow_login,
+    3: flow_password_recovery,
+    4: flow_deck_management,
+    5: flow_card_management,
+    6: flow_study_session,
+    7: flow_performance_tracking,
+    8: flow_card_review_history,
+    9: flow_multiple_devices,
+    10: flow_deck_browsing,
+    11: flow_study_session,
+    12: flow_session_analysis,
+}
+
+
+def parse_mix(mix):
+    """Parse ``"6=5,11=5,4=1"`` into parallel lists of flow ids and weights."""
+    flow_ids, weights = [], []
+    for part in mix.split(","):
+        if not part.strip():
+            continue
+        flow_id, _, weight = part.partition("=")
+        flow_id = int(flow_id)
+        if flow_id not in FLOWS:
+            raise ValueError(f"Unknown flow id in mix: {flow_id}")
+        if float(weight or 1) > 0:
+            flow_ids.append(flow_id)
+            weights.append(float(weight or 1))
+    if not flow_ids:
+        raise ValueError("Flow mix must give at least one flow a positive weight")
+    return flow_ids, weights
+
+
+def load_accounts(path):
+    with open(path, newline="") as f:
+        return [
+            Account(row["username"], row.get("email", ""), row["password"])
+            for row in csv.DictReader(f)
+        ]
+
+
+async def run_virtual_user(vu, ctx, start_delay, stop_at):
+    await asyncio.sleep(start_delay)
+    try:
+        ready = await vu.setup(ctx)
+    except (aiohttp.ClientError, asyncio.TimeoutError):
+        ready = False
+    if not ready:
+        ctx.failed_users += 1
+        return
+
+    think_time = ctx.args.think_time
+    while time.monotonic() < stop_at:
+        flow_id = vu.rng.choices(ctx.flow_ids, weights=ctx.weights)[0]
+        try:
+            await FLOWS[flow_id](vu, ctx)
+            ctx.flow_counts[flow_id] += 1
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            ctx.flow_errors[flow_id] += 1
+        if think_time > 0:
+            await asyncio.sleep(vu.rng.expovariate(1.0 / think_time))
+
+
+async def run_load(args):
+    rng = random.Random(args.seed)
+    limiter = RateLimiter(args.rate) if args.rate > 0 else None
+    stats = EndpointStats()
+    if args.smtp_sink:
+        token_source = await SmtpTokenSink(
+            *parse_listen_address(args.smtp_sink)
+        ).start()
+    else:
+        token_source = MailHogTokenSource(args.mailhog_url)
+
+    async with ConnectionPool(
+        args.base_url, max_connections=args.max_connections, rate_limiter=limiter
+    ) as pool:
+        ctx = LoadContext(args, pool, token_source)
+
+        if args.accounts:
+            accounts = load_accounts(args.accounts)[: args.users]
+        else:
+            print(f"Provisioning {args.users} verified users...")
+            semaphore = asyncio.Semaphore(args.provision_concurrency)
+
+            async def provision():
+                async with semaphore:
+                    return await provision_account(pool, token_source, rng)
+
+            accounts = [
+                a
+                for a in await asyncio.gather(*(provision() for _ in range(args.users)))
+                if a
+            ]
+        if not accounts:
+            print("No usable accounts; aborting load run.")
+            await token_source.close()
+            return 1
+
+        pool.listeners.append(stats.record)
+        started = time.monotonic()
+        stop_at = started + args.ramp_up + args.duration
+        users = [
+            VirtualUser(i, pool, account, random.Random(rng.random()))
+            for i, account in enumerate(accounts)
+        ]
+        print(
+            f"Running {len(users)} virtual users for {args.duration}s "
+            f"after a {args.ramp_up}s ramp-up..."
+        )
+        await asyncio.gather(
+            *(
+                run_virtual_user(vu, ctx, args.ramp_up * i / len(users), stop_at)
+                for i, vu in enumerate(users)
+            )
+        )
+        elapsed = time.monotonic() - started
+
+    await token_source.close()
+    print_report(ctx, stats, elapsed)
+    if args.report_json:
+        with open(args.report_json, "w") as f:
+            json.dump(
+                {
+                    "elapsedSeconds": elapsed,
+                    "users": len(users),
+                    "failedUsers": ctx.failed_users,
+                    "flows": {str(k): v for k, v in ctx.flow_counts.items()},
+                    "flowErrors": {str(k): v for k, v in ctx.flow_errors.items()},
+                    "endpoints": stats.rows(elapsed),
+                    "histograms": stats.to_json(),
+                },
+                f,
+                indent=2,
+            )
+    return 0
+
+
+def merge_reports(paths):
+    """Print one report for several --report-json files run side by side."""
+    ctx = SimpleNamespace(flow_counts=Counter(), flow_errors=Counter(), failed_users=0)
+    stats = EndpointStats()
+    elapsed = 0.0
+    for path in paths:
+        with open(path) as f:
+            report = json.load(f)
+        if "histograms" not in report:
+            print(f"{path} has no latency histograms; skipping")
+            continue
+        stats.merge(EndpointStats.from_json(report["histograms"]))
+        ctx.flow_counts.update({int(k): v for k, v in report["flows"].items()})
+        ctx.flow_errors.update({int(k): v for k, v in report["flowErrors"].items()})
+        ctx.failed_users += report["failedUsers"]
+        # The runs overlap, so throughput is measured over the longest one
+        elapsed = max(elapsed, report["elapsedSeconds"])
+    print_report(ctx, stats, elapsed)
+    return 0
+
+
+def print_report(ctx, stats, elapsed):
+    print(f"\nLoad run finished in {elapsed:.1f}s")
+    if ctx.failed_users:
+        print(f"{ctx.failed_users} virtual users failed to set up")
+
+    print("\nFlows:")
+    for flow_id in sorted(set(ctx.flow_counts) | set(ctx.flow_errors)):
+        print(
+            f"  {flow_id:>2}. {FLOW_NAMES[flow_id]:<36} "
+            f"completed={ctx.flow_counts[flow_id]} errors={ctx.flow_errors[flow_id]}"
+        )
+
+    header = (
+        f"{'Endpoint':<52}{'Count':>8}{'Err':>6}{'Req/s':>9}"
+        f"{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}"
+    )
+    print("\n" + header)
+    print("-" * len(header))
+    for row in stats.rows(elapsed):
+        print(
+            f"{row['endpoint']:<52}{row['count']:>8}{row['errors']:>6}"
+            f"{row['throughput']:>9.1f}{row['p50_ms']:>9.1f}{row['p95_ms']:>9.1f}"
+            f"{row['p99_ms']:>9.1f}{row['max_ms']:>9.1f}"
+        )
+    print("(latencies in ms)")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Drive a weighted mix of the UsageFlow flows against the API"
+    )
+    parser.add_argument("--load", action="store_true", help="Run in load mode")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("--users", type=int, default=10, help="Virtual users")
+    parser.add_argument(
+        "--ramp-up", type=float, default=10, help="Seconds to start all users"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=60, help="Seconds to run after ramp-up"
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=0,
+        help="Target total requests per second (default: unlimited)",
+    )
+    parser.add_argument(
+        "--mix",
+        default=DEFAULT_MIX,
+        help=f"Flow weights as id=weight pairs (default: {DEFAULT_MIX})",
+    )
+    parser.add_argument(
+        "--think-time",
+        type=float,
+        default=1.0,
+        help="Mean pause between flows in seconds (0 disables)",
+    )
+    parser.add_argument("--cards-per-deck", type=int, default=20)
+    parser.add_argument(
+        "--review-batch", type=int, default=10, help="Cards pulled per study session"
+    )
+    parser.add_argument("--max-connections", type=int, default=100)
+    parser.add_argument(
+        "--accounts",
+        help="CSV with username,email,password of verified users to reuse",
+    )
+    parser.add_argument(
+        "--mailhog-url",
+        default="http://localhost:8025",
+        help="MailHog used to verify freshly provisioned users",
+    )
+    parser.add_argument(
+        "--smtp-sink",
+        metavar="[HOST:]PORT",
+        help="Capture email with a built-in SMTP server instead of polling MailHog",
+    )
+    parser.add_argument("--provision-concurrency", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--report-json", help="Also write the report to this file")
+    parser.add_argument(
+        "--trace", metavar="FILE", help="Record every request to a JSONL trace"
+    )
+    parser.add_argument(
+        "--merge",
+        nargs="+",
+        metavar="REPORT",
+        help="Combine --report-json files from concurrent load processes "
+        "into one report instead of running",
+    )
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.merge:
+        return merge_reports(args.merge)
+    try:
+        parse_mix(args.mix)
+    except ValueError as e:
+        print(f"Invalid --mix: {e}")
+        return 2
+    if args.trace:
+        enable_trace(args.trace)
+    return asyncio.run(run_load(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Sources for the verification and password reset tokens the API emails.
+
+Every source exposes ``await wait_for_token(email, kind, timeout)`` where
+``kind`` is ``"verification"`` or ``"reset"``, so harness code does not care
+where the mail ends up.
+"""
+
+import asyncio
+import re
+
+import aiohttp
+
+# EmailService writes "Or copy and paste this token: <uuid>" into both emails.
+TOKEN_PATTERN = re.compile(
+    r"token:\s*([a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12})",
+    re.IGNORECASE,
+)
+SUBJECT_KINDS = {
+    "verify your email address": "verification",
+    "reset your password": "reset",
+}
+
+
+def mail_kind(subject):
+    """Map an email subject to a token kind, or None for unrelated mail."""
+    return SUBJECT_KINDS.get((subject or "").strip().lower())
+
+
+def extract_token(body):
+    match = TOKEN_PATTERN.search(body or "")
+    return match.group(1) if match else None
+
+
+def newest_mailhog_token(search_result, kind):
+    """Return the token of the newest ``kind`` mail in a MailHog search result."""
+    # MailHog returns the newest message first
+    for item in search_result.get("items") or []:
+        content = item.get("Content", {})
+        subject = (content.get("Headers", {}).get("Subject") or [""])[0]
+        if mail_kind(subject) != kind:
+            continue
+        # Undo quoted-printable soft line breaks before matching
+        body = re.sub(r"=\r?\n", "", content.get("Body", "")).replace("=3D", "=")
+        token = extract_token(body)
+        if token:
+            return token
+    return None
+
+
+class MailHogTokenSource:
+    """Polls the MailHog search API for the newest mail to one recipient."""
+
+    def __init__(self, api_url="http://localhost:8025", poll_interval=0.5):
+        self.api_url = api_url.rstrip("/")
+        self.poll_interval = poll_interval
+        self._session = None
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def wait_for_token(self, email, kind="verification", timeout=30):
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+        deadline = asyncio.get_running_loop().time() + timeout
+        while True:
+            token = await self._search(email, kind)
+            if token:
+                return token
+            if asyncio.get_running_loop().time() >= deadline:
+                return None
+            await asyncio.sleep(self.poll_interval)
+
+    async def _search(self, email, kind):
+        try:
+            async with self._session.get(
+                f"{self.api_url}/api/v2/search",
+                params={"kind": "to", "query": email},
+            ) as resp:
+                if resp.status != 200:
+                    return None
+                data = await resp.json()
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+            return None
+
+        return newest_mailhog_token(data, kind)
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""Per-request latency and payload tracing for the Python tooling.
+
+Set ``FLASHCARD_TRACE=trace.jsonl`` (or pass ``--trace`` to the scripts that
+take it) and every request made through ConnectionPool or the requests-based
+API test is appended to that file as one JSON line:
+
+    {"ts": 1700000000.1, "pid": 4242, "method": "GET",
+     "route": "/api/decks/{deckId}/cards", "status": 200, "connectMs": 0.0,
+     "ttfbMs": 11.8, "totalMs": 12.4, "requestBytes": 0, "responseBytes": 5120}
+
+``connectMs`` is the time spent opening a new connection (0 on a reused
+keep-alive connection, null when the HTTP library does not report it),
+``ttfbMs`` runs until the response headers arrived and ``totalMs`` until the
+body was read. Byte counts are body sizes. The process that opened the trace
+prints a per-endpoint summary of the whole file when it exits, so requests
+made by worker processes are included.
+"""
+
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+
+import aiohttp
+
+TRACE_ENV = "FLASHCARD_TRACE"
+# Pid of the process that owns the trace file and prints the summary
+OWNER_ENV = "FLASHCARD_TRACE_OWNER"
+
+_trace = None
+_trace_lock = threading.Lock()
+
+
+def enable_trace(path):
+    """Start a fresh trace in ``path`` for this process and its children."""
+    global _trace
+    with _trace_lock:
+        os.environ[TRACE_ENV] = path
+        os.environ[OWNER_ENV] = str(os.getpid())
+        _trace = RequestTrace(path, truncate=True)
+        atexit.register(_trace.print_summary)
+        return _trace
+
+
+def current_trace():
+    """Return the trace enabled through FLASHCARD_TRACE, or None."""
+    if _trace is None and os.environ.get(TRACE_ENV):
+        if os.environ.get(OWNER_ENV) is None:
+            return enable_trace(os.environ[TRACE_ENV])
+        # A worker of the owning process: only append
+        return _child_trace()
+    return _trace
+
+
+def _child_trace():
+    global _trace
+    with _trace_lock:
+        if _trace is None:
+            _trace = RequestTrace(os.environ[TRACE_ENV])
+        return _trace
+
+
+class RequestTrace:
+    """Appends request records to a JSONL file.
+
+    Lines are written with single ``os.write`` calls on an ``O_APPEND``
+    descriptor, so several threads and processes can share one file.
+    """
+
+    def __init__(self, path, truncate=False):
+        self.path = path
+        flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND
+        if truncate:
+            flags |= os.O_TRUNC
+        self._fd = os.open(path, flags, 0o644)
+
+    def record(
+        self,
+        method,
+        route,
+        status,
+        total,
+        ttfb=None,
+        connect=None,
+        request_bytes=0,
+        response_bytes=0,
+    ):
+        """Append one request; times are in seconds."""
+        line = json.dumps(
+            {
+                "ts": round(time.time(), 3),
+                "pid": os.getpid(),
+                "method": method,
+                "route": route,
+                "status": status,
+                "connectMs": _ms(connect),
+                "ttfbMs": _ms(ttfb),
+                "totalMs": _ms(total),
+                "requestBytes": request_bytes,
+                "responseBytes": response_bytes,
+            }
+        )
+        os.write(self._fd, (line + "\n").encode("utf-8"))
+
+    def record_response(self, response):
+        """ConnectionPool listener."""
+        self.record(
+            response.method,
+            response.route,
+            response.status,
+            response.elapsed,
+            response.ttfb,
+            response.connect,
+            response.request_bytes,
+            response.response_bytes,
+        )
+
+    def print_summary(self, file=None):
+        rows = summarize(read_trace(self.path))
+        if rows:
+            print_summary(rows, self.path, file or sys.stdout)
+
+
+def _ms(seconds):
+    return None if seconds is None else round(seconds * 1000, 3)
+
+
+def read_trace(path):
+    try:
+        with open(path) as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+    except OSError:
+        return
+
+
+def summarize(records):
+    """Aggregate trace records into per-endpoint rows sorted by wall time."""
+    groups = defaultdict(list)
+    for record in records:
+        groups[(record["method"], record["route"])].append(record)
+
+    rows = []
+    for (method, route), items in groups.items():
+        totals = sorted(r["totalMs"] or 0.0 for r in items)
+        ttfbs = [r["ttfbMs"] for r in items if r["ttfbMs"] is not None]
+        connects = [r["connectMs"] for r in items if r["connectMs"] is not None]
+        rows.append(
+            {
+                "endpoint": f"{method} {route}",
+                "count": len(items),
+                "errors": sum(1 for r in items if not 200 <= r["status"] < 400),
+                "wall_ms": sum(totals),
+                "connect_ms": sum(connects) / len(connects) if connects else None,
+                "ttfb_ms": sum(ttfbs) / len(ttfbs) if ttfbs else None,
+                "p50_ms": totals[(len(totals) - 1) // 2],
+                "max_ms": totals[-1],
+                "request_bytes": sum(r["requestBytes"] for r in items) / len(items),
+                "response_bytes": sum(r["responseBytes"] for r in items) / len(items),
+            }
+        )
+    rows.sort(key=lambda row: row["wall_ms"], reverse=True)
+    return rows
+
+
+def print_summary(rows, path, file):
+    def optional(value):
+        return f"{value:>9.1f}" if value is not None else f"{'-':>9}"
+
+    wall = sum(row["wall_ms"] for row in rows) or 1.0
+    header = (
+        f"{'Endpoint':<52}{'Count':>7}{'Err':>5}{'Wall%':>7}{'Connect':>9}"
+        f"{'TTFB':>9}{'p50':>9}{'Max':>9}{'Req B':>9}{'Resp B':>9}"
+    )
+    print(f"\nRequest trace summary ({path})", file=file)
+    print(header, file=file)
+    print("-" * len(header), file=file)
+    for row in rows:
+        print(
+            f"{row['endpoint'][:51]:<52}{row['count']:>7}{row['errors']:>5}"
+            f"{row['wall_ms'] / wall:>7.1%}{optional(row['connect_ms'])}"
+            f"{optional(row['ttfb_ms'])}{row['p50_ms']:>9.1f}{row['max_ms']:>9.1f}"
+            f"{row['request_bytes']:>9.0f}{row['response_bytes']:>9.0f}",
+            file=file,
+        )
+    print(
+        "(connect and TTFB are means; times in ms, sizes are mean body bytes)",
+        file=file,
+    )
+
+
+def aiohttp_trace_config():
+    """TraceConfig that fills the ``trace_request_ctx`` dict of each request.
+
+    Sets ``connect`` (seconds spent opening a connection, 0 when one was
+    reused), ``ttfb`` (seconds until the response headers were received) and
+    ``request_bytes`` (body bytes sent).
+    """
+
+    async def on_request_start(session, ctx, params):
+        ctx.trace_request_ctx.update(started=time.perf_counter(), request_bytes=0)
+        ctx.trace_request_ctx.setdefault("connect", 0.0)
+
+    async def on_connection_create_start(session, ctx, params):
+        ctx.trace_request_ctx["connect_started"] = time.perf_counter()
+
+    async def on_connection_create_end(session, ctx, params):
+        ctx.trace_request_ctx["connect"] = (
+            time.perf_counter() - ctx.trace_request_ctx["connect_started"]
+        )
+
+    async def on_request_chunk_sent(session, ctx, params):
+        ctx.trace_request_ctx["request_bytes"] += len(params.chunk)
+
+    async def on_request_end(session, ctx, params):
+        ctx.trace_request_ctx["ttfb"] = (
+            time.perf_counter() - ctx.trace_request_ctx["started"]
+        )
+
+    config = aiohttp.TraceConfig()
+    config.on_request_start.append(on_request_start)
+    config.on_connection_create_start.append(on_connection_create_start)
+    config.on_connection_create_end.append(on_connection_create_end)
+    config.on_request_chunk_sent.append(on_request_chunk_sent)
+    config.on_request_end.append(on_request_end)
+    return config
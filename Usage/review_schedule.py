@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""Client-side copy of the server's review scheduling rules.
+
+Mirrors CardReviewController.submitCardReview so simulators and data
+generators can predict the difficulty and next review date the server
+assigns without calling it.
+"""
+
+# Interval in seconds for each difficulty; anything else falls back to a day
+REVIEW_INTERVALS = {
+    0: 6 * 3600,
+    1: 1 * 86400,
+    2: 3 * 86400,
+    3: 7 * 86400,
+    4: 14 * 86400,
+    5: 30 * 86400,
+}
+DEFAULT_INTERVAL = 86400
+
+
+def next_difficulty(difficulty, result):
+    """Difficulty after a review with ``result`` 0 (wrong) to 5 (perfect).
+
+    Like the server, a correct rating of 1 or 2 raises the difficulty with no
+    upper bound; only a wrong answer is capped at 5.
+    """
+    if result == 0:
+        return min(5, difficulty + 2)
+    return max(0, difficulty - (result - 3))
+
+
+def review_interval(difficulty):
+    """Seconds until a card with ``difficulty`` is due again."""
+    return REVIEW_INTERVALS.get(difficulty, DEFAULT_INTERVAL)
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""Minimal in-process SMTP server that captures the API's token emails.
+
+Point the application's mail settings at the sink instead of MailHog, e.g.
+
+    SPRING_MAIL_HOST=host.docker.internal SPRING_MAIL_PORT=2525
+
+and every verification or password reset token is parsed as the mail is
+received and handed to whoever is waiting for that recipient, so nothing
+sleeps or polls. Tokens that arrive before anyone asks for them are queued.
+
+SmtpTokenSink runs on the caller's event loop; ThreadedSmtpTokenSink runs one
+in a background thread for synchronous (requests-based) scripts.
+"""
+
+import asyncio
+import threading
+from collections import defaultdict, deque
+from email import message_from_bytes, policy
+from email.utils import parseaddr
+
+from mail_tokens import extract_token, mail_kind
+
+MAX_MESSAGE_BYTES = 1024 * 1024
+
+
+def parse_listen_address(value, default_host="0.0.0.0"):
+    """Turn ``"2525"`` or ``"127.0.0.1:2525"`` into a (host, port) tuple."""
+    host, _, port = str(value).rpartition(":")
+    return host or default_host, int(port)
+
+
+def message_text(message):
+    """Concatenate every text part of a parsed email, transfer-decoded."""
+    parts = message.walk() if message.is_multipart() else [message]
+    texts = []
+    for part in parts:
+        if part.get_content_maintype() == "text":
+            try:
+                texts.append(part.get_content())
+            except (LookupError, ValueError):
+                payload = part.get_payload(decode=True) or b""
+                texts.append(payload.decode("utf-8", "replace"))
+    return "\n".join(texts)
+
+
+class SmtpTokenSink:
+    """SMTP server that routes tokens to waiters keyed by (recipient, kind)."""
+
+    def __init__(self, host="0.0.0.0", port=2525):
+        self.host = host
+        self.port = port
+        self.messages_received = 0
+        self._server = None
+        self._tokens = defaultdict(deque)
+        self._waiters = defaultdict(deque)
+        self._subscribers = {}
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def start(self):
+        self._server = await asyncio.start_server(
+            self._handle_client, self.host, self.port
+        )
+        # Report the real port when started with port 0
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        for waiters in self._waiters.values():
+            for future in waiters:
+                future.cancel()
+        self._waiters.clear()
+
+    def subscribe(self, email, target):
+        """Send every token mailed to ``email`` to ``target.put((kind, token))``.
+
+        Lets callers in other processes receive tokens through a queue.
+        """
+        self._subscribers[email.lower()] = target
+
+    async def wait_for_token(self, email, kind="verification", timeout=30):
+        """Return the next unclaimed token mailed to ``email``, or None on timeout."""
+        key = (email.lower(), kind)
+        if self._tokens[key]:
+            return self._tokens[key].popleft()
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters[key].append(future)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            if future in self._waiters[key]:
+                self._waiters[key].remove(future)
+
+    def deliver(self, recipients, raw_message):
+        """Parse one received message and hand its token to the recipients."""
+        self.messages_received += 1
+        message = message_from_bytes(raw_message, policy=policy.default)
+        kind = mail_kind(message.get("Subject"))
+        token = extract_token(message_text(message)) if kind else None
+        if not token:
+            return
+        for recipient in recipients:
+            subscriber = self._subscribers.get(recipient.lower())
+            if subscriber is not None:
+                subscriber.put((kind, token))
+                continue
+            key = (recipient.lower(), kind)
+            waiters = self._waiters[key]
+            while waiters:
+                future = waiters.popleft()
+                if not future.done():
+                    future.set_result(token)
+                    break
+            else:
+                self._tokens[key].append(token)
+
+    async def _handle_client(self, reader, writer):
+        async def reply(line):
+            writer.write(line.encode("ascii") + b"\r\n")
+            await writer.drain()
+
+        recipients = []
+        try:
+            await reply("220 flashcard-smtp-sink ESMTP")
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                command = line.decode("utf-8", "replace").strip()
+                verb = command[:4].upper()
+
+                if verb == "EHLO":
+                    writer.write(
+                        b"250-flashcard-smtp-sink\r\n250-8BITMIME\r\n"
+                        + f"250 SIZE {MAX_MESSAGE_BYTES}\r\n".encode("ascii")
+                    )
+                    await writer.drain()
+                elif verb == "HELO":
+                    await reply("250 flashcard-smtp-sink")
+                elif verb == "MAIL":
+                    recipients = []
+                    await reply("250 OK")
+                elif verb == "RCPT":
+                    recipients.append(parseaddr(command.split(":", 1)[1])[1])
+                    await reply("250 OK")
+                elif verb == "DATA":
+                    await reply("354 End data with <CR><LF>.<CR><LF>")
+                    raw_message = await self._read_data(reader)
+                    self.deliver(recipients, raw_message)
+                    recipients = []
+                    await reply("250 OK: queued")
+                elif verb == "RSET":
+                    recipients = []
+                    await reply("250 OK")
+                elif verb == "NOOP":
+                    await reply("250 OK")
+                elif verb == "AUTH":
+                    await reply("235 Authentication successful")
+                elif verb == "QUIT":
+                    await reply("221 Bye")
+                    break
+                else:
+                    await reply("502 Command not implemented")
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _read_data(reader):
+        lines = []
+        while True:
+            line = await reader.readline()
+            if not line or line in (b".\r\n", b".\n"):
+                break
+            # Undo dot-stuffing
+            lines.append(line[1:] if line.startswith(b"..") else line)
+        return b"".join(lines)
+
+
+class ThreadedSmtpTokenSink:
+    """SmtpTokenSink on a background event loop with a blocking API."""
+
+    def __init__(self, host="0.0.0.0", port=2525):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self.sink = SmtpTokenSink(host, port)
+
+    @property
+    def port(self):
+        return self.sink.port
+
+    def start(self):
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self.sink.start(), self._loop).result()
+        return self
+
+    def subscribe(self, email, target):
+        self._loop.call_soon_threadsafe(self.sink.subscribe, email, target)
+
+    def wait_for_token(self, email, kind="verification", timeout=30):
+        return asyncio.run_coroutine_threadsafe(
+            self.sink.wait_for_token(email, kind, timeout), self._loop
+        ).result()
+
+    def close(self):
+        asyncio.run_coroutine_threadsafe(self.sink.close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
@@ -3,15 +3,52 @@ package com.flashcardapp.config;
 import com.flashcardapp.models.ERole;
 import com.flashcardapp.models.Role;
 import com.flashcardapp.repositories.RoleRepository;
+import com.flashcardapp.services.SearchService;
 import org.springframework.beans.factory.annotation.Autowired;
 import org.springframework.boot.CommandLineRunner;
+import org.springframework.jdbc.core.ConnectionCallback;
+import org.springframework.jdbc.core.JdbcTemplate;
 import org.springframework.stereotype.Component;
 
+import java.util.Map;
+
 @Component
 public class DbInitializer implements CommandLineRunner {
+    // Tables whose ids moved from IDENTITY columns to pooled sequences
+    private static final Map<String, String> ID_SEQUENCES = Map.of(
+            "cards", "cards_seq",
+            "card_reviews", "card_reviews_seq");
+
+    // Daily rollups rebuilt from the review and session history; a review is a
+    // new card if it is the first review of its card
+    private static final String BACKFILL_DAILY_STATS = "INSERT INTO user_daily_stats (user_id, stat_date, "
+            + "reviews, correct_responses, incorrect_responses, time_spent_seconds, new_cards, sessions_completed) "
+            + "SELECT user_id, stat_date, SUM(reviews), SUM(correct), SUM(incorrect), SUM(time_spent), "
+            + "SUM(new_cards), SUM(sessions) FROM ("
+            + "SELECT s.user_id, CAST(r.reviewed_at AS DATE) AS stat_date, 1 AS reviews, "
+            + "CASE WHEN r.result > 0 THEN 1 ELSE 0 END AS correct, "
+            + "CASE WHEN r.result > 0 THEN 0 ELSE 1 END AS incorrect, "
+            + "COALESCE(r.time_spent_seconds, 0) AS time_spent, "
+            + "CASE WHEN ROW_NUMBER() OVER (PARTITION BY r.card_id ORDER BY r.reviewed_at, r.id) = 1 "
+            + "THEN 1 ELSE 0 END AS new_cards, "
+            + "0 AS sessions "
+            + "FROM card_reviews r JOIN study_sessions s ON s.id = r.study_session_id "
+            + "UNION ALL "
+            + "SELECT user_id, CAST(completed_at AS DATE), 0, 0, 0, 0, 0, 1 "
+            + "FROM study_sessions WHERE completed_at IS NOT NULL"
+            + ") t GROUP BY user_id, stat_date";
+
+    // Columns covered by the H2 full-text index, per table
+    private static final Map<String, String> SEARCH_COLUMNS = Map.of(
+            "DECKS", "NAME,DESCRIPTION",
+            "CARDS", "FRONT,BACK,NOTES");
+
     @Autowired
     private RoleRepository roleRepository;
 
+    @Autowired
+    private JdbcTemplate jdbcTemplate;
+
     @Override
     public void run(String... args) throws Exception {
         // Initialize roles if they don't exist
@@ -22,5 +59,85 @@ public class DbInitializer implements CommandLineRunner {
 
             System.out.println("Initialized role data");
         }
+
+        String database = jdbcTemplate.execute(
+                (ConnectionCallback<String>) connection -> connection.getMetaData().getDatabaseProductName());
+        if ("PostgreSQL".equals(database)) {
+            alignIdSequences();
+        }
+        backfillCardOwners();
+        createSearchIndexes(database);
+        backfillDailyStats();
+    }
+
+    /**
+     * A PostgreSQL database created before a table switched to a sequence already
+     * holds rows numbered by the old identity column, while Hibernate creates the
+     * new sequence starting at 1. Move each sequence past the existing ids.
+     */
+    private void alignIdSequences() {
+        ID_SEQUENCES.forEach((table, sequence) -> jdbcTemplate.queryForObject(
+                "SELECT setval('" + sequence + "', GREATEST("
+                        + "(SELECT COALESCE(MAX(id), 0) FROM " + table + "), "
+                        + "(SELECT last_value FROM " + sequence + ")))",
+                Long.class));
+    }
+
+    /**
+     * Cards created before cards.user_id existed get their deck's owner. Only
+     * rows still missing it are touched, found through the user_id index.
+     */
+    private void backfillCardOwners() {
+        int rows = jdbcTemplate.update("UPDATE cards SET user_id = "
+                + "(SELECT d.user_id FROM decks d WHERE d.id = cards.deck_id) WHERE user_id IS NULL");
+        if (rows > 0) {
+            System.out.println("Set the owner of " + rows + " cards");
+        }
+    }
+
+    /**
+     * Inverted indexes for SearchService. On PostgreSQL, GIN indexes over
+     * user_id and the same tsvector expressions the search queries use, built
+     * without blocking writes. btree_gin lets the user id be a GIN key, so a
+     * common word only yields the searching user's rows; the earlier indexes
+     * over the tsvector alone are dropped. On H2, its FullText index,
+     * maintained by triggers; it is rebuilt on every start because a recreated
+     * schema drops the triggers but not the FT tables.
+     */
+    private void createSearchIndexes(String database) {
+        if ("PostgreSQL".equals(database)) {
+            // Trusted since PostgreSQL 13, so the database owner can create it
+            jdbcTemplate.execute("CREATE EXTENSION IF NOT EXISTS btree_gin");
+            jdbcTemplate.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_decks_user_search ON decks "
+                    + "USING GIN (user_id, (" + SearchService.DECK_DOCUMENT + "))");
+            jdbcTemplate.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_cards_user_search ON cards "
+                    + "USING GIN (user_id, (" + SearchService.CARD_DOCUMENT + "))");
+            jdbcTemplate.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_decks_search");
+            jdbcTemplate.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_cards_search");
+        } else if ("H2".equals(database)) {
+            jdbcTemplate.execute("CREATE ALIAS IF NOT EXISTS FT_INIT FOR 'org.h2.fulltext.FullText.init'");
+            jdbcTemplate.execute("CALL FT_INIT()");
+            SEARCH_COLUMNS.forEach((table, columns) -> {
+                jdbcTemplate.execute("CALL FT_DROP_INDEX('PUBLIC', '" + table + "')");
+                jdbcTemplate.execute("CALL FT_CREATE_INDEX('PUBLIC', '" + table + "', '" + columns + "')");
+            });
+        }
+    }
+
+    /**
+     * Databases that hold reviews from before the daily rollups existed get
+     * their rollups built once from the history.
+     */
+    private void backfillDailyStats() {
+        boolean hasRollups = Boolean.TRUE.equals(jdbcTemplate.queryForObject(
+                "SELECT EXISTS (SELECT 1 FROM user_daily_stats)", Boolean.class));
+        boolean hasHistory = Boolean.TRUE.equals(jdbcTemplate.queryForObject(
+                "SELECT EXISTS (SELECT 1 FROM study_sessions)", Boolean.class));
+        if (hasRollups || !hasHistory) {
+            return;
+        }
+
+        int rows = jdbcTemplate.update(BACKFILL_DAILY_STATS);
+        System.out.println("Built " + rows + " daily study stat rows from review history");
     }
-}
\ No newline at end of file
+}
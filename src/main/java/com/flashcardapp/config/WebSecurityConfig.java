@@ -1,9 +1,12 @@
 package com.flashcardapp.config;
 
+import com.flashcardapp.controllers.DeckController;
 import com.flashcardapp.security.jwt.AuthEntryPointJwt;
 import com.flashcardapp.security.jwt.AuthTokenFilter;
+import com.flashcardapp.security.services.BoundedPasswordEncoder;
 import com.flashcardapp.security.services.UserDetailsServiceImpl;
 import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.beans.factory.annotation.Value;
 import org.springframework.context.annotation.Bean;
 import org.springframework.context.annotation.Configuration;
 import org.springframework.security.authentication.AuthenticationManager;
@@ -14,12 +17,12 @@ import org.springframework.security.config.annotation.web.configuration.EnableWe
 import org.springframework.security.config.annotation.web.configuration.WebSecurityConfigurerAdapter;
 import org.springframework.security.config.http.SessionCreationPolicy;
 import org.springframework.security.crypto.bcrypt.BCryptPasswordEncoder;
-import org.springframework.security.crypto.password.PasswordEncoder;
 import org.springframework.security.web.authentication.UsernamePasswordAuthenticationFilter;
 import org.springframework.web.cors.CorsConfiguration;
 import org.springframework.web.cors.CorsConfigurationSource;
 import org.springframework.web.cors.UrlBasedCorsConfigurationSource;
 
+import java.time.Duration;
 import java.util.Arrays;
 
 @Configuration
@@ -32,6 +35,19 @@ public class WebSecurityConfig extends WebSecurityConfigurerAdapter {
     @Autowired
     private AuthEntryPointJwt unauthorizedHandler;
 
+    // 0 means one thread per available core
+    @Value("${app.password-hashing.threads:0}")
+    private int passwordHashingThreads;
+
+    @Value("${app.password-hashing.queue-capacity:100}")
+    private int passwordHashingQueueCapacity;
+
+    @Value("${app.password-hashing.max-queue-wait-ms:250}")
+    private long passwordHashingMaxQueueWaitMs;
+
+    @Value("${app.password-hashing.timeout-ms:5000}")
+    private long passwordHashingTimeoutMs;
+
     @Bean
     public AuthTokenFilter authenticationJwtTokenFilter() {
         return new AuthTokenFilter();
@@ -49,8 +65,12 @@ public class WebSecurityConfig extends WebSecurityConfigurerAdapter {
     }
 
     @Bean
-    public PasswordEncoder passwordEncoder() {
-        return new BCryptPasswordEncoder();
+    public BoundedPasswordEncoder passwordEncoder() {
+        int threads = passwordHashingThreads > 0
+                ? passwordHashingThreads
+                : Runtime.getRuntime().availableProcessors();
+        return new BoundedPasswordEncoder(new BCryptPasswordEncoder(), threads, passwordHashingQueueCapacity,
+                Duration.ofMillis(passwordHashingMaxQueueWaitMs), Duration.ofMillis(passwordHashingTimeoutMs));
     }
 
     @Override
@@ -79,7 +99,7 @@ public class WebSecurityConfig extends WebSecurityConfigurerAdapter {
         configuration.setAllowedMethods(Arrays.asList("GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"));
         configuration
                 .setAllowedHeaders(Arrays.asList("authorization", "content-type", "x-auth-token", "Origin", "Accept"));
-        configuration.setExposedHeaders(Arrays.asList("x-auth-token"));
+        configuration.setExposedHeaders(Arrays.asList("x-auth-token", DeckController.NEXT_OFFSET_HEADER));
         configuration.setAllowCredentials(true);
         UrlBasedCorsConfigurationSource source = new UrlBasedCorsConfigurationSource();
         source.registerCorsConfiguration("/**", configuration);
@@ -1,5 +1,6 @@
 package com.flashcardapp.controllers;
 
+import com.flashcardapp.models.EEmailType;
 import com.flashcardapp.models.ERole;
 import com.flashcardapp.models.Role;
 import com.flashcardapp.models.User;
@@ -16,18 +17,27 @@ import com.flashcardapp.payload.response.MessageResponse;
 import com.flashcardapp.repositories.RoleRepository;
 import com.flashcardapp.repositories.UserRepository;
 import com.flashcardapp.security.jwt.JwtUtils;
+import com.flashcardapp.security.services.PasswordHashingBusyException;
+import com.flashcardapp.security.services.PrincipalCache;
 import com.flashcardapp.security.services.UserDetailsImpl;
-import com.flashcardapp.services.EmailService;
+import com.flashcardapp.security.services.UserDetailsServiceImpl;
+import com.flashcardapp.services.AccountTokenService;
+import com.flashcardapp.services.EmailOutboxService;
+import com.flashcardapp.services.RefreshTokenService;
+import io.jsonwebtoken.Claims;
 import org.slf4j.Logger;
 import org.slf4j.LoggerFactory;
 import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.http.HttpHeaders;
 import org.springframework.http.HttpStatus;
 import org.springframework.http.ResponseEntity;
 import org.springframework.security.authentication.AuthenticationManager;
 import org.springframework.security.authentication.UsernamePasswordAuthenticationToken;
 import org.springframework.security.core.Authentication;
 import org.springframework.security.core.context.SecurityContextHolder;
+import org.springframework.security.core.userdetails.UsernameNotFoundException;
 import org.springframework.security.crypto.password.PasswordEncoder;
+import org.springframework.transaction.annotation.Transactional;
 import org.springframework.web.bind.annotation.*;
 
 import javax.validation.Valid;
@@ -36,6 +46,7 @@ import java.util.HashMap;
 import java.util.HashSet;
 import java.util.List;
 import java.util.Map;
+import java.util.Optional;
 import java.util.Set;
 import java.util.UUID;
 import java.util.stream.Collectors;
@@ -62,9 +73,22 @@ public class AuthController {
     JwtUtils jwtUtils;
 
     @Autowired
-    EmailService emailService;
+    EmailOutboxService emailOutboxService;
+
+    @Autowired
+    AccountTokenService accountTokenService;
+
+    @Autowired
+    RefreshTokenService refreshTokenService;
+
+    @Autowired
+    PrincipalCache principalCache;
+
+    @Autowired
+    UserDetailsServiceImpl userDetailsService;
 
     @PostMapping("/signup")
+    @Transactional
     public ResponseEntity<?> registerUser(@Valid @RequestBody SignupRequest signUpRequest) {
         if (userRepository.existsByUsername(signUpRequest.getUsername())) {
             return ResponseEntity
@@ -120,14 +144,8 @@ public class AuthController {
         user.setRoles(roles);
         User savedUser = userRepository.save(user);
 
-        // Send verification email
-        try {
-            emailService.sendVerificationEmail(savedUser.getEmail(), savedUser.getVerificationToken());
-            logger.info("Verification email sent to: {}", savedUser.getEmail());
-        } catch (Exception e) {
-            logger.error("Failed to send verification email: {}", e.getMessage());
-            // Continue execution even if email sending fails
-        }
+        // Queue the verification email; it is sent once the user row is committed
+        emailOutboxService.enqueue(EEmailType.VERIFICATION, savedUser.getEmail(), savedUser.getVerificationToken());
 
         Map<String, Object> response = new HashMap<>();
         response.put("message", "User registered successfully. Verification email has been sent.");
@@ -137,7 +155,8 @@ public class AuthController {
     }
 
     @PostMapping("/login")
-    public ResponseEntity<?> authenticateUser(@Valid @RequestBody LoginRequest loginRequest) {
+    public ResponseEntity<?> authenticateUser(@Valid @RequestBody LoginRequest loginRequest,
+            @RequestHeader(value = HttpHeaders.USER_AGENT, required = false) String userAgent) {
         Authentication authentication = authenticationManager.authenticate(
                 new UsernamePasswordAuthenticationToken(loginRequest.getUsername(), loginRequest.getPassword()));
 
@@ -157,7 +176,7 @@ public class AuthController {
         }
 
         String accessToken = jwtUtils.generateAccessToken(authentication);
-        String refreshToken = jwtUtils.generateRefreshToken(authentication);
+        String refreshToken = refreshTokenService.issue(userDetails, userAgent);
 
         List<String> roles = userDetails.getAuthorities().stream()
                 .map(item -> item.getAuthority())
@@ -221,19 +240,9 @@ public class AuthController {
                 return ResponseEntity.badRequest().body(new MessageResponse("Email is already verified"));
             }
 
-            // Generate new verification token
-            user.setVerificationToken(UUID.randomUUID().toString());
-            user.setVerificationTokenExpiry(LocalDateTime.now().plusDays(1));
-            userRepository.save(user);
-
-            // Send new verification email
-            try {
-                emailService.sendVerificationEmail(user.getEmail(), user.getVerificationToken());
-                logger.info("Verification email resent to: {}", user.getEmail());
-            } catch (Exception e) {
-                logger.error("Failed to resend verification email: {}", e.getMessage());
-                // Continue execution even if email sending fails
-            }
+            // New token and its email, committed together; a failure rolls
+            // both back before it reaches the catch below
+            accountTokenService.issueVerificationToken(user);
 
             return ResponseEntity.ok(new MessageResponse("Verification code resent"));
         } catch (Exception e) {
@@ -243,7 +252,8 @@ public class AuthController {
     }
 
     @PostMapping("/refresh")
-    public ResponseEntity<?> refreshToken(@Valid @RequestBody RefreshTokenRequest request) {
+    public ResponseEntity<?> refreshToken(@Valid @RequestBody RefreshTokenRequest request,
+            @RequestHeader(value = HttpHeaders.USER_AGENT, required = false) String userAgent) {
         String refreshToken = request.getRefreshToken();
 
         // Validate the refresh token
@@ -251,36 +261,35 @@ public class AuthController {
             return ResponseEntity.badRequest().body(new MessageResponse("Refresh token is required"));
         }
 
-        if (!jwtUtils.validateJwtToken(refreshToken)) {
+        Claims claims = jwtUtils.parseClaims(refreshToken).orElse(null);
+        if (claims == null || !JwtUtils.isRefreshToken(claims)) {
             return ResponseEntity.status(HttpStatus.UNAUTHORIZED).body(new MessageResponse("Invalid refresh token"));
         }
 
         try {
-            // Get username from refresh token
-            String username = jwtUtils.getUserNameFromJwtToken(refreshToken);
-
-            // Find the user directly instead of re-authenticating
-            User user = userRepository.findByUsername(username)
-                    .orElseThrow(() -> new RuntimeException("User not found"));
-
-            // Create the UserDetails object
-            UserDetailsImpl userDetails = UserDetailsImpl.build(user);
+            // Same cached principal AuthTokenFilter uses; no users+roles query
+            UserDetailsImpl userDetails = principalCache.get(claims.getSubject(),
+                    name -> (UserDetailsImpl) userDetailsService.loadUserByUsername(name));
+
+            // Consumes the presented token; a reused one revokes all sessions
+            Optional<String> newRefreshToken = refreshTokenService.rotate(claims, userDetails, userAgent);
+            if (newRefreshToken.isEmpty()) {
+                return ResponseEntity.status(HttpStatus.UNAUTHORIZED)
+                        .body(new MessageResponse("Invalid refresh token"));
+            }
 
-            // Create authentication token without password validation
             UsernamePasswordAuthenticationToken authentication = new UsernamePasswordAuthenticationToken(userDetails,
                     null, userDetails.getAuthorities());
-
-            // Set the authentication in the context
-            SecurityContextHolder.getContext().setAuthentication(authentication);
-
-            // Generate new access token
             String newAccessToken = jwtUtils.generateAccessToken(authentication);
 
             Map<String, Object> response = new HashMap<>();
             response.put("message", "Token refreshed successfully");
             response.put("accessToken", newAccessToken);
+            response.put("refreshToken", newRefreshToken.get());
 
             return ResponseEntity.ok(response);
+        } catch (UsernameNotFoundException e) {
+            return ResponseEntity.status(HttpStatus.UNAUTHORIZED).body(new MessageResponse("Invalid refresh token"));
         } catch (Exception e) {
             logger.error("Token refresh failed: {}", e.getMessage());
             return ResponseEntity.status(HttpStatus.INTERNAL_SERVER_ERROR)
@@ -290,25 +299,31 @@ public class AuthController {
 
     @PostMapping("/logout")
     public ResponseEntity<?> logout(@Valid @RequestBody LogoutRequest request) {
-        // In a production environment, you would invalidate the refresh token in a
-        // token store
-        // For this implementation, we'll simply return success
-        // TODO: Implement token invalidation logic with a token store
+        String refreshToken = request.getRefreshToken();
+        if (refreshToken == null || refreshToken.isEmpty()) {
+            return ResponseEntity.badRequest().body(new MessageResponse("Refresh token is required"));
+        }
+
+        // An invalid or already revoked token leaves nothing to log out of
+        jwtUtils.parseClaims(refreshToken)
+                .filter(JwtUtils::isRefreshToken)
+                .ifPresent(claims -> refreshTokenService.revoke(claims.getId()));
 
         return ResponseEntity.ok(new MessageResponse("Logout successful"));
     }
 
     @PostMapping("/logout-all")
     public ResponseEntity<?> logoutFromAllDevices() {
-        // This endpoint requires authentication, which should be handled by Spring
-        // Security
-        // Get the authenticated user
+        // /api/auth/** is open, so check for a token-authenticated user here
         Authentication authentication = SecurityContextHolder.getContext().getAuthentication();
+        if (authentication == null || !(authentication.getPrincipal() instanceof UserDetailsImpl)) {
+            return ResponseEntity.status(HttpStatus.UNAUTHORIZED)
+                    .body(new MessageResponse("Error: Unauthorized"));
+        }
         UserDetailsImpl userDetails = (UserDetailsImpl) authentication.getPrincipal();
 
-        // In a production environment, you would invalidate all refresh tokens for this
-        // user
-        // TODO: Implement token invalidation logic with a token store
+        // Revokes every refresh token and the access tokens issued so far
+        refreshTokenService.revokeAll(userDetails.getId());
 
         return ResponseEntity.ok(new MessageResponse("Logged out from all devices"));
     }
@@ -320,21 +335,9 @@ public class AuthController {
 
         if (request.getEmail() != null && !request.getEmail().isEmpty()) {
             try {
-                userRepository.findByEmail(request.getEmail()).ifPresent(user -> {
-                    // Generate reset token
-                    user.setResetPasswordToken(UUID.randomUUID().toString());
-                    user.setResetPasswordTokenExpiry(LocalDateTime.now().plusHours(24));
-                    userRepository.save(user);
-
-                    // Send password reset email
-                    try {
-                        emailService.sendPasswordResetEmail(user.getEmail(), user.getResetPasswordToken());
-                        logger.info("Password reset email sent to: {}", user.getEmail());
-                    } catch (Exception e) {
-                        logger.error("Failed to send password reset email: {}", e.getMessage());
-                        // Continue execution even if email sending fails
-                    }
-                });
+                // Reset token and its email, committed together
+                userRepository.findByEmail(request.getEmail())
+                        .ifPresent(accountTokenService::issuePasswordResetToken);
             } catch (Exception e) {
                 // Log the error but don't expose it to the user
                 logger.error("Error in forgot password flow: {}", e.getMessage());
@@ -367,6 +370,8 @@ public class AuthController {
             userRepository.save(user);
 
             return ResponseEntity.ok(new MessageResponse("Password reset successful"));
+        } catch (PasswordHashingBusyException e) {
+            throw e;
         } catch (Exception e) {
             return ResponseEntity.badRequest().body(new MessageResponse("Password reset failed"));
         }
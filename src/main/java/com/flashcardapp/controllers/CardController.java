@@ -1,13 +1,17 @@
 package com.flashcardapp.controllers;
 
 import com.flashcardapp.models.Card;
-import com.flashcardapp.models.Deck;
-import com.flashcardapp.models.User;
+import com.flashcardapp.payload.request.BatchCreateCardsRequest;
+import com.flashcardapp.payload.response.CardSearchHit;
 import com.flashcardapp.payload.response.MessageResponse;
 import com.flashcardapp.repositories.CardRepository;
 import com.flashcardapp.repositories.DeckRepository;
-import com.flashcardapp.repositories.UserRepository;
 import com.flashcardapp.security.services.UserDetailsImpl;
+import com.flashcardapp.services.CardBatchService;
+import com.flashcardapp.services.KeysetPaginationService;
+import com.flashcardapp.services.KeysetPaginationService.KeyType;
+import com.flashcardapp.services.KeysetPaginationService.KeysetPage;
+import com.flashcardapp.services.SearchService;
 import org.springframework.beans.factory.annotation.Autowired;
 import org.springframework.data.domain.Page;
 import org.springframework.data.domain.PageRequest;
@@ -38,24 +42,48 @@ public class CardController {
         private DeckRepository deckRepository;
 
         @Autowired
-        private UserRepository userRepository;
+        private CardBatchService cardBatchService;
 
+        @Autowired
+        private KeysetPaginationService keysetPaginationService;
+
+        @Autowired
+        private SearchService searchService;
+
+        // Sort keys accepted for card listings, each backed by a (deck_id, key, id) index
+        private static final Map<String, KeyType> CARD_SORT_KEYS = Map.of(
+                        "id", KeyType.LONG,
+                        "nextReviewDate", KeyType.DATE_TIME);
+
+        /**
+         * List the cards of a deck. Passing {@code limit} or {@code after}
+         * switches from page/size paging to cursor paging, which skips the
+         * COUNT unless {@code includeTotal} is set and costs the same on every page.
+         */
         @GetMapping("/decks/{deckId}/cards")
         @PreAuthorize("hasRole('USER') or hasRole('SUPERVISOR') or hasRole('ADMIN')")
         public ResponseEntity<?> getAllCardsByDeck(
                         @PathVariable Long deckId,
                         @RequestParam(defaultValue = "0") int page,
                         @RequestParam(defaultValue = "10") int size,
-                        @RequestParam(defaultValue = "id,asc") String[] sort) {
+                        @RequestParam(defaultValue = "id,asc") String[] sort,
+                        @RequestParam(required = false) String after,
+                        @RequestParam(required = false) Integer limit,
+                        @RequestParam(defaultValue = "false") boolean includeTotal) {
 
                 UserDetailsImpl userDetails = (UserDetailsImpl) SecurityContextHolder.getContext().getAuthentication()
                                 .getPrincipal();
-                User user = userRepository.findById(userDetails.getId())
-                                .orElseThrow(() -> new RuntimeException("User not found"));
 
-                Deck deck = deckRepository.findByIdAndUser(deckId, user)
-                                .orElseThrow(() -> new RuntimeException(
-                                                "Deck not found or you don't have access to this deck"));
+                if (after != null || limit != null) {
+                        return getCardsByCursor(deckId, userDetails.getId(), sort, after,
+                                        limit != null ? limit : size, includeTotal);
+                }
+
+                try {
+                        KeysetPaginationService.validateSort(sort, CARD_SORT_KEYS);
+                } catch (IllegalArgumentException e) {
+                        return ResponseEntity.badRequest().body(new MessageResponse(e.getMessage()));
+                }
 
                 String sortField = sort[0];
                 String sortDirection = sort.length > 1 ? sort[1] : "asc";
@@ -64,7 +92,7 @@ public class CardController {
                 Sort sortBy = Sort.by(direction, sortField);
                 Pageable pageable = PageRequest.of(page, size, sortBy);
 
-                Page<Card> cards = cardRepository.findByDeck(deck, pageable);
+                Page<Card> cards = findOwnedCards(deckId, userDetails.getId(), pageable);
 
                 Map<String, Object> response = new HashMap<>();
                 response.put("cards", cards.getContent());
@@ -75,6 +103,32 @@ public class CardController {
                 return ResponseEntity.ok(response);
         }
 
+        private ResponseEntity<?> getCardsByCursor(Long deckId, Long userId, String[] sort, String after, int limit,
+                        boolean includeTotal) {
+                String where = "e.deck.id = :deckId AND e.deck.user.id = :userId";
+                Map<String, Object> params = Map.of("deckId", deckId, "userId", userId);
+
+                KeysetPage<Card> cards;
+                try {
+                        cards = keysetPaginationService.fetch(Card.class, where, params, CARD_SORT_KEYS, sort, after,
+                                        limit);
+                } catch (IllegalArgumentException e) {
+                        return ResponseEntity.badRequest().body(new MessageResponse(e.getMessage()));
+                }
+                if (cards.getItems().isEmpty()) {
+                        requireOwnedDeck(deckId, userId);
+                }
+
+                Map<String, Object> response = new HashMap<>();
+                response.put("cards", cards.getItems());
+                response.put("nextCursor", cards.getNextCursor());
+                if (includeTotal) {
+                        response.put("totalItems", keysetPaginationService.count(Card.class, where, params));
+                }
+
+                return ResponseEntity.ok(response);
+        }
+
         /**
          * Get cards in a deck with simplified response to avoid chunked encoding issues
          */
@@ -89,15 +143,9 @@ public class CardController {
                         UserDetailsImpl userDetails = (UserDetailsImpl) SecurityContextHolder.getContext()
                                         .getAuthentication()
                                         .getPrincipal();
-                        User user = userRepository.findById(userDetails.getId())
-                                        .orElseThrow(() -> new RuntimeException("User not found"));
-
-                        Deck deck = deckRepository.findByIdAndUser(deckId, user)
-                                        .orElseThrow(() -> new RuntimeException(
-                                                        "Deck not found or you don't have access to this deck"));
 
                         Pageable pageable = PageRequest.of(page, size);
-                        Page<Card> cards = cardRepository.findByDeck(deck, pageable);
+                        Page<Card> cards = findOwnedCards(deckId, userDetails.getId(), pageable);
 
                         // Create a simplified response with just essential card data
                         List<Map<String, Object>> simplifiedCards = cards.getContent().stream()
@@ -130,15 +178,8 @@ public class CardController {
         public ResponseEntity<?> getCardById(@PathVariable Long deckId, @PathVariable Long id) {
                 UserDetailsImpl userDetails = (UserDetailsImpl) SecurityContextHolder.getContext().getAuthentication()
                                 .getPrincipal();
-                User user = userRepository.findById(userDetails.getId())
-                                .orElseThrow(() -> new RuntimeException("User not found"));
 
-                deckRepository.findByIdAndUser(deckId, user)
-                                .orElseThrow(() -> new RuntimeException(
-                                                "Deck not found or you don't have access to this deck"));
-
-                Card card = cardRepository.findByIdAndDeckId(id, deckId)
-                                .orElseThrow(() -> new RuntimeException("Card not found"));
+                Card card = findOwnedCard(deckId, id, userDetails.getId());
 
                 return ResponseEntity.ok(card);
         }
@@ -153,15 +194,8 @@ public class CardController {
                         UserDetailsImpl userDetails = (UserDetailsImpl) SecurityContextHolder.getContext()
                                         .getAuthentication()
                                         .getPrincipal();
-                        User user = userRepository.findById(userDetails.getId())
-                                        .orElseThrow(() -> new RuntimeException("User not found"));
-
-                        deckRepository.findByIdAndUser(deckId, user)
-                                        .orElseThrow(() -> new RuntimeException(
-                                                        "Deck not found or you don't have access to this deck"));
 
-                        Card card = cardRepository.findByIdAndDeckId(id, deckId)
-                                        .orElseThrow(() -> new RuntimeException("Card not found"));
+                        Card card = findOwnedCard(deckId, id, userDetails.getId());
 
                         // Create a simplified response with just essential card data
                         Map<String, Object> simplifiedCard = new HashMap<>();
@@ -188,18 +222,18 @@ public class CardController {
 
                 UserDetailsImpl userDetails = (UserDetailsImpl) SecurityContextHolder.getContext().getAuthentication()
                                 .getPrincipal();
-                User user = userRepository.findById(userDetails.getId())
-                                .orElseThrow(() -> new RuntimeException("User not found"));
-
-                Deck deck = deckRepository.findByIdAndUser(deckId, user)
-                                .orElseThrow(() -> new RuntimeException(
-                                                "Deck not found or you don't have access to this deck"));
 
                 LocalDateTime now = LocalDateTime.now();
 
                 Pageable pageable = PageRequest.of(0, limit);
-                List<Card> cards = cardRepository.findCardsForReview(deck, now, pageable);
-                Long totalCards = cardRepository.countCardsForReview(deck, now);
+                List<Card> cards = cardRepository.findCardsForReview(deckId, userDetails.getId(), now, pageable);
+                if (cards.isEmpty()) {
+                        requireOwnedDeck(deckId, userDetails.getId());
+                }
+                // A short page already holds every due card
+                Long totalCards = cards.size() < limit
+                                ? Long.valueOf(cards.size())
+                                : cardRepository.countCardsForReview(deckId, now);
 
                 Map<String, Object> response = new HashMap<>();
                 response.put("cards", cards);
@@ -208,24 +242,82 @@ public class CardController {
                 return ResponseEntity.ok(response);
         }
 
+        /**
+         * Cards in any of the user's decks whose front, back or notes contain
+         * every word of {@code q}, best match first. {@code nextOffset} is null
+         * on the last page.
+         */
+        @GetMapping("/cards/search")
+        @PreAuthorize("hasRole('USER') or hasRole('SUPERVISOR') or hasRole('ADMIN')")
+        public ResponseEntity<?> searchCards(
+                        @RequestParam String q,
+                        @RequestParam(defaultValue = "20") int limit,
+                        @RequestParam(defaultValue = "0") int offset) {
+
+                UserDetailsImpl userDetails = (UserDetailsImpl) SecurityContextHolder.getContext().getAuthentication()
+                                .getPrincipal();
+
+                int pageSize = Math.max(1, Math.min(limit, SearchService.MAX_LIMIT));
+                int start = Math.max(0, offset);
+                // One extra row tells whether another page follows
+                List<CardSearchHit> cards = searchService.searchCards(userDetails.getId(), q, pageSize + 1, start);
+
+                Integer nextOffset = null;
+                if (cards.size() > pageSize) {
+                        cards = cards.subList(0, pageSize);
+                        nextOffset = start + pageSize;
+                }
+
+                Map<String, Object> response = new HashMap<>();
+                response.put("cards", cards);
+                response.put("nextOffset", nextOffset);
+
+                return ResponseEntity.ok(response);
+        }
+
         @PostMapping("/decks/{deckId}/cards")
         @PreAuthorize("hasRole('USER') or hasRole('SUPERVISOR') or hasRole('ADMIN')")
         public ResponseEntity<?> createCard(@PathVariable Long deckId, @Valid @RequestBody Card card) {
                 UserDetailsImpl userDetails = (UserDetailsImpl) SecurityContextHolder.getContext().getAuthentication()
                                 .getPrincipal();
-                User user = userRepository.findById(userDetails.getId())
-                                .orElseThrow(() -> new RuntimeException("User not found"));
 
-                Deck deck = deckRepository.findByIdAndUser(deckId, user)
-                                .orElseThrow(() -> new RuntimeException(
-                                                "Deck not found or you don't have access to this deck"));
+                requireOwnedDeck(deckId, userDetails.getId());
 
-                card.setDeck(deck);
+                card.setDeck(deckRepository.getReferenceById(deckId));
+                card.setUserId(userDetails.getId());
                 Card savedCard = cardRepository.save(card);
 
                 return ResponseEntity.status(HttpStatus.CREATED).body(savedCard);
         }
 
+        /**
+         * Create many cards in one request. Ownership is checked once and the
+         * cards are inserted with JDBC batching; only their ids are returned.
+         */
+        @PostMapping("/decks/{deckId}/cards/batch")
+        @PreAuthorize("hasRole('USER') or hasRole('SUPERVISOR') or hasRole('ADMIN')")
+        public ResponseEntity<?> createCardsBatch(
+                        @PathVariable Long deckId,
+                        @Valid @RequestBody BatchCreateCardsRequest request) {
+                UserDetailsImpl userDetails = (UserDetailsImpl) SecurityContextHolder.getContext().getAuthentication()
+                                .getPrincipal();
+
+                if (!deckRepository.existsByIdAndUserId(deckId, userDetails.getId())) {
+                        return ResponseEntity.status(HttpStatus.NOT_FOUND)
+                                        .body(new MessageResponse(
+                                                        "Deck not found or you don't have access to this deck"));
+                }
+
+                List<Long> ids = cardBatchService.createCards(userDetails.getId(), deckId, request.getCards());
+
+                Map<String, Object> response = new HashMap<>();
+                response.put("deckId", deckId);
+                response.put("created", ids.size());
+                response.put("ids", ids);
+
+                return ResponseEntity.status(HttpStatus.CREATED).body(response);
+        }
+
         /**
          * Alternative card creation endpoint that returns a lightweight response
          * to avoid chunked encoding issues with some clients
@@ -237,14 +329,11 @@ public class CardController {
                         UserDetailsImpl userDetails = (UserDetailsImpl) SecurityContextHolder.getContext()
                                         .getAuthentication()
                                         .getPrincipal();
-                        User user = userRepository.findById(userDetails.getId())
-                                        .orElseThrow(() -> new RuntimeException("User not found"));
 
-                        Deck deck = deckRepository.findByIdAndUser(deckId, user)
-                                        .orElseThrow(() -> new RuntimeException(
-                                                        "Deck not found or you don't have access to this deck"));
+                        requireOwnedDeck(deckId, userDetails.getId());
 
-                        card.setDeck(deck);
+                        card.setDeck(deckRepository.getReferenceById(deckId));
+                        card.setUserId(userDetails.getId());
                         Card savedCard = cardRepository.save(card);
 
                         // Create a simplified response with just the essential fields
@@ -270,15 +359,8 @@ public class CardController {
                         @Valid @RequestBody Card cardDetails) {
                 UserDetailsImpl userDetails = (UserDetailsImpl) SecurityContextHolder.getContext().getAuthentication()
                                 .getPrincipal();
-                User user = userRepository.findById(userDetails.getId())
-                                .orElseThrow(() -> new RuntimeException("User not found"));
-
-                deckRepository.findByIdAndUser(deckId, user)
-                                .orElseThrow(() -> new RuntimeException(
-                                                "Deck not found or you don't have access to this deck"));
 
-                Card card = cardRepository.findByIdAndDeckId(id, deckId)
-                                .orElseThrow(() -> new RuntimeException("Card not found"));
+                Card card = findOwnedCard(deckId, id, userDetails.getId());
 
                 card.setFront(cardDetails.getFront());
                 card.setBack(cardDetails.getBack());
@@ -295,18 +377,36 @@ public class CardController {
         public ResponseEntity<?> deleteCard(@PathVariable Long deckId, @PathVariable Long id) {
                 UserDetailsImpl userDetails = (UserDetailsImpl) SecurityContextHolder.getContext().getAuthentication()
                                 .getPrincipal();
-                User user = userRepository.findById(userDetails.getId())
-                                .orElseThrow(() -> new RuntimeException("User not found"));
 
-                deckRepository.findByIdAndUser(deckId, user)
-                                .orElseThrow(() -> new RuntimeException(
-                                                "Deck not found or you don't have access to this deck"));
-
-                Card card = cardRepository.findByIdAndDeckId(id, deckId)
-                                .orElseThrow(() -> new RuntimeException("Card not found"));
+                Card card = findOwnedCard(deckId, id, userDetails.getId());
 
                 cardRepository.delete(card);
 
                 return ResponseEntity.ok(new MessageResponse("Card deleted successfully"));
         }
-}
\ No newline at end of file
+
+        private void requireOwnedDeck(Long deckId, Long userId) {
+                if (!deckRepository.existsByIdAndUserId(deckId, userId)) {
+                        throw new RuntimeException("Deck not found or you don't have access to this deck");
+                }
+        }
+
+        /**
+         * Page of cards in a deck owned by the user, in one query. An empty page
+         * is also what a foreign deck yields, so ownership is only checked then.
+         */
+        private Page<Card> findOwnedCards(Long deckId, Long userId, Pageable pageable) {
+                Page<Card> cards = cardRepository.findByDeckIdAndDeckUserId(deckId, userId, pageable);
+                if (cards.isEmpty()) {
+                        requireOwnedDeck(deckId, userId);
+                }
+                return cards;
+        }
+
+        private Card findOwnedCard(Long deckId, Long id, Long userId) {
+                return cardRepository.findByIdAndDeckIdAndDeckUserId(id, deckId, userId)
+                                .orElseThrow(() -> new RuntimeException(deckRepository.existsByIdAndUserId(deckId, userId)
+                                                ? "Card not found"
+                                                : "Deck not found or you don't have access to this deck"));
+        }
+}
@@ -3,22 +3,32 @@ package com.flashcardapp.controllers;
 import com.flashcardapp.models.Card;
 import com.flashcardapp.models.CardReview;
 import com.flashcardapp.models.StudySession;
-import com.flashcardapp.models.User;
+import com.flashcardapp.payload.request.BatchReviewRequest;
+import com.flashcardapp.payload.response.CardReviewItem;
+import com.flashcardapp.payload.response.CardReviewStats;
 import com.flashcardapp.payload.response.MessageResponse;
 import com.flashcardapp.repositories.CardRepository;
 import com.flashcardapp.repositories.CardReviewRepository;
 import com.flashcardapp.repositories.StudySessionRepository;
-import com.flashcardapp.repositories.UserRepository;
 import com.flashcardapp.security.services.UserDetailsImpl;
+import com.flashcardapp.services.ReviewBatchService;
+import com.flashcardapp.services.SpacedRepetitionScheduler;
+import com.flashcardapp.services.StudyStatsService;
+import com.flashcardapp.util.CursorCodec;
 import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.data.domain.PageRequest;
+import org.springframework.data.domain.Pageable;
 import org.springframework.http.HttpStatus;
 import org.springframework.http.ResponseEntity;
 import org.springframework.security.access.prepost.PreAuthorize;
 import org.springframework.security.core.context.SecurityContextHolder;
+import org.springframework.transaction.annotation.Transactional;
 import org.springframework.web.bind.annotation.*;
 
 import javax.validation.Valid;
 import java.time.LocalDateTime;
+import java.time.format.DateTimeParseException;
+import java.util.ArrayList;
 import java.util.HashMap;
 import java.util.List;
 import java.util.Map;
@@ -28,6 +38,8 @@ import java.util.Map;
 @RequestMapping("/api")
 public class CardReviewController {
 
+    static final int MAX_HISTORY_LIMIT = 100;
+
     @Autowired
     private CardReviewRepository cardReviewRepository;
 
@@ -38,24 +50,34 @@ public class CardReviewController {
     private StudySessionRepository studySessionRepository;
 
     @Autowired
-    private UserRepository userRepository;
+    private SpacedRepetitionScheduler scheduler;
+
+    @Autowired
+    private ReviewBatchService reviewBatchService;
+
+    @Autowired
+    private StudyStatsService studyStatsService;
 
+    /**
+     * Submit one review. The review, the card's new schedule and the daily
+     * rollup are saved in one transaction, so a failed request changes nothing
+     * and can be retried.
+     */
     @PostMapping("/study-sessions/{sessionId}/reviews")
     @PreAuthorize("hasRole('USER') or hasRole('SUPERVISOR') or hasRole('ADMIN')")
+    @Transactional
     public ResponseEntity<?> submitCardReview(
             @PathVariable String sessionId,
             @Valid @RequestBody CardReview reviewDetails) {
 
         UserDetailsImpl userDetails = (UserDetailsImpl) SecurityContextHolder.getContext().getAuthentication()
                 .getPrincipal();
-        User user = userRepository.findById(userDetails.getId())
-                .orElseThrow(() -> new RuntimeException("User not found"));
 
         StudySession studySession = studySessionRepository.findBySessionId(sessionId)
                 .orElseThrow(() -> new RuntimeException("Study session not found"));
 
         // Verify ownership
-        if (!studySession.getUser().getId().equals(user.getId())) {
+        if (!studySession.getUser().getId().equals(userDetails.getId())) {
             return ResponseEntity.status(HttpStatus.FORBIDDEN)
                     .body(new MessageResponse("You don't have access to this study session"));
         }
@@ -75,91 +97,141 @@ public class CardReviewController {
         cardReview.setStudySession(studySession);
         cardReview.setResult(reviewDetails.getResult());
         cardReview.setTimeSpentSeconds(reviewDetails.getTimeSpentSeconds());
-        cardReview.setPreviousDifficulty(card.getDifficulty());
-
-        // Calculate new difficulty based on review result (0 = incorrect, 1-5 for
-        // correct with varying difficulty)
-        int newDifficulty;
-        if (reviewDetails.getResult() == 0) {
-            // Incorrect answer increases difficulty
-            newDifficulty = Math.min(5, card.getDifficulty() + 2);
-        } else {
-            // Correct answer decreases difficulty depending on rating (1-5)
-            // Lower rating = higher difficulty
-            newDifficulty = Math.max(0, card.getDifficulty() - (reviewDetails.getResult() - 3));
-        }
-        cardReview.setNewDifficulty(newDifficulty);
-
-        // Calculate next review date based on the difficulty
-        LocalDateTime nextReview;
-        switch (newDifficulty) {
-            case 0:
-                nextReview = LocalDateTime.now().plusHours(6); // Easiest: review after 6 hours
-                break;
-            case 1:
-                nextReview = LocalDateTime.now().plusDays(1); // Review after 1 day
-                break;
-            case 2:
-                nextReview = LocalDateTime.now().plusDays(3); // Review after 3 days
-                break;
-            case 3:
-                nextReview = LocalDateTime.now().plusDays(7); // Review after 1 week
-                break;
-            case 4:
-                nextReview = LocalDateTime.now().plusDays(14); // Review after 2 weeks
-                break;
-            case 5:
-                nextReview = LocalDateTime.now().plusDays(30); // Hardest: review after 1 month
-                break;
-            default:
-                nextReview = LocalDateTime.now().plusDays(1); // Default: review after 1 day
-        }
-        cardReview.setNextReviewDate(nextReview);
+        boolean newCard = card.getReviewCount() == 0;
+        scheduler.apply(card, cardReview, LocalDateTime.now());
 
         // Save the review
         CardReview savedReview = cardReviewRepository.save(cardReview);
 
-        // Update the card's difficulty and next review date
-        card.setDifficulty(newDifficulty);
-        card.setNextReviewDate(nextReview);
-        card.setReviewCount(card.getReviewCount() + 1);
+        // Save the card's new difficulty and next review date
         cardRepository.save(card);
 
+        studyStatsService.record(userDetails.getId(), new StudyStatsService.Tally()
+                .addReview(savedReview.getReviewedAt(), savedReview.getResult(), savedReview.getTimeSpentSeconds(), newCard));
+
         return ResponseEntity.status(HttpStatus.CREATED).body(savedReview);
     }
 
-    @GetMapping("/cards/{cardId}/reviews")
+    /**
+     * Submit many reviews of one study session at once, e.g. a session that was
+     * studied offline. All reviews are applied in one transaction, or none are.
+     */
+    @PostMapping("/study-sessions/{sessionId}/reviews/batch")
     @PreAuthorize("hasRole('USER') or hasRole('SUPERVISOR') or hasRole('ADMIN')")
-    public ResponseEntity<?> getCardReviewHistory(@PathVariable Long cardId) {
+    public ResponseEntity<?> submitCardReviewsBatch(
+            @PathVariable String sessionId,
+            @Valid @RequestBody BatchReviewRequest request) {
+
         UserDetailsImpl userDetails = (UserDetailsImpl) SecurityContextHolder.getContext().getAuthentication()
                 .getPrincipal();
 
-        Card card = cardRepository.findById(cardId)
-                .orElseThrow(() -> new RuntimeException("Card not found"));
+        StudySession studySession = studySessionRepository.findBySessionId(sessionId).orElse(null);
+        if (studySession == null) {
+            return ResponseEntity.status(HttpStatus.NOT_FOUND)
+                    .body(new MessageResponse("Study session not found"));
+        }
 
-        // Verify ownership by checking if the card's deck belongs to the current user
-        if (!card.getDeck().getUser().getId().equals(userDetails.getId())) {
+        // Verify ownership
+        if (!studySession.getUser().getId().equals(userDetails.getId())) {
+            return ResponseEntity.status(HttpStatus.FORBIDDEN)
+                    .body(new MessageResponse("You don't have access to this study session"));
+        }
+
+        List<CardReview> reviews;
+        try {
+            reviews = reviewBatchService.submitReviews(studySession, request.getReviews());
+        } catch (IllegalArgumentException e) {
+            return ResponseEntity.badRequest().body(new MessageResponse(e.getMessage()));
+        }
+
+        List<Map<String, Object>> results = new ArrayList<>(reviews.size());
+        int correct = 0;
+        for (CardReview review : reviews) {
+            Map<String, Object> result = new HashMap<>();
+            result.put("id", review.getId());
+            result.put("cardId", review.getCard().getId());
+            result.put("result", review.getResult());
+            result.put("newDifficulty", review.getNewDifficulty());
+            result.put("nextReviewDate", review.getNextReviewDate());
+            results.add(result);
+            if (review.getResult() > 0) {
+                correct++;
+            }
+        }
+
+        Map<String, Object> response = new HashMap<>();
+        response.put("sessionId", sessionId);
+        response.put("submitted", reviews.size());
+        response.put("correct", correct);
+        response.put("reviews", results);
+
+        return ResponseEntity.status(HttpStatus.CREATED).body(response);
+    }
+
+    /**
+     * Review history of a card, newest first, with totals over all of its
+     * reviews. Pass the returned {@code nextCursor} back as {@code cursor} to
+     * get older reviews; it is null on the last page.
+     */
+    @GetMapping("/cards/{cardId}/reviews")
+    @PreAuthorize("hasRole('USER') or hasRole('SUPERVISOR') or hasRole('ADMIN')")
+    public ResponseEntity<?> getCardReviewHistory(
+            @PathVariable Long cardId,
+            @RequestParam(defaultValue = "20") int limit,
+            @RequestParam(required = false) String cursor) {
+        UserDetailsImpl userDetails = (UserDetailsImpl) SecurityContextHolder.getContext().getAuthentication()
+                .getPrincipal();
+
+        // Ownership is part of the lookup; only a miss needs a second query
+        if (!cardRepository.existsByIdAndDeckUserId(cardId, userDetails.getId())) {
+            if (!cardRepository.existsById(cardId)) {
+                throw new RuntimeException("Card not found");
+            }
             return ResponseEntity.status(HttpStatus.FORBIDDEN)
                     .body(new MessageResponse("You don't have access to this card"));
         }
 
-        List<CardReview> reviews = cardReviewRepository.findByCard(card);
+        int pageSize = Math.max(1, Math.min(limit, MAX_HISTORY_LIMIT));
+        // One extra row tells whether another page follows
+        Pageable pageable = PageRequest.of(0, pageSize + 1);
+
+        List<CardReviewItem> reviews;
+        if (cursor == null || cursor.isEmpty()) {
+            reviews = cardReviewRepository.findHistory(cardId, pageable);
+        } else {
+            LocalDateTime beforeDate;
+            Long beforeId;
+            try {
+                List<String> key = CursorCodec.decode(cursor, 2);
+                beforeDate = LocalDateTime.parse(key.get(0));
+                beforeId = Long.valueOf(key.get(1));
+            } catch (IllegalArgumentException | DateTimeParseException e) {
+                return ResponseEntity.badRequest().body(new MessageResponse("Invalid cursor"));
+            }
+            reviews = cardReviewRepository.findHistoryBefore(cardId, beforeDate, beforeId, pageable);
+        }
+
+        String nextCursor = null;
+        if (reviews.size() > pageSize) {
+            reviews = reviews.subList(0, pageSize);
+            CardReviewItem last = reviews.get(pageSize - 1);
+            nextCursor = CursorCodec.encode(last.getReviewedAt(), last.getId());
+        }
 
-        // Get statistics for the card
-        Long correctCount = cardReviewRepository.countCorrectReviews(card);
-        Long incorrectCount = cardReviewRepository.countIncorrectReviews(card);
-        Double averageTime = cardReviewRepository.getAverageTimeSpent(card);
+        CardReviewStats stats = cardReviewRepository.getStats(cardId);
+        long total = stats.getTotalReviews();
 
         Map<String, Object> response = new HashMap<>();
         response.put("cardId", cardId);
         response.put("reviews", reviews);
+        response.put("nextCursor", nextCursor);
         response.put("statistics", Map.of(
-                "totalReviews", reviews.size(),
-                "correctCount", correctCount,
-                "incorrectCount", incorrectCount,
-                "averageTimeSeconds", averageTime != null ? averageTime : 0,
-                "successRate", reviews.size() > 0 ? (double) correctCount / reviews.size() * 100 : 0));
+                "totalReviews", total,
+                "correctCount", stats.getCorrectCount(),
+                "incorrectCount", stats.getIncorrectCount(),
+                "averageTimeSeconds", stats.getAverageTimeSeconds() != null ? stats.getAverageTimeSeconds() : 0,
+                "successRate", total > 0 ? (double) stats.getCorrectCount() / total * 100 : 0));
 
         return ResponseEntity.ok(response);
     }
-}
\ No newline at end of file
+}
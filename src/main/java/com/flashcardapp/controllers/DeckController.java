@@ -1,42 +1,87 @@
 package com.flashcardapp.controllers;
 
 import com.flashcardapp.models.Deck;
-import com.flashcardapp.models.User;
+import com.flashcardapp.payload.response.DeckSummary;
 import com.flashcardapp.payload.response.MessageResponse;
 import com.flashcardapp.repositories.DeckRepository;
 import com.flashcardapp.repositories.UserRepository;
 import com.flashcardapp.security.services.UserDetailsImpl;
+import com.flashcardapp.services.DeckCsvService;
+import com.flashcardapp.services.DeckCsvService.ImportResult;
+import com.flashcardapp.services.SearchService;
 import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.http.HttpHeaders;
 import org.springframework.http.HttpStatus;
+import org.springframework.http.MediaType;
 import org.springframework.http.ResponseEntity;
 import org.springframework.security.access.prepost.PreAuthorize;
 import org.springframework.security.core.context.SecurityContextHolder;
 import org.springframework.web.bind.annotation.*;
+import org.springframework.web.multipart.MultipartFile;
+import org.springframework.web.servlet.mvc.method.annotation.StreamingResponseBody;
 
+import javax.servlet.http.HttpServletRequest;
 import javax.validation.Valid;
+import java.io.IOException;
+import java.io.InputStream;
+import java.io.InputStreamReader;
+import java.nio.charset.StandardCharsets;
 import java.time.LocalDateTime;
+import java.util.HashMap;
 import java.util.List;
+import java.util.Map;
 
 @CrossOrigin(origins = "*", maxAge = 3600)
 @RestController
 @RequestMapping("/api/decks")
 public class DeckController {
 
+    public static final String NEXT_OFFSET_HEADER = "X-Next-Offset";
+
     @Autowired
     private DeckRepository deckRepository;
 
     @Autowired
     private UserRepository userRepository;
 
+    @Autowired
+    private SearchService searchService;
+
+    @Autowired
+    private DeckCsvService deckCsvService;
+
+    /**
+     * All of the user's decks, or with {@code search} the decks whose name or
+     * description contain every word of it, best match first and paged with
+     * {@code limit} and {@code offset}. A search page that is not the last
+     * carries the offset of the next one in {@value #NEXT_OFFSET_HEADER}, the
+     * header counterpart of {@code nextOffset} in card search; the body stays
+     * a plain list like the unfiltered listing.
+     */
     @GetMapping
     @PreAuthorize("hasRole('USER') or hasRole('SUPERVISOR') or hasRole('ADMIN')")
-    public ResponseEntity<List<Deck>> getAllDecks() {
+    public ResponseEntity<List<DeckSummary>> getAllDecks(
+            @RequestParam(required = false) String search,
+            @RequestParam(defaultValue = "20") int limit,
+            @RequestParam(defaultValue = "0") int offset) {
         UserDetailsImpl userDetails = (UserDetailsImpl) SecurityContextHolder.getContext().getAuthentication()
                 .getPrincipal();
-        User user = userRepository.findById(userDetails.getId())
-                .orElseThrow(() -> new RuntimeException("User not found"));
 
-        List<Deck> decks = deckRepository.findByUser(user);
+        if (search != null && !search.isBlank()) {
+            int pageSize = Math.max(1, Math.min(limit, SearchService.MAX_LIMIT));
+            int start = Math.max(0, offset);
+            // One extra row tells whether another page follows
+            List<DeckSummary> decks = searchService.searchDecks(userDetails.getId(), search, pageSize + 1, start);
+            if (decks.size() <= pageSize) {
+                return ResponseEntity.ok(decks);
+            }
+            return ResponseEntity.ok()
+                    .header(NEXT_OFFSET_HEADER, String.valueOf(start + pageSize))
+                    .body(decks.subList(0, pageSize));
+        }
+
+        // Counts come from one aggregate query instead of loading each deck's cards
+        List<DeckSummary> decks = deckRepository.findSummariesByUserId(userDetails.getId(), LocalDateTime.now());
 
         return ResponseEntity.ok(decks);
     }
@@ -47,8 +92,7 @@ public class DeckController {
         UserDetailsImpl userDetails = (UserDetailsImpl) SecurityContextHolder.getContext().getAuthentication()
                 .getPrincipal();
 
-        Deck deck = deckRepository.findByIdAndUser(id,
-                userRepository.findById(userDetails.getId()).orElseThrow(() -> new RuntimeException("User not found")))
+        Deck deck = deckRepository.findByIdAndUserId(id, userDetails.getId())
                 .orElseThrow(() -> new RuntimeException("Deck not found"));
 
         return ResponseEntity.ok(deck);
@@ -59,10 +103,9 @@ public class DeckController {
     public ResponseEntity<?> createDeck(@Valid @RequestBody Deck deck) {
         UserDetailsImpl userDetails = (UserDetailsImpl) SecurityContextHolder.getContext().getAuthentication()
                 .getPrincipal();
-        User user = userRepository.findById(userDetails.getId())
-                .orElseThrow(() -> new RuntimeException("User not found"));
 
-        deck.setUser(user);
+        // Only the foreign key is needed; don't load the user row
+        deck.setUser(userRepository.getReferenceById(userDetails.getId()));
         deck.setCreatedAt(LocalDateTime.now());
         deck.setUpdatedAt(LocalDateTime.now());
 
@@ -76,10 +119,8 @@ public class DeckController {
     public ResponseEntity<?> updateDeck(@PathVariable Long id, @Valid @RequestBody Deck deckDetails) {
         UserDetailsImpl userDetails = (UserDetailsImpl) SecurityContextHolder.getContext().getAuthentication()
                 .getPrincipal();
-        User user = userRepository.findById(userDetails.getId())
-                .orElseThrow(() -> new RuntimeException("User not found"));
 
-        Deck deck = deckRepository.findByIdAndUser(id, user)
+        Deck deck = deckRepository.findByIdAndUserId(id, userDetails.getId())
                 .orElseThrow(() -> new RuntimeException("Deck not found or you don't have access to this deck"));
 
         deck.setName(deckDetails.getName());
@@ -96,10 +137,8 @@ public class DeckController {
     public ResponseEntity<?> deleteDeck(@PathVariable Long id) {
         UserDetailsImpl userDetails = (UserDetailsImpl) SecurityContextHolder.getContext().getAuthentication()
                 .getPrincipal();
-        User user = userRepository.findById(userDetails.getId())
-                .orElseThrow(() -> new RuntimeException("User not found"));
 
-        if (!deckRepository.existsByIdAndUser(id, user)) {
+        if (!deckRepository.existsByIdAndUserId(id, userDetails.getId())) {
             return ResponseEntity.badRequest()
                     .body(new MessageResponse("Deck not found or you don't have access to this deck"));
         }
@@ -108,4 +147,74 @@ public class DeckController {
 
         return ResponseEntity.ok(new MessageResponse("Deck deleted successfully"));
     }
-}
\ No newline at end of file
+
+    /**
+     * Import cards from a CSV file uploaded as the multipart part "file"
+     * (subject to the multipart size limit).
+     */
+    @PostMapping(value = "/{id}/import", consumes = MediaType.MULTIPART_FORM_DATA_VALUE)
+    @PreAuthorize("hasRole('USER') or hasRole('SUPERVISOR') or hasRole('ADMIN')")
+    public ResponseEntity<?> importCards(@PathVariable Long id, @RequestParam("file") MultipartFile file)
+            throws IOException {
+        return importCsv(id, file.getInputStream());
+    }
+
+    /**
+     * Import cards from a CSV request body, read as it arrives so the upload
+     * size is not limited by the multipart settings.
+     */
+    @PostMapping(value = "/{id}/import", consumes = { "text/csv", MediaType.TEXT_PLAIN_VALUE,
+            MediaType.APPLICATION_OCTET_STREAM_VALUE })
+    @PreAuthorize("hasRole('USER') or hasRole('SUPERVISOR') or hasRole('ADMIN')")
+    public ResponseEntity<?> importCardsStream(@PathVariable Long id, HttpServletRequest request)
+            throws IOException {
+        return importCsv(id, request.getInputStream());
+    }
+
+    private ResponseEntity<?> importCsv(Long deckId, InputStream csv) throws IOException {
+        UserDetailsImpl userDetails = (UserDetailsImpl) SecurityContextHolder.getContext().getAuthentication()
+                .getPrincipal();
+
+        if (!deckRepository.existsByIdAndUserId(deckId, userDetails.getId())) {
+            return ResponseEntity.status(HttpStatus.NOT_FOUND)
+                    .body(new MessageResponse("Deck not found or you don't have access to this deck"));
+        }
+
+        ImportResult result;
+        try {
+            result = deckCsvService.importCards(userDetails.getId(), deckId, new InputStreamReader(csv, StandardCharsets.UTF_8));
+        } catch (IllegalArgumentException e) {
+            return ResponseEntity.badRequest().body(new MessageResponse(e.getMessage()));
+        }
+
+        Map<String, Object> response = new HashMap<>();
+        response.put("deckId", deckId);
+        response.put("imported", result.getImported());
+        response.put("skipped", result.getSkipped());
+        response.put("errors", result.getErrors());
+
+        return ResponseEntity.status(HttpStatus.CREATED).body(response);
+    }
+
+    /**
+     * The deck's cards as CSV (front,back,notes), streamed from the database
+     * as they are read.
+     */
+    @GetMapping("/{id}/export")
+    @PreAuthorize("hasRole('USER') or hasRole('SUPERVISOR') or hasRole('ADMIN')")
+    public ResponseEntity<StreamingResponseBody> exportCards(@PathVariable Long id) {
+        UserDetailsImpl userDetails = (UserDetailsImpl) SecurityContextHolder.getContext().getAuthentication()
+                .getPrincipal();
+
+        if (!deckRepository.existsByIdAndUserId(id, userDetails.getId())) {
+            // No body: the response type is fixed to the CSV stream
+            return ResponseEntity.status(HttpStatus.NOT_FOUND).build();
+        }
+
+        StreamingResponseBody body = out -> deckCsvService.exportCards(id, out);
+        return ResponseEntity.ok()
+                .contentType(new MediaType("text", "csv", StandardCharsets.UTF_8))
+                .header(HttpHeaders.CONTENT_DISPOSITION, "attachment; filename=\"deck-" + id + ".csv\"")
+                .body(body);
+    }
+}
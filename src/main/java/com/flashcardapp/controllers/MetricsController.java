@@ -0,0 +1,43 @@
+package com.flashcardapp.controllers;
+
+import com.flashcardapp.security.services.BoundedPasswordEncoder;
+import com.flashcardapp.security.services.PrincipalCache;
+import com.flashcardapp.services.EmailOutboxService;
+import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.http.ResponseEntity;
+import org.springframework.security.access.prepost.PreAuthorize;
+import org.springframework.web.bind.annotation.CrossOrigin;
+import org.springframework.web.bind.annotation.GetMapping;
+import org.springframework.web.bind.annotation.RequestMapping;
+import org.springframework.web.bind.annotation.RestController;
+
+import java.util.LinkedHashMap;
+import java.util.Map;
+
+/**
+ * Controller exposing in-process counters for operators.
+ */
+@CrossOrigin(origins = "*", maxAge = 3600)
+@RestController
+@RequestMapping("/api/metrics")
+public class MetricsController {
+
+    @Autowired
+    private PrincipalCache principalCache;
+
+    @Autowired
+    private EmailOutboxService emailOutboxService;
+
+    @Autowired
+    private BoundedPasswordEncoder passwordEncoder;
+
+    @GetMapping
+    @PreAuthorize("hasRole('ADMIN')")
+    public ResponseEntity<?> getMetrics() {
+        Map<String, Object> response = new LinkedHashMap<>();
+        response.put("principalCache", principalCache.stats());
+        response.put("emailOutbox", emailOutboxService.stats());
+        response.put("passwordHashing", passwordEncoder.stats());
+        return ResponseEntity.ok(response);
+    }
+}
@@ -0,0 +1,45 @@
+package com.flashcardapp.controllers;
+
+import com.flashcardapp.payload.response.MessageResponse;
+import com.flashcardapp.security.services.PasswordHashingBusyException;
+import org.springframework.beans.factory.annotation.Value;
+import org.springframework.http.HttpHeaders;
+import org.springframework.http.HttpStatus;
+import org.springframework.http.ResponseEntity;
+import org.springframework.security.authentication.InternalAuthenticationServiceException;
+import org.springframework.web.bind.annotation.ExceptionHandler;
+import org.springframework.web.bind.annotation.RestControllerAdvice;
+
+/**
+ * Turns a saturated password-hashing pool into 503 with Retry-After, so
+ * clients back off instead of waiting on a queue that is already full.
+ */
+@RestControllerAdvice
+public class PasswordHashingExceptionHandler {
+
+    @Value("${app.password-hashing.retry-after-seconds:1}")
+    private long retryAfterSeconds;
+
+    @ExceptionHandler(PasswordHashingBusyException.class)
+    public ResponseEntity<MessageResponse> handleBusy(PasswordHashingBusyException e) {
+        return ResponseEntity.status(HttpStatus.SERVICE_UNAVAILABLE)
+                .header(HttpHeaders.RETRY_AFTER, String.valueOf(retryAfterSeconds))
+                .body(new MessageResponse("Error: Server is busy, please retry shortly"));
+    }
+
+    /**
+     * AuthenticationManager wraps exceptions thrown while loading the user.
+     * DaoAuthenticationProvider's own password checks, including the dummy
+     * one for unknown usernames, let the busy exception through unwrapped,
+     * but a UserDetailsService or provider that hashes while loading would
+     * arrive here.
+     */
+    @ExceptionHandler(InternalAuthenticationServiceException.class)
+    public ResponseEntity<MessageResponse> handleAuthenticationFailure(InternalAuthenticationServiceException e) {
+        if (e.getCause() instanceof PasswordHashingBusyException) {
+            return handleBusy((PasswordHashingBusyException) e.getCause());
+        }
+        return ResponseEntity.status(HttpStatus.UNAUTHORIZED)
+                .body(new MessageResponse("Error: Unauthorized"));
+    }
+}
@@ -0,0 +1,92 @@
+package com.flashcardapp.controllers;
+
+import com.flashcardapp.payload.response.MessageResponse;
+import com.flashcardapp.payload.response.ReviewQueueItem;
+import com.flashcardapp.repositories.CardRepository;
+import com.flashcardapp.security.services.UserDetailsImpl;
+import com.flashcardapp.util.CursorCodec;
+import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.data.domain.PageRequest;
+import org.springframework.data.domain.Pageable;
+import org.springframework.http.ResponseEntity;
+import org.springframework.security.access.prepost.PreAuthorize;
+import org.springframework.security.core.context.SecurityContextHolder;
+import org.springframework.web.bind.annotation.*;
+
+import java.time.LocalDateTime;
+import java.time.format.DateTimeParseException;
+import java.util.HashMap;
+import java.util.List;
+import java.util.Map;
+
+/**
+ * Cards due for review across all of the user's decks.
+ */
+@CrossOrigin(origins = "*", maxAge = 3600)
+@RestController
+@RequestMapping("/api/review-queue")
+public class ReviewQueueController {
+
+    static final int MAX_LIMIT = 100;
+    static final int TOTAL_CAP = 1000;
+
+    @Autowired
+    private CardRepository cardRepository;
+
+    /**
+     * Due cards ordered by next review date, then id. Pass the returned
+     * {@code nextCursor} back as {@code cursor} to continue; it is null on the
+     * last page. With {@code includeTotal=true} the response also counts the
+     * due cards, up to {@value #TOTAL_CAP}.
+     */
+    @GetMapping
+    @PreAuthorize("hasRole('USER') or hasRole('SUPERVISOR') or hasRole('ADMIN')")
+    public ResponseEntity<?> getReviewQueue(
+            @RequestParam(defaultValue = "20") int limit,
+            @RequestParam(required = false) String cursor,
+            @RequestParam(defaultValue = "false") boolean includeTotal) {
+
+        UserDetailsImpl userDetails = (UserDetailsImpl) SecurityContextHolder.getContext().getAuthentication()
+                .getPrincipal();
+
+        int pageSize = Math.max(1, Math.min(limit, MAX_LIMIT));
+        // One extra row tells whether another page follows
+        Pageable pageable = PageRequest.of(0, pageSize + 1);
+        LocalDateTime now = LocalDateTime.now();
+
+        List<ReviewQueueItem> cards;
+        if (cursor == null || cursor.isEmpty()) {
+            cards = cardRepository.findReviewQueue(userDetails.getId(), now, pageable);
+        } else {
+            LocalDateTime afterDate;
+            Long afterId;
+            try {
+                List<String> key = CursorCodec.decode(cursor, 2);
+                afterDate = LocalDateTime.parse(key.get(0));
+                afterId = Long.valueOf(key.get(1));
+            } catch (IllegalArgumentException | DateTimeParseException e) {
+                return ResponseEntity.badRequest().body(new MessageResponse("Invalid cursor"));
+            }
+            cards = cardRepository.findReviewQueueAfter(userDetails.getId(), now, afterDate, afterId, pageable);
+        }
+
+        String nextCursor = null;
+        if (cards.size() > pageSize) {
+            cards = cards.subList(0, pageSize);
+            ReviewQueueItem last = cards.get(pageSize - 1);
+            nextCursor = CursorCodec.encode(last.getNextReviewDate(), last.getId());
+        }
+
+        Map<String, Object> response = new HashMap<>();
+        response.put("cards", cards);
+        response.put("nextCursor", nextCursor);
+        if (includeTotal) {
+            long total = cardRepository.countReviewQueueCapped(userDetails.getId(), now, TOTAL_CAP);
+            response.put("total", total);
+            // At the cap the real queue may be longer
+            response.put("totalIsLowerBound", total >= TOTAL_CAP);
+        }
+
+        return ResponseEntity.ok(response);
+    }
+}
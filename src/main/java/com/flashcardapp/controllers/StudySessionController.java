@@ -2,12 +2,15 @@ package com.flashcardapp.controllers;
 
 import com.flashcardapp.models.Deck;
 import com.flashcardapp.models.StudySession;
-import com.flashcardapp.models.User;
 import com.flashcardapp.payload.response.MessageResponse;
 import com.flashcardapp.repositories.DeckRepository;
 import com.flashcardapp.repositories.StudySessionRepository;
 import com.flashcardapp.repositories.UserRepository;
 import com.flashcardapp.security.services.UserDetailsImpl;
+import com.flashcardapp.services.KeysetPaginationService;
+import com.flashcardapp.services.KeysetPaginationService.KeyType;
+import com.flashcardapp.services.KeysetPaginationService.KeysetPage;
+import com.flashcardapp.services.StudyStatsService;
 import org.springframework.beans.factory.annotation.Autowired;
 import org.springframework.data.domain.Page;
 import org.springframework.data.domain.PageRequest;
@@ -17,6 +20,7 @@ import org.springframework.http.HttpStatus;
 import org.springframework.http.ResponseEntity;
 import org.springframework.security.access.prepost.PreAuthorize;
 import org.springframework.security.core.context.SecurityContextHolder;
+import org.springframework.transaction.annotation.Transactional;
 import org.springframework.web.bind.annotation.*;
 
 import javax.validation.Valid;
@@ -39,17 +43,61 @@ public class StudySessionController {
     @Autowired
     private UserRepository userRepository;
 
+    @Autowired
+    private KeysetPaginationService keysetPaginationService;
+
+    @Autowired
+    private StudyStatsService studyStatsService;
+
+    // Sort keys accepted for session listings, each backed by a (user_id, key, id) index
+    private static final Map<String, KeyType> SESSION_SORT_KEYS = Map.of(
+            "id", KeyType.LONG,
+            "startedAt", KeyType.DATE_TIME);
+
+    /**
+     * List the user's study sessions. Passing {@code limit} or {@code after}
+     * switches from page/size paging to cursor paging, which skips the COUNT
+     * unless {@code includeTotal} is set and costs the same on every page.
+     */
     @GetMapping("/study-sessions")
     @PreAuthorize("hasRole('USER') or hasRole('SUPERVISOR') or hasRole('ADMIN')")
     public ResponseEntity<?> getAllStudySessions(
             @RequestParam(defaultValue = "0") int page,
             @RequestParam(defaultValue = "10") int size,
-            @RequestParam(defaultValue = "startedAt,desc") String[] sort) {
+            @RequestParam(defaultValue = "startedAt,desc") String[] sort,
+            @RequestParam(required = false) String after,
+            @RequestParam(required = false) Integer limit,
+            @RequestParam(defaultValue = "false") boolean includeTotal) {
 
         UserDetailsImpl userDetails = (UserDetailsImpl) SecurityContextHolder.getContext().getAuthentication()
                 .getPrincipal();
-        User user = userRepository.findById(userDetails.getId())
-                .orElseThrow(() -> new RuntimeException("User not found"));
+
+        if (after != null || limit != null) {
+            String where = "e.user.id = :userId";
+            Map<String, Object> params = Map.of("userId", userDetails.getId());
+
+            KeysetPage<StudySession> sessions;
+            try {
+                sessions = keysetPaginationService.fetch(StudySession.class, where, params, SESSION_SORT_KEYS, sort,
+                        after, limit != null ? limit : size);
+            } catch (IllegalArgumentException e) {
+                return ResponseEntity.badRequest().body(new MessageResponse(e.getMessage()));
+            }
+
+            Map<String, Object> response = new HashMap<>();
+            response.put("sessions", sessions.getItems());
+            response.put("nextCursor", sessions.getNextCursor());
+            if (includeTotal) {
+                response.put("totalItems", keysetPaginationService.count(StudySession.class, where, params));
+            }
+            return ResponseEntity.ok(response);
+        }
+
+        try {
+            KeysetPaginationService.validateSort(sort, SESSION_SORT_KEYS);
+        } catch (IllegalArgumentException e) {
+            return ResponseEntity.badRequest().body(new MessageResponse(e.getMessage()));
+        }
 
         String sortField = sort[0];
         String sortDirection = sort.length > 1 ? sort[1] : "desc";
@@ -57,7 +105,7 @@ public class StudySessionController {
         Sort sortBy = Sort.by(direction, sortField);
         Pageable pageable = PageRequest.of(page, size, sortBy);
 
-        Page<StudySession> sessions = studySessionRepository.findByUser(user, pageable);
+        Page<StudySession> sessions = studySessionRepository.findByUserId(userDetails.getId(), pageable);
 
         Map<String, Object> response = new HashMap<>();
         response.put("sessions", sessions.getContent());
@@ -91,15 +139,13 @@ public class StudySessionController {
     public ResponseEntity<?> startStudySession(@PathVariable Long deckId) {
         UserDetailsImpl userDetails = (UserDetailsImpl) SecurityContextHolder.getContext().getAuthentication()
                 .getPrincipal();
-        User user = userRepository.findById(userDetails.getId())
-                .orElseThrow(() -> new RuntimeException("User not found"));
 
-        Deck deck = deckRepository.findByIdAndUser(deckId, user)
+        Deck deck = deckRepository.findByIdAndUserId(deckId, userDetails.getId())
                 .orElseThrow(() -> new RuntimeException("Deck not found or you don't have access to this deck"));
 
         // Create a new study session
         StudySession studySession = StudySession.builder()
-                .user(user)
+                .user(userRepository.getReferenceById(userDetails.getId()))
                 .deck(deck)
                 .build();
 
@@ -114,24 +160,25 @@ public class StudySessionController {
 
     @PutMapping("/study-sessions/{sessionId}/complete")
     @PreAuthorize("hasRole('USER') or hasRole('SUPERVISOR') or hasRole('ADMIN')")
+    @Transactional
     public ResponseEntity<?> completeStudySession(
             @PathVariable String sessionId,
             @Valid @RequestBody StudySession sessionDetails) {
 
         UserDetailsImpl userDetails = (UserDetailsImpl) SecurityContextHolder.getContext().getAuthentication()
                 .getPrincipal();
-        User user = userRepository.findById(userDetails.getId())
-                .orElseThrow(() -> new RuntimeException("User not found"));
 
         StudySession studySession = studySessionRepository.findBySessionId(sessionId)
                 .orElseThrow(() -> new RuntimeException("Study session not found"));
 
         // Verify ownership
-        if (!studySession.getUser().getId().equals(user.getId())) {
+        if (!studySession.getUser().getId().equals(userDetails.getId())) {
             return ResponseEntity.status(HttpStatus.FORBIDDEN)
                     .body(new MessageResponse("You don't have access to this study session"));
         }
 
+        boolean alreadyCompleted = studySession.getCompletedAt() != null;
+
         // Update session details
         studySession.setCardsReviewed(sessionDetails.getCardsReviewed());
         studySession.setCorrectResponses(sessionDetails.getCorrectResponses());
@@ -141,9 +188,19 @@ public class StudySessionController {
 
         StudySession updatedSession = studySessionRepository.save(studySession);
 
+        // Completing a session again only updates its details
+        if (!alreadyCompleted) {
+            studyStatsService.record(userDetails.getId(),
+                    new StudyStatsService.Tally().addCompletedSession(updatedSession.getCompletedAt()));
+        }
+
         return ResponseEntity.ok(updatedSession);
     }
 
+    /**
+     * Activity statistics for the last {@code days} days (today included),
+     * read from the daily rollups.
+     */
     @GetMapping("/stats/study-activity")
     @PreAuthorize("hasRole('USER') or hasRole('SUPERVISOR') or hasRole('ADMIN')")
     public ResponseEntity<?> getStudyActivity(
@@ -151,20 +208,12 @@ public class StudySessionController {
 
         UserDetailsImpl userDetails = (UserDetailsImpl) SecurityContextHolder.getContext().getAuthentication()
                 .getPrincipal();
-        User user = userRepository.findById(userDetails.getId())
-                .orElseThrow(() -> new RuntimeException("User not found"));
-
-        LocalDateTime startDate = LocalDateTime.now().minusDays(days);
 
-        // Get user's recent study activity
-        long completedSessions = studySessionRepository.countCompletedSessionsSince(user, startDate);
-
-        Map<String, Object> stats = new HashMap<>();
-        stats.put("period", days + " days");
-        stats.put("completedSessions", completedSessions);
-
-        // TODO: Add more detailed statistics if needed
+        if (days < 1 || days > StudyStatsService.MAX_DAYS) {
+            return ResponseEntity.badRequest().body(
+                    new MessageResponse("days must be between 1 and " + StudyStatsService.MAX_DAYS));
+        }
 
-        return ResponseEntity.ok(stats);
+        return ResponseEntity.ok(studyStatsService.getActivity(userDetails.getId(), days));
     }
-}
\ No newline at end of file
+}
@@ -1,5 +1,6 @@
 package com.flashcardapp.models;
 
+import com.fasterxml.jackson.annotation.JsonIgnore;
 import lombok.AllArgsConstructor;
 import lombok.Builder;
 import lombok.Data;
@@ -10,20 +11,37 @@ import javax.validation.constraints.NotBlank;
 import java.time.LocalDateTime;
 
 @Entity
-@Table(name = "cards")
+// Due-card queries and card listings filter by deck (or, for the review queue
+// across decks, by owner) and walk next_review_date or id in order; id is
+// included so keyset pagination resolves ties from the index
+@Table(name = "cards", indexes = {
+        @Index(name = "idx_cards_user_next_review", columnList = "user_id, next_review_date, id"),
+        @Index(name = "idx_cards_deck_next_review", columnList = "deck_id, next_review_date, id"),
+        @Index(name = "idx_cards_deck_id", columnList = "deck_id, id")
+})
 @Data
 @NoArgsConstructor
 @AllArgsConstructor
 @Builder
 public class Card {
+    // A pooled sequence (rather than IDENTITY) lets Hibernate batch inserts
     @Id
-    @GeneratedValue(strategy = GenerationType.IDENTITY)
+    @GeneratedValue(strategy = GenerationType.SEQUENCE, generator = "cards_seq")
+    @SequenceGenerator(name = "cards_seq", sequenceName = "cards_seq", allocationSize = 50)
     private Long id;
 
+    @JsonIgnore
     @ManyToOne(fetch = FetchType.LAZY)
     @JoinColumn(name = "deck_id", nullable = false)
     private Deck deck;
 
+    // The deck owner's id, copied so per-user queries read one index instead
+    // of one range per deck. Nullable only so existing tables can gain the
+    // column; DbInitializer fills it in.
+    @JsonIgnore
+    @Column(name = "user_id")
+    private Long userId;
+
     @NotBlank
     @Column(columnDefinition = "TEXT")
     private String front;
@@ -56,6 +74,9 @@ public class Card {
         difficulty = 0;
         reviewCount = 0;
         nextReviewDate = LocalDateTime.now();
+        if (userId == null && deck != null) {
+            userId = deck.getUser().getId();
+        }
     }
 
     @PreUpdate
@@ -9,14 +9,19 @@ import javax.persistence.*;
 import java.time.LocalDateTime;
 
 @Entity
-@Table(name = "card_reviews")
+// A card's review history is read newest first and paged by (reviewed_at, id)
+@Table(name = "card_reviews", indexes = {
+        @Index(name = "idx_card_reviews_card_reviewed", columnList = "card_id, reviewed_at, id")
+})
 @Data
 @NoArgsConstructor
 @AllArgsConstructor
 @Builder
 public class CardReview {
+    // A pooled sequence (rather than IDENTITY) lets Hibernate batch inserts
     @Id
-    @GeneratedValue(strategy = GenerationType.IDENTITY)
+    @GeneratedValue(strategy = GenerationType.SEQUENCE, generator = "card_reviews_seq")
+    @SequenceGenerator(name = "card_reviews_seq", sequenceName = "card_reviews_seq", allocationSize = 50)
     private Long id;
 
     @ManyToOne(fetch = FetchType.LAZY)
@@ -43,6 +48,9 @@ public class CardReview {
 
     @PrePersist
     protected void onCreate() {
-        reviewedAt = LocalDateTime.now();
+        // Batch uploads carry the time the card was answered offline
+        if (reviewedAt == null) {
+            reviewedAt = LocalDateTime.now();
+        }
     }
 }
\ No newline at end of file
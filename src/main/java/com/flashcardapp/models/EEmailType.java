@@ -0,0 +1,6 @@
+package com.flashcardapp.models;
+
+public enum EEmailType {
+    VERIFICATION,
+    PASSWORD_RESET
+}
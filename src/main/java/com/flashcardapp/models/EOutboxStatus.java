@@ -0,0 +1,7 @@
+package com.flashcardapp.models;
+
+public enum EOutboxStatus {
+    PENDING,
+    SENT,
+    FAILED
+}
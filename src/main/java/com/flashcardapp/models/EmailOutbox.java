@@ -0,0 +1,69 @@
+package com.flashcardapp.models;
+
+import lombok.AllArgsConstructor;
+import lombok.Builder;
+import lombok.Data;
+import lombok.NoArgsConstructor;
+
+import javax.persistence.*;
+import java.time.LocalDateTime;
+
+/**
+ * An email waiting to be sent. Rows are written in the same transaction as
+ * the change that calls for the email and sent later by
+ * {@link com.flashcardapp.services.EmailOutboxService}; the message body is
+ * rendered at send time from the type and token.
+ */
+@Entity
+// The dispatcher reads pending rows in next_attempt_at order
+@Table(name = "email_outbox", indexes = {
+        @Index(name = "idx_email_outbox_status_next_attempt", columnList = "status, next_attempt_at, id")
+})
+@Data
+@NoArgsConstructor
+@AllArgsConstructor
+@Builder
+public class EmailOutbox {
+    @Id
+    @GeneratedValue(strategy = GenerationType.IDENTITY)
+    private Long id;
+
+    @Enumerated(EnumType.STRING)
+    @Column(length = 20, nullable = false)
+    private EEmailType type;
+
+    @Column(nullable = false)
+    private String recipient;
+
+    @Column(nullable = false)
+    private String token;
+
+    @Enumerated(EnumType.STRING)
+    @Column(length = 20, nullable = false)
+    private EOutboxStatus status;
+
+    private int attempts;
+
+    @Column(name = "next_attempt_at", nullable = false)
+    private LocalDateTime nextAttemptAt;
+
+    @Column(length = 1000)
+    private String lastError;
+
+    @Column(name = "created_at")
+    private LocalDateTime createdAt;
+
+    @Column(name = "sent_at")
+    private LocalDateTime sentAt;
+
+    @PrePersist
+    protected void onCreate() {
+        createdAt = LocalDateTime.now();
+        if (status == null) {
+            status = EOutboxStatus.PENDING;
+        }
+        if (nextAttemptAt == null) {
+            nextAttemptAt = createdAt;
+        }
+    }
+}
@@ -0,0 +1,52 @@
+package com.flashcardapp.models;
+
+import lombok.AllArgsConstructor;
+import lombok.Builder;
+import lombok.Data;
+import lombok.NoArgsConstructor;
+
+import javax.persistence.*;
+import java.time.LocalDateTime;
+
+/**
+ * An issued refresh token, identified by the SHA-256 hash of its JWT id so
+ * the stored rows cannot be turned back into usable tokens. A token is used
+ * once: refreshing revokes it and issues a new one.
+ */
+@Entity
+@Table(name = "refresh_tokens", indexes = {
+        @Index(name = "uk_refresh_tokens_hash", columnList = "token_hash", unique = true),
+        @Index(name = "idx_refresh_tokens_user", columnList = "user_id")
+})
+@Data
+@NoArgsConstructor
+@AllArgsConstructor
+@Builder
+public class RefreshToken {
+    @Id
+    @GeneratedValue(strategy = GenerationType.IDENTITY)
+    private Long id;
+
+    @Column(name = "token_hash", length = 64, nullable = false)
+    private String tokenHash;
+
+    @Column(name = "user_id", nullable = false)
+    private Long userId;
+
+    // Client that logged in, from its User-Agent
+    private String device;
+
+    @Column(name = "created_at")
+    private LocalDateTime createdAt;
+
+    @Column(name = "expires_at", nullable = false)
+    private LocalDateTime expiresAt;
+
+    @Column(name = "revoked_at")
+    private LocalDateTime revokedAt;
+
+    @PrePersist
+    protected void onCreate() {
+        createdAt = LocalDateTime.now();
+    }
+}
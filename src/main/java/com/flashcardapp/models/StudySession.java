@@ -1,5 +1,7 @@
 package com.flashcardapp.models;
 
+import com.fasterxml.jackson.annotation.JsonIgnore;
+import com.fasterxml.jackson.annotation.JsonIgnoreProperties;
 import lombok.AllArgsConstructor;
 import lombok.Builder;
 import lombok.Data;
@@ -12,7 +14,11 @@ import java.util.List;
 import java.util.UUID;
 
 @Entity
-@Table(name = "study_sessions")
+// Session listings page by (started_at, id) or id within one user
+@Table(name = "study_sessions", indexes = {
+        @Index(name = "idx_study_sessions_user_started", columnList = "user_id, started_at, id"),
+        @Index(name = "idx_study_sessions_user_id", columnList = "user_id, id")
+})
 @Data
 @NoArgsConstructor
 @AllArgsConstructor
@@ -25,14 +31,18 @@ public class StudySession {
     @Column(nullable = false, unique = true)
     private String sessionId;
 
+    @JsonIgnore
     @ManyToOne(fetch = FetchType.LAZY)
     @JoinColumn(name = "user_id", nullable = false)
     private User user;
 
+    // Listings serialize the deck's own columns only, not its lazy cards
+    @JsonIgnoreProperties({"hibernateLazyInitializer", "handler", "cards", "cardCount"})
     @ManyToOne(fetch = FetchType.LAZY)
     @JoinColumn(name = "deck_id", nullable = false)
     private Deck deck;
 
+    @JsonIgnore
     @OneToMany(mappedBy = "studySession", cascade = CascadeType.ALL)
     private List<CardReview> cardReviews = new ArrayList<>();
 
@@ -0,0 +1,34 @@
+package com.flashcardapp.models;
+
+import lombok.AllArgsConstructor;
+import lombok.Builder;
+import lombok.Data;
+import lombok.NoArgsConstructor;
+
+import javax.persistence.*;
+import java.time.LocalDateTime;
+
+/**
+ * Time of a user's last "log out from all devices". Access tokens issued
+ * before it are rejected until they expire on their own.
+ */
+@Entity
+@Table(name = "token_revocations", indexes = {
+        @Index(name = "uk_token_revocations_user", columnList = "user_id", unique = true),
+        @Index(name = "idx_token_revocations_revoked_before", columnList = "revoked_before")
+})
+@Data
+@NoArgsConstructor
+@AllArgsConstructor
+@Builder
+public class TokenRevocation {
+    @Id
+    @GeneratedValue(strategy = GenerationType.IDENTITY)
+    private Long id;
+
+    @Column(name = "user_id", nullable = false)
+    private Long userId;
+
+    @Column(name = "revoked_before", nullable = false)
+    private LocalDateTime revokedBefore;
+}
@@ -1,5 +1,6 @@
 package com.flashcardapp.models;
 
+import com.flashcardapp.security.services.UserCacheEvictionListener;
 import lombok.AllArgsConstructor;
 import lombok.Builder;
 import lombok.Data;
@@ -14,6 +15,7 @@ import java.util.HashSet;
 import java.util.Set;
 
 @Entity
+@EntityListeners(UserCacheEvictionListener.class)
 @Table(name = "users", uniqueConstraints = {
         @UniqueConstraint(columnNames = "username"),
         @UniqueConstraint(columnNames = "email")
@@ -0,0 +1,55 @@
+package com.flashcardapp.models;
+
+import lombok.AllArgsConstructor;
+import lombok.Builder;
+import lombok.Data;
+import lombok.NoArgsConstructor;
+
+import javax.persistence.*;
+import java.time.LocalDate;
+
+/**
+ * One user's study totals for one day, kept up to date as reviews are
+ * submitted and sessions completed. Activity statistics read a range of these
+ * rows instead of the underlying reviews. The user is stored as a plain id so
+ * the counters can be created and incremented without loading the user.
+ */
+@Entity
+// The unique key doubles as the index for per-user date range scans
+@Table(name = "user_daily_stats", uniqueConstraints = {
+        @UniqueConstraint(name = "uk_user_daily_stats_user_date", columnNames = { "user_id", "stat_date" })
+})
+@Data
+@NoArgsConstructor
+@AllArgsConstructor
+@Builder
+public class UserDailyStats {
+    @Id
+    @GeneratedValue(strategy = GenerationType.IDENTITY)
+    private Long id;
+
+    @Column(name = "user_id", nullable = false)
+    private Long userId;
+
+    @Column(name = "stat_date", nullable = false)
+    private LocalDate statDate;
+
+    @Column(nullable = false)
+    private Integer reviews;
+
+    @Column(nullable = false)
+    private Integer correctResponses;
+
+    @Column(nullable = false)
+    private Integer incorrectResponses;
+
+    @Column(nullable = false)
+    private Integer timeSpentSeconds;
+
+    // Reviews that were the first review of their card
+    @Column(nullable = false)
+    private Integer newCards;
+
+    @Column(nullable = false)
+    private Integer sessionsCompleted;
+}
@@ -0,0 +1,30 @@
+package com.flashcardapp.payload.request;
+
+import lombok.Data;
+
+import javax.validation.Valid;
+import javax.validation.constraints.NotBlank;
+import javax.validation.constraints.NotEmpty;
+import javax.validation.constraints.Size;
+import java.util.List;
+
+@Data
+public class BatchCreateCardsRequest {
+    public static final int MAX_CARDS = 1000;
+
+    @NotEmpty
+    @Size(max = MAX_CARDS)
+    @Valid
+    private List<CardItem> cards;
+
+    @Data
+    public static class CardItem {
+        @NotBlank
+        private String front;
+
+        @NotBlank
+        private String back;
+
+        private String notes;
+    }
+}
@@ -0,0 +1,39 @@
+package com.flashcardapp.payload.request;
+
+import lombok.Data;
+
+import javax.validation.Valid;
+import javax.validation.constraints.Max;
+import javax.validation.constraints.Min;
+import javax.validation.constraints.NotEmpty;
+import javax.validation.constraints.NotNull;
+import javax.validation.constraints.Size;
+import java.time.LocalDateTime;
+import java.util.List;
+
+@Data
+public class BatchReviewRequest {
+    public static final int MAX_REVIEWS = 500;
+
+    @NotEmpty
+    @Size(max = MAX_REVIEWS)
+    @Valid
+    private List<ReviewItem> reviews;
+
+    @Data
+    public static class ReviewItem {
+        @NotNull
+        private Long cardId;
+
+        @NotNull
+        @Min(0)
+        @Max(5)
+        private Integer result;
+
+        @Min(0)
+        private Integer timeSpentSeconds;
+
+        // When the card was answered, for clients that review offline
+        private LocalDateTime reviewedAt;
+    }
+}
@@ -0,0 +1,23 @@
+package com.flashcardapp.payload.response;
+
+import lombok.AllArgsConstructor;
+import lombok.Data;
+
+import java.time.LocalDateTime;
+
+/**
+ * One entry of a card's review history, projected from the query so no
+ * CardReview, Card or StudySession entities are loaded.
+ */
+@Data
+@AllArgsConstructor
+public class CardReviewItem {
+    private Long id;
+    private String sessionId;
+    private Integer result;
+    private Integer timeSpentSeconds;
+    private Integer previousDifficulty;
+    private Integer newDifficulty;
+    private LocalDateTime nextReviewDate;
+    private LocalDateTime reviewedAt;
+}
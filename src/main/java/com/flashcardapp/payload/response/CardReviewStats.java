@@ -0,0 +1,17 @@
+package com.flashcardapp.payload.response;
+
+import lombok.AllArgsConstructor;
+import lombok.Data;
+
+/**
+ * Review totals of one card, computed by a single aggregate query.
+ */
+@Data
+@AllArgsConstructor
+public class CardReviewStats {
+    private Long totalReviews;
+    private Long correctCount;
+    private Long incorrectCount;
+    // Null when the card has no reviews
+    private Double averageTimeSeconds;
+}
@@ -0,0 +1,20 @@
+package com.flashcardapp.payload.response;
+
+import lombok.AllArgsConstructor;
+import lombok.Data;
+
+/**
+ * A card matching a full-text search, with its deck and its rank among the
+ * results (higher is better).
+ */
+@Data
+@AllArgsConstructor
+public class CardSearchHit {
+    private Long id;
+    private Long deckId;
+    private String deckName;
+    private String front;
+    private String back;
+    private String notes;
+    private double rank;
+}
@@ -0,0 +1,23 @@
+package com.flashcardapp.payload.response;
+
+import lombok.AllArgsConstructor;
+import lombok.Data;
+
+import java.time.LocalDateTime;
+
+/**
+ * One row of the deck listing, built directly by a JPQL constructor
+ * expression so no Deck or Card entities are loaded.
+ */
+@Data
+@AllArgsConstructor
+public class DeckSummary {
+    private Long id;
+    private String name;
+    private String description;
+    private Long cardCount;
+    private Long dueCount;
+    private LocalDateTime lastStudied;
+    private LocalDateTime createdAt;
+    private LocalDateTime updatedAt;
+}
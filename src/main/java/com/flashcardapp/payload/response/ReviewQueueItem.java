@@ -0,0 +1,24 @@
+package com.flashcardapp.payload.response;
+
+import lombok.AllArgsConstructor;
+import lombok.Data;
+
+import java.time.LocalDateTime;
+
+/**
+ * A due card in the cross-deck review queue, projected straight from the
+ * query so neither Card nor Deck entities are loaded.
+ */
+@Data
+@AllArgsConstructor
+public class ReviewQueueItem {
+    private Long id;
+    private Long deckId;
+    private String deckName;
+    private String front;
+    private String back;
+    private String notes;
+    private Integer difficulty;
+    private LocalDateTime nextReviewDate;
+    private Integer reviewCount;
+}
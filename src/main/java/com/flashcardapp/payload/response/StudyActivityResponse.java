@@ -0,0 +1,45 @@
+package com.flashcardapp.payload.response;
+
+import lombok.AllArgsConstructor;
+import lombok.Data;
+import lombok.NoArgsConstructor;
+
+import java.time.LocalDate;
+import java.util.ArrayList;
+import java.util.List;
+
+/**
+ * Study statistics for a window of days, summed from the daily rollups.
+ */
+@Data
+@NoArgsConstructor
+public class StudyActivityResponse {
+    private String period;
+    private LocalDate from;
+    private LocalDate to;
+    private long completedSessions;
+    private long totalCardsStudied;
+    private long correctResponses;
+    private long incorrectResponses;
+    private double averageCorrectPercentage;
+    private long totalTimeSpentSeconds;
+    private long totalTimeSpentMinutes;
+    private long newCards;
+    private int activeDays;
+    private int currentStreak;
+    private int longestStreak;
+    // Days with any activity, oldest first
+    private List<DailyActivity> daily = new ArrayList<>();
+
+    @Data
+    @AllArgsConstructor
+    public static class DailyActivity {
+        private LocalDate date;
+        private int reviews;
+        private int correctResponses;
+        private int incorrectResponses;
+        private int timeSpentSeconds;
+        private int newCards;
+        private int sessionsCompleted;
+    }
+}
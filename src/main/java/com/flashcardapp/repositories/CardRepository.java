@@ -2,6 +2,7 @@ package com.flashcardapp.repositories;
 
 import com.flashcardapp.models.Card;
 import com.flashcardapp.models.Deck;
+import com.flashcardapp.payload.response.ReviewQueueItem;
 import org.springframework.data.domain.Page;
 import org.springframework.data.domain.Pageable;
 import org.springframework.data.jpa.repository.JpaRepository;
@@ -10,6 +11,7 @@ import org.springframework.data.repository.query.Param;
 import org.springframework.stereotype.Repository;
 
 import java.time.LocalDateTime;
+import java.util.Collection;
 import java.util.List;
 import java.util.Optional;
 
@@ -17,13 +19,59 @@ import java.util.Optional;
 public interface CardRepository extends JpaRepository<Card, Long> {
     List<Card> findByDeck(Deck deck);
 
-    Page<Card> findByDeck(Deck deck, Pageable pageable);
-
     Optional<Card> findByIdAndDeckId(Long id, Long deckId);
 
-    @Query("SELECT c FROM Card c WHERE c.deck = :deck AND c.nextReviewDate <= :now ORDER BY c.nextReviewDate ASC")
-    List<Card> findCardsForReview(@Param("deck") Deck deck, @Param("now") LocalDateTime now, Pageable pageable);
+    // Card in a deck owned by the user, checked in the same query
+    Optional<Card> findByIdAndDeckIdAndDeckUserId(Long id, Long deckId, Long userId);
+
+    Optional<Card> findByIdAndDeckUserId(Long id, Long userId);
+
+    boolean existsByIdAndDeckUserId(Long id, Long userId);
+
+    Page<Card> findByDeckIdAndDeckUserId(Long deckId, Long userId, Pageable pageable);
+
+    List<Card> findByIdInAndDeckId(Collection<Long> ids, Long deckId);
+
+    @Query("SELECT c FROM Card c WHERE c.deck.id = :deckId AND c.deck.user.id = :userId AND c.nextReviewDate <= :now "
+            + "ORDER BY c.nextReviewDate ASC")
+    List<Card> findCardsForReview(@Param("deckId") Long deckId, @Param("userId") Long userId,
+            @Param("now") LocalDateTime now, Pageable pageable);
+
+    @Query("SELECT COUNT(c) FROM Card c WHERE c.deck.id = :deckId AND c.nextReviewDate <= :now")
+    Long countCardsForReview(@Param("deckId") Long deckId, @Param("now") LocalDateTime now);
+
+    /**
+     * First page of the cards due across all of a user's decks, oldest due
+     * first. The rows are read in order from idx_cards_user_next_review and
+     * the scan stops at the page size, however many cards are due.
+     */
+    @Query("SELECT new com.flashcardapp.payload.response.ReviewQueueItem("
+            + "c.id, d.id, d.name, c.front, c.back, c.notes, c.difficulty, c.nextReviewDate, c.reviewCount) "
+            + "FROM Card c JOIN c.deck d "
+            + "WHERE c.userId = :userId AND c.nextReviewDate <= :now "
+            + "ORDER BY c.nextReviewDate ASC, c.id ASC")
+    List<ReviewQueueItem> findReviewQueue(@Param("userId") Long userId, @Param("now") LocalDateTime now,
+            Pageable pageable);
+
+    /**
+     * Page of the review queue after the (nextReviewDate, id) keyset of the last
+     * row already returned. Unlike an OFFSET, the cost does not grow with depth.
+     */
+    @Query("SELECT new com.flashcardapp.payload.response.ReviewQueueItem("
+            + "c.id, d.id, d.name, c.front, c.back, c.notes, c.difficulty, c.nextReviewDate, c.reviewCount) "
+            + "FROM Card c JOIN c.deck d "
+            + "WHERE c.userId = :userId AND c.nextReviewDate <= :now "
+            + "AND (c.nextReviewDate > :afterDate OR (c.nextReviewDate = :afterDate AND c.id > :afterId)) "
+            + "ORDER BY c.nextReviewDate ASC, c.id ASC")
+    List<ReviewQueueItem> findReviewQueueAfter(@Param("userId") Long userId, @Param("now") LocalDateTime now,
+            @Param("afterDate") LocalDateTime afterDate, @Param("afterId") Long afterId, Pageable pageable);
 
-    @Query("SELECT COUNT(c) FROM Card c WHERE c.deck = :deck AND c.nextReviewDate <= :now")
-    Long countCardsForReview(@Param("deck") Deck deck, @Param("now") LocalDateTime now);
-}
\ No newline at end of file
+    /**
+     * Number of due cards across the user's decks, counting at most
+     * {@code cap} rows so the cost stays bounded for very large queues.
+     */
+    @Query(value = "SELECT COUNT(*) FROM (SELECT 1 FROM cards c "
+            + "WHERE c.user_id = :userId AND c.next_review_date <= :now LIMIT :cap) due", nativeQuery = true)
+    long countReviewQueueCapped(@Param("userId") Long userId, @Param("now") LocalDateTime now,
+            @Param("cap") int cap);
+}
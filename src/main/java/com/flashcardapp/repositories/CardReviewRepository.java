@@ -1,8 +1,9 @@
 package com.flashcardapp.repositories;
 
-import com.flashcardapp.models.Card;
 import com.flashcardapp.models.CardReview;
 import com.flashcardapp.models.StudySession;
+import com.flashcardapp.payload.response.CardReviewItem;
+import com.flashcardapp.payload.response.CardReviewStats;
 import org.springframework.data.domain.Pageable;
 import org.springframework.data.jpa.repository.JpaRepository;
 import org.springframework.data.jpa.repository.Query;
@@ -14,22 +15,38 @@ import java.util.List;
 
 @Repository
 public interface CardReviewRepository extends JpaRepository<CardReview, Long> {
-    List<CardReview> findByCard(Card card);
-
     List<CardReview> findByStudySession(StudySession studySession);
 
-    @Query("SELECT cr FROM CardReview cr WHERE cr.card = :card ORDER BY cr.reviewedAt DESC")
-    List<CardReview> findRecentReviews(@Param("card") Card card, Pageable pageable);
-
-    @Query("SELECT COUNT(cr) FROM CardReview cr WHERE cr.card = :card AND cr.result > 0")
-    Long countCorrectReviews(@Param("card") Card card);
-
-    @Query("SELECT COUNT(cr) FROM CardReview cr WHERE cr.card = :card AND cr.result = 0")
-    Long countIncorrectReviews(@Param("card") Card card);
-
-    @Query("SELECT AVG(cr.timeSpentSeconds) FROM CardReview cr WHERE cr.card = :card")
-    Double getAverageTimeSpent(@Param("card") Card card);
-
-    @Query("SELECT cr FROM CardReview cr WHERE cr.card.deck.user.id = :userId AND cr.reviewedAt >= :startDate")
-    List<CardReview> findUserReviewsInPeriod(@Param("userId") Long userId, @Param("startDate") LocalDateTime startDate);
+    /**
+     * Newest reviews of a card first; ties on reviewedAt are ordered by id.
+     */
+    @Query("SELECT new com.flashcardapp.payload.response.CardReviewItem("
+            + "cr.id, s.sessionId, cr.result, cr.timeSpentSeconds, cr.previousDifficulty, cr.newDifficulty, "
+            + "cr.nextReviewDate, cr.reviewedAt) "
+            + "FROM CardReview cr JOIN cr.studySession s "
+            + "WHERE cr.card.id = :cardId "
+            + "ORDER BY cr.reviewedAt DESC, cr.id DESC")
+    List<CardReviewItem> findHistory(@Param("cardId") Long cardId, Pageable pageable);
+
+    /**
+     * Page of a card's history after the (reviewedAt, id) keyset of the last
+     * review already returned.
+     */
+    @Query("SELECT new com.flashcardapp.payload.response.CardReviewItem("
+            + "cr.id, s.sessionId, cr.result, cr.timeSpentSeconds, cr.previousDifficulty, cr.newDifficulty, "
+            + "cr.nextReviewDate, cr.reviewedAt) "
+            + "FROM CardReview cr JOIN cr.studySession s "
+            + "WHERE cr.card.id = :cardId "
+            + "AND (cr.reviewedAt < :beforeDate OR (cr.reviewedAt = :beforeDate AND cr.id < :beforeId)) "
+            + "ORDER BY cr.reviewedAt DESC, cr.id DESC")
+    List<CardReviewItem> findHistoryBefore(@Param("cardId") Long cardId,
+            @Param("beforeDate") LocalDateTime beforeDate, @Param("beforeId") Long beforeId, Pageable pageable);
+
+    @Query("SELECT new com.flashcardapp.payload.response.CardReviewStats("
+            + "COUNT(cr), "
+            + "COALESCE(SUM(CASE WHEN cr.result > 0 THEN 1 ELSE 0 END), 0), "
+            + "COALESCE(SUM(CASE WHEN cr.result = 0 THEN 1 ELSE 0 END), 0), "
+            + "AVG(cr.timeSpentSeconds)) "
+            + "FROM CardReview cr WHERE cr.card.id = :cardId")
+    CardReviewStats getStats(@Param("cardId") Long cardId);
 }
@@ -2,9 +2,14 @@ package com.flashcardapp.repositories;
 
 import com.flashcardapp.models.Deck;
 import com.flashcardapp.models.User;
+import com.flashcardapp.payload.response.DeckSummary;
 import org.springframework.data.jpa.repository.JpaRepository;
+import org.springframework.data.jpa.repository.Query;
+import org.springframework.data.repository.query.Param;
 import org.springframework.stereotype.Repository;
 
+import java.time.LocalDateTime;
+import java.util.Collection;
 import java.util.List;
 import java.util.Optional;
 
@@ -15,4 +20,36 @@ public interface DeckRepository extends JpaRepository<Deck, Long> {
     Optional<Deck> findByIdAndUser(Long id, User user);
 
     boolean existsByIdAndUser(Long id, User user);
-}
\ No newline at end of file
+
+    Optional<Deck> findByIdAndUserId(Long id, Long userId);
+
+    boolean existsByIdAndUserId(Long id, Long userId);
+
+    /**
+     * Every deck of the user with its card and due-card counts, in one
+     * grouped query.
+     */
+    @Query("SELECT new com.flashcardapp.payload.response.DeckSummary("
+            + "d.id, d.name, d.description, COUNT(c.id), "
+            + "COALESCE(SUM(CASE WHEN c.nextReviewDate <= :now THEN 1 ELSE 0 END), 0), "
+            + "d.lastStudied, d.createdAt, d.updatedAt) "
+            + "FROM Deck d LEFT JOIN d.cards c "
+            + "WHERE d.user.id = :userId "
+            + "GROUP BY d.id, d.name, d.description, d.lastStudied, d.createdAt, d.updatedAt "
+            + "ORDER BY d.id")
+    List<DeckSummary> findSummariesByUserId(@Param("userId") Long userId, @Param("now") LocalDateTime now);
+
+    /**
+     * Summaries of the given decks of the user, e.g. one page of search
+     * results; the caller restores the order it needs.
+     */
+    @Query("SELECT new com.flashcardapp.payload.response.DeckSummary("
+            + "d.id, d.name, d.description, COUNT(c.id), "
+            + "COALESCE(SUM(CASE WHEN c.nextReviewDate <= :now THEN 1 ELSE 0 END), 0), "
+            + "d.lastStudied, d.createdAt, d.updatedAt) "
+            + "FROM Deck d LEFT JOIN d.cards c "
+            + "WHERE d.user.id = :userId AND d.id IN :ids "
+            + "GROUP BY d.id, d.name, d.description, d.lastStudied, d.createdAt, d.updatedAt")
+    List<DeckSummary> findSummariesByUserIdAndIdIn(@Param("userId") Long userId, @Param("ids") Collection<Long> ids,
+            @Param("now") LocalDateTime now);
+}
@@ -0,0 +1,45 @@
+package com.flashcardapp.repositories;
+
+import com.flashcardapp.models.EOutboxStatus;
+import com.flashcardapp.models.EmailOutbox;
+import org.springframework.data.domain.Pageable;
+import org.springframework.data.jpa.repository.JpaRepository;
+import org.springframework.data.jpa.repository.Lock;
+import org.springframework.data.jpa.repository.Modifying;
+import org.springframework.data.jpa.repository.Query;
+import org.springframework.data.jpa.repository.QueryHints;
+import org.springframework.data.repository.query.Param;
+import org.springframework.stereotype.Repository;
+
+import javax.persistence.LockModeType;
+import javax.persistence.QueryHint;
+import java.time.LocalDateTime;
+import java.util.List;
+
+@Repository
+public interface EmailOutboxRepository extends JpaRepository<EmailOutbox, Long> {
+
+    /**
+     * Pending emails whose next attempt is due, oldest first, locked for the
+     * calling transaction. Rows another dispatcher has locked are skipped
+     * (lock timeout -2 is Hibernate's SKIP LOCKED) where the database supports it.
+     */
+    @Lock(LockModeType.PESSIMISTIC_WRITE)
+    @QueryHints(@QueryHint(name = "javax.persistence.lock.timeout", value = "-2"))
+    @Query("SELECT e FROM EmailOutbox e WHERE e.status = com.flashcardapp.models.EOutboxStatus.PENDING "
+            + "AND e.nextAttemptAt <= :now ORDER BY e.nextAttemptAt ASC, e.id ASC")
+    List<EmailOutbox> findDueForUpdate(@Param("now") LocalDateTime now, Pageable pageable);
+
+    long countByStatus(EOutboxStatus status);
+
+    long countByStatusAndNextAttemptAtLessThanEqual(EOutboxStatus status, LocalDateTime time);
+
+    /**
+     * Delete sent and failed emails created before {@code before}; their
+     * tokens are no longer needed once the email is finished with.
+     */
+    @Modifying
+    @Query("DELETE FROM EmailOutbox e WHERE e.status <> com.flashcardapp.models.EOutboxStatus.PENDING "
+            + "AND e.createdAt < :before")
+    int deleteFinishedBefore(@Param("before") LocalDateTime before);
+}
@@ -0,0 +1,38 @@
+package com.flashcardapp.repositories;
+
+import com.flashcardapp.models.RefreshToken;
+import org.springframework.data.jpa.repository.JpaRepository;
+import org.springframework.data.jpa.repository.Modifying;
+import org.springframework.data.jpa.repository.Query;
+import org.springframework.data.repository.query.Param;
+import org.springframework.stereotype.Repository;
+
+import java.time.LocalDateTime;
+
+@Repository
+public interface RefreshTokenRepository extends JpaRepository<RefreshToken, Long> {
+
+    boolean existsByTokenHashAndRevokedAtIsNotNull(String tokenHash);
+
+    /**
+     * Revoke one live token of the user; returns 0 if it is unknown, already
+     * revoked or expired, so of two concurrent uses only one succeeds.
+     */
+    @Modifying
+    @Query("UPDATE RefreshToken t SET t.revokedAt = :now WHERE t.tokenHash = :tokenHash "
+            + "AND t.userId = :userId AND t.revokedAt IS NULL AND t.expiresAt > :now")
+    int revokeLive(@Param("tokenHash") String tokenHash, @Param("userId") Long userId,
+            @Param("now") LocalDateTime now);
+
+    @Modifying
+    @Query("UPDATE RefreshToken t SET t.revokedAt = :now WHERE t.tokenHash = :tokenHash AND t.revokedAt IS NULL")
+    int revokeByTokenHash(@Param("tokenHash") String tokenHash, @Param("now") LocalDateTime now);
+
+    @Modifying
+    @Query("UPDATE RefreshToken t SET t.revokedAt = :now WHERE t.userId = :userId AND t.revokedAt IS NULL")
+    int revokeAllByUserId(@Param("userId") Long userId, @Param("now") LocalDateTime now);
+
+    @Modifying
+    @Query("DELETE FROM RefreshToken t WHERE t.expiresAt < :before")
+    int deleteExpiredBefore(@Param("before") LocalDateTime before);
+}
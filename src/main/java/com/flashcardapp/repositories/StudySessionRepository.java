@@ -18,11 +18,13 @@ public interface StudySessionRepository extends JpaRepository<StudySession, Long
 
     Page<StudySession> findByUser(User user, Pageable pageable);
 
+    Page<StudySession> findByUserId(Long userId, Pageable pageable);
+
     @Query("SELECT s FROM StudySession s WHERE s.user = :user AND s.startedAt >= :startDate ORDER BY s.startedAt DESC")
     Page<StudySession> findUserSessionsByDateRange(@Param("user") User user,
             @Param("startDate") LocalDateTime startDate,
             Pageable pageable);
 
-    @Query("SELECT COUNT(s) FROM StudySession s WHERE s.user = :user AND s.completedAt IS NOT NULL AND s.completedAt >= :startDate")
-    long countCompletedSessionsSince(@Param("user") User user, @Param("startDate") LocalDateTime startDate);
+    @Query("SELECT COUNT(s) FROM StudySession s WHERE s.user.id = :userId AND s.completedAt IS NOT NULL AND s.completedAt >= :startDate")
+    long countCompletedSessionsSince(@Param("userId") Long userId, @Param("startDate") LocalDateTime startDate);
 }
\ No newline at end of file
@@ -0,0 +1,17 @@
+package com.flashcardapp.repositories;
+
+import com.flashcardapp.models.TokenRevocation;
+import org.springframework.data.jpa.repository.JpaRepository;
+import org.springframework.stereotype.Repository;
+
+import java.time.LocalDateTime;
+import java.util.List;
+import java.util.Optional;
+
+@Repository
+public interface TokenRevocationRepository extends JpaRepository<TokenRevocation, Long> {
+
+    Optional<TokenRevocation> findByUserId(Long userId);
+
+    List<TokenRevocation> findByRevokedBeforeAfter(LocalDateTime since);
+}
@@ -0,0 +1,15 @@
+package com.flashcardapp.repositories;
+
+import com.flashcardapp.models.UserDailyStats;
+import org.springframework.data.jpa.repository.JpaRepository;
+import org.springframework.stereotype.Repository;
+
+import java.time.LocalDate;
+import java.util.List;
+
+@Repository
+public interface UserDailyStatsRepository extends JpaRepository<UserDailyStats, Long> {
+
+    List<UserDailyStats> findByUserIdAndStatDateBetweenOrderByStatDateAsc(Long userId, LocalDate from,
+            LocalDate to);
+}
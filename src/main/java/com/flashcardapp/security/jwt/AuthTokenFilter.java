@@ -1,13 +1,15 @@
 package com.flashcardapp.security.jwt;
 
+import com.flashcardapp.security.services.PrincipalCache;
+import com.flashcardapp.security.services.TokenDenylist;
+import com.flashcardapp.security.services.UserDetailsImpl;
 import com.flashcardapp.security.services.UserDetailsServiceImpl;
+import io.jsonwebtoken.Claims;
 import org.slf4j.Logger;
 import org.slf4j.LoggerFactory;
 import org.springframework.beans.factory.annotation.Autowired;
 import org.springframework.security.authentication.UsernamePasswordAuthenticationToken;
 import org.springframework.security.core.context.SecurityContextHolder;
-import org.springframework.security.core.userdetails.UserDetails;
-import org.springframework.security.web.authentication.WebAuthenticationDetailsSource;
 import org.springframework.util.StringUtils;
 import org.springframework.web.filter.OncePerRequestFilter;
 
@@ -24,6 +26,12 @@ public class AuthTokenFilter extends OncePerRequestFilter {
     @Autowired
     private UserDetailsServiceImpl userDetailsService;
 
+    @Autowired
+    private PrincipalCache principalCache;
+
+    @Autowired
+    private TokenDenylist tokenDenylist;
+
     private static final Logger logger = LoggerFactory.getLogger(AuthTokenFilter.class);
 
     @Override
@@ -31,15 +39,24 @@ public class AuthTokenFilter extends OncePerRequestFilter {
             throws ServletException, IOException {
         try {
             String jwt = parseJwt(request);
-            if (jwt != null && jwtUtils.validateJwtToken(jwt)) {
-                String username = jwtUtils.getUserNameFromJwtToken(jwt);
+            // Verify the signature once and keep the claims
+            Claims claims = jwt != null ? jwtUtils.parseClaims(jwt).orElse(null) : null;
+            // Refresh tokens are only accepted by /api/auth/refresh
+            if (claims != null && !JwtUtils.isRefreshToken(claims)) {
+                String username = claims.getSubject();
+
+                // The token already identifies the user; avoid a users+roles query per request
+                UserDetailsImpl userDetails = principalCache.get(username,
+                        name -> (UserDetailsImpl) userDetailsService.loadUserByUsername(name));
 
-                UserDetails userDetails = userDetailsService.loadUserByUsername(username);
-                UsernamePasswordAuthenticationToken authentication = new UsernamePasswordAuthenticationToken(
-                        userDetails, null, userDetails.getAuthorities());
-                authentication.setDetails(new WebAuthenticationDetailsSource().buildDetails(request));
+                // In-memory check; logging out of all devices rejects older tokens
+                if (!tokenDenylist.isRevoked(userDetails.getId(), JwtUtils.getIssuedAtMillis(claims))) {
+                    UsernamePasswordAuthenticationToken authentication = new UsernamePasswordAuthenticationToken(
+                            userDetails, null, userDetails.getAuthorities());
+                    authentication.setDetails(new JwtAuthenticationDetails(request, claims));
 
-                SecurityContextHolder.getContext().setAuthentication(authentication);
+                    SecurityContextHolder.getContext().setAuthentication(authentication);
+                }
             }
         } catch (Exception e) {
             logger.error("Cannot set user authentication: {}", e.getMessage());
@@ -0,0 +1,25 @@
+package com.flashcardapp.security.jwt;
+
+import io.jsonwebtoken.Claims;
+import org.springframework.security.web.authentication.WebAuthenticationDetails;
+
+import javax.servlet.http.HttpServletRequest;
+
+/**
+ * Authentication details for a request authenticated by a JWT. Carries the
+ * verified claims so later code can read them without parsing the token again.
+ */
+public class JwtAuthenticationDetails extends WebAuthenticationDetails {
+    private static final long serialVersionUID = 1L;
+
+    private final transient Claims claims;
+
+    public JwtAuthenticationDetails(HttpServletRequest request, Claims claims) {
+        super(request);
+        this.claims = claims;
+    }
+
+    public Claims getClaims() {
+        return claims;
+    }
+}
@@ -12,6 +12,7 @@ import org.springframework.stereotype.Component;
 
 import java.security.Key;
 import java.util.Date;
+import java.util.Optional;
 
 @Component
 public class JwtUtils {
@@ -26,39 +27,103 @@ public class JwtUtils {
     @Value("${jwt.refresh-token-expiration}")
     private int jwtRefreshExpirationMs;
 
+    // Claim telling access and refresh tokens apart
+    public static final String TOKEN_TYPE_CLAIM = "type";
+    public static final String ACCESS_TOKEN = "access";
+    public static final String REFRESH_TOKEN = "refresh";
+
+    // The standard "iat" claim has one-second precision, too coarse to tell a
+    // token issued just after a revocation from one issued just before it
+    public static final String ISSUED_AT_MS_CLAIM = "iat_ms";
+
     public String generateAccessToken(Authentication authentication) {
         UserDetailsImpl userPrincipal = (UserDetailsImpl) authentication.getPrincipal();
-        return generateJwtToken(userPrincipal, jwtAccessExpirationMs);
+        return generateJwtToken(userPrincipal, ACCESS_TOKEN, null, jwtAccessExpirationMs);
     }
 
-    public String generateRefreshToken(Authentication authentication) {
-        UserDetailsImpl userPrincipal = (UserDetailsImpl) authentication.getPrincipal();
-        return generateJwtToken(userPrincipal, jwtRefreshExpirationMs);
+    /**
+     * Refresh token carrying {@code tokenId} as its JWT id; the caller is
+     * responsible for recording the id so the token can be revoked.
+     */
+    public String generateRefreshToken(UserDetailsImpl userPrincipal, String tokenId) {
+        return generateJwtToken(userPrincipal, REFRESH_TOKEN, tokenId, jwtRefreshExpirationMs);
+    }
+
+    public int getRefreshExpirationMs() {
+        return jwtRefreshExpirationMs;
+    }
+
+    public static boolean isRefreshToken(Claims claims) {
+        return REFRESH_TOKEN.equals(claims.get(TOKEN_TYPE_CLAIM, String.class));
     }
 
-    private String generateJwtToken(UserDetailsImpl userPrincipal, int expirationMs) {
+    /**
+     * Issue time in epoch milliseconds, falling back to the second-precision
+     * "iat" claim for tokens issued without {@link #ISSUED_AT_MS_CLAIM}.
+     * Returns null when the token carries neither.
+     */
+    public static Long getIssuedAtMillis(Claims claims) {
+        Long issuedAtMs = claims.get(ISSUED_AT_MS_CLAIM, Long.class);
+        if (issuedAtMs != null) {
+            return issuedAtMs;
+        }
+        Date issuedAt = claims.getIssuedAt();
+        return issuedAt != null ? issuedAt.getTime() : null;
+    }
+
+    private String generateJwtToken(UserDetailsImpl userPrincipal, String type, String tokenId, int expirationMs) {
+        Date now = new Date();
         return Jwts.builder()
                 .setSubject((userPrincipal.getUsername()))
-                .setIssuedAt(new Date())
-                .setExpiration(new Date((new Date()).getTime() + expirationMs))
+                .setId(tokenId)
+                .claim(TOKEN_TYPE_CLAIM, type)
+                .claim(ISSUED_AT_MS_CLAIM, now.getTime())
+                .setIssuedAt(now)
+                .setExpiration(new Date(now.getTime() + expirationMs))
                 .signWith(key(), SignatureAlgorithm.HS256)
                 .compact();
     }
 
-    private Key key() {
-        return Keys.hmacShaKeyFor(Decoders.BASE64.decode(jwtSecret));
+    /**
+     * Key and parser derived from one secret. Both are immutable and
+     * thread-safe, so they are built once and shared by all requests.
+     */
+    private static final class SigningKey {
+        final String secret;
+        final Key key;
+        final JwtParser parser;
+
+        SigningKey(String secret) {
+            this.secret = secret;
+            this.key = Keys.hmacShaKeyFor(Decoders.BASE64.decode(secret));
+            this.parser = Jwts.parserBuilder().setSigningKey(key).build();
+        }
     }
 
-    public String getUserNameFromJwtToken(String token) {
-        return Jwts.parserBuilder().setSigningKey(key()).build()
-                .parseClaimsJws(token).getBody().getSubject();
+    private volatile SigningKey signingKey;
+
+    private SigningKey signingKey() {
+        SigningKey current = signingKey;
+        // Rebuilt only if the secret changes, e.g. when tests inject their own
+        if (current == null || !current.secret.equals(jwtSecret)) {
+            current = new SigningKey(jwtSecret);
+            signingKey = current;
+        }
+        return current;
     }
 
-    public boolean validateJwtToken(String authToken) {
+    private Key key() {
+        return signingKey().key;
+    }
+
+    /**
+     * Verify the token's signature and expiry once and return its claims, or
+     * an empty Optional if the token is not valid.
+     */
+    public Optional<Claims> parseClaims(String token) {
         try {
-            Jwts.parserBuilder().setSigningKey(key()).build().parseClaimsJws(authToken);
-            return true;
-        } catch (SecurityException e) {
+            return Optional.of(signingKey().parser.parseClaimsJws(token).getBody());
+        } catch (io.jsonwebtoken.security.SecurityException e) {
             logger.error("Invalid JWT signature: {}", e.getMessage());
         } catch (MalformedJwtException e) {
             logger.error("Invalid JWT token: {}", e.getMessage());
@@ -70,6 +135,14 @@ public class JwtUtils {
             logger.error("JWT claims string is empty: {}", e.getMessage());
         }
 
-        return false;
+        return Optional.empty();
+    }
+
+    public String getUserNameFromJwtToken(String token) {
+        return signingKey().parser.parseClaimsJws(token).getBody().getSubject();
+    }
+
+    public boolean validateJwtToken(String authToken) {
+        return parseClaims(authToken).isPresent();
     }
-}
\ No newline at end of file
+}
@@ -0,0 +1,158 @@
+package com.flashcardapp.security.services;
+
+import org.springframework.security.crypto.password.PasswordEncoder;
+
+import java.time.Duration;
+import java.util.LinkedHashMap;
+import java.util.Map;
+import java.util.concurrent.ArrayBlockingQueue;
+import java.util.concurrent.CountDownLatch;
+import java.util.concurrent.ExecutionException;
+import java.util.concurrent.Future;
+import java.util.concurrent.RejectedExecutionException;
+import java.util.concurrent.ThreadPoolExecutor;
+import java.util.concurrent.TimeUnit;
+import java.util.concurrent.TimeoutException;
+import java.util.concurrent.atomic.AtomicInteger;
+import java.util.concurrent.atomic.AtomicLong;
+import java.util.function.Supplier;
+
+/**
+ * Runs a CPU-heavy encoder (BCrypt) on a fixed pool sized to the cores, with
+ * a bounded queue in front. At most that many hashes run at once however
+ * many requests arrive, so a login burst cannot take the CPU from the rest of
+ * the API. Callers get {@link PasswordHashingBusyException} instead of piling
+ * up once the queue is full, when their hash has not started within the
+ * queue-wait budget, or when it does not finish within the timeout. The
+ * budget is kept short because a waiting request thread may hold a pooled
+ * database connection (open-in-view), so long queue waits would move the
+ * starvation from the CPU to the connection pool.
+ */
+public class BoundedPasswordEncoder implements PasswordEncoder {
+
+    private final PasswordEncoder delegate;
+    private final ThreadPoolExecutor executor;
+    private final int queueCapacity;
+    private final long maxQueueWaitMillis;
+    private final long timeoutMillis;
+
+    private final AtomicLong started = new AtomicLong();
+    private final AtomicLong completed = new AtomicLong();
+    private final AtomicLong rejected = new AtomicLong();
+    private final AtomicLong shed = new AtomicLong();
+    private final AtomicLong timedOut = new AtomicLong();
+    private final AtomicLong queueWaitNanos = new AtomicLong();
+    private final AtomicLong maxQueueWaitNanos = new AtomicLong();
+
+    /**
+     * @param maxQueueWait how long a caller waits for its hash to start
+     * @param timeout      how long a caller waits for a started hash to finish
+     */
+    public BoundedPasswordEncoder(PasswordEncoder delegate, int threads, int queueCapacity, Duration maxQueueWait,
+            Duration timeout) {
+        this.delegate = delegate;
+        this.queueCapacity = queueCapacity;
+        this.maxQueueWaitMillis = maxQueueWait.toMillis();
+        this.timeoutMillis = timeout.toMillis();
+
+        AtomicInteger threadNumber = new AtomicInteger();
+        this.executor = new ThreadPoolExecutor(threads, threads, 0L, TimeUnit.MILLISECONDS,
+                new ArrayBlockingQueue<>(queueCapacity),
+                runnable -> {
+                    Thread thread = new Thread(runnable, "password-hash-" + threadNumber.incrementAndGet());
+                    thread.setDaemon(true);
+                    return thread;
+                },
+                new ThreadPoolExecutor.AbortPolicy());
+    }
+
+    @Override
+    public String encode(CharSequence rawPassword) {
+        return run(() -> delegate.encode(rawPassword));
+    }
+
+    @Override
+    public boolean matches(CharSequence rawPassword, String encodedPassword) {
+        return run(() -> delegate.matches(rawPassword, encodedPassword));
+    }
+
+    @Override
+    public boolean upgradeEncoding(String encodedPassword) {
+        return delegate.upgradeEncoding(encodedPassword);
+    }
+
+    private <T> T run(Supplier<T> task) {
+        long submittedAt = System.nanoTime();
+        CountDownLatch taskStarted = new CountDownLatch(1);
+        Future<T> future;
+        try {
+            future = executor.submit(() -> {
+                taskStarted.countDown();
+                recordQueueWait(System.nanoTime() - submittedAt);
+                return task.get();
+            });
+        } catch (RejectedExecutionException e) {
+            rejected.incrementAndGet();
+            throw new PasswordHashingBusyException("Password hashing queue is full");
+        }
+
+        try {
+            if (!taskStarted.await(maxQueueWaitMillis, TimeUnit.MILLISECONDS)) {
+                // Drops the task if it is still queued; a hash that started
+                // just now finishes unused
+                future.cancel(false);
+                shed.incrementAndGet();
+                throw new PasswordHashingBusyException("Password hashing queue wait exceeded");
+            }
+            T result = future.get(timeoutMillis, TimeUnit.MILLISECONDS);
+            completed.incrementAndGet();
+            return result;
+        } catch (TimeoutException e) {
+            // Drops the task if it is still queued; a running hash finishes unused
+            future.cancel(false);
+            timedOut.incrementAndGet();
+            throw new PasswordHashingBusyException("Password hashing timed out");
+        } catch (InterruptedException e) {
+            future.cancel(false);
+            Thread.currentThread().interrupt();
+            throw new PasswordHashingBusyException("Interrupted while waiting for password hashing");
+        } catch (ExecutionException e) {
+            Throwable cause = e.getCause();
+            if (cause instanceof RuntimeException) {
+                throw (RuntimeException) cause;
+            }
+            if (cause instanceof Error) {
+                throw (Error) cause;
+            }
+            throw new IllegalStateException(cause);
+        }
+    }
+
+    private void recordQueueWait(long nanos) {
+        started.incrementAndGet();
+        queueWaitNanos.addAndGet(nanos);
+        maxQueueWaitNanos.accumulateAndGet(nanos, Math::max);
+    }
+
+    /** Stops the pool; called by Spring when the context closes. */
+    public void shutdown() {
+        executor.shutdownNow();
+    }
+
+    public Map<String, Object> stats() {
+        long startedCount = started.get();
+
+        Map<String, Object> stats = new LinkedHashMap<>();
+        stats.put("threads", executor.getMaximumPoolSize());
+        stats.put("active", executor.getActiveCount());
+        stats.put("queued", executor.getQueue().size());
+        stats.put("queueCapacity", queueCapacity);
+        stats.put("completed", completed.get());
+        stats.put("rejected", rejected.get());
+        stats.put("shed", shed.get());
+        stats.put("timedOut", timedOut.get());
+        stats.put("avgQueueWaitMs", startedCount > 0 ? queueWaitNanos.get() / 1e6 / startedCount : 0.0);
+        stats.put("maxQueueWaitMs", maxQueueWaitNanos.get() / 1e6);
+        return stats;
+    }
+}
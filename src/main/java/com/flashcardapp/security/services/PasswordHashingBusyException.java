@@ -0,0 +1,11 @@
+package com.flashcardapp.security.services;
+
+/**
+ * Thrown when the password-hashing pool is saturated and a hash or check
+ * cannot start in time; mapped to 503 with a Retry-After header.
+ */
+public class PasswordHashingBusyException extends RuntimeException {
+    public PasswordHashingBusyException(String message) {
+        super(message);
+    }
+}
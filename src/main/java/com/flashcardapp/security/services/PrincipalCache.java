@@ -0,0 +1,135 @@
+package com.flashcardapp.security.services;
+
+import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.beans.factory.annotation.Value;
+import org.springframework.stereotype.Component;
+
+import java.time.Clock;
+import java.time.Duration;
+import java.util.LinkedHashMap;
+import java.util.Map;
+import java.util.concurrent.atomic.AtomicLong;
+import java.util.function.Function;
+
+/**
+ * Bounded, time-limited cache of the principals AuthTokenFilter builds from a
+ * JWT, keyed by username. Entries expire after the TTL and the least recently
+ * used entry is dropped once the cache is full. {@link UserCacheEvictionListener}
+ * evicts a user as soon as their row changes, so the TTL only bounds staleness
+ * after changes made outside JPA.
+ */
+@Component
+public class PrincipalCache {
+
+    private static final class Entry {
+        final UserDetailsImpl principal;
+        final long expiresAt;
+
+        Entry(UserDetailsImpl principal, long expiresAt) {
+            this.principal = principal;
+            this.expiresAt = expiresAt;
+        }
+    }
+
+    private final int maxSize;
+    private final long ttlMillis;
+    private final Clock clock;
+    private final LinkedHashMap<String, Entry> entries;
+
+    private final AtomicLong hits = new AtomicLong();
+    private final AtomicLong misses = new AtomicLong();
+    private final AtomicLong evictions = new AtomicLong();
+
+    // Bumped on every eviction; a load that raced with one is not stored
+    private long generation;
+
+    @Autowired
+    public PrincipalCache(@Value("${app.principal-cache.max-size:10000}") int maxSize,
+            @Value("${app.principal-cache.ttl-seconds:60}") long ttlSeconds) {
+        this(maxSize, Duration.ofSeconds(ttlSeconds), Clock.systemUTC());
+    }
+
+    public PrincipalCache(int maxSize, Duration ttl, Clock clock) {
+        this.maxSize = maxSize;
+        this.ttlMillis = ttl.toMillis();
+        this.clock = clock;
+        this.entries = new LinkedHashMap<String, Entry>(16, 0.75f, true) {
+            @Override
+            protected boolean removeEldestEntry(Map.Entry<String, Entry> eldest) {
+                return size() > PrincipalCache.this.maxSize;
+            }
+        };
+    }
+
+    /**
+     * Return the cached principal for {@code username}, or load and cache it.
+     * Exceptions thrown by the loader (e.g. UsernameNotFoundException) are
+     * propagated and nothing is cached.
+     */
+    public UserDetailsImpl get(String username, Function<String, UserDetailsImpl> loader) {
+        long loadedGeneration;
+        synchronized (this) {
+            Entry entry = entries.get(username);
+            if (entry != null && entry.expiresAt > clock.millis()) {
+                hits.incrementAndGet();
+                return entry.principal;
+            }
+            if (entry != null) {
+                entries.remove(username);
+            }
+            loadedGeneration = generation;
+        }
+
+        misses.incrementAndGet();
+        UserDetailsImpl principal = loader.apply(username);
+        if (maxSize > 0 && ttlMillis > 0) {
+            synchronized (this) {
+                if (generation == loadedGeneration) {
+                    entries.put(username, new Entry(principal, clock.millis() + ttlMillis));
+                }
+            }
+        }
+        return principal;
+    }
+
+    public synchronized void evict(String username) {
+        generation++;
+        if (entries.remove(username) != null) {
+            evictions.incrementAndGet();
+        }
+    }
+
+    public synchronized void clear() {
+        generation++;
+        evictions.addAndGet(entries.size());
+        entries.clear();
+    }
+
+    public synchronized int size() {
+        return entries.size();
+    }
+
+    public long getHits() {
+        return hits.get();
+    }
+
+    public long getMisses() {
+        return misses.get();
+    }
+
+    public Map<String, Object> stats() {
+        long hitCount = hits.get();
+        long missCount = misses.get();
+        long lookups = hitCount + missCount;
+
+        Map<String, Object> stats = new LinkedHashMap<>();
+        stats.put("size", size());
+        stats.put("maxSize", maxSize);
+        stats.put("ttlSeconds", ttlMillis / 1000);
+        stats.put("hits", hitCount);
+        stats.put("misses", missCount);
+        stats.put("evictions", evictions.get());
+        stats.put("hitRate", lookups > 0 ? (double) hitCount / lookups : 0.0);
+        return stats;
+    }
+}
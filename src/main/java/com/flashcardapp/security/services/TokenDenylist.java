@@ -0,0 +1,84 @@
+package com.flashcardapp.security.services;
+
+import com.flashcardapp.models.TokenRevocation;
+import com.flashcardapp.repositories.TokenRevocationRepository;
+import org.slf4j.Logger;
+import org.slf4j.LoggerFactory;
+import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.beans.factory.annotation.Value;
+import org.springframework.scheduling.annotation.Scheduled;
+import org.springframework.stereotype.Component;
+
+import java.time.LocalDateTime;
+import java.time.ZoneId;
+import java.util.Map;
+import java.util.concurrent.ConcurrentHashMap;
+
+/**
+ * In-memory copy of the per-user "log out from all devices" cut-offs, so
+ * AuthTokenFilter can reject access tokens issued before one without a
+ * database query. Entries older than the access-token lifetime are dropped:
+ * every token they could reject has expired anyway, which keeps the map to
+ * the users who revoked recently. Revocations made on another instance are
+ * picked up on the next refresh.
+ */
+@Component
+public class TokenDenylist {
+
+    private static final Logger logger = LoggerFactory.getLogger(TokenDenylist.class);
+
+    // userId -> tokens issued before this epoch millisecond are revoked
+    private final Map<Long, Long> revokedBefore = new ConcurrentHashMap<>();
+
+    @Autowired
+    private TokenRevocationRepository tokenRevocationRepository;
+
+    @Value("${jwt.access-token-expiration}")
+    private long accessTokenExpirationMs;
+
+    /**
+     * Whether a token of {@code userId} issued at {@code issuedAtMs} (epoch
+     * milliseconds) has been revoked. Only tokens issued strictly before the
+     * cut-off are, so logging in again right after logging out of all devices
+     * yields a usable token.
+     */
+    public boolean isRevoked(Long userId, Long issuedAtMs) {
+        Long cutoff = revokedBefore.get(userId);
+        if (cutoff == null) {
+            return false;
+        }
+        return issuedAtMs == null || issuedAtMs < cutoff;
+    }
+
+    public void revokeIssuedBefore(Long userId, LocalDateTime before) {
+        revokedBefore.merge(userId, toEpochMilli(before), Math::max);
+    }
+
+    /**
+     * Reload the revocations that can still affect a live access token and
+     * forget the rest; runs at startup and then periodically.
+     */
+    @Scheduled(fixedDelayString = "${app.token-denylist.refresh-ms:30000}")
+    public void refresh() {
+        LocalDateTime since = LocalDateTime.now().minusNanos(accessTokenExpirationMs * 1_000_000L);
+        long sinceMs = toEpochMilli(since);
+        try {
+            for (TokenRevocation revocation : tokenRevocationRepository.findByRevokedBeforeAfter(since)) {
+                revokeIssuedBefore(revocation.getUserId(), revocation.getRevokedBefore());
+            }
+        } catch (Exception e) {
+            // Keep serving from the current entries until the next refresh
+            logger.error("Failed to refresh token denylist: {}", e.getMessage());
+            return;
+        }
+        revokedBefore.values().removeIf(cutoff -> cutoff < sinceMs);
+    }
+
+    public int size() {
+        return revokedBefore.size();
+    }
+
+    private static long toEpochMilli(LocalDateTime time) {
+        return time.atZone(ZoneId.systemDefault()).toInstant().toEpochMilli();
+    }
+}
@@ -0,0 +1,43 @@
+package com.flashcardapp.security.services;
+
+import com.flashcardapp.models.User;
+import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.transaction.support.TransactionSynchronization;
+import org.springframework.transaction.support.TransactionSynchronizationManager;
+
+import javax.persistence.PostRemove;
+import javax.persistence.PostUpdate;
+
+/**
+ * Drops a user's cached principal whenever their row is updated or deleted,
+ * so role, enabled-flag and password changes take effect on the next request.
+ * Hibernate does not fire entity callbacks when only the roles collection
+ * changes; code that edits roles alone should call {@link PrincipalCache#evict}.
+ */
+public class UserCacheEvictionListener {
+
+    // Absent in slices that don't load the security beans, e.g. @DataJpaTest
+    @Autowired(required = false)
+    private PrincipalCache principalCache;
+
+    @PostUpdate
+    @PostRemove
+    public void evict(User user) {
+        if (principalCache == null) {
+            return;
+        }
+        String username = user.getUsername();
+        principalCache.evict(username);
+
+        // A request between the flush and the commit may reload the old row;
+        // evict again once the change is visible to other transactions
+        if (TransactionSynchronizationManager.isSynchronizationActive()) {
+            TransactionSynchronizationManager.registerSynchronization(new TransactionSynchronization() {
+                @Override
+                public void afterCommit() {
+                    principalCache.evict(username);
+                }
+            });
+        }
+    }
+}
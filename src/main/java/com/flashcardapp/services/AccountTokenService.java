@@ -0,0 +1,45 @@
+package com.flashcardapp.services;
+
+import com.flashcardapp.models.EEmailType;
+import com.flashcardapp.models.User;
+import com.flashcardapp.repositories.UserRepository;
+import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
+
+import java.time.LocalDateTime;
+import java.util.UUID;
+
+/**
+ * Issues email verification and password reset tokens. Each token is saved
+ * and its email queued in one transaction, so a user never holds a token
+ * whose email was not queued. Callers handle failures outside the
+ * transaction, after it has rolled back.
+ */
+@Service
+public class AccountTokenService {
+
+    @Autowired
+    private UserRepository userRepository;
+
+    @Autowired
+    private EmailOutboxService emailOutboxService;
+
+    @Transactional
+    public void issueVerificationToken(User user) {
+        user.setVerificationToken(UUID.randomUUID().toString());
+        user.setVerificationTokenExpiry(LocalDateTime.now().plusDays(1));
+        userRepository.save(user);
+
+        emailOutboxService.enqueue(EEmailType.VERIFICATION, user.getEmail(), user.getVerificationToken());
+    }
+
+    @Transactional
+    public void issuePasswordResetToken(User user) {
+        user.setResetPasswordToken(UUID.randomUUID().toString());
+        user.setResetPasswordTokenExpiry(LocalDateTime.now().plusHours(24));
+        userRepository.save(user);
+
+        emailOutboxService.enqueue(EEmailType.PASSWORD_RESET, user.getEmail(), user.getResetPasswordToken());
+    }
+}
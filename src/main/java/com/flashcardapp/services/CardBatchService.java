@@ -0,0 +1,57 @@
+package com.flashcardapp.services;
+
+import com.flashcardapp.models.Card;
+import com.flashcardapp.models.Deck;
+import com.flashcardapp.payload.request.BatchCreateCardsRequest.CardItem;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
+
+import javax.persistence.EntityManager;
+import javax.persistence.PersistenceContext;
+import java.util.ArrayList;
+import java.util.List;
+
+/**
+ * Inserts many cards in one transaction using JDBC batching. Card ids come
+ * from a pooled sequence, so persisting does not hit the database and
+ * Hibernate sends the inserts in batches of hibernate.jdbc.batch_size.
+ */
+@Service
+public class CardBatchService {
+    // Same as hibernate.jdbc.batch_size; flushing at this size sends full batches
+    // and clearing keeps the persistence context from growing with the import
+    public static final int FLUSH_SIZE = 50;
+
+    @PersistenceContext
+    private EntityManager entityManager;
+
+    /**
+     * Create the cards in the given deck and return their ids in request order.
+     * The caller is responsible for checking that the deck belongs to
+     * {@code userId}.
+     */
+    @Transactional
+    public List<Long> createCards(Long userId, Long deckId, List<CardItem> items) {
+        Deck deck = entityManager.getReference(Deck.class, deckId);
+        List<Long> ids = new ArrayList<>(items.size());
+
+        for (int i = 0; i < items.size(); i++) {
+            CardItem item = items.get(i);
+            Card card = new Card();
+            card.setDeck(deck);
+            card.setUserId(userId);
+            card.setFront(item.getFront());
+            card.setBack(item.getBack());
+            card.setNotes(item.getNotes());
+            entityManager.persist(card);
+            ids.add(card.getId());
+
+            if ((i + 1) % FLUSH_SIZE == 0) {
+                entityManager.flush();
+                entityManager.clear();
+                deck = entityManager.getReference(Deck.class, deckId);
+            }
+        }
+        return ids;
+    }
+}
@@ -0,0 +1,201 @@
+package com.flashcardapp.services;
+
+import com.flashcardapp.payload.request.BatchCreateCardsRequest.CardItem;
+import org.apache.commons.csv.CSVFormat;
+import org.apache.commons.csv.CSVParser;
+import org.apache.commons.csv.CSVPrinter;
+import org.apache.commons.csv.CSVRecord;
+import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.beans.factory.annotation.Value;
+import org.springframework.jdbc.core.JdbcTemplate;
+import org.springframework.jdbc.core.RowCallbackHandler;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.PlatformTransactionManager;
+import org.springframework.transaction.annotation.Transactional;
+import org.springframework.transaction.support.TransactionTemplate;
+
+import javax.sql.DataSource;
+import java.io.BufferedWriter;
+import java.io.IOException;
+import java.io.OutputStream;
+import java.io.OutputStreamWriter;
+import java.io.PushbackReader;
+import java.io.Reader;
+import java.io.UncheckedIOException;
+import java.io.Writer;
+import java.nio.charset.StandardCharsets;
+import java.util.ArrayList;
+import java.util.List;
+import java.util.Locale;
+
+/**
+ * CSV import and export of a deck's cards as front,back,notes rows. Import
+ * reads the stream record by record and inserts through CardBatchService in
+ * chunks; export streams rows from a forward-only JDBC cursor straight to the
+ * response. Neither holds the whole deck in memory.
+ */
+@Service
+public class DeckCsvService {
+
+    public static final String[] HEADER = { "front", "back", "notes" };
+
+    // Cards handed to CardBatchService at a time; a multiple of its flush size
+    static final int IMPORT_CHUNK_SIZE = 1000;
+    static final int EXPORT_FETCH_SIZE = 1000;
+    static final int MAX_REPORTED_ERRORS = 20;
+
+    private static final String EXPORT_SQL = "SELECT front, back, notes FROM cards WHERE deck_id = ? ORDER BY id";
+
+    public static final class ImportResult {
+        private final int imported;
+        private final int skipped;
+        private final List<String> errors;
+
+        ImportResult(int imported, int skipped, List<String> errors) {
+            this.imported = imported;
+            this.skipped = skipped;
+            this.errors = errors;
+        }
+
+        public int getImported() {
+            return imported;
+        }
+
+        /** Rows without a front or back, which are not imported. */
+        public int getSkipped() {
+            return skipped;
+        }
+
+        /** Why rows were skipped, for the first {@value DeckCsvService#MAX_REPORTED_ERRORS} of them. */
+        public List<String> getErrors() {
+            return errors;
+        }
+    }
+
+    @Autowired
+    private CardBatchService cardBatchService;
+
+    @Value("${app.csv.max-import-cards:100000}")
+    private int maxImportCards;
+
+    private final JdbcTemplate exportJdbcTemplate;
+    private final TransactionTemplate readOnlyTransaction;
+
+    @Autowired
+    public DeckCsvService(DataSource dataSource, PlatformTransactionManager transactionManager) {
+        // PostgreSQL only streams with a fetch size inside a transaction;
+        // otherwise the driver reads the whole result set into memory
+        exportJdbcTemplate = new JdbcTemplate(dataSource);
+        exportJdbcTemplate.setFetchSize(EXPORT_FETCH_SIZE);
+        readOnlyTransaction = new TransactionTemplate(transactionManager);
+        readOnlyTransaction.setReadOnly(true);
+    }
+
+    /**
+     * Import the cards in {@code csv} into the deck. The first record must be
+     * a header naming at least the front and back columns (any order, any
+     * case); a notes column is optional. All rows are imported in one
+     * transaction. The caller is responsible for checking that the deck
+     * belongs to {@code userId}.
+     *
+     * @throws IllegalArgumentException if the header is missing columns, the
+     *                                  CSV is malformed or it holds more than
+     *                                  the allowed number of cards
+     */
+    @Transactional(rollbackFor = IOException.class)
+    public ImportResult importCards(Long userId, Long deckId, Reader csv) throws IOException {
+        CSVFormat format = CSVFormat.DEFAULT.builder()
+                .setHeader()
+                .setSkipHeaderRecord(true)
+                .setIgnoreEmptyLines(true)
+                .setTrim(true)
+                .build();
+
+        int imported = 0;
+        int skipped = 0;
+        List<String> errors = new ArrayList<>();
+        List<CardItem> chunk = new ArrayList<>(IMPORT_CHUNK_SIZE);
+
+        try (CSVParser parser = format.parse(skipByteOrderMark(csv))) {
+            List<String> columns = new ArrayList<>();
+            for (String name : parser.getHeaderNames()) {
+                columns.add(name.toLowerCase(Locale.ROOT));
+            }
+            int frontColumn = columns.indexOf("front");
+            int backColumn = columns.indexOf("back");
+            int notesColumn = columns.indexOf("notes");
+            if (frontColumn < 0 || backColumn < 0) {
+                throw new IllegalArgumentException("CSV header must name the front and back columns");
+            }
+
+            for (CSVRecord record : parser) {
+                String front = value(record, frontColumn);
+                String back = value(record, backColumn);
+                if (front.isEmpty() || back.isEmpty()) {
+                    skipped++;
+                    if (errors.size() < MAX_REPORTED_ERRORS) {
+                        errors.add("Row " + record.getRecordNumber() + ": front and back are required");
+                    }
+                    continue;
+                }
+                if (imported + chunk.size() >= maxImportCards) {
+                    throw new IllegalArgumentException("CSV holds more than " + maxImportCards + " cards");
+                }
+
+                CardItem item = new CardItem();
+                item.setFront(front);
+                item.setBack(back);
+                String notes = value(record, notesColumn);
+                item.setNotes(notes.isEmpty() ? null : notes);
+                chunk.add(item);
+
+                if (chunk.size() == IMPORT_CHUNK_SIZE) {
+                    imported += cardBatchService.createCards(userId, deckId, chunk).size();
+                    chunk.clear();
+                }
+            }
+        } catch (IllegalStateException | UncheckedIOException e) {
+            // commons-csv reports malformed input this way while iterating
+            throw new IllegalArgumentException("Invalid CSV: " + e.getMessage(), e);
+        }
+        if (!chunk.isEmpty()) {
+            imported += cardBatchService.createCards(userId, deckId, chunk).size();
+        }
+        return new ImportResult(imported, skipped, errors);
+    }
+
+    /**
+     * Write the deck's cards to {@code out} as CSV with a header row, in card
+     * id order. Rows are fetched {@value #EXPORT_FETCH_SIZE} at a time and
+     * written as they arrive. The caller is responsible for checking that the
+     * deck belongs to the user.
+     */
+    public void exportCards(Long deckId, OutputStream out) throws IOException {
+        Writer writer = new BufferedWriter(new OutputStreamWriter(out, StandardCharsets.UTF_8));
+        CSVPrinter printer = new CSVPrinter(writer, CSVFormat.DEFAULT.builder().setHeader(HEADER).build());
+
+        RowCallbackHandler writeRow = rs -> {
+            try {
+                printer.printRecord(rs.getString(1), rs.getString(2), rs.getString(3));
+            } catch (IOException e) {
+                // Client went away; stop reading the cursor
+                throw new UncheckedIOException(e);
+            }
+        };
+        readOnlyTransaction.executeWithoutResult(status -> exportJdbcTemplate.query(EXPORT_SQL, writeRow, deckId));
+        printer.flush();
+    }
+
+    private static String value(CSVRecord record, int column) {
+        return column >= 0 && column < record.size() ? record.get(column) : "";
+    }
+
+    private static Reader skipByteOrderMark(Reader reader) throws IOException {
+        PushbackReader pushback = new PushbackReader(reader, 1);
+        int first = pushback.read();
+        if (first != -1 && first != '\uFEFF') {
+            pushback.unread(first);
+        }
+        return pushback;
+    }
+}
@@ -0,0 +1,235 @@
+package com.flashcardapp.services;
+
+import com.flashcardapp.models.EEmailType;
+import com.flashcardapp.models.EOutboxStatus;
+import com.flashcardapp.models.EmailOutbox;
+import com.flashcardapp.repositories.EmailOutboxRepository;
+import org.slf4j.Logger;
+import org.slf4j.LoggerFactory;
+import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.beans.factory.annotation.Value;
+import org.springframework.data.domain.PageRequest;
+import org.springframework.mail.MailException;
+import org.springframework.mail.MailSendException;
+import org.springframework.scheduling.annotation.Scheduled;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.PlatformTransactionManager;
+import org.springframework.transaction.annotation.Transactional;
+import org.springframework.transaction.support.TransactionTemplate;
+
+import javax.mail.MessagingException;
+import javax.mail.internet.MimeMessage;
+import java.time.Duration;
+import java.time.LocalDateTime;
+import java.util.HashMap;
+import java.util.LinkedHashMap;
+import java.util.List;
+import java.util.Map;
+import java.util.concurrent.atomic.AtomicLong;
+import java.util.stream.Collectors;
+
+/**
+ * Transactional outbox for account emails. Request handlers only insert a row
+ * alongside the change that needs the email; a scheduled dispatcher sends due
+ * rows in batches over one SMTP connection and retries failures with
+ * exponential backoff, so request latency does not depend on the mail server.
+ */
+@Service
+public class EmailOutboxService {
+    private static final Logger logger = LoggerFactory.getLogger(EmailOutboxService.class);
+
+    private static final int MAX_ERROR_LENGTH = 1000;
+
+    @Autowired
+    private EmailOutboxRepository emailOutboxRepository;
+
+    @Autowired
+    private EmailService emailService;
+
+    @Value("${app.email.outbox.enabled:true}")
+    private boolean enabled;
+
+    @Value("${app.email.outbox.batch-size:50}")
+    private int batchSize;
+
+    @Value("${app.email.outbox.max-attempts:8}")
+    private int maxAttempts;
+
+    @Value("${app.email.outbox.retry-base-seconds:30}")
+    private long retryBaseSeconds;
+
+    @Value("${app.email.outbox.retry-max-seconds:3600}")
+    private long retryMaxSeconds;
+
+    // How long a claimed batch stays invisible to other dispatchers
+    @Value("${app.email.outbox.lease-seconds:300}")
+    private long leaseSeconds;
+
+    // Sent and failed rows still hold the plaintext token; keep them only this long
+    @Value("${app.email.outbox.retention-days:7}")
+    private long retentionDays;
+
+    private final TransactionTemplate transactionTemplate;
+
+    private final AtomicLong sent = new AtomicLong();
+    private final AtomicLong failedAttempts = new AtomicLong();
+    private volatile LocalDateTime lastDispatchAt;
+
+    @Autowired
+    public EmailOutboxService(PlatformTransactionManager transactionManager) {
+        transactionTemplate = new TransactionTemplate(transactionManager);
+    }
+
+    /**
+     * Queue an email in the caller's transaction; it is sent only if that
+     * transaction commits.
+     */
+    @Transactional
+    public EmailOutbox enqueue(EEmailType type, String recipient, String token) {
+        return emailOutboxRepository.save(EmailOutbox.builder()
+                .type(type)
+                .recipient(recipient)
+                .token(token)
+                .build());
+    }
+
+    @Scheduled(fixedDelayString = "${app.email.outbox.poll-interval-ms:1000}")
+    public void dispatch() {
+        if (!enabled) {
+            return;
+        }
+        try {
+            // A full batch means more may be waiting
+            while (dispatchBatch() == batchSize) {
+                // keep draining
+            }
+        } catch (RuntimeException e) {
+            logger.error("Email outbox dispatch failed: {}", e.getMessage());
+        }
+    }
+
+    /**
+     * Claim up to one batch of due emails, send them and record the outcome.
+     *
+     * @return the number of emails attempted
+     */
+    public int dispatchBatch() {
+        LocalDateTime now = LocalDateTime.now();
+        lastDispatchAt = now;
+
+        // Claiming pushes nextAttemptAt past the lease, so a crash mid-send
+        // leaves the rows to be retried rather than stuck
+        List<EmailOutbox> batch = transactionTemplate.execute(status -> {
+            List<EmailOutbox> due = emailOutboxRepository.findDueForUpdate(now, PageRequest.of(0, batchSize));
+            due.forEach(email -> email.setNextAttemptAt(now.plusSeconds(leaseSeconds)));
+            return due;
+        });
+        if (batch == null || batch.isEmpty()) {
+            return 0;
+        }
+
+        Map<Long, String> failures = send(batch);
+
+        transactionTemplate.executeWithoutResult(status -> {
+            LocalDateTime finished = LocalDateTime.now();
+            List<Long> ids = batch.stream().map(EmailOutbox::getId).collect(Collectors.toList());
+            for (EmailOutbox email : emailOutboxRepository.findAllById(ids)) {
+                email.setAttempts(email.getAttempts() + 1);
+                String error = failures.get(email.getId());
+                if (error == null) {
+                    email.setStatus(EOutboxStatus.SENT);
+                    email.setSentAt(finished);
+                    email.setLastError(null);
+                } else {
+                    email.setLastError(error.length() > MAX_ERROR_LENGTH ? error.substring(0, MAX_ERROR_LENGTH) : error);
+                    if (email.getAttempts() >= maxAttempts) {
+                        email.setStatus(EOutboxStatus.FAILED);
+                        logger.error("Giving up on {} email {} to {} after {} attempts: {}",
+                                email.getType(), email.getId(), email.getRecipient(), email.getAttempts(), error);
+                    } else {
+                        email.setNextAttemptAt(finished.plus(backoff(email.getAttempts())));
+                    }
+                }
+            }
+        });
+
+        sent.addAndGet(batch.size() - failures.size());
+        failedAttempts.addAndGet(failures.size());
+        return batch.size();
+    }
+
+    @Scheduled(cron = "${app.email.outbox.purge-cron:0 45 3 * * *}")
+    @Transactional
+    public void purgeFinished() {
+        int deleted = emailOutboxRepository.deleteFinishedBefore(LocalDateTime.now().minusDays(retentionDays));
+        if (deleted > 0) {
+            logger.info("Purged {} finished outbox emails", deleted);
+        }
+    }
+
+    /**
+     * Delay before the next attempt after {@code attempts} failed ones:
+     * the base delay doubled per attempt, up to the maximum.
+     */
+    Duration backoff(int attempts) {
+        long seconds = retryBaseSeconds << Math.min(attempts - 1, 20);
+        return Duration.ofSeconds(Math.min(seconds, retryMaxSeconds));
+    }
+
+    /**
+     * Outbox depth and dispatcher counters for the metrics endpoint.
+     */
+    public Map<String, Object> stats() {
+        Map<String, Object> stats = new LinkedHashMap<>();
+        stats.put("pending", emailOutboxRepository.countByStatus(EOutboxStatus.PENDING));
+        stats.put("due", emailOutboxRepository.countByStatusAndNextAttemptAtLessThanEqual(
+                EOutboxStatus.PENDING, LocalDateTime.now()));
+        stats.put("failed", emailOutboxRepository.countByStatus(EOutboxStatus.FAILED));
+        stats.put("sent", sent.get());
+        stats.put("failedAttempts", failedAttempts.get());
+        stats.put("lastDispatchAt", lastDispatchAt);
+        return stats;
+    }
+
+    /**
+     * Send the batch over one connection; returns the error of each email
+     * that was not sent, by outbox id.
+     */
+    private Map<Long, String> send(List<EmailOutbox> batch) {
+        Map<Long, String> failures = new HashMap<>();
+        Map<MimeMessage, EmailOutbox> messages = new LinkedHashMap<>();
+        for (EmailOutbox email : batch) {
+            try {
+                messages.put(emailService.createEmail(email.getType(), email.getRecipient(), email.getToken()),
+                        email);
+            } catch (MessagingException e) {
+                failures.put(email.getId(), e.getMessage());
+            }
+        }
+        if (messages.isEmpty()) {
+            return failures;
+        }
+
+        try {
+            emailService.sendAll(messages.keySet().toArray(new MimeMessage[0]));
+        } catch (MailSendException e) {
+            if (e.getFailedMessages().isEmpty()) {
+                messages.values().forEach(email -> failures.put(email.getId(), String.valueOf(e.getMessage())));
+            } else {
+                e.getFailedMessages().forEach((message, cause) -> {
+                    EmailOutbox email = messages.get(message);
+                    if (email != null) {
+                        failures.put(email.getId(), String.valueOf(cause.getMessage()));
+                    }
+                });
+            }
+        } catch (MailException e) {
+            // Connection or authentication failure: nothing was sent
+            messages.values().forEach(email -> failures.put(email.getId(), String.valueOf(e.getMessage())));
+        }
+        if (!failures.isEmpty()) {
+            logger.warn("{} of {} outbox emails failed to send", failures.size(), batch.size());
+        }
+        return failures;
+    }
+}
@@ -1,11 +1,13 @@
 package com.flashcardapp.services;
 
+import com.flashcardapp.models.EEmailType;
 import javax.mail.MessagingException;
 import javax.mail.internet.MimeMessage;
 import org.slf4j.Logger;
 import org.slf4j.LoggerFactory;
 import org.springframework.beans.factory.annotation.Autowired;
 import org.springframework.beans.factory.annotation.Value;
+import org.springframework.mail.MailException;
 import org.springframework.mail.javamail.JavaMailSender;
 import org.springframework.mail.javamail.MimeMessageHelper;
 import org.springframework.stereotype.Service;
@@ -30,45 +32,7 @@ public class EmailService {
      * @param token verification token
      */
     public void sendVerificationEmail(String to, String token) {
-        logger.info("Starting to send verification email to: {} with token: {}", to, token);
-
-        // Log mail configuration
-        logger.info("Mail configuration: fromEmail={}, verificationBaseUrl={}",
-                fromEmail, verificationBaseUrl);
-
-        try {
-            logger.info("Creating MIME message");
-            MimeMessage message = emailSender.createMimeMessage();
-            MimeMessageHelper helper = new MimeMessageHelper(message, true);
-
-            logger.info("Setting email headers");
-            helper.setFrom(fromEmail);
-            helper.setTo(to);
-            helper.setSubject("Verify Your Email Address");
-
-            String verificationLink = verificationBaseUrl + token;
-            String htmlContent = "<h1>Welcome to Flashcard App</h1>" +
-                    "<p>Thank you for registering with us. Please click the link below to verify your email address:</p>"
-                    +
-                    "<p><a href=\"" + verificationLink + "\">Verify My Email</a></p>" +
-                    "<p>Or copy and paste this token: " + token + "</p>" +
-                    "<p>This link will expire in 24 hours.</p>";
-
-            logger.info("Setting email content");
-            helper.setText(htmlContent, true);
-
-            logger.info("About to send verification email to: {}", to);
-            emailSender.send(message);
-            logger.info("Verification email sent successfully to: {}", to);
-        } catch (MessagingException e) {
-            logger.error("Failed to send verification email to {}: {}", to, e.getMessage());
-            logger.error("Stack trace:", e);
-            throw new RuntimeException("Failed to send verification email", e);
-        } catch (Exception e) {
-            logger.error("Unexpected error while sending verification email to {}: {}", to, e.getMessage());
-            logger.error("Stack trace:", e);
-            throw new RuntimeException("Failed to send verification email", e);
-        }
+        send(EEmailType.VERIFICATION, to, token, "verification");
     }
 
     /**
@@ -78,39 +42,65 @@ public class EmailService {
      * @param token reset token
      */
     public void sendPasswordResetEmail(String to, String token) {
-        logger.info("Starting to send password reset email to: {} with token: {}", to, token);
-
-        try {
-            logger.info("Creating MIME message");
-            MimeMessage message = emailSender.createMimeMessage();
-            MimeMessageHelper helper = new MimeMessageHelper(message, true);
-
-            logger.info("Setting email headers");
-            helper.setFrom(fromEmail);
-            helper.setTo(to);
-            helper.setSubject("Reset Your Password");
+        send(EEmailType.PASSWORD_RESET, to, token, "password reset");
+    }
 
-            String resetLink = "http://localhost:3000/reset-password?token=" + token;
-            String htmlContent = "<h1>Password Reset Request</h1>" +
-                    "<p>You requested to reset your password. Click the link below to create a new password:</p>" +
-                    "<p><a href=\"" + resetLink + "\">Reset My Password</a></p>" +
-                    "<p>Or copy and paste this token: " + token + "</p>" +
-                    "<p>This link will expire in 24 hours. If you did not request a password reset, please ignore this email.</p>";
+    /**
+     * Build the message for an email of the given type without sending it
+     *
+     * @param type  kind of email
+     * @param to    recipient email address
+     * @param token verification or reset token to include
+     */
+    public MimeMessage createEmail(EEmailType type, String to, String token) throws MessagingException {
+        MimeMessage message = emailSender.createMimeMessage();
+        MimeMessageHelper helper = new MimeMessageHelper(message, true);
+        helper.setFrom(fromEmail);
+        helper.setTo(to);
+
+        switch (type) {
+            case VERIFICATION:
+                String verificationLink = verificationBaseUrl + token;
+                helper.setSubject("Verify Your Email Address");
+                helper.setText("<h1>Welcome to Flashcard App</h1>" +
+                        "<p>Thank you for registering with us. Please click the link below to verify your email address:</p>"
+                        +
+                        "<p><a href=\"" + verificationLink + "\">Verify My Email</a></p>" +
+                        "<p>Or copy and paste this token: " + token + "</p>" +
+                        "<p>This link will expire in 24 hours.</p>", true);
+                break;
+            case PASSWORD_RESET:
+            default:
+                String resetLink = "http://localhost:3000/reset-password?token=" + token;
+                helper.setSubject("Reset Your Password");
+                helper.setText("<h1>Password Reset Request</h1>" +
+                        "<p>You requested to reset your password. Click the link below to create a new password:</p>" +
+                        "<p><a href=\"" + resetLink + "\">Reset My Password</a></p>" +
+                        "<p>Or copy and paste this token: " + token + "</p>" +
+                        "<p>This link will expire in 24 hours. If you did not request a password reset, please ignore this email.</p>",
+                        true);
+                break;
+        }
+        return message;
+    }
 
-            logger.info("Setting email content");
-            helper.setText(htmlContent, true);
+    /**
+     * Send several messages over one SMTP connection. On failure the thrown
+     * {@link org.springframework.mail.MailSendException} lists the messages
+     * that were not sent.
+     */
+    public void sendAll(MimeMessage... messages) throws MailException {
+        emailSender.send(messages);
+    }
 
-            logger.info("About to send password reset email to: {}", to);
-            emailSender.send(message);
-            logger.info("Password reset email sent successfully to: {}", to);
-        } catch (MessagingException e) {
-            logger.error("Failed to send password reset email to {}: {}", to, e.getMessage());
-            logger.error("Stack trace:", e);
-            throw new RuntimeException("Failed to send password reset email", e);
-        } catch (Exception e) {
-            logger.error("Unexpected error while sending password reset email to {}: {}", to, e.getMessage());
-            logger.error("Stack trace:", e);
-            throw new RuntimeException("Failed to send password reset email", e);
+    private void send(EEmailType type, String to, String token, String description) {
+        logger.info("Sending {} email to: {}", description, to);
+        try {
+            emailSender.send(createEmail(type, to, token));
+            logger.info("{} email sent successfully to: {}", description, to);
+        } catch (MessagingException | MailException e) {
+            logger.error("Failed to send {} email to {}: {}", description, to, e.getMessage());
+            throw new RuntimeException("Failed to send " + description + " email", e);
         }
     }
-}
\ No newline at end of file
+}
@@ -0,0 +1,177 @@
+package com.flashcardapp.services;
+
+import com.flashcardapp.util.CursorCodec;
+import org.springframework.beans.BeanWrapperImpl;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
+
+import javax.persistence.EntityManager;
+import javax.persistence.PersistenceContext;
+import javax.persistence.TypedQuery;
+import java.time.LocalDateTime;
+import java.time.format.DateTimeParseException;
+import java.util.List;
+import java.util.Map;
+
+/**
+ * Cursor (keyset) pagination over an entity listing. Each page continues
+ * after the sort value and id of the previous page's last row instead of
+ * using OFFSET, and no COUNT runs unless asked for, so every page costs the
+ * same. Only whitelisted sort keys are accepted; each should be backed by an
+ * index that ends in the entity id.
+ */
+@Service
+public class KeysetPaginationService {
+
+    public static final int MAX_LIMIT = 100;
+
+    public enum KeyType {
+        LONG, DATE_TIME
+    }
+
+    public static final class KeysetPage<T> {
+        private final List<T> items;
+        private final String nextCursor;
+
+        KeysetPage(List<T> items, String nextCursor) {
+            this.items = items;
+            this.nextCursor = nextCursor;
+        }
+
+        public List<T> getItems() {
+            return items;
+        }
+
+        /** Cursor for the following page, or null on the last page. */
+        public String getNextCursor() {
+            return nextCursor;
+        }
+    }
+
+    private static final class SortKey {
+        final String field;
+        final KeyType type;
+        final boolean descending;
+
+        SortKey(String field, KeyType type, boolean descending) {
+            this.field = field;
+            this.type = type;
+            this.descending = descending;
+        }
+    }
+
+    @PersistenceContext
+    private EntityManager entityManager;
+
+    /**
+     * Fetch one page of {@code type} matching {@code where}, a JPQL condition on
+     * the alias {@code e}. The sort comes from {@code after} when continuing,
+     * otherwise from {@code sort} ("field" or "field,desc").
+     *
+     * @throws IllegalArgumentException if the sort field is not in
+     *                                  {@code sortKeys} or the cursor is invalid
+     */
+    @Transactional(readOnly = true)
+    public <T> KeysetPage<T> fetch(Class<T> type, String where, Map<String, Object> params,
+            Map<String, KeyType> sortKeys, String[] sort, String after, int limit) {
+        int pageSize = Math.max(1, Math.min(limit, MAX_LIMIT));
+
+        SortKey key;
+        Object afterValue = null;
+        Long afterId = null;
+        if (after != null && !after.isEmpty()) {
+            List<String> cursor = CursorCodec.decode(after, 4);
+            key = sortKey(sortKeys, cursor.get(0), cursor.get(1));
+            try {
+                afterValue = parse(key.type, cursor.get(2));
+                afterId = Long.valueOf(cursor.get(3));
+            } catch (DateTimeParseException e) {
+                throw new IllegalArgumentException("Invalid cursor");
+            }
+        } else {
+            key = sortKey(sortKeys, sort[0], sort.length > 1 ? sort[1] : "asc");
+        }
+
+        String direction = key.descending ? "DESC" : "ASC";
+        String comparison = key.descending ? "<" : ">";
+        StringBuilder jpql = new StringBuilder("SELECT e FROM ")
+                .append(type.getSimpleName()).append(" e WHERE ").append(where);
+        if (afterId != null) {
+            if (key.field.equals("id")) {
+                jpql.append(" AND e.id ").append(comparison).append(" :afterId");
+            } else {
+                jpql.append(" AND (e.").append(key.field).append(' ').append(comparison).append(" :afterValue")
+                        .append(" OR (e.").append(key.field).append(" = :afterValue AND e.id ")
+                        .append(comparison).append(" :afterId))");
+            }
+        }
+        jpql.append(" ORDER BY ");
+        if (!key.field.equals("id")) {
+            jpql.append("e.").append(key.field).append(' ').append(direction).append(", ");
+        }
+        jpql.append("e.id ").append(direction);
+
+        TypedQuery<T> query = entityManager.createQuery(jpql.toString(), type);
+        params.forEach(query::setParameter);
+        if (afterId != null) {
+            query.setParameter("afterId", afterId);
+            if (!key.field.equals("id")) {
+                query.setParameter("afterValue", afterValue);
+            }
+        }
+        // One extra row tells whether another page follows
+        List<T> rows = query.setMaxResults(pageSize + 1).getResultList();
+
+        String nextCursor = null;
+        if (rows.size() > pageSize) {
+            rows = rows.subList(0, pageSize);
+            BeanWrapperImpl last = new BeanWrapperImpl(rows.get(pageSize - 1));
+            nextCursor = CursorCodec.encode(key.field, key.descending ? "desc" : "asc",
+                    last.getPropertyValue(key.field), last.getPropertyValue("id"));
+        }
+        return new KeysetPage<>(rows, nextCursor);
+    }
+
+    /**
+     * Exact number of rows matching {@code where}; only run when the client
+     * asks for a total.
+     */
+    @Transactional(readOnly = true)
+    public long count(Class<?> type, String where, Map<String, Object> params) {
+        TypedQuery<Long> query = entityManager.createQuery(
+                "SELECT COUNT(e) FROM " + type.getSimpleName() + " e WHERE " + where, Long.class);
+        params.forEach(query::setParameter);
+        return query.getSingleResult();
+    }
+
+    /**
+     * Check a legacy "field,direction" sort parameter against the whitelist.
+     *
+     * @throws IllegalArgumentException if the field is not allowed
+     */
+    public static void validateSort(String[] sort, Map<String, KeyType> sortKeys) {
+        sortKey(sortKeys, sort[0], sort.length > 1 ? sort[1] : "asc");
+    }
+
+    private static SortKey sortKey(Map<String, KeyType> sortKeys, String field, String direction) {
+        KeyType type = sortKeys.get(field);
+        if (type == null) {
+            throw new IllegalArgumentException("Unsupported sort field: " + field
+                    + " (allowed: " + String.join(", ", sortKeys.keySet()) + ")");
+        }
+        if (!direction.equalsIgnoreCase("asc") && !direction.equalsIgnoreCase("desc")) {
+            throw new IllegalArgumentException("Unsupported sort direction: " + direction);
+        }
+        return new SortKey(field, type, direction.equalsIgnoreCase("desc"));
+    }
+
+    private static Object parse(KeyType type, String value) {
+        switch (type) {
+            case DATE_TIME:
+                return LocalDateTime.parse(value);
+            case LONG:
+            default:
+                return Long.valueOf(value);
+        }
+    }
+}
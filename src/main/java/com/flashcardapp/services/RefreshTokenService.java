@@ -0,0 +1,136 @@
+package com.flashcardapp.services;
+
+import com.flashcardapp.models.RefreshToken;
+import com.flashcardapp.models.TokenRevocation;
+import com.flashcardapp.repositories.RefreshTokenRepository;
+import com.flashcardapp.repositories.TokenRevocationRepository;
+import com.flashcardapp.security.jwt.JwtUtils;
+import com.flashcardapp.security.services.TokenDenylist;
+import com.flashcardapp.security.services.UserDetailsImpl;
+import io.jsonwebtoken.Claims;
+import org.slf4j.Logger;
+import org.slf4j.LoggerFactory;
+import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.scheduling.annotation.Scheduled;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
+
+import java.nio.charset.StandardCharsets;
+import java.security.MessageDigest;
+import java.security.NoSuchAlgorithmException;
+import java.time.LocalDateTime;
+import java.util.Optional;
+import java.util.UUID;
+
+/**
+ * Issues, rotates and revokes refresh tokens. Each token carries a random id
+ * whose hash is stored with the user and device; refreshing consumes the
+ * token and issues a new one. Presenting an already consumed token revokes
+ * every session of the user, since either it or its successor was stolen.
+ */
+@Service
+public class RefreshTokenService {
+    private static final Logger logger = LoggerFactory.getLogger(RefreshTokenService.class);
+
+    private static final int MAX_DEVICE_LENGTH = 255;
+
+    @Autowired
+    private RefreshTokenRepository refreshTokenRepository;
+
+    @Autowired
+    private TokenRevocationRepository tokenRevocationRepository;
+
+    @Autowired
+    private TokenDenylist tokenDenylist;
+
+    @Autowired
+    private JwtUtils jwtUtils;
+
+    /**
+     * Record a new refresh token for {@code user} and return the signed JWT.
+     */
+    @Transactional
+    public String issue(UserDetailsImpl user, String device) {
+        String tokenId = UUID.randomUUID().toString();
+        LocalDateTime now = LocalDateTime.now();
+        refreshTokenRepository.save(RefreshToken.builder()
+                .tokenHash(hash(tokenId))
+                .userId(user.getId())
+                .device(device != null && device.length() > MAX_DEVICE_LENGTH
+                        ? device.substring(0, MAX_DEVICE_LENGTH)
+                        : device)
+                .expiresAt(now.plusNanos(jwtUtils.getRefreshExpirationMs() * 1_000_000L))
+                .build());
+        return jwtUtils.generateRefreshToken(user, tokenId);
+    }
+
+    /**
+     * Consume the refresh token described by {@code claims} and issue its
+     * successor. Empty if the token is unknown, expired or already revoked.
+     */
+    @Transactional
+    public Optional<String> rotate(Claims claims, UserDetailsImpl user, String device) {
+        if (claims.getId() == null) {
+            return Optional.empty();
+        }
+        String tokenHash = hash(claims.getId());
+        if (refreshTokenRepository.revokeLive(tokenHash, user.getId(), LocalDateTime.now()) == 1) {
+            return Optional.of(issue(user, device));
+        }
+        if (refreshTokenRepository.existsByTokenHashAndRevokedAtIsNotNull(tokenHash)) {
+            logger.warn("Revoked refresh token reused for user {}; revoking all sessions", user.getId());
+            revokeAll(user.getId());
+        }
+        return Optional.empty();
+    }
+
+    /**
+     * Revoke a single refresh token by its JWT id; unknown ids are ignored.
+     */
+    @Transactional
+    public void revoke(String tokenId) {
+        if (tokenId != null) {
+            refreshTokenRepository.revokeByTokenHash(hash(tokenId), LocalDateTime.now());
+        }
+    }
+
+    /**
+     * Revoke every refresh token of the user and reject the access tokens
+     * issued to them so far.
+     */
+    @Transactional
+    public void revokeAll(Long userId) {
+        LocalDateTime now = LocalDateTime.now();
+        refreshTokenRepository.revokeAllByUserId(userId, now);
+
+        TokenRevocation revocation = tokenRevocationRepository.findByUserId(userId)
+                .orElseGet(() -> TokenRevocation.builder().userId(userId).build());
+        revocation.setRevokedBefore(now);
+        tokenRevocationRepository.save(revocation);
+
+        tokenDenylist.revokeIssuedBefore(userId, now);
+    }
+
+    @Scheduled(cron = "${app.refresh-token.purge-cron:0 30 3 * * *}")
+    @Transactional
+    public void purgeExpired() {
+        int deleted = refreshTokenRepository.deleteExpiredBefore(LocalDateTime.now());
+        if (deleted > 0) {
+            logger.info("Purged {} expired refresh tokens", deleted);
+        }
+    }
+
+    static String hash(String tokenId) {
+        try {
+            byte[] digest = MessageDigest.getInstance("SHA-256")
+                    .digest(tokenId.getBytes(StandardCharsets.UTF_8));
+            StringBuilder hex = new StringBuilder(digest.length * 2);
+            for (byte b : digest) {
+                hex.append(String.format("%02x", b));
+            }
+            return hex.toString();
+        } catch (NoSuchAlgorithmException e) {
+            throw new IllegalStateException("SHA-256 not available", e);
+        }
+    }
+}
@@ -0,0 +1,93 @@
+package com.flashcardapp.services;
+
+import com.flashcardapp.models.Card;
+import com.flashcardapp.models.CardReview;
+import com.flashcardapp.models.StudySession;
+import com.flashcardapp.payload.request.BatchReviewRequest.ReviewItem;
+import com.flashcardapp.repositories.CardRepository;
+import com.flashcardapp.repositories.CardReviewRepository;
+import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
+
+import java.time.LocalDateTime;
+import java.util.ArrayList;
+import java.util.Comparator;
+import java.util.List;
+import java.util.Map;
+import java.util.Set;
+import java.util.function.Function;
+import java.util.stream.Collectors;
+
+/**
+ * Applies a whole study session's reviews at once: one query loads every
+ * reviewed card of the session's deck, then the reviews are inserted and the
+ * cards updated in JDBC batches within a single transaction.
+ */
+@Service
+public class ReviewBatchService {
+
+    @Autowired
+    private CardRepository cardRepository;
+
+    @Autowired
+    private CardReviewRepository cardReviewRepository;
+
+    @Autowired
+    private SpacedRepetitionScheduler scheduler;
+
+    @Autowired
+    private StudyStatsService studyStatsService;
+
+    /**
+     * Store the reviews and return them in the order they were applied
+     * (oldest first, by reviewedAt). Nothing is written if any card is not
+     * in the session's deck.
+     *
+     * @throws IllegalArgumentException listing the cards outside the deck
+     */
+    @Transactional
+    public List<CardReview> submitReviews(StudySession session, List<ReviewItem> items) {
+        Set<Long> cardIds = items.stream().map(ReviewItem::getCardId).collect(Collectors.toSet());
+        Map<Long, Card> cards = cardRepository.findByIdInAndDeckId(cardIds, session.getDeck().getId()).stream()
+                .collect(Collectors.toMap(Card::getId, Function.identity()));
+        if (cards.size() != cardIds.size()) {
+            List<Long> foreign = cardIds.stream()
+                    .filter(id -> !cards.containsKey(id))
+                    .sorted()
+                    .collect(Collectors.toList());
+            throw new IllegalArgumentException("Cards do not belong to the deck being studied: " + foreign);
+        }
+
+        // Reviews recorded offline may arrive out of order; the latest one for a
+        // card has to decide its schedule. Future timestamps are clamped to now.
+        LocalDateTime now = LocalDateTime.now();
+        List<CardReview> reviews = new ArrayList<>(items.size());
+        for (ReviewItem item : items) {
+            LocalDateTime reviewedAt = item.getReviewedAt() != null && item.getReviewedAt().isBefore(now)
+                    ? item.getReviewedAt()
+                    : now;
+
+            CardReview review = new CardReview();
+            review.setCard(cards.get(item.getCardId()));
+            review.setStudySession(session);
+            review.setResult(item.getResult());
+            review.setTimeSpentSeconds(item.getTimeSpentSeconds() != null ? item.getTimeSpentSeconds() : 0);
+            review.setReviewedAt(reviewedAt);
+            reviews.add(review);
+        }
+        reviews.sort(Comparator.comparing(CardReview::getReviewedAt));
+
+        StudyStatsService.Tally tally = new StudyStatsService.Tally();
+        for (CardReview review : reviews) {
+            boolean newCard = review.getCard().getReviewCount() == 0;
+            scheduler.apply(review.getCard(), review, review.getReviewedAt());
+            tally.addReview(review.getReviewedAt(), review.getResult(), review.getTimeSpentSeconds(), newCard);
+        }
+
+        // The managed cards are flushed as batched updates on commit
+        List<CardReview> saved = cardReviewRepository.saveAll(reviews);
+        studyStatsService.record(session.getUser().getId(), tally);
+        return saved;
+    }
+}
@@ -0,0 +1,177 @@
+package com.flashcardapp.services;
+
+import com.flashcardapp.payload.response.CardSearchHit;
+import com.flashcardapp.payload.response.DeckSummary;
+import com.flashcardapp.repositories.DeckRepository;
+import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.jdbc.core.ConnectionCallback;
+import org.springframework.jdbc.core.JdbcTemplate;
+import org.springframework.jdbc.core.RowMapper;
+import org.springframework.jdbc.core.namedparam.MapSqlParameterSource;
+import org.springframework.jdbc.core.namedparam.NamedParameterJdbcTemplate;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
+
+import java.time.LocalDateTime;
+import java.util.ArrayList;
+import java.util.Collections;
+import java.util.Comparator;
+import java.util.HashMap;
+import java.util.LinkedHashSet;
+import java.util.List;
+import java.util.Locale;
+import java.util.Map;
+import java.util.Set;
+import java.util.regex.Matcher;
+import java.util.regex.Pattern;
+
+/**
+ * Full-text search over a user's decks (name, description) and cards (front,
+ * back, notes) through an inverted index. On PostgreSQL that is a GIN index
+ * over (user_id, weighted tsvector), so a query only visits the user's own
+ * matches, ranked with ts_rank; on H2 it is H2's built-in FullText index,
+ * which matches the same words across all users but does not rank. Both are
+ * created by DbInitializer. A result must contain every word of the query.
+ */
+@Service
+public class SearchService {
+
+    public static final int MAX_LIMIT = 100;
+    static final int MAX_TERMS = 8;
+
+    private static final Pattern TERM = Pattern.compile("[\\p{L}\\p{N}]+");
+
+    // The GIN indexes are built on user_id and these expressions; queries must
+    // filter on both and use the expressions verbatim
+    public static final String DECK_DOCUMENT = "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+            + "setweight(to_tsvector('simple', coalesce(description, '')), 'B')";
+    public static final String CARD_DOCUMENT = "setweight(to_tsvector('simple', coalesce(front, '')), 'A') || "
+            + "setweight(to_tsvector('simple', coalesce(back, '')), 'B') || "
+            + "setweight(to_tsvector('simple', coalesce(notes, '')), 'C')";
+
+    private static final String POSTGRES_DECKS = "SELECT id FROM decks "
+            + "CROSS JOIN to_tsquery('simple', :query) q "
+            + "WHERE user_id = :userId AND (" + DECK_DOCUMENT + ") @@ q "
+            + "ORDER BY ts_rank(" + DECK_DOCUMENT + ", q) DESC, id "
+            + "LIMIT :limit OFFSET :offset";
+
+    private static final String POSTGRES_CARDS = "SELECT c.id, c.deck_id, d.name AS deck_name, "
+            + "c.front, c.back, c.notes, ts_rank(" + CARD_DOCUMENT + ", q) AS score "
+            + "FROM cards c JOIN decks d ON d.id = c.deck_id "
+            + "CROSS JOIN to_tsquery('simple', :query) q "
+            + "WHERE c.user_id = :userId AND (" + CARD_DOCUMENT + ") @@ q "
+            + "ORDER BY score DESC, c.id "
+            + "LIMIT :limit OFFSET :offset";
+
+    // FT_SEARCH_DATA returns the primary key of each matching row in KEYS
+    private static final String H2_DECKS = "SELECT d.id FROM FT_SEARCH_DATA(:query, 0, 0) ft "
+            + "JOIN decks d ON d.id = CAST(ft.KEYS[1] AS BIGINT) "
+            + "WHERE ft.\"TABLE\" = 'DECKS' AND d.user_id = :userId "
+            + "ORDER BY ft.SCORE DESC, d.id "
+            + "LIMIT :limit OFFSET :offset";
+
+    private static final String H2_CARDS = "SELECT c.id, c.deck_id, d.name AS deck_name, "
+            + "c.front, c.back, c.notes, ft.SCORE AS score "
+            + "FROM FT_SEARCH_DATA(:query, 0, 0) ft "
+            + "JOIN cards c ON c.id = CAST(ft.KEYS[1] AS BIGINT) "
+            + "JOIN decks d ON d.id = c.deck_id "
+            + "WHERE ft.\"TABLE\" = 'CARDS' AND c.user_id = :userId "
+            + "ORDER BY score DESC, c.id "
+            + "LIMIT :limit OFFSET :offset";
+
+    private static final RowMapper<CardSearchHit> CARD_HIT = (rs, rowNum) -> new CardSearchHit(
+            rs.getLong("id"),
+            rs.getLong("deck_id"),
+            rs.getString("deck_name"),
+            rs.getString("front"),
+            rs.getString("back"),
+            rs.getString("notes"),
+            rs.getDouble("score"));
+
+    @Autowired
+    private NamedParameterJdbcTemplate namedParameterJdbcTemplate;
+
+    @Autowired
+    private JdbcTemplate jdbcTemplate;
+
+    @Autowired
+    private DeckRepository deckRepository;
+
+    private volatile Boolean postgres;
+
+    /**
+     * The user's decks matching {@code query}, best match first. Returns at
+     * most {@code limit} decks after skipping {@code offset}.
+     */
+    @Transactional(readOnly = true)
+    public List<DeckSummary> searchDecks(Long userId, String query, int limit, int offset) {
+        List<String> terms = terms(query);
+        if (terms.isEmpty()) {
+            return Collections.emptyList();
+        }
+        List<Long> ids = namedParameterJdbcTemplate.queryForList(isPostgres() ? POSTGRES_DECKS : H2_DECKS,
+                params(userId, terms, limit, offset), Long.class);
+        if (ids.isEmpty()) {
+            return Collections.emptyList();
+        }
+
+        // Counts for the page only, then back into rank order
+        Map<Long, Integer> position = new HashMap<>();
+        for (int i = 0; i < ids.size(); i++) {
+            position.put(ids.get(i), i);
+        }
+        List<DeckSummary> decks = new ArrayList<>(
+                deckRepository.findSummariesByUserIdAndIdIn(userId, ids, LocalDateTime.now()));
+        decks.sort(Comparator.comparing(deck -> position.get(deck.getId())));
+        return decks;
+    }
+
+    /**
+     * Cards in any of the user's decks matching {@code query}, best match
+     * first. Returns at most {@code limit} cards after skipping {@code offset}.
+     */
+    @Transactional(readOnly = true)
+    public List<CardSearchHit> searchCards(Long userId, String query, int limit, int offset) {
+        List<String> terms = terms(query);
+        if (terms.isEmpty()) {
+            return Collections.emptyList();
+        }
+        return namedParameterJdbcTemplate.query(isPostgres() ? POSTGRES_CARDS : H2_CARDS,
+                params(userId, terms, limit, offset), CARD_HIT);
+    }
+
+    private MapSqlParameterSource params(Long userId, List<String> terms, int limit, int offset) {
+        // Terms are letters and digits only, so they cannot form tsquery operators
+        String query = isPostgres() ? String.join(" & ", terms) : String.join(" ", terms);
+        return new MapSqlParameterSource()
+                .addValue("query", query)
+                .addValue("userId", userId)
+                .addValue("limit", limit)
+                .addValue("offset", offset);
+    }
+
+    /**
+     * Distinct lower-cased words of the query, at most {@value #MAX_TERMS}.
+     */
+    static List<String> terms(String query) {
+        if (query == null) {
+            return Collections.emptyList();
+        }
+        Set<String> terms = new LinkedHashSet<>();
+        Matcher matcher = TERM.matcher(query);
+        while (matcher.find() && terms.size() < MAX_TERMS) {
+            terms.add(matcher.group().toLowerCase(Locale.ROOT));
+        }
+        return new ArrayList<>(terms);
+    }
+
+    private boolean isPostgres() {
+        Boolean result = postgres;
+        if (result == null) {
+            String database = jdbcTemplate.execute(
+                    (ConnectionCallback<String>) connection -> connection.getMetaData().getDatabaseProductName());
+            result = postgres = "PostgreSQL".equals(database);
+        }
+        return result;
+    }
+}
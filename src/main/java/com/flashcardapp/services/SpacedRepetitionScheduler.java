@@ -0,0 +1,65 @@
+package com.flashcardapp.services;
+
+import com.flashcardapp.models.Card;
+import com.flashcardapp.models.CardReview;
+import org.springframework.stereotype.Component;
+
+import java.time.LocalDateTime;
+
+/**
+ * Difficulty and interval rules applied when a card is reviewed.
+ */
+@Component
+public class SpacedRepetitionScheduler {
+
+    /**
+     * Difficulty after a review. Result 0 is an incorrect answer; 1-5 are
+     * correct answers where a lower rating means the card felt harder.
+     */
+    public int nextDifficulty(int difficulty, int result) {
+        if (result == 0) {
+            // Incorrect answer increases difficulty
+            return Math.min(5, difficulty + 2);
+        }
+        // Correct answer decreases difficulty depending on rating (1-5)
+        // Lower rating = higher difficulty
+        return Math.max(0, difficulty - (result - 3));
+    }
+
+    public LocalDateTime nextReviewDate(int difficulty, LocalDateTime reviewedAt) {
+        switch (difficulty) {
+            case 0:
+                return reviewedAt.plusHours(6); // Easiest: review after 6 hours
+            case 1:
+                return reviewedAt.plusDays(1); // Review after 1 day
+            case 2:
+                return reviewedAt.plusDays(3); // Review after 3 days
+            case 3:
+                return reviewedAt.plusDays(7); // Review after 1 week
+            case 4:
+                return reviewedAt.plusDays(14); // Review after 2 weeks
+            case 5:
+                return reviewedAt.plusDays(30); // Hardest: review after 1 month
+            default:
+                return reviewedAt.plusDays(1); // Default: review after 1 day
+        }
+    }
+
+    /**
+     * Record the outcome of {@code review} (whose result is set) on the review
+     * row and on the card it belongs to.
+     */
+    public void apply(Card card, CardReview review, LocalDateTime reviewedAt) {
+        int previousDifficulty = card.getDifficulty();
+        int newDifficulty = nextDifficulty(previousDifficulty, review.getResult());
+        LocalDateTime nextReview = nextReviewDate(newDifficulty, reviewedAt);
+
+        review.setPreviousDifficulty(previousDifficulty);
+        review.setNewDifficulty(newDifficulty);
+        review.setNextReviewDate(nextReview);
+
+        card.setDifficulty(newDifficulty);
+        card.setNextReviewDate(nextReview);
+        card.setReviewCount(card.getReviewCount() + 1);
+    }
+}
@@ -0,0 +1,194 @@
+package com.flashcardapp.services;
+
+import com.flashcardapp.models.UserDailyStats;
+import com.flashcardapp.payload.response.StudyActivityResponse;
+import com.flashcardapp.payload.response.StudyActivityResponse.DailyActivity;
+import com.flashcardapp.repositories.UserDailyStatsRepository;
+import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.jdbc.core.ConnectionCallback;
+import org.springframework.jdbc.core.JdbcTemplate;
+import org.springframework.jdbc.core.namedparam.MapSqlParameterSource;
+import org.springframework.jdbc.core.namedparam.NamedParameterJdbcTemplate;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
+
+import java.time.LocalDate;
+import java.time.LocalDateTime;
+import java.util.Map;
+import java.util.TreeMap;
+
+/**
+ * Maintains the per-user daily rollups in {@code user_daily_stats} and
+ * summarises them into activity statistics.
+ *
+ * Counters are bumped with a single upsert per day in the caller's
+ * transaction: the first write of a day inserts the row, later ones add to it
+ * in place, so concurrent writers for the same user and day never lose
+ * increments and no second connection is needed.
+ */
+@Service
+public class StudyStatsService {
+
+    /** Longest window served by {@link #getActivity}, five years. */
+    public static final int MAX_DAYS = 5 * 366;
+
+    /**
+     * Changes to a user's daily counters, grouped by day. Collect the effects
+     * of a request here, then pass it to {@link #record}.
+     */
+    public static final class Tally {
+        // Sorted, so concurrent writers update the same rows in the same order
+        private final Map<LocalDate, int[]> days = new TreeMap<>();
+
+        private static final int REVIEWS = 0;
+        private static final int CORRECT = 1;
+        private static final int INCORRECT = 2;
+        private static final int TIME_SPENT = 3;
+        private static final int NEW_CARDS = 4;
+        private static final int SESSIONS = 5;
+
+        /**
+         * Count one review; {@code newCard} if it was the card's first review.
+         */
+        public Tally addReview(LocalDateTime reviewedAt, int result, Integer timeSpentSeconds, boolean newCard) {
+            int[] counters = day(reviewedAt);
+            counters[REVIEWS]++;
+            counters[result > 0 ? CORRECT : INCORRECT]++;
+            counters[TIME_SPENT] += timeSpentSeconds != null ? timeSpentSeconds : 0;
+            if (newCard) {
+                counters[NEW_CARDS]++;
+            }
+            return this;
+        }
+
+        public Tally addCompletedSession(LocalDateTime completedAt) {
+            day(completedAt)[SESSIONS]++;
+            return this;
+        }
+
+        public boolean isEmpty() {
+            return days.isEmpty();
+        }
+
+        private int[] day(LocalDateTime time) {
+            return days.computeIfAbsent(time.toLocalDate(), date -> new int[6]);
+        }
+    }
+
+    // Conflicts on uk_user_daily_stats_user_date add to the existing row
+    private static final String POSTGRES_UPSERT = "INSERT INTO user_daily_stats (user_id, stat_date, "
+            + "reviews, correct_responses, incorrect_responses, time_spent_seconds, new_cards, sessions_completed) "
+            + "VALUES (:userId, :statDate, :reviews, :correct, :incorrect, :timeSpent, :newCards, :sessions) "
+            + "ON CONFLICT (user_id, stat_date) DO UPDATE SET "
+            + "reviews = user_daily_stats.reviews + EXCLUDED.reviews, "
+            + "correct_responses = user_daily_stats.correct_responses + EXCLUDED.correct_responses, "
+            + "incorrect_responses = user_daily_stats.incorrect_responses + EXCLUDED.incorrect_responses, "
+            + "time_spent_seconds = user_daily_stats.time_spent_seconds + EXCLUDED.time_spent_seconds, "
+            + "new_cards = user_daily_stats.new_cards + EXCLUDED.new_cards, "
+            + "sessions_completed = user_daily_stats.sessions_completed + EXCLUDED.sessions_completed";
+
+    // H2's MERGE ... KEY replaces the row, so increment with the standard MERGE
+    private static final String H2_UPSERT = "MERGE INTO user_daily_stats s USING (VALUES "
+            + "(CAST(:userId AS BIGINT), CAST(:statDate AS DATE), CAST(:reviews AS INT), CAST(:correct AS INT), "
+            + "CAST(:incorrect AS INT), CAST(:timeSpent AS INT), CAST(:newCards AS INT), CAST(:sessions AS INT))) "
+            + "AS v (user_id, stat_date, reviews, correct, incorrect, time_spent, new_cards, sessions) "
+            + "ON s.user_id = v.user_id AND s.stat_date = v.stat_date "
+            + "WHEN MATCHED THEN UPDATE SET reviews = s.reviews + v.reviews, "
+            + "correct_responses = s.correct_responses + v.correct, "
+            + "incorrect_responses = s.incorrect_responses + v.incorrect, "
+            + "time_spent_seconds = s.time_spent_seconds + v.time_spent, "
+            + "new_cards = s.new_cards + v.new_cards, "
+            + "sessions_completed = s.sessions_completed + v.sessions "
+            + "WHEN NOT MATCHED THEN INSERT (user_id, stat_date, reviews, correct_responses, incorrect_responses, "
+            + "time_spent_seconds, new_cards, sessions_completed) "
+            + "VALUES (v.user_id, v.stat_date, v.reviews, v.correct, v.incorrect, v.time_spent, v.new_cards, "
+            + "v.sessions)";
+
+    @Autowired
+    private UserDailyStatsRepository userDailyStatsRepository;
+
+    @Autowired
+    private NamedParameterJdbcTemplate namedParameterJdbcTemplate;
+
+    @Autowired
+    private JdbcTemplate jdbcTemplate;
+
+    private volatile Boolean postgres;
+
+    /**
+     * Add {@code tally} to the user's daily rows, within the caller's
+     * transaction if there is one.
+     */
+    @Transactional
+    public void record(Long userId, Tally tally) {
+        String upsert = isPostgres() ? POSTGRES_UPSERT : H2_UPSERT;
+        tally.days.forEach((date, c) -> namedParameterJdbcTemplate.update(upsert, new MapSqlParameterSource()
+                .addValue("userId", userId)
+                .addValue("statDate", date)
+                .addValue("reviews", c[Tally.REVIEWS])
+                .addValue("correct", c[Tally.CORRECT])
+                .addValue("incorrect", c[Tally.INCORRECT])
+                .addValue("timeSpent", c[Tally.TIME_SPENT])
+                .addValue("newCards", c[Tally.NEW_CARDS])
+                .addValue("sessions", c[Tally.SESSIONS])));
+    }
+
+    /**
+     * Statistics for the {@code days} days ending today, from one range scan
+     * of the user's daily rows. Streaks only count days inside the window.
+     */
+    @Transactional(readOnly = true)
+    public StudyActivityResponse getActivity(Long userId, int days) {
+        LocalDate to = LocalDate.now();
+        LocalDate from = to.minusDays(days - 1L);
+
+        StudyActivityResponse activity = new StudyActivityResponse();
+        activity.setPeriod(days + " days");
+        activity.setFrom(from);
+        activity.setTo(to);
+
+        LocalDate previous = null;
+        int streak = 0;
+        for (UserDailyStats day : userDailyStatsRepository
+                .findByUserIdAndStatDateBetweenOrderByStatDateAsc(userId, from, to)) {
+            if (day.getReviews() == 0 && day.getSessionsCompleted() == 0) {
+                continue;
+            }
+            activity.setCompletedSessions(activity.getCompletedSessions() + day.getSessionsCompleted());
+            activity.setTotalCardsStudied(activity.getTotalCardsStudied() + day.getReviews());
+            activity.setCorrectResponses(activity.getCorrectResponses() + day.getCorrectResponses());
+            activity.setIncorrectResponses(activity.getIncorrectResponses() + day.getIncorrectResponses());
+            activity.setTotalTimeSpentSeconds(activity.getTotalTimeSpentSeconds() + day.getTimeSpentSeconds());
+            activity.setNewCards(activity.getNewCards() + day.getNewCards());
+            activity.setActiveDays(activity.getActiveDays() + 1);
+            activity.getDaily().add(new DailyActivity(day.getStatDate(), day.getReviews(),
+                    day.getCorrectResponses(), day.getIncorrectResponses(), day.getTimeSpentSeconds(),
+                    day.getNewCards(), day.getSessionsCompleted()));
+
+            streak = previous != null && previous.plusDays(1).equals(day.getStatDate()) ? streak + 1 : 1;
+            activity.setLongestStreak(Math.max(activity.getLongestStreak(), streak));
+            previous = day.getStatDate();
+        }
+
+        // A streak is still current if the last active day was today or yesterday
+        if (previous != null && !previous.isBefore(to.minusDays(1))) {
+            activity.setCurrentStreak(streak);
+        }
+        activity.setTotalTimeSpentMinutes(activity.getTotalTimeSpentSeconds() / 60);
+        if (activity.getTotalCardsStudied() > 0) {
+            activity.setAverageCorrectPercentage(
+                    activity.getCorrectResponses() * 100.0 / activity.getTotalCardsStudied());
+        }
+        return activity;
+    }
+
+    private boolean isPostgres() {
+        Boolean result = postgres;
+        if (result == null) {
+            String database = jdbcTemplate.execute(
+                    (ConnectionCallback<String>) connection -> connection.getMetaData().getDatabaseProductName());
+            result = postgres = "PostgreSQL".equals(database);
+        }
+        return result;
+    }
+}
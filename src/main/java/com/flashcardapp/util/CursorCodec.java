@@ -0,0 +1,53 @@
+package com.flashcardapp.util;
+
+import java.nio.charset.StandardCharsets;
+import java.util.Base64;
+import java.util.List;
+
+/**
+ * Encodes the sort key of the last row of a page into an opaque, URL-safe
+ * cursor for keyset pagination, and decodes it again for the next request.
+ */
+public final class CursorCodec {
+
+    private static final String SEPARATOR = "|";
+
+    private CursorCodec() {
+    }
+
+    public static String encode(Object... keyValues) {
+        StringBuilder raw = new StringBuilder();
+        for (Object value : keyValues) {
+            String text = value == null ? "" : value.toString();
+            if (text.contains(SEPARATOR)) {
+                throw new IllegalArgumentException("Cursor values may not contain '" + SEPARATOR + "'");
+            }
+            if (raw.length() > 0) {
+                raw.append(SEPARATOR);
+            }
+            raw.append(text);
+        }
+        return Base64.getUrlEncoder().withoutPadding()
+                .encodeToString(raw.toString().getBytes(StandardCharsets.UTF_8));
+    }
+
+    /**
+     * Split a cursor back into its key values as strings.
+     *
+     * @throws IllegalArgumentException if the cursor is malformed or does not
+     *                                  hold {@code expectedParts} values
+     */
+    public static List<String> decode(String cursor, int expectedParts) {
+        String raw;
+        try {
+            raw = new String(Base64.getUrlDecoder().decode(cursor), StandardCharsets.UTF_8);
+        } catch (IllegalArgumentException e) {
+            throw new IllegalArgumentException("Invalid cursor");
+        }
+        List<String> parts = List.of(raw.split("\\|", -1));
+        if (parts.size() != expectedParts) {
+            throw new IllegalArgumentException("Invalid cursor");
+        }
+        return parts;
+    }
+}
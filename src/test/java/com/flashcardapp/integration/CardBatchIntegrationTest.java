@@ -0,0 +1,190 @@
+package com.flashcardapp.integration;
+
+import com.fasterxml.jackson.databind.JsonNode;
+import com.fasterxml.jackson.databind.ObjectMapper;
+import com.flashcardapp.models.Card;
+import com.flashcardapp.models.Deck;
+import com.flashcardapp.models.ERole;
+import com.flashcardapp.models.Role;
+import com.flashcardapp.models.User;
+import com.flashcardapp.repositories.CardRepository;
+import com.flashcardapp.repositories.DeckRepository;
+import com.flashcardapp.repositories.RoleRepository;
+import com.flashcardapp.repositories.UserRepository;
+import com.flashcardapp.security.jwt.JwtUtils;
+import org.junit.jupiter.api.AfterEach;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.Test;
+import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.boot.test.autoconfigure.web.servlet.AutoConfigureMockMvc;
+import org.springframework.boot.test.context.SpringBootTest;
+import org.springframework.http.MediaType;
+import org.springframework.security.authentication.AuthenticationManager;
+import org.springframework.security.authentication.UsernamePasswordAuthenticationToken;
+import org.springframework.security.crypto.password.PasswordEncoder;
+import org.springframework.test.util.ReflectionTestUtils;
+import org.springframework.test.web.servlet.MockMvc;
+import org.springframework.test.web.servlet.MvcResult;
+
+import java.time.LocalDateTime;
+import java.util.ArrayList;
+import java.util.Base64;
+import java.util.HashMap;
+import java.util.HashSet;
+import java.util.List;
+import java.util.Map;
+import java.util.Set;
+
+import static org.hamcrest.Matchers.hasSize;
+import static org.hamcrest.Matchers.is;
+import static org.junit.jupiter.api.Assertions.*;
+import static org.springframework.test.web.servlet.request.MockMvcRequestBuilders.post;
+import static org.springframework.test.web.servlet.result.MockMvcResultMatchers.*;
+
+@SpringBootTest
+@AutoConfigureMockMvc
+public class CardBatchIntegrationTest {
+
+    @Autowired
+    private MockMvc mockMvc;
+
+    @Autowired
+    private ObjectMapper objectMapper;
+
+    @Autowired
+    private CardRepository cardRepository;
+
+    @Autowired
+    private DeckRepository deckRepository;
+
+    @Autowired
+    private UserRepository userRepository;
+
+    @Autowired
+    private RoleRepository roleRepository;
+
+    @Autowired
+    private PasswordEncoder passwordEncoder;
+
+    @Autowired
+    private JwtUtils jwtUtils;
+
+    @Autowired
+    private AuthenticationManager authenticationManager;
+
+    private String accessToken;
+    private User testUser;
+    private Deck deck;
+
+    @BeforeEach
+    void setUp() {
+        deckRepository.deleteAll();
+        userRepository.deleteAll();
+
+        String secretKey = Base64.getEncoder().encodeToString(
+                "TEST_JWT_SECRET_KEY_THAT_IS_SUFFICIENTLY_LONG_FOR_TESTING_PURPOSES_ONLY".getBytes());
+        ReflectionTestUtils.setField(jwtUtils, "jwtSecret", secretKey);
+
+        testUser = createUser("batchuser", "batch@example.com");
+        deck = new Deck();
+        deck.setName("Import target");
+        deck.setUser(testUser);
+        deck = deckRepository.save(deck);
+
+        accessToken = jwtUtils.generateAccessToken(authenticationManager.authenticate(
+                new UsernamePasswordAuthenticationToken("batchuser", "password")));
+    }
+
+    @AfterEach
+    void tearDown() {
+        deckRepository.deleteAll();
+    }
+
+    private User createUser(String username, String email) {
+        Role userRole = roleRepository.findByName(ERole.ROLE_USER)
+                .orElseGet(() -> roleRepository.save(new Role(null, ERole.ROLE_USER)));
+        Set<Role> roles = new HashSet<>();
+        roles.add(userRole);
+
+        return userRepository.save(User.builder()
+                .username(username)
+                .email(email)
+                .password(passwordEncoder.encode("password"))
+                .enabled(true)
+                .emailVerified(true)
+                .roles(roles)
+                .createdAt(LocalDateTime.now())
+                .updatedAt(LocalDateTime.now())
+                .build());
+    }
+
+    private String batchOf(int count) throws Exception {
+        List<Map<String, String>> cards = new ArrayList<>();
+        for (int i = 0; i < count; i++) {
+            Map<String, String> card = new HashMap<>();
+            card.put("front", "Question " + i);
+            card.put("back", "Answer " + i);
+            cards.add(card);
+        }
+        Map<String, Object> body = new HashMap<>();
+        body.put("cards", cards);
+        return objectMapper.writeValueAsString(body);
+    }
+
+    @Test
+    void createCardsBatch_ShouldInsertCardsInRequestOrder() throws Exception {
+        // More than one flush of CardBatchService.FLUSH_SIZE
+        int count = 120;
+
+        MvcResult result = mockMvc.perform(post("/api/decks/" + deck.getId() + "/cards/batch")
+                .header("Authorization", "Bearer " + accessToken)
+                .contentType(MediaType.APPLICATION_JSON)
+                .content(batchOf(count)))
+                .andExpect(status().isCreated())
+                .andExpect(jsonPath("$.deckId", is(deck.getId().intValue())))
+                .andExpect(jsonPath("$.created", is(count)))
+                .andExpect(jsonPath("$.ids", hasSize(count)))
+                .andReturn();
+
+        JsonNode ids = objectMapper.readTree(result.getResponse().getContentAsString()).get("ids");
+        for (int i = 0; i < count; i++) {
+            Card card = cardRepository.findByIdAndDeckId(ids.get(i).asLong(), deck.getId())
+                    .orElseThrow(() -> new AssertionError("Batch card was not stored in the deck"));
+            assertEquals("Question " + i, card.getFront());
+            assertEquals(testUser.getId(), card.getUserId());
+            assertEquals(0, card.getDifficulty());
+            assertNotNull(card.getNextReviewDate());
+        }
+        assertEquals(count, cardRepository.findByDeck(deck).size());
+    }
+
+    @Test
+    void createCardsBatch_OtherUsersDeck_ShouldReturnNotFound() throws Exception {
+        User otherUser = createUser("otheruser", "other@example.com");
+        Deck otherDeck = new Deck();
+        otherDeck.setName("Not yours");
+        otherDeck.setUser(otherUser);
+        otherDeck = deckRepository.save(otherDeck);
+
+        mockMvc.perform(post("/api/decks/" + otherDeck.getId() + "/cards/batch")
+                .header("Authorization", "Bearer " + accessToken)
+                .contentType(MediaType.APPLICATION_JSON)
+                .content(batchOf(3)))
+                .andExpect(status().isNotFound());
+
+        assertTrue(cardRepository.findByDeck(otherDeck).isEmpty());
+    }
+
+    @Test
+    void createCardsBatch_BlankCard_ShouldRejectWholeBatch() throws Exception {
+        String body = "{\"cards\":[{\"front\":\"Q\",\"back\":\"A\"},{\"front\":\"\",\"back\":\"A\"}]}";
+
+        mockMvc.perform(post("/api/decks/" + deck.getId() + "/cards/batch")
+                .header("Authorization", "Bearer " + accessToken)
+                .contentType(MediaType.APPLICATION_JSON)
+                .content(body))
+                .andExpect(status().isBadRequest());
+
+        assertTrue(cardRepository.findByDeck(deck).isEmpty());
+    }
+}
@@ -0,0 +1,214 @@
+package com.flashcardapp.integration;
+
+import com.fasterxml.jackson.databind.JsonNode;
+import com.fasterxml.jackson.databind.ObjectMapper;
+import com.flashcardapp.models.Card;
+import com.flashcardapp.models.CardReview;
+import com.flashcardapp.models.Deck;
+import com.flashcardapp.models.ERole;
+import com.flashcardapp.models.Role;
+import com.flashcardapp.models.StudySession;
+import com.flashcardapp.models.User;
+import com.flashcardapp.repositories.CardRepository;
+import com.flashcardapp.repositories.CardReviewRepository;
+import com.flashcardapp.repositories.DeckRepository;
+import com.flashcardapp.repositories.RoleRepository;
+import com.flashcardapp.repositories.StudySessionRepository;
+import com.flashcardapp.repositories.UserRepository;
+import com.flashcardapp.security.jwt.JwtUtils;
+import org.junit.jupiter.api.AfterEach;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.Test;
+import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.boot.test.autoconfigure.web.servlet.AutoConfigureMockMvc;
+import org.springframework.boot.test.context.SpringBootTest;
+import org.springframework.security.authentication.AuthenticationManager;
+import org.springframework.security.authentication.UsernamePasswordAuthenticationToken;
+import org.springframework.security.crypto.password.PasswordEncoder;
+import org.springframework.test.util.ReflectionTestUtils;
+import org.springframework.test.web.servlet.MockMvc;
+import org.springframework.test.web.servlet.request.MockHttpServletRequestBuilder;
+
+import java.time.LocalDateTime;
+import java.time.temporal.ChronoUnit;
+import java.util.ArrayList;
+import java.util.Base64;
+import java.util.Collections;
+import java.util.HashSet;
+import java.util.List;
+import java.util.Set;
+
+import static org.hamcrest.Matchers.is;
+import static org.junit.jupiter.api.Assertions.*;
+import static org.springframework.test.web.servlet.request.MockMvcRequestBuilders.get;
+import static org.springframework.test.web.servlet.result.MockMvcResultMatchers.*;
+
+@SpringBootTest
+@AutoConfigureMockMvc
+public class CardReviewHistoryIntegrationTest {
+
+    @Autowired
+    private MockMvc mockMvc;
+
+    @Autowired
+    private ObjectMapper objectMapper;
+
+    @Autowired
+    private CardRepository cardRepository;
+
+    @Autowired
+    private CardReviewRepository cardReviewRepository;
+
+    @Autowired
+    private StudySessionRepository studySessionRepository;
+
+    @Autowired
+    private DeckRepository deckRepository;
+
+    @Autowired
+    private UserRepository userRepository;
+
+    @Autowired
+    private RoleRepository roleRepository;
+
+    @Autowired
+    private PasswordEncoder passwordEncoder;
+
+    @Autowired
+    private JwtUtils jwtUtils;
+
+    @Autowired
+    private AuthenticationManager authenticationManager;
+
+    private String accessToken;
+    private String otherAccessToken;
+    private Card card;
+    private List<Long> reviewIds;
+
+    @BeforeEach
+    void setUp() {
+        clearData();
+        userRepository.deleteAll();
+
+        String secretKey = Base64.getEncoder().encodeToString(
+                "TEST_JWT_SECRET_KEY_THAT_IS_SUFFICIENTLY_LONG_FOR_TESTING_PURPOSES_ONLY".getBytes());
+        ReflectionTestUtils.setField(jwtUtils, "jwtSecret", secretKey);
+
+        User learner = createUser("historyuser", "history@example.com");
+        createUser("otherhistory", "otherhistory@example.com");
+
+        Deck deck = new Deck();
+        deck.setName("History deck");
+        deck.setUser(learner);
+        deck = deckRepository.save(deck);
+
+        card = new Card();
+        card.setDeck(deck);
+        card.setFront("Question");
+        card.setBack("Answer");
+        card = cardRepository.save(card);
+
+        StudySession session = studySessionRepository.save(StudySession.builder()
+                .user(learner)
+                .deck(deck)
+                .build());
+
+        // Five reviews, the middle two at the same time; results 0, 4, 0, 4, 4
+        LocalDateTime base = LocalDateTime.now().minusDays(5).truncatedTo(ChronoUnit.SECONDS);
+        LocalDateTime[] times = { base, base.plusDays(1), base.plusDays(2), base.plusDays(2), base.plusDays(3) };
+        reviewIds = new ArrayList<>();
+        for (int i = 0; i < times.length; i++) {
+            CardReview review = new CardReview();
+            review.setCard(card);
+            review.setStudySession(session);
+            review.setResult(i % 2 == 0 && i < 4 ? 0 : 4);
+            review.setTimeSpentSeconds(10 * (i + 1));
+            review.setReviewedAt(times[i]);
+            reviewIds.add(cardReviewRepository.save(review).getId());
+        }
+
+        accessToken = token("historyuser");
+        otherAccessToken = token("otherhistory");
+    }
+
+    @AfterEach
+    void tearDown() {
+        clearData();
+    }
+
+    private void clearData() {
+        cardReviewRepository.deleteAll();
+        studySessionRepository.deleteAll();
+        deckRepository.deleteAll();
+    }
+
+    private User createUser(String username, String email) {
+        Role userRole = roleRepository.findByName(ERole.ROLE_USER)
+                .orElseGet(() -> roleRepository.save(new Role(null, ERole.ROLE_USER)));
+        Set<Role> roles = new HashSet<>();
+        roles.add(userRole);
+
+        return userRepository.save(User.builder()
+                .username(username)
+                .email(email)
+                .password(passwordEncoder.encode("password"))
+                .enabled(true)
+                .emailVerified(true)
+                .roles(roles)
+                .createdAt(LocalDateTime.now())
+                .updatedAt(LocalDateTime.now())
+                .build());
+    }
+
+    private String token(String username) {
+        return jwtUtils.generateAccessToken(authenticationManager.authenticate(
+                new UsernamePasswordAuthenticationToken(username, "password")));
+    }
+
+    @Test
+    void getHistory_ShouldPageNewestFirstWithTotals() throws Exception {
+        List<Long> seen = new ArrayList<>();
+        String cursor = null;
+        int pages = 0;
+        do {
+            MockHttpServletRequestBuilder request = get("/api/cards/" + card.getId() + "/reviews")
+                    .header("Authorization", "Bearer " + accessToken)
+                    .param("limit", "2");
+            if (cursor != null) {
+                request.param("cursor", cursor);
+            }
+            String body = mockMvc.perform(request)
+                    .andExpect(status().isOk())
+                    .andExpect(jsonPath("$.statistics.totalReviews", is(5)))
+                    .andExpect(jsonPath("$.statistics.correctCount", is(3)))
+                    .andExpect(jsonPath("$.statistics.incorrectCount", is(2)))
+                    .andExpect(jsonPath("$.statistics.averageTimeSeconds", is(30.0)))
+                    .andExpect(jsonPath("$.statistics.successRate", is(60.0)))
+                    .andReturn().getResponse().getContentAsString();
+            JsonNode json = objectMapper.readTree(body);
+            json.get("reviews").forEach(review -> seen.add(review.get("id").asLong()));
+            cursor = json.get("nextCursor").isNull() ? null : json.get("nextCursor").asText();
+            pages++;
+        } while (cursor != null);
+
+        List<Long> newestFirst = new ArrayList<>(reviewIds);
+        Collections.reverse(newestFirst);
+        assertEquals(newestFirst, seen);
+        assertEquals(3, pages);
+    }
+
+    @Test
+    void getHistory_OtherUsersCard_ShouldReturnForbidden() throws Exception {
+        mockMvc.perform(get("/api/cards/" + card.getId() + "/reviews")
+                .header("Authorization", "Bearer " + otherAccessToken))
+                .andExpect(status().isForbidden());
+    }
+
+    @Test
+    void getHistory_InvalidCursor_ShouldReturnBadRequest() throws Exception {
+        mockMvc.perform(get("/api/cards/" + card.getId() + "/reviews")
+                .header("Authorization", "Bearer " + accessToken)
+                .param("cursor", "not-a-cursor"))
+                .andExpect(status().isBadRequest());
+    }
+}
@@ -0,0 +1,202 @@
+package com.flashcardapp.integration;
+
+import com.fasterxml.jackson.databind.JsonNode;
+import com.fasterxml.jackson.databind.ObjectMapper;
+import com.flashcardapp.models.Card;
+import com.flashcardapp.models.Deck;
+import com.flashcardapp.models.ERole;
+import com.flashcardapp.models.Role;
+import com.flashcardapp.models.StudySession;
+import com.flashcardapp.models.User;
+import com.flashcardapp.repositories.CardRepository;
+import com.flashcardapp.repositories.DeckRepository;
+import com.flashcardapp.repositories.RoleRepository;
+import com.flashcardapp.repositories.StudySessionRepository;
+import com.flashcardapp.repositories.UserRepository;
+import com.flashcardapp.security.jwt.JwtUtils;
+import org.junit.jupiter.api.AfterEach;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.Test;
+import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.boot.test.autoconfigure.web.servlet.AutoConfigureMockMvc;
+import org.springframework.boot.test.context.SpringBootTest;
+import org.springframework.security.authentication.AuthenticationManager;
+import org.springframework.security.authentication.UsernamePasswordAuthenticationToken;
+import org.springframework.security.crypto.password.PasswordEncoder;
+import org.springframework.test.util.ReflectionTestUtils;
+import org.springframework.test.web.servlet.MockMvc;
+import org.springframework.test.web.servlet.request.MockHttpServletRequestBuilder;
+
+import java.time.LocalDateTime;
+import java.util.ArrayList;
+import java.util.Base64;
+import java.util.Collections;
+import java.util.HashSet;
+import java.util.List;
+import java.util.Set;
+import java.util.stream.Collectors;
+
+import static org.hamcrest.Matchers.hasSize;
+import static org.hamcrest.Matchers.is;
+import static org.junit.jupiter.api.Assertions.*;
+import static org.springframework.test.web.servlet.request.MockMvcRequestBuilders.get;
+import static org.springframework.test.web.servlet.result.MockMvcResultMatchers.*;
+
+@SpringBootTest
+@AutoConfigureMockMvc
+public class CursorPaginationIntegrationTest {
+
+    @Autowired
+    private MockMvc mockMvc;
+
+    @Autowired
+    private ObjectMapper objectMapper;
+
+    @Autowired
+    private CardRepository cardRepository;
+
+    @Autowired
+    private DeckRepository deckRepository;
+
+    @Autowired
+    private StudySessionRepository studySessionRepository;
+
+    @Autowired
+    private UserRepository userRepository;
+
+    @Autowired
+    private RoleRepository roleRepository;
+
+    @Autowired
+    private PasswordEncoder passwordEncoder;
+
+    @Autowired
+    private JwtUtils jwtUtils;
+
+    @Autowired
+    private AuthenticationManager authenticationManager;
+
+    private String accessToken;
+    private User testUser;
+    private Deck deck;
+    private List<Long> cardIds;
+
+    @BeforeEach
+    void setUp() {
+        clearData();
+        userRepository.deleteAll();
+
+        String secretKey = Base64.getEncoder().encodeToString(
+                "TEST_JWT_SECRET_KEY_THAT_IS_SUFFICIENTLY_LONG_FOR_TESTING_PURPOSES_ONLY".getBytes());
+        ReflectionTestUtils.setField(jwtUtils, "jwtSecret", secretKey);
+
+        Role userRole = roleRepository.findByName(ERole.ROLE_USER)
+                .orElseGet(() -> roleRepository.save(new Role(null, ERole.ROLE_USER)));
+        Set<Role> roles = new HashSet<>();
+        roles.add(userRole);
+        testUser = userRepository.save(User.builder()
+                .username("pageuser")
+                .email("page@example.com")
+                .password(passwordEncoder.encode("password"))
+                .enabled(true)
+                .emailVerified(true)
+                .roles(roles)
+                .createdAt(LocalDateTime.now())
+                .updatedAt(LocalDateTime.now())
+                .build());
+
+        deck = new Deck();
+        deck.setName("Paged deck");
+        deck.setUser(testUser);
+        deck = deckRepository.save(deck);
+
+        cardIds = new ArrayList<>();
+        for (int i = 0; i < 20; i++) {
+            Card card = new Card();
+            card.setDeck(deck);
+            card.setFront("Question " + i);
+            card.setBack("Answer " + i);
+            cardIds.add(cardRepository.save(card).getId());
+        }
+
+        accessToken = jwtUtils.generateAccessToken(authenticationManager.authenticate(
+                new UsernamePasswordAuthenticationToken("pageuser", "password")));
+    }
+
+    @AfterEach
+    void tearDown() {
+        clearData();
+    }
+
+    private void clearData() {
+        studySessionRepository.deleteAll();
+        deckRepository.deleteAll();
+    }
+
+    private List<Long> walk(String path, String items, String sort, int limit) throws Exception {
+        List<Long> seen = new ArrayList<>();
+        String cursor = null;
+        do {
+            MockHttpServletRequestBuilder request = get(path)
+                    .header("Authorization", "Bearer " + accessToken)
+                    .param("limit", String.valueOf(limit))
+                    .param("sort", sort);
+            if (cursor != null) {
+                request.param("after", cursor);
+            }
+            String body = mockMvc.perform(request)
+                    .andExpect(status().isOk())
+                    .andReturn().getResponse().getContentAsString();
+            JsonNode json = objectMapper.readTree(body);
+            assertFalse(json.has("totalItems"));
+            json.get(items).forEach(item -> seen.add(item.get("id").asLong()));
+            cursor = json.get("nextCursor").isNull() ? null : json.get("nextCursor").asText();
+        } while (cursor != null);
+        return seen;
+    }
+
+    @Test
+    void getCards_CursorMode_ShouldVisitEveryCardOnce() throws Exception {
+        List<Long> descending = new ArrayList<>(cardIds);
+        Collections.reverse(descending);
+
+        assertEquals(cardIds, walk("/api/decks/" + deck.getId() + "/cards", "cards", "id,asc", 7));
+        assertEquals(descending, walk("/api/decks/" + deck.getId() + "/cards", "cards", "id,desc", 7));
+        // Cards created together share due times; ties are broken by id
+        assertEquals(cardIds, walk("/api/decks/" + deck.getId() + "/cards", "cards", "nextReviewDate,asc", 3)
+                .stream().sorted().collect(Collectors.toList()));
+    }
+
+    @Test
+    void getCards_CursorMode_WithTotal_ShouldCount() throws Exception {
+        mockMvc.perform(get("/api/decks/" + deck.getId() + "/cards")
+                .header("Authorization", "Bearer " + accessToken)
+                .param("limit", "5")
+                .param("includeTotal", "true"))
+                .andExpect(status().isOk())
+                .andExpect(jsonPath("$.cards", hasSize(5)))
+                .andExpect(jsonPath("$.totalItems", is(20)));
+    }
+
+    @Test
+    void getCards_UnknownSortField_ShouldReturnBadRequest() throws Exception {
+        mockMvc.perform(get("/api/decks/" + deck.getId() + "/cards")
+                .header("Authorization", "Bearer " + accessToken)
+                .param("sort", "back,asc"))
+                .andExpect(status().isBadRequest());
+    }
+
+    @Test
+    void getSessions_CursorMode_ShouldPageNewestFirst() throws Exception {
+        List<Long> sessionIds = new ArrayList<>();
+        for (int i = 0; i < 5; i++) {
+            sessionIds.add(studySessionRepository.save(StudySession.builder()
+                    .user(testUser)
+                    .deck(deck)
+                    .build()).getId());
+        }
+        Collections.reverse(sessionIds);
+
+        assertEquals(sessionIds, walk("/api/study-sessions", "sessions", "id,desc", 2));
+    }
+}
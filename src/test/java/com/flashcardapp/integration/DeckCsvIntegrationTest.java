@@ -0,0 +1,232 @@
+package com.flashcardapp.integration;
+
+import com.flashcardapp.models.Card;
+import com.flashcardapp.models.Deck;
+import com.flashcardapp.models.ERole;
+import com.flashcardapp.models.Role;
+import com.flashcardapp.models.User;
+import com.flashcardapp.repositories.CardRepository;
+import com.flashcardapp.repositories.DeckRepository;
+import com.flashcardapp.repositories.RoleRepository;
+import com.flashcardapp.repositories.UserRepository;
+import com.flashcardapp.security.jwt.JwtUtils;
+import org.junit.jupiter.api.AfterEach;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.Test;
+import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.boot.test.autoconfigure.web.servlet.AutoConfigureMockMvc;
+import org.springframework.boot.test.context.SpringBootTest;
+import org.springframework.mock.web.MockMultipartFile;
+import org.springframework.security.authentication.AuthenticationManager;
+import org.springframework.security.authentication.UsernamePasswordAuthenticationToken;
+import org.springframework.security.crypto.password.PasswordEncoder;
+import org.springframework.test.util.ReflectionTestUtils;
+import org.springframework.test.web.servlet.MockMvc;
+import org.springframework.test.web.servlet.MvcResult;
+
+import java.nio.charset.StandardCharsets;
+import java.time.LocalDateTime;
+import java.util.Base64;
+import java.util.HashSet;
+import java.util.List;
+import java.util.Set;
+
+import static org.hamcrest.Matchers.hasSize;
+import static org.hamcrest.Matchers.is;
+import static org.junit.jupiter.api.Assertions.*;
+import static org.springframework.test.web.servlet.request.MockMvcRequestBuilders.*;
+import static org.springframework.test.web.servlet.result.MockMvcResultMatchers.*;
+
+@SpringBootTest
+@AutoConfigureMockMvc
+public class DeckCsvIntegrationTest {
+
+    @Autowired
+    private MockMvc mockMvc;
+
+    @Autowired
+    private CardRepository cardRepository;
+
+    @Autowired
+    private DeckRepository deckRepository;
+
+    @Autowired
+    private UserRepository userRepository;
+
+    @Autowired
+    private RoleRepository roleRepository;
+
+    @Autowired
+    private PasswordEncoder passwordEncoder;
+
+    @Autowired
+    private JwtUtils jwtUtils;
+
+    @Autowired
+    private AuthenticationManager authenticationManager;
+
+    private String accessToken;
+    private User owner;
+    private Deck deck;
+    private Deck otherDeck;
+
+    @BeforeEach
+    void setUp() {
+        clearData();
+        userRepository.deleteAll();
+
+        String secretKey = Base64.getEncoder().encodeToString(
+                "TEST_JWT_SECRET_KEY_THAT_IS_SUFFICIENTLY_LONG_FOR_TESTING_PURPOSES_ONLY".getBytes());
+        ReflectionTestUtils.setField(jwtUtils, "jwtSecret", secretKey);
+
+        owner = createUser("csvuser", "csv@example.com");
+        User other = createUser("othercsv", "othercsv@example.com");
+        deck = deck(owner, "Spanish");
+        otherDeck = deck(other, "Not yours");
+
+        accessToken = jwtUtils.generateAccessToken(authenticationManager.authenticate(
+                new UsernamePasswordAuthenticationToken("csvuser", "password")));
+    }
+
+    @AfterEach
+    void tearDown() {
+        clearData();
+    }
+
+    private void clearData() {
+        cardRepository.deleteAll();
+        deckRepository.deleteAll();
+    }
+
+    private User createUser(String username, String email) {
+        Role userRole = roleRepository.findByName(ERole.ROLE_USER)
+                .orElseGet(() -> roleRepository.save(new Role(null, ERole.ROLE_USER)));
+        Set<Role> roles = new HashSet<>();
+        roles.add(userRole);
+
+        return userRepository.save(User.builder()
+                .username(username)
+                .email(email)
+                .password(passwordEncoder.encode("password"))
+                .enabled(true)
+                .emailVerified(true)
+                .roles(roles)
+                .createdAt(LocalDateTime.now())
+                .updatedAt(LocalDateTime.now())
+                .build());
+    }
+
+    private Deck deck(User user, String name) {
+        Deck deck = new Deck();
+        deck.setName(name);
+        deck.setUser(user);
+        return deckRepository.save(deck);
+    }
+
+    private String export(Long deckId) throws Exception {
+        MvcResult started = mockMvc.perform(get("/api/decks/{id}/export", deckId)
+                .header("Authorization", "Bearer " + accessToken))
+                .andExpect(request().asyncStarted())
+                .andReturn();
+
+        return mockMvc.perform(asyncDispatch(started))
+                .andExpect(status().isOk())
+                .andExpect(header().string("Content-Disposition", "attachment; filename=\"deck-" + deckId + ".csv\""))
+                .andReturn().getResponse().getContentAsString(StandardCharsets.UTF_8);
+    }
+
+    @Test
+    void importCsvBody_ShouldCreateCardsAndReportSkippedRows() throws Exception {
+        String csv = "\uFEFFBack,Front,Notes,Extra\n"
+                + "to be,ser,\"Irregular, permanent\",x\n"
+                + ",missing front,,\n"
+                + "\n"
+                + "to have,tener,,\n";
+
+        mockMvc.perform(post("/api/decks/{id}/import", deck.getId())
+                .header("Authorization", "Bearer " + accessToken)
+                .contentType("text/csv")
+                .content(csv.getBytes(StandardCharsets.UTF_8)))
+                .andExpect(status().isCreated())
+                .andExpect(jsonPath("$.imported", is(2)))
+                .andExpect(jsonPath("$.skipped", is(1)))
+                .andExpect(jsonPath("$.errors", hasSize(1)))
+                .andExpect(jsonPath("$.errors[0]", is("Row 2: front and back are required")));
+
+        List<Card> cards = cardRepository.findByDeck(deck);
+        assertEquals(2, cards.size());
+        Card ser = cards.stream().filter(card -> card.getFront().equals("ser")).findFirst().orElseThrow();
+        assertEquals("to be", ser.getBack());
+        assertEquals("Irregular, permanent", ser.getNotes());
+    }
+
+    @Test
+    void importMultipart_ShouldCreateCards() throws Exception {
+        MockMultipartFile file = new MockMultipartFile("file", "cards.csv", "text/csv",
+                "front,back\nhola,hello\nadiós,goodbye\n".getBytes(StandardCharsets.UTF_8));
+
+        mockMvc.perform(multipart("/api/decks/{id}/import", deck.getId())
+                .file(file)
+                .header("Authorization", "Bearer " + accessToken))
+                .andExpect(status().isCreated())
+                .andExpect(jsonPath("$.imported", is(2)));
+
+        assertEquals(2, cardRepository.findByDeck(deck).size());
+    }
+
+    @Test
+    void importWithoutFrontColumn_ShouldReturnBadRequest() throws Exception {
+        mockMvc.perform(post("/api/decks/{id}/import", deck.getId())
+                .header("Authorization", "Bearer " + accessToken)
+                .contentType("text/csv")
+                .content("question,answer\nhola,hello\n"))
+                .andExpect(status().isBadRequest())
+                .andExpect(jsonPath("$.message", is("CSV header must name the front and back columns")));
+
+        assertTrue(cardRepository.findByDeck(deck).isEmpty());
+    }
+
+    @Test
+    void importAndExport_OtherUsersDeck_ShouldReturnNotFound() throws Exception {
+        mockMvc.perform(post("/api/decks/{id}/import", otherDeck.getId())
+                .header("Authorization", "Bearer " + accessToken)
+                .contentType("text/csv")
+                .content("front,back\nhola,hello\n"))
+                .andExpect(status().isNotFound());
+
+        mockMvc.perform(get("/api/decks/{id}/export", otherDeck.getId())
+                .header("Authorization", "Bearer " + accessToken))
+                .andExpect(status().isNotFound());
+
+        assertTrue(cardRepository.findByDeck(otherDeck).isEmpty());
+    }
+
+    @Test
+    void exportThenImport_ShouldRoundTripEveryCard() throws Exception {
+        StringBuilder csv = new StringBuilder("front,back,notes\n");
+        for (int i = 0; i < 2500; i++) {
+            csv.append("\"front ").append(i).append(", with comma\",\"back \"\"").append(i)
+                    .append("\"\"\",").append(i % 2 == 0 ? "\"line one\nline two\"" : "").append('\n');
+        }
+        mockMvc.perform(post("/api/decks/{id}/import", deck.getId())
+                .header("Authorization", "Bearer " + accessToken)
+                .contentType("text/csv")
+                .content(csv.toString()))
+                .andExpect(status().isCreated())
+                .andExpect(jsonPath("$.imported", is(2500)));
+
+        String exported = export(deck.getId());
+        assertTrue(exported.startsWith("front,back,notes\r\n"));
+
+        Deck copy = deck(owner, "Spanish copy");
+        mockMvc.perform(post("/api/decks/{id}/import", copy.getId())
+                .header("Authorization", "Bearer " + accessToken)
+                .contentType("text/csv")
+                .content(exported))
+                .andExpect(status().isCreated())
+                .andExpect(jsonPath("$.imported", is(2500)))
+                .andExpect(jsonPath("$.skipped", is(0)));
+
+        assertEquals(exported, export(copy.getId()));
+    }
+}
@@ -0,0 +1,201 @@
+package com.flashcardapp.integration;
+
+import com.fasterxml.jackson.databind.ObjectMapper;
+import com.flashcardapp.models.EEmailType;
+import com.flashcardapp.models.ERole;
+import com.flashcardapp.models.EOutboxStatus;
+import com.flashcardapp.models.EmailOutbox;
+import com.flashcardapp.models.Role;
+import com.flashcardapp.models.User;
+import com.flashcardapp.payload.request.ForgotPasswordRequest;
+import com.flashcardapp.payload.request.SignupRequest;
+import com.flashcardapp.repositories.EmailOutboxRepository;
+import com.flashcardapp.repositories.RoleRepository;
+import com.flashcardapp.repositories.UserRepository;
+import com.flashcardapp.services.EmailOutboxService;
+import org.junit.jupiter.api.AfterEach;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.Test;
+import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.boot.test.autoconfigure.web.servlet.AutoConfigureMockMvc;
+import org.springframework.boot.test.context.SpringBootTest;
+import org.springframework.boot.test.mock.mockito.MockBean;
+import org.springframework.boot.test.mock.mockito.SpyBean;
+import org.springframework.http.MediaType;
+import org.springframework.mail.MailSendException;
+import org.springframework.mail.javamail.JavaMailSender;
+import org.springframework.test.web.servlet.MockMvc;
+
+import javax.mail.Session;
+import javax.mail.internet.MimeMessage;
+import java.time.LocalDateTime;
+import java.util.List;
+import java.util.stream.Collectors;
+
+import static org.junit.jupiter.api.Assertions.*;
+import static org.mockito.Mockito.*;
+import static org.springframework.test.web.servlet.request.MockMvcRequestBuilders.post;
+import static org.springframework.test.web.servlet.result.MockMvcResultMatchers.jsonPath;
+import static org.springframework.test.web.servlet.result.MockMvcResultMatchers.status;
+
+@SpringBootTest
+@AutoConfigureMockMvc
+public class EmailOutboxIntegrationTest {
+
+    @Autowired
+    private MockMvc mockMvc;
+
+    @Autowired
+    private ObjectMapper objectMapper;
+
+    @Autowired
+    private EmailOutboxRepository emailOutboxRepository;
+
+    @SpyBean
+    private EmailOutboxService emailOutboxService;
+
+    @Autowired
+    private UserRepository userRepository;
+
+    @Autowired
+    private RoleRepository roleRepository;
+
+    @MockBean
+    private JavaMailSender mailSender;
+
+    @BeforeEach
+    void setUp() {
+        emailOutboxRepository.deleteAll();
+        userRepository.deleteAll();
+        if (!roleRepository.findByName(ERole.ROLE_USER).isPresent()) {
+            roleRepository.save(new Role(null, ERole.ROLE_USER));
+        }
+        when(mailSender.createMimeMessage()).thenAnswer(invocation -> new MimeMessage((Session) null));
+    }
+
+    @AfterEach
+    void tearDown() {
+        emailOutboxRepository.deleteAll();
+    }
+
+    private EmailOutbox queued(String recipient) {
+        return emailOutboxService.enqueue(EEmailType.VERIFICATION, recipient, "token-" + recipient);
+    }
+
+    @Test
+    void signup_ShouldQueueVerificationEmailWithoutSending() throws Exception {
+        SignupRequest signupRequest = new SignupRequest();
+        signupRequest.setUsername("outboxuser");
+        signupRequest.setEmail("outbox@example.com");
+        signupRequest.setPassword("password123");
+
+        mockMvc.perform(post("/api/auth/signup")
+                .contentType(MediaType.APPLICATION_JSON)
+                .content(objectMapper.writeValueAsString(signupRequest)))
+                .andExpect(status().isCreated());
+
+        verify(mailSender, never()).send(any(MimeMessage[].class));
+
+        User user = userRepository.findByUsername("outboxuser").orElseThrow();
+        List<EmailOutbox> queued = emailOutboxRepository.findAll();
+        assertEquals(1, queued.size());
+        assertEquals(EEmailType.VERIFICATION, queued.get(0).getType());
+        assertEquals("outbox@example.com", queued.get(0).getRecipient());
+        assertEquals(user.getVerificationToken(), queued.get(0).getToken());
+        assertEquals(EOutboxStatus.PENDING, queued.get(0).getStatus());
+    }
+
+    @Test
+    void forgotPassword_WhenQueueingFails_ShouldStillReturnOkAndKeepNoToken() throws Exception {
+        userRepository.save(User.builder()
+                .username("resetuser")
+                .email("reset@example.com")
+                .password("password")
+                .enabled(true)
+                .emailVerified(true)
+                .build());
+        doThrow(new IllegalStateException("Outbox unavailable")).when(emailOutboxService)
+                .enqueue(any(EEmailType.class), anyString(), anyString());
+
+        ForgotPasswordRequest request = new ForgotPasswordRequest();
+        request.setEmail("reset@example.com");
+        mockMvc.perform(post("/api/auth/forgot-password")
+                .contentType(MediaType.APPLICATION_JSON)
+                .content(objectMapper.writeValueAsString(request)))
+                .andExpect(status().isOk())
+                .andExpect(jsonPath("$.message").exists());
+
+        // The token was rolled back with the failed email
+        assertNull(userRepository.findByUsername("resetuser").orElseThrow().getResetPasswordToken());
+        assertTrue(emailOutboxRepository.findAll().isEmpty());
+    }
+
+    @Test
+    void purgeFinished_ShouldDeleteOnlyOldSentAndFailedEmails() {
+        EmailOutbox oldSent = queued("old-sent@example.com");
+        EmailOutbox oldFailed = queued("old-failed@example.com");
+        EmailOutbox oldPending = queued("old-pending@example.com");
+        EmailOutbox recentSent = queued("recent-sent@example.com");
+        oldSent.setStatus(EOutboxStatus.SENT);
+        oldFailed.setStatus(EOutboxStatus.FAILED);
+        recentSent.setStatus(EOutboxStatus.SENT);
+        for (EmailOutbox email : List.of(oldSent, oldFailed, oldPending)) {
+            email.setCreatedAt(LocalDateTime.now().minusDays(30));
+        }
+        emailOutboxRepository.saveAll(List.of(oldSent, oldFailed, oldPending, recentSent));
+
+        emailOutboxService.purgeFinished();
+
+        List<Long> remaining = emailOutboxRepository.findAll().stream().map(EmailOutbox::getId).sorted()
+                .collect(Collectors.toList());
+        assertEquals(List.of(oldPending.getId(), recentSent.getId()), remaining);
+    }
+
+    @Test
+    void dispatchBatch_ShouldSendDueEmailsAndMarkThemSent() {
+        queued("first@example.com");
+        queued("second@example.com");
+
+        assertEquals(2, emailOutboxService.dispatchBatch());
+        // Nothing is left for the next run
+        assertEquals(0, emailOutboxService.dispatchBatch());
+
+        for (EmailOutbox email : emailOutboxRepository.findAll()) {
+            assertEquals(EOutboxStatus.SENT, email.getStatus());
+            assertEquals(1, email.getAttempts());
+            assertNotNull(email.getSentAt());
+        }
+    }
+
+    @Test
+    void dispatchBatch_SendFailure_ShouldRetryLater() {
+        doThrow(new MailSendException("Connection refused")).when(mailSender)
+                .send(any(MimeMessage[].class));
+        Long id = queued("retry@example.com").getId();
+
+        assertEquals(1, emailOutboxService.dispatchBatch());
+
+        EmailOutbox email = emailOutboxRepository.findById(id).orElseThrow();
+        assertEquals(EOutboxStatus.PENDING, email.getStatus());
+        assertEquals(1, email.getAttempts());
+        assertEquals("Connection refused", email.getLastError());
+        assertTrue(email.getNextAttemptAt().isAfter(LocalDateTime.now().plusSeconds(20)));
+        // Backing off, so not due again yet
+        assertEquals(0, emailOutboxService.dispatchBatch());
+    }
+
+    @Test
+    void dispatchBatch_LastAttemptFails_ShouldMarkFailed() {
+        doThrow(new MailSendException("Mailbox unavailable")).when(mailSender)
+                .send(any(MimeMessage[].class));
+        EmailOutbox email = queued("gone@example.com");
+        email.setAttempts(7);
+        emailOutboxRepository.save(email);
+
+        emailOutboxService.dispatchBatch();
+
+        email = emailOutboxRepository.findById(email.getId()).orElseThrow();
+        assertEquals(EOutboxStatus.FAILED, email.getStatus());
+        assertEquals(8, email.getAttempts());
+    }
+}
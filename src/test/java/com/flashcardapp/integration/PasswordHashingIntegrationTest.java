@@ -0,0 +1,170 @@
+package com.flashcardapp.integration;
+
+import com.fasterxml.jackson.databind.ObjectMapper;
+import com.flashcardapp.controllers.PasswordHashingExceptionHandler;
+import com.flashcardapp.models.ERole;
+import com.flashcardapp.models.Role;
+import com.flashcardapp.models.User;
+import com.flashcardapp.payload.request.LoginRequest;
+import com.flashcardapp.payload.response.MessageResponse;
+import com.flashcardapp.repositories.RoleRepository;
+import com.flashcardapp.repositories.UserRepository;
+import com.flashcardapp.security.services.BoundedPasswordEncoder;
+import com.flashcardapp.security.services.PasswordHashingBusyException;
+import org.junit.jupiter.api.AfterEach;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.Test;
+import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.boot.test.autoconfigure.web.servlet.AutoConfigureMockMvc;
+import org.springframework.boot.test.context.SpringBootTest;
+import org.springframework.http.HttpHeaders;
+import org.springframework.http.HttpStatus;
+import org.springframework.http.MediaType;
+import org.springframework.http.ResponseEntity;
+import org.springframework.security.authentication.InternalAuthenticationServiceException;
+import org.springframework.test.util.ReflectionTestUtils;
+import org.springframework.test.web.servlet.MockMvc;
+
+import java.time.LocalDateTime;
+import java.util.HashSet;
+import java.util.Set;
+import java.util.concurrent.CountDownLatch;
+import java.util.concurrent.ThreadPoolExecutor;
+import java.util.concurrent.TimeUnit;
+
+import static org.junit.jupiter.api.Assertions.*;
+import static org.springframework.test.web.servlet.request.MockMvcRequestBuilders.post;
+import static org.springframework.test.web.servlet.result.MockMvcResultMatchers.*;
+
+// One hashing thread and one queue slot, so two blocked tasks saturate the pool
+@SpringBootTest(properties = {
+        "app.password-hashing.threads=1",
+        "app.password-hashing.queue-capacity=1",
+        "app.password-hashing.retry-after-seconds=2"
+})
+@AutoConfigureMockMvc
+public class PasswordHashingIntegrationTest {
+
+    @Autowired
+    private MockMvc mockMvc;
+
+    @Autowired
+    private ObjectMapper objectMapper;
+
+    @Autowired
+    private UserRepository userRepository;
+
+    @Autowired
+    private RoleRepository roleRepository;
+
+    @Autowired
+    private BoundedPasswordEncoder passwordEncoder;
+
+    @Autowired
+    private PasswordHashingExceptionHandler exceptionHandler;
+
+    private final CountDownLatch release = new CountDownLatch(1);
+
+    @BeforeEach
+    void setUp() {
+        userRepository.deleteAll();
+
+        Role userRole = roleRepository.findByName(ERole.ROLE_USER)
+                .orElseGet(() -> roleRepository.save(new Role(null, ERole.ROLE_USER)));
+        Set<Role> roles = new HashSet<>();
+        roles.add(userRole);
+        userRepository.save(User.builder()
+                .username("busyuser")
+                .email("busy@example.com")
+                .password(passwordEncoder.encode("password"))
+                .enabled(true)
+                .emailVerified(true)
+                .roles(roles)
+                .createdAt(LocalDateTime.now())
+                .updatedAt(LocalDateTime.now())
+                .build());
+    }
+
+    @AfterEach
+    void tearDown() {
+        release.countDown();
+        userRepository.deleteAll();
+    }
+
+    private ThreadPoolExecutor executor() {
+        return (ThreadPoolExecutor) ReflectionTestUtils.getField(passwordEncoder, "executor");
+    }
+
+    private void saturate() throws InterruptedException {
+        ThreadPoolExecutor executor = executor();
+        Runnable blocked = () -> {
+            try {
+                release.await(10, TimeUnit.SECONDS);
+            } catch (InterruptedException e) {
+                Thread.currentThread().interrupt();
+            }
+        };
+        executor.execute(blocked);
+        executor.execute(blocked);
+        while (executor.getActiveCount() < 1 || executor.getQueue().remainingCapacity() > 0) {
+            Thread.sleep(5);
+        }
+    }
+
+    private String login(String username) throws Exception {
+        LoginRequest request = new LoginRequest();
+        request.setUsername(username);
+        request.setPassword("password");
+        return objectMapper.writeValueAsString(request);
+    }
+
+    @Test
+    void login_WhenHashingIsSaturated_ShouldReturnServiceUnavailable() throws Exception {
+        saturate();
+
+        mockMvc.perform(post("/api/auth/login")
+                .contentType(MediaType.APPLICATION_JSON)
+                .content(login("busyuser")))
+                .andExpect(status().isServiceUnavailable())
+                .andExpect(header().string(HttpHeaders.RETRY_AFTER, "2"));
+    }
+
+    @Test
+    void login_UnknownUserWhenHashingIsSaturated_ShouldReturnServiceUnavailable() throws Exception {
+        saturate();
+
+        // The dummy password check for unknown users runs on the same pool
+        mockMvc.perform(post("/api/auth/login")
+                .contentType(MediaType.APPLICATION_JSON)
+                .content(login("nobody")))
+                .andExpect(status().isServiceUnavailable())
+                .andExpect(header().string(HttpHeaders.RETRY_AFTER, "2"));
+    }
+
+    @Test
+    void login_AfterSaturationClears_ShouldSucceed() throws Exception {
+        saturate();
+        release.countDown();
+        while (executor().getActiveCount() > 0 || !executor().getQueue().isEmpty()) {
+            Thread.sleep(5);
+        }
+
+        mockMvc.perform(post("/api/auth/login")
+                .contentType(MediaType.APPLICATION_JSON)
+                .content(login("busyuser")))
+                .andExpect(status().isOk());
+    }
+
+    @Test
+    void wrappedBusyException_ShouldMapToServiceUnavailable() {
+        ResponseEntity<MessageResponse> busy = exceptionHandler.handleAuthenticationFailure(
+                new InternalAuthenticationServiceException("Loading user failed",
+                        new PasswordHashingBusyException("Password hashing queue is full")));
+        assertEquals(HttpStatus.SERVICE_UNAVAILABLE, busy.getStatusCode());
+        assertEquals("2", busy.getHeaders().getFirst(HttpHeaders.RETRY_AFTER));
+
+        ResponseEntity<MessageResponse> other = exceptionHandler.handleAuthenticationFailure(
+                new InternalAuthenticationServiceException("Database unavailable"));
+        assertEquals(HttpStatus.UNAUTHORIZED, other.getStatusCode());
+    }
+}
@@ -0,0 +1,200 @@
+package com.flashcardapp.integration;
+
+import com.fasterxml.jackson.databind.JsonNode;
+import com.fasterxml.jackson.databind.ObjectMapper;
+import com.flashcardapp.models.ERole;
+import com.flashcardapp.models.RefreshToken;
+import com.flashcardapp.models.Role;
+import com.flashcardapp.models.User;
+import com.flashcardapp.repositories.RefreshTokenRepository;
+import com.flashcardapp.repositories.RoleRepository;
+import com.flashcardapp.repositories.TokenRevocationRepository;
+import com.flashcardapp.repositories.UserRepository;
+import com.flashcardapp.security.jwt.JwtUtils;
+import org.junit.jupiter.api.AfterEach;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.Test;
+import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.boot.test.autoconfigure.web.servlet.AutoConfigureMockMvc;
+import org.springframework.boot.test.context.SpringBootTest;
+import org.springframework.http.HttpHeaders;
+import org.springframework.http.MediaType;
+import org.springframework.security.crypto.password.PasswordEncoder;
+import org.springframework.test.util.ReflectionTestUtils;
+import org.springframework.test.web.servlet.MockMvc;
+import org.springframework.test.web.servlet.ResultActions;
+
+import java.util.Base64;
+import java.util.List;
+import java.util.Set;
+
+import static org.junit.jupiter.api.Assertions.*;
+import static org.springframework.test.web.servlet.request.MockMvcRequestBuilders.get;
+import static org.springframework.test.web.servlet.request.MockMvcRequestBuilders.post;
+import static org.springframework.test.web.servlet.result.MockMvcResultMatchers.status;
+
+@SpringBootTest
+@AutoConfigureMockMvc
+public class RefreshTokenIntegrationTest {
+
+    @Autowired
+    private MockMvc mockMvc;
+
+    @Autowired
+    private ObjectMapper objectMapper;
+
+    @Autowired
+    private UserRepository userRepository;
+
+    @Autowired
+    private RoleRepository roleRepository;
+
+    @Autowired
+    private RefreshTokenRepository refreshTokenRepository;
+
+    @Autowired
+    private TokenRevocationRepository tokenRevocationRepository;
+
+    @Autowired
+    private PasswordEncoder passwordEncoder;
+
+    @Autowired
+    private JwtUtils jwtUtils;
+
+    private User user;
+
+    @BeforeEach
+    void setUp() {
+        clearData();
+
+        String secretKey = Base64.getEncoder().encodeToString(
+                "TEST_JWT_SECRET_KEY_THAT_IS_SUFFICIENTLY_LONG_FOR_TESTING_PURPOSES_ONLY".getBytes());
+        ReflectionTestUtils.setField(jwtUtils, "jwtSecret", secretKey);
+
+        Role userRole = roleRepository.findByName(ERole.ROLE_USER)
+                .orElseGet(() -> roleRepository.save(new Role(null, ERole.ROLE_USER)));
+        user = userRepository.save(User.builder()
+                .username("refreshuser")
+                .email("refresh@example.com")
+                .password(passwordEncoder.encode("password"))
+                .enabled(true)
+                .emailVerified(true)
+                .roles(Set.of(userRole))
+                .build());
+    }
+
+    @AfterEach
+    void tearDown() {
+        clearData();
+    }
+
+    private void clearData() {
+        refreshTokenRepository.deleteAll();
+        tokenRevocationRepository.deleteAll();
+        userRepository.deleteAll();
+    }
+
+    private JsonNode login(String device) throws Exception {
+        String body = mockMvc.perform(post("/api/auth/login")
+                .header(HttpHeaders.USER_AGENT, device)
+                .contentType(MediaType.APPLICATION_JSON)
+                .content("{\"username\":\"refreshuser\",\"password\":\"password\"}"))
+                .andExpect(status().isOk())
+                .andReturn().getResponse().getContentAsString();
+        return objectMapper.readTree(body);
+    }
+
+    private ResultActions refresh(String refreshToken) throws Exception {
+        return mockMvc.perform(post("/api/auth/refresh")
+                .contentType(MediaType.APPLICATION_JSON)
+                .content("{\"refreshToken\":\"" + refreshToken + "\"}"));
+    }
+
+    private ResultActions listDecks(String accessToken) throws Exception {
+        return mockMvc.perform(get("/api/decks").header("Authorization", "Bearer " + accessToken));
+    }
+
+    @Test
+    void login_ShouldStoreHashedRefreshTokenWithDevice() throws Exception {
+        String refreshToken = login("test-device").get("refreshToken").asText();
+
+        List<RefreshToken> stored = refreshTokenRepository.findAll();
+        assertEquals(1, stored.size());
+        assertEquals(user.getId(), stored.get(0).getUserId());
+        assertEquals("test-device", stored.get(0).getDevice());
+        assertEquals(64, stored.get(0).getTokenHash().length());
+        assertFalse(refreshToken.contains(stored.get(0).getTokenHash()));
+        assertNull(stored.get(0).getRevokedAt());
+    }
+
+    @Test
+    void refresh_ShouldRotateAndRejectTheConsumedToken() throws Exception {
+        String first = login("device").get("refreshToken").asText();
+
+        JsonNode rotated = objectMapper.readTree(refresh(first)
+                .andExpect(status().isOk())
+                .andReturn().getResponse().getContentAsString());
+        String second = rotated.get("refreshToken").asText();
+        assertNotEquals(first, second);
+        listDecks(rotated.get("accessToken").asText()).andExpect(status().isOk());
+
+        // Reusing the consumed token is treated as theft and ends every session
+        refresh(first).andExpect(status().isUnauthorized());
+        refresh(second).andExpect(status().isUnauthorized());
+    }
+
+    @Test
+    void refreshToken_ShouldNotAuthenticateApiRequests() throws Exception {
+        String refreshToken = login("device").get("refreshToken").asText();
+
+        listDecks(refreshToken).andExpect(status().isUnauthorized());
+    }
+
+    @Test
+    void logout_ShouldRevokeOnlyThatRefreshToken() throws Exception {
+        String phone = login("phone").get("refreshToken").asText();
+        String laptop = login("laptop").get("refreshToken").asText();
+
+        mockMvc.perform(post("/api/auth/logout")
+                .contentType(MediaType.APPLICATION_JSON)
+                .content("{\"refreshToken\":\"" + phone + "\"}"))
+                .andExpect(status().isOk());
+
+        refresh(phone).andExpect(status().isUnauthorized());
+        refresh(laptop).andExpect(status().isOk());
+    }
+
+    @Test
+    void logoutAll_ShouldRevokeRefreshAndAccessTokens() throws Exception {
+        JsonNode session = login("device");
+        String accessToken = session.get("accessToken").asText();
+        listDecks(accessToken).andExpect(status().isOk());
+
+        mockMvc.perform(post("/api/auth/logout-all").header("Authorization", "Bearer " + accessToken))
+                .andExpect(status().isOk());
+
+        listDecks(accessToken).andExpect(status().isUnauthorized());
+        refresh(session.get("refreshToken").asText()).andExpect(status().isUnauthorized());
+        assertTrue(tokenRevocationRepository.findByUserId(user.getId()).isPresent());
+    }
+
+    @Test
+    void loginRightAfterLogoutAll_ShouldIssueUsableTokens() throws Exception {
+        String oldAccessToken = login("device").get("accessToken").asText();
+
+        mockMvc.perform(post("/api/auth/logout-all").header("Authorization", "Bearer " + oldAccessToken))
+                .andExpect(status().isOk());
+
+        // Usually lands in the same second as the revocation
+        JsonNode session = login("device");
+        listDecks(session.get("accessToken").asText()).andExpect(status().isOk());
+        refresh(session.get("refreshToken").asText()).andExpect(status().isOk());
+        listDecks(oldAccessToken).andExpect(status().isUnauthorized());
+    }
+
+    @Test
+    void logoutAll_WithoutToken_ShouldBeUnauthorized() throws Exception {
+        mockMvc.perform(post("/api/auth/logout-all"))
+                .andExpect(status().isUnauthorized());
+    }
+}
@@ -0,0 +1,223 @@
+package com.flashcardapp.integration;
+
+import com.fasterxml.jackson.databind.ObjectMapper;
+import com.flashcardapp.models.Card;
+import com.flashcardapp.models.Deck;
+import com.flashcardapp.models.ERole;
+import com.flashcardapp.models.Role;
+import com.flashcardapp.models.StudySession;
+import com.flashcardapp.models.User;
+import com.flashcardapp.repositories.CardRepository;
+import com.flashcardapp.repositories.CardReviewRepository;
+import com.flashcardapp.repositories.DeckRepository;
+import com.flashcardapp.repositories.RoleRepository;
+import com.flashcardapp.repositories.StudySessionRepository;
+import com.flashcardapp.repositories.UserRepository;
+import com.flashcardapp.security.jwt.JwtUtils;
+import org.junit.jupiter.api.AfterEach;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.Test;
+import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.boot.test.autoconfigure.web.servlet.AutoConfigureMockMvc;
+import org.springframework.boot.test.context.SpringBootTest;
+import org.springframework.http.MediaType;
+import org.springframework.security.authentication.AuthenticationManager;
+import org.springframework.security.authentication.UsernamePasswordAuthenticationToken;
+import org.springframework.security.crypto.password.PasswordEncoder;
+import org.springframework.test.util.ReflectionTestUtils;
+import org.springframework.test.web.servlet.MockMvc;
+
+import java.time.LocalDateTime;
+import java.time.temporal.ChronoUnit;
+import java.util.ArrayList;
+import java.util.Base64;
+import java.util.HashMap;
+import java.util.HashSet;
+import java.util.List;
+import java.util.Map;
+import java.util.Set;
+
+import static org.hamcrest.Matchers.hasSize;
+import static org.hamcrest.Matchers.is;
+import static org.junit.jupiter.api.Assertions.*;
+import static org.springframework.test.web.servlet.request.MockMvcRequestBuilders.post;
+import static org.springframework.test.web.servlet.result.MockMvcResultMatchers.*;
+
+@SpringBootTest
+@AutoConfigureMockMvc
+public class ReviewBatchIntegrationTest {
+
+    @Autowired
+    private MockMvc mockMvc;
+
+    @Autowired
+    private ObjectMapper objectMapper;
+
+    @Autowired
+    private CardRepository cardRepository;
+
+    @Autowired
+    private CardReviewRepository cardReviewRepository;
+
+    @Autowired
+    private StudySessionRepository studySessionRepository;
+
+    @Autowired
+    private DeckRepository deckRepository;
+
+    @Autowired
+    private UserRepository userRepository;
+
+    @Autowired
+    private RoleRepository roleRepository;
+
+    @Autowired
+    private PasswordEncoder passwordEncoder;
+
+    @Autowired
+    private JwtUtils jwtUtils;
+
+    @Autowired
+    private AuthenticationManager authenticationManager;
+
+    private String accessToken;
+    private Deck deck;
+    private StudySession session;
+    private List<Card> cards;
+
+    @BeforeEach
+    void setUp() {
+        clearData();
+        userRepository.deleteAll();
+
+        String secretKey = Base64.getEncoder().encodeToString(
+                "TEST_JWT_SECRET_KEY_THAT_IS_SUFFICIENTLY_LONG_FOR_TESTING_PURPOSES_ONLY".getBytes());
+        ReflectionTestUtils.setField(jwtUtils, "jwtSecret", secretKey);
+
+        Role userRole = roleRepository.findByName(ERole.ROLE_USER)
+                .orElseGet(() -> roleRepository.save(new Role(null, ERole.ROLE_USER)));
+        Set<Role> roles = new HashSet<>();
+        roles.add(userRole);
+        User testUser = userRepository.save(User.builder()
+                .username("reviewer")
+                .email("reviewer@example.com")
+                .password(passwordEncoder.encode("password"))
+                .enabled(true)
+                .emailVerified(true)
+                .roles(roles)
+                .createdAt(LocalDateTime.now())
+                .updatedAt(LocalDateTime.now())
+                .build());
+
+        deck = new Deck();
+        deck.setName("Offline deck");
+        deck.setUser(testUser);
+        deck = deckRepository.save(deck);
+
+        cards = new ArrayList<>();
+        for (int i = 0; i < 3; i++) {
+            Card card = new Card();
+            card.setDeck(deck);
+            card.setFront("Question " + i);
+            card.setBack("Answer " + i);
+            cards.add(cardRepository.save(card));
+        }
+
+        session = studySessionRepository.save(StudySession.builder()
+                .user(testUser)
+                .deck(deck)
+                .build());
+
+        accessToken = jwtUtils.generateAccessToken(authenticationManager.authenticate(
+                new UsernamePasswordAuthenticationToken("reviewer", "password")));
+    }
+
+    @AfterEach
+    void tearDown() {
+        clearData();
+    }
+
+    private void clearData() {
+        cardReviewRepository.deleteAll();
+        studySessionRepository.deleteAll();
+        deckRepository.deleteAll();
+    }
+
+    private Map<String, Object> review(Long cardId, int result, LocalDateTime reviewedAt) {
+        Map<String, Object> review = new HashMap<>();
+        review.put("cardId", cardId);
+        review.put("result", result);
+        review.put("timeSpentSeconds", 5);
+        if (reviewedAt != null) {
+            review.put("reviewedAt", reviewedAt.toString());
+        }
+        return review;
+    }
+
+    private String body(List<Map<String, Object>> reviews) throws Exception {
+        Map<String, Object> body = new HashMap<>();
+        body.put("reviews", reviews);
+        return objectMapper.writeValueAsString(body);
+    }
+
+    @Test
+    void submitReviewsBatch_ShouldApplyEveryReview() throws Exception {
+        LocalDateTime earlier = LocalDateTime.now().minusHours(2).truncatedTo(ChronoUnit.SECONDS);
+        List<Map<String, Object>> reviews = new ArrayList<>();
+        reviews.add(review(cards.get(0).getId(), 5, null));
+        reviews.add(review(cards.get(1).getId(), 0, null));
+        // The same card answered twice offline, sent out of order
+        reviews.add(review(cards.get(2).getId(), 3, earlier.plusMinutes(5)));
+        reviews.add(review(cards.get(2).getId(), 0, earlier));
+
+        mockMvc.perform(post("/api/study-sessions/" + session.getSessionId() + "/reviews/batch")
+                .header("Authorization", "Bearer " + accessToken)
+                .contentType(MediaType.APPLICATION_JSON)
+                .content(body(reviews)))
+                .andExpect(status().isCreated())
+                .andExpect(jsonPath("$.submitted", is(4)))
+                .andExpect(jsonPath("$.correct", is(2)))
+                .andExpect(jsonPath("$.reviews", hasSize(4)));
+
+        assertEquals(4, cardReviewRepository.findByStudySession(session).size());
+
+        Card easy = cardRepository.findById(cards.get(0).getId()).orElseThrow();
+        assertEquals(0, easy.getDifficulty());
+        assertEquals(1, easy.getReviewCount());
+
+        Card missed = cardRepository.findById(cards.get(1).getId()).orElseThrow();
+        assertEquals(2, missed.getDifficulty());
+
+        // Applied oldest first: 0 -> 2 after the miss, then unchanged by a 3
+        Card twice = cardRepository.findById(cards.get(2).getId()).orElseThrow();
+        assertEquals(2, twice.getDifficulty());
+        assertEquals(2, twice.getReviewCount());
+        assertEquals(earlier.plusMinutes(5).plusDays(3), twice.getNextReviewDate());
+    }
+
+    @Test
+    void submitReviewsBatch_CardFromAnotherDeck_ShouldRejectWholeBatch() throws Exception {
+        Deck otherDeck = new Deck();
+        otherDeck.setName("Other deck");
+        otherDeck.setUser(deck.getUser());
+        otherDeck = deckRepository.save(otherDeck);
+        Card foreign = new Card();
+        foreign.setDeck(otherDeck);
+        foreign.setFront("Elsewhere");
+        foreign.setBack("Elsewhere");
+        foreign = cardRepository.save(foreign);
+
+        List<Map<String, Object>> reviews = new ArrayList<>();
+        reviews.add(review(cards.get(0).getId(), 4, null));
+        reviews.add(review(foreign.getId(), 4, null));
+
+        mockMvc.perform(post("/api/study-sessions/" + session.getSessionId() + "/reviews/batch")
+                .header("Authorization", "Bearer " + accessToken)
+                .contentType(MediaType.APPLICATION_JSON)
+                .content(body(reviews)))
+                .andExpect(status().isBadRequest());
+
+        assertTrue(cardReviewRepository.findByStudySession(session).isEmpty());
+        assertEquals(0, cardRepository.findById(cards.get(0).getId()).orElseThrow().getReviewCount());
+    }
+}
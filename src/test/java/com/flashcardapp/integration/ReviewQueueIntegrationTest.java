@@ -0,0 +1,189 @@
+package com.flashcardapp.integration;
+
+import com.fasterxml.jackson.databind.JsonNode;
+import com.fasterxml.jackson.databind.ObjectMapper;
+import com.flashcardapp.models.Card;
+import com.flashcardapp.models.Deck;
+import com.flashcardapp.models.ERole;
+import com.flashcardapp.models.Role;
+import com.flashcardapp.models.User;
+import com.flashcardapp.repositories.CardRepository;
+import com.flashcardapp.repositories.DeckRepository;
+import com.flashcardapp.repositories.RoleRepository;
+import com.flashcardapp.repositories.UserRepository;
+import com.flashcardapp.security.jwt.JwtUtils;
+import org.junit.jupiter.api.AfterEach;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.Test;
+import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.boot.test.autoconfigure.web.servlet.AutoConfigureMockMvc;
+import org.springframework.boot.test.context.SpringBootTest;
+import org.springframework.security.authentication.AuthenticationManager;
+import org.springframework.security.authentication.UsernamePasswordAuthenticationToken;
+import org.springframework.security.crypto.password.PasswordEncoder;
+import org.springframework.test.util.ReflectionTestUtils;
+import org.springframework.test.web.servlet.MockMvc;
+import org.springframework.test.web.servlet.request.MockHttpServletRequestBuilder;
+
+import java.time.LocalDateTime;
+import java.util.ArrayList;
+import java.util.Base64;
+import java.util.HashSet;
+import java.util.List;
+import java.util.Set;
+
+import static org.hamcrest.Matchers.hasSize;
+import static org.hamcrest.Matchers.is;
+import static org.junit.jupiter.api.Assertions.*;
+import static org.springframework.test.web.servlet.request.MockMvcRequestBuilders.get;
+import static org.springframework.test.web.servlet.result.MockMvcResultMatchers.*;
+
+@SpringBootTest
+@AutoConfigureMockMvc
+public class ReviewQueueIntegrationTest {
+
+    @Autowired
+    private MockMvc mockMvc;
+
+    @Autowired
+    private ObjectMapper objectMapper;
+
+    @Autowired
+    private CardRepository cardRepository;
+
+    @Autowired
+    private DeckRepository deckRepository;
+
+    @Autowired
+    private UserRepository userRepository;
+
+    @Autowired
+    private RoleRepository roleRepository;
+
+    @Autowired
+    private PasswordEncoder passwordEncoder;
+
+    @Autowired
+    private JwtUtils jwtUtils;
+
+    @Autowired
+    private AuthenticationManager authenticationManager;
+
+    private String accessToken;
+    private List<Long> dueIds;
+
+    @BeforeEach
+    void setUp() {
+        deckRepository.deleteAll();
+        userRepository.deleteAll();
+
+        String secretKey = Base64.getEncoder().encodeToString(
+                "TEST_JWT_SECRET_KEY_THAT_IS_SUFFICIENTLY_LONG_FOR_TESTING_PURPOSES_ONLY".getBytes());
+        ReflectionTestUtils.setField(jwtUtils, "jwtSecret", secretKey);
+
+        User learner = createUser("queueuser", "queue@example.com");
+        User otherUser = createUser("otherqueue", "otherqueue@example.com");
+
+        Deck first = createDeck("First", learner);
+        Deck second = createDeck("Second", learner);
+        Deck foreign = createDeck("Foreign", otherUser);
+
+        // Due times interleave across both decks; two cards share a due time
+        LocalDateTime base = LocalDateTime.now().minusDays(1).withNano(0);
+        dueIds = new ArrayList<>();
+        dueIds.add(createCard(first, base).getId());
+        dueIds.add(createCard(second, base.plusMinutes(10)).getId());
+        dueIds.add(createCard(first, base.plusMinutes(20)).getId());
+        dueIds.add(createCard(second, base.plusMinutes(20)).getId());
+        dueIds.add(createCard(first, base.plusMinutes(30)).getId());
+        createCard(second, LocalDateTime.now().plusDays(2));
+        createCard(foreign, base);
+
+        accessToken = jwtUtils.generateAccessToken(authenticationManager.authenticate(
+                new UsernamePasswordAuthenticationToken("queueuser", "password")));
+    }
+
+    @AfterEach
+    void tearDown() {
+        deckRepository.deleteAll();
+    }
+
+    private User createUser(String username, String email) {
+        Role userRole = roleRepository.findByName(ERole.ROLE_USER)
+                .orElseGet(() -> roleRepository.save(new Role(null, ERole.ROLE_USER)));
+        Set<Role> roles = new HashSet<>();
+        roles.add(userRole);
+
+        return userRepository.save(User.builder()
+                .username(username)
+                .email(email)
+                .password(passwordEncoder.encode("password"))
+                .enabled(true)
+                .emailVerified(true)
+                .roles(roles)
+                .createdAt(LocalDateTime.now())
+                .updatedAt(LocalDateTime.now())
+                .build());
+    }
+
+    private Deck createDeck(String name, User owner) {
+        Deck deck = new Deck();
+        deck.setName(name);
+        deck.setUser(owner);
+        return deckRepository.save(deck);
+    }
+
+    private Card createCard(Deck deck, LocalDateTime nextReviewDate) {
+        Card card = new Card();
+        card.setDeck(deck);
+        card.setFront("Front");
+        card.setBack("Back");
+        card = cardRepository.save(card);
+        // @PrePersist makes new cards due immediately
+        card.setNextReviewDate(nextReviewDate);
+        return cardRepository.save(card);
+    }
+
+    private MockHttpServletRequestBuilder queue() {
+        return get("/api/review-queue").header("Authorization", "Bearer " + accessToken);
+    }
+
+    @Test
+    void getReviewQueue_ShouldWalkAllDecksInDueOrder() throws Exception {
+        List<Long> seen = new ArrayList<>();
+        String cursor = null;
+        int pages = 0;
+        do {
+            MockHttpServletRequestBuilder request = queue().param("limit", "2");
+            if (cursor != null) {
+                request.param("cursor", cursor);
+            }
+            String body = mockMvc.perform(request)
+                    .andExpect(status().isOk())
+                    .andReturn().getResponse().getContentAsString();
+            JsonNode json = objectMapper.readTree(body);
+            json.get("cards").forEach(card -> seen.add(card.get("id").asLong()));
+            cursor = json.get("nextCursor").isNull() ? null : json.get("nextCursor").asText();
+            pages++;
+        } while (cursor != null);
+
+        assertEquals(dueIds, seen);
+        assertEquals(3, pages);
+    }
+
+    @Test
+    void getReviewQueue_WithTotal_ShouldCountOnlyOwnDueCards() throws Exception {
+        mockMvc.perform(queue().param("includeTotal", "true"))
+                .andExpect(status().isOk())
+                .andExpect(jsonPath("$.cards", hasSize(5)))
+                .andExpect(jsonPath("$.cards[0].deckName", is("First")))
+                .andExpect(jsonPath("$.total", is(5)))
+                .andExpect(jsonPath("$.totalIsLowerBound", is(false)));
+    }
+
+    @Test
+    void getReviewQueue_InvalidCursor_ShouldReturnBadRequest() throws Exception {
+        mockMvc.perform(queue().param("cursor", "not-a-cursor"))
+                .andExpect(status().isBadRequest());
+    }
+}
@@ -0,0 +1,242 @@
+package com.flashcardapp.integration;
+
+import com.fasterxml.jackson.databind.JsonNode;
+import com.fasterxml.jackson.databind.ObjectMapper;
+import com.flashcardapp.models.Card;
+import com.flashcardapp.models.Deck;
+import com.flashcardapp.models.ERole;
+import com.flashcardapp.models.Role;
+import com.flashcardapp.models.User;
+import com.flashcardapp.repositories.CardRepository;
+import com.flashcardapp.repositories.DeckRepository;
+import com.flashcardapp.repositories.RoleRepository;
+import com.flashcardapp.repositories.UserRepository;
+import com.flashcardapp.security.jwt.JwtUtils;
+import org.junit.jupiter.api.AfterEach;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.Test;
+import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.boot.test.autoconfigure.web.servlet.AutoConfigureMockMvc;
+import org.springframework.boot.test.context.SpringBootTest;
+import org.springframework.security.authentication.AuthenticationManager;
+import org.springframework.security.authentication.UsernamePasswordAuthenticationToken;
+import org.springframework.security.crypto.password.PasswordEncoder;
+import org.springframework.test.util.ReflectionTestUtils;
+import org.springframework.test.web.servlet.MockMvc;
+
+import java.time.LocalDateTime;
+import java.util.ArrayList;
+import java.util.Base64;
+import java.util.HashSet;
+import java.util.List;
+import java.util.Set;
+
+import static org.hamcrest.Matchers.hasSize;
+import static org.hamcrest.Matchers.is;
+import static org.hamcrest.Matchers.nullValue;
+import static org.junit.jupiter.api.Assertions.*;
+import static org.springframework.test.web.servlet.request.MockMvcRequestBuilders.get;
+import static org.springframework.test.web.servlet.result.MockMvcResultMatchers.*;
+
+@SpringBootTest
+@AutoConfigureMockMvc
+public class SearchIntegrationTest {
+
+    @Autowired
+    private MockMvc mockMvc;
+
+    @Autowired
+    private ObjectMapper objectMapper;
+
+    @Autowired
+    private CardRepository cardRepository;
+
+    @Autowired
+    private DeckRepository deckRepository;
+
+    @Autowired
+    private UserRepository userRepository;
+
+    @Autowired
+    private RoleRepository roleRepository;
+
+    @Autowired
+    private PasswordEncoder passwordEncoder;
+
+    @Autowired
+    private JwtUtils jwtUtils;
+
+    @Autowired
+    private AuthenticationManager authenticationManager;
+
+    private String accessToken;
+    private Deck spanish;
+    private Deck biology;
+
+    @BeforeEach
+    void setUp() {
+        clearData();
+        userRepository.deleteAll();
+
+        String secretKey = Base64.getEncoder().encodeToString(
+                "TEST_JWT_SECRET_KEY_THAT_IS_SUFFICIENTLY_LONG_FOR_TESTING_PURPOSES_ONLY".getBytes());
+        ReflectionTestUtils.setField(jwtUtils, "jwtSecret", secretKey);
+
+        User learner = createUser("searchuser", "search@example.com");
+        User other = createUser("othersearch", "othersearch@example.com");
+
+        spanish = deck(learner, "Spanish verbs", "Irregular verbs in the present tense");
+        biology = deck(learner, "Biology", "Cell structure and photosynthesis");
+        deck(other, "Spanish verbs", "Someone else's deck");
+
+        card(spanish, "ser", "to be", "Irregular, used for permanent traits");
+        card(spanish, "tener", "to have", "Irregular stem change");
+        card(spanish, "hablar", "to speak", "Regular");
+        card(biology, "Where does photosynthesis happen?", "In the chloroplast", null);
+
+        accessToken = token("searchuser");
+    }
+
+    @AfterEach
+    void tearDown() {
+        clearData();
+    }
+
+    private void clearData() {
+        cardRepository.deleteAll();
+        deckRepository.deleteAll();
+    }
+
+    private User createUser(String username, String email) {
+        Role userRole = roleRepository.findByName(ERole.ROLE_USER)
+                .orElseGet(() -> roleRepository.save(new Role(null, ERole.ROLE_USER)));
+        Set<Role> roles = new HashSet<>();
+        roles.add(userRole);
+
+        return userRepository.save(User.builder()
+                .username(username)
+                .email(email)
+                .password(passwordEncoder.encode("password"))
+                .enabled(true)
+                .emailVerified(true)
+                .roles(roles)
+                .createdAt(LocalDateTime.now())
+                .updatedAt(LocalDateTime.now())
+                .build());
+    }
+
+    private Deck deck(User user, String name, String description) {
+        Deck deck = new Deck();
+        deck.setName(name);
+        deck.setDescription(description);
+        deck.setUser(user);
+        return deckRepository.save(deck);
+    }
+
+    private void card(Deck deck, String front, String back, String notes) {
+        Card card = new Card();
+        card.setDeck(deck);
+        card.setFront(front);
+        card.setBack(back);
+        card.setNotes(notes);
+        cardRepository.save(card);
+    }
+
+    private String token(String username) {
+        return jwtUtils.generateAccessToken(authenticationManager.authenticate(
+                new UsernamePasswordAuthenticationToken(username, "password")));
+    }
+
+    @Test
+    void searchDecks_ShouldMatchNameAndDescriptionOfOwnDecksOnly() throws Exception {
+        mockMvc.perform(get("/api/decks").param("search", "Verbs")
+                .header("Authorization", "Bearer " + accessToken))
+                .andExpect(status().isOk())
+                .andExpect(jsonPath("$", hasSize(1)))
+                .andExpect(jsonPath("$[0].id", is(spanish.getId().intValue())))
+                .andExpect(jsonPath("$[0].cardCount", is(3)));
+
+        mockMvc.perform(get("/api/decks").param("search", "photosynthesis")
+                .header("Authorization", "Bearer " + accessToken))
+                .andExpect(status().isOk())
+                .andExpect(jsonPath("$", hasSize(1)))
+                .andExpect(jsonPath("$[0].id", is(biology.getId().intValue())));
+    }
+
+    @Test
+    void searchDecks_ShouldSignalNextPageInHeader() throws Exception {
+        deck(spanish.getUser(), "More Spanish", "Nouns");
+
+        mockMvc.perform(get("/api/decks").param("search", "spanish").param("limit", "1")
+                .header("Authorization", "Bearer " + accessToken))
+                .andExpect(status().isOk())
+                .andExpect(jsonPath("$", hasSize(1)))
+                .andExpect(header().string("X-Next-Offset", "1"));
+
+        mockMvc.perform(get("/api/decks").param("search", "spanish").param("limit", "1").param("offset", "1")
+                .header("Authorization", "Bearer " + accessToken))
+                .andExpect(status().isOk())
+                .andExpect(jsonPath("$", hasSize(1)))
+                .andExpect(header().doesNotExist("X-Next-Offset"));
+    }
+
+    @Test
+    void searchDecks_ShouldRequireEveryWord() throws Exception {
+        mockMvc.perform(get("/api/decks").param("search", "spanish photosynthesis")
+                .header("Authorization", "Bearer " + accessToken))
+                .andExpect(status().isOk())
+                .andExpect(jsonPath("$", hasSize(0)));
+    }
+
+    @Test
+    void listDecks_WithoutSearch_ShouldReturnAllDecks() throws Exception {
+        mockMvc.perform(get("/api/decks").header("Authorization", "Bearer " + accessToken))
+                .andExpect(status().isOk())
+                .andExpect(jsonPath("$", hasSize(2)));
+    }
+
+    @Test
+    void searchCards_ShouldMatchFrontBackAndNotes() throws Exception {
+        mockMvc.perform(get("/api/cards/search").param("q", "chloroplast")
+                .header("Authorization", "Bearer " + accessToken))
+                .andExpect(status().isOk())
+                .andExpect(jsonPath("$.cards", hasSize(1)))
+                .andExpect(jsonPath("$.cards[0].deckId", is(biology.getId().intValue())))
+                .andExpect(jsonPath("$.cards[0].deckName", is("Biology")))
+                .andExpect(jsonPath("$.nextOffset", nullValue()));
+
+        mockMvc.perform(get("/api/cards/search").param("q", "IRREGULAR")
+                .header("Authorization", "Bearer " + accessToken))
+                .andExpect(status().isOk())
+                .andExpect(jsonPath("$.cards", hasSize(2)));
+    }
+
+    @Test
+    void searchCards_ShouldPageWithOffsets() throws Exception {
+        List<String> fronts = new ArrayList<>();
+        Integer offset = 0;
+        int pages = 0;
+        while (offset != null) {
+            String body = mockMvc.perform(get("/api/cards/search").param("q", "to")
+                    .param("limit", "2").param("offset", offset.toString())
+                    .header("Authorization", "Bearer " + accessToken))
+                    .andExpect(status().isOk())
+                    .andReturn().getResponse().getContentAsString();
+            JsonNode json = objectMapper.readTree(body);
+            json.get("cards").forEach(card -> fronts.add(card.get("front").asText()));
+            offset = json.get("nextOffset").isNull() ? null : json.get("nextOffset").asInt();
+            pages++;
+        }
+
+        assertEquals(List.of("ser", "tener", "hablar"), fronts);
+        assertEquals(2, pages);
+    }
+
+    @Test
+    void searchCards_WithoutWords_ShouldReturnNothing() throws Exception {
+        mockMvc.perform(get("/api/cards/search").param("q", " ?! ")
+                .header("Authorization", "Bearer " + accessToken))
+                .andExpect(status().isOk())
+                .andExpect(jsonPath("$.cards", hasSize(0)));
+    }
+}
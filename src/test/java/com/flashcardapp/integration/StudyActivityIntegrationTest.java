@@ -0,0 +1,284 @@
+package com.flashcardapp.integration;
+
+import com.fasterxml.jackson.databind.ObjectMapper;
+import com.flashcardapp.models.Card;
+import com.flashcardapp.models.Deck;
+import com.flashcardapp.models.ERole;
+import com.flashcardapp.models.Role;
+import com.flashcardapp.models.StudySession;
+import com.flashcardapp.models.User;
+import com.flashcardapp.models.UserDailyStats;
+import com.flashcardapp.repositories.CardRepository;
+import com.flashcardapp.repositories.CardReviewRepository;
+import com.flashcardapp.repositories.DeckRepository;
+import com.flashcardapp.repositories.RoleRepository;
+import com.flashcardapp.repositories.StudySessionRepository;
+import com.flashcardapp.repositories.UserDailyStatsRepository;
+import com.flashcardapp.repositories.UserRepository;
+import com.flashcardapp.security.jwt.JwtUtils;
+import com.flashcardapp.services.StudyStatsService;
+import org.junit.jupiter.api.AfterEach;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.Test;
+import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.boot.test.autoconfigure.web.servlet.AutoConfigureMockMvc;
+import org.springframework.boot.test.context.SpringBootTest;
+import org.springframework.boot.test.mock.mockito.SpyBean;
+import org.springframework.http.MediaType;
+import org.springframework.security.authentication.AuthenticationManager;
+import org.springframework.security.authentication.UsernamePasswordAuthenticationToken;
+import org.springframework.security.crypto.password.PasswordEncoder;
+import org.springframework.test.util.ReflectionTestUtils;
+import org.springframework.test.web.servlet.MockMvc;
+
+import java.time.LocalDate;
+import java.time.LocalDateTime;
+import java.util.ArrayList;
+import java.util.Base64;
+import java.util.HashMap;
+import java.util.HashSet;
+import java.util.List;
+import java.util.Map;
+import java.util.Set;
+
+import static org.hamcrest.Matchers.hasSize;
+import static org.hamcrest.Matchers.is;
+import static org.junit.jupiter.api.Assertions.*;
+import static org.mockito.ArgumentMatchers.any;
+import static org.mockito.ArgumentMatchers.anyLong;
+import static org.mockito.Mockito.doThrow;
+import static org.springframework.test.web.servlet.request.MockMvcRequestBuilders.get;
+import static org.springframework.test.web.servlet.request.MockMvcRequestBuilders.post;
+import static org.springframework.test.web.servlet.request.MockMvcRequestBuilders.put;
+import static org.springframework.test.web.servlet.result.MockMvcResultMatchers.*;
+
+@SpringBootTest
+@AutoConfigureMockMvc
+public class StudyActivityIntegrationTest {
+
+    @Autowired
+    private MockMvc mockMvc;
+
+    @Autowired
+    private ObjectMapper objectMapper;
+
+    @Autowired
+    private CardRepository cardRepository;
+
+    @Autowired
+    private CardReviewRepository cardReviewRepository;
+
+    @Autowired
+    private StudySessionRepository studySessionRepository;
+
+    @Autowired
+    private UserDailyStatsRepository userDailyStatsRepository;
+
+    @Autowired
+    private DeckRepository deckRepository;
+
+    @Autowired
+    private UserRepository userRepository;
+
+    @Autowired
+    private RoleRepository roleRepository;
+
+    @Autowired
+    private PasswordEncoder passwordEncoder;
+
+    @Autowired
+    private JwtUtils jwtUtils;
+
+    @Autowired
+    private AuthenticationManager authenticationManager;
+
+    @SpyBean
+    private StudyStatsService studyStatsService;
+
+    private String accessToken;
+    private User testUser;
+    private StudySession session;
+    private List<Card> cards;
+
+    @BeforeEach
+    void setUp() {
+        clearData();
+        userRepository.deleteAll();
+
+        String secretKey = Base64.getEncoder().encodeToString(
+                "TEST_JWT_SECRET_KEY_THAT_IS_SUFFICIENTLY_LONG_FOR_TESTING_PURPOSES_ONLY".getBytes());
+        ReflectionTestUtils.setField(jwtUtils, "jwtSecret", secretKey);
+
+        Role userRole = roleRepository.findByName(ERole.ROLE_USER)
+                .orElseGet(() -> roleRepository.save(new Role(null, ERole.ROLE_USER)));
+        Set<Role> roles = new HashSet<>();
+        roles.add(userRole);
+        testUser = userRepository.save(User.builder()
+                .username("statsuser")
+                .email("stats@example.com")
+                .password(passwordEncoder.encode("password"))
+                .enabled(true)
+                .emailVerified(true)
+                .roles(roles)
+                .createdAt(LocalDateTime.now())
+                .updatedAt(LocalDateTime.now())
+                .build());
+
+        Deck deck = new Deck();
+        deck.setName("Stats deck");
+        deck.setUser(testUser);
+        deck = deckRepository.save(deck);
+
+        cards = new ArrayList<>();
+        for (int i = 0; i < 2; i++) {
+            Card card = new Card();
+            card.setDeck(deck);
+            card.setFront("Question " + i);
+            card.setBack("Answer " + i);
+            cards.add(cardRepository.save(card));
+        }
+
+        session = studySessionRepository.save(StudySession.builder()
+                .user(testUser)
+                .deck(deck)
+                .build());
+
+        accessToken = jwtUtils.generateAccessToken(authenticationManager.authenticate(
+                new UsernamePasswordAuthenticationToken("statsuser", "password")));
+    }
+
+    @AfterEach
+    void tearDown() {
+        clearData();
+    }
+
+    private void clearData() {
+        userDailyStatsRepository.deleteAll();
+        cardReviewRepository.deleteAll();
+        studySessionRepository.deleteAll();
+        deckRepository.deleteAll();
+    }
+
+    private Map<String, Object> review(Long cardId, int result) {
+        Map<String, Object> review = new HashMap<>();
+        review.put("cardId", cardId);
+        review.put("result", result);
+        review.put("timeSpentSeconds", 30);
+        return review;
+    }
+
+    @Test
+    void studyActivity_ShouldSumReviewsAndSessionsFromRollups() throws Exception {
+        // One review on its own, then the same card and another in a batch
+        Map<String, Object> single = new HashMap<>();
+        single.put("card", Map.of("id", cards.get(0).getId()));
+        single.put("result", 4);
+        single.put("timeSpentSeconds", 30);
+        mockMvc.perform(post("/api/study-sessions/" + session.getSessionId() + "/reviews")
+                .header("Authorization", "Bearer " + accessToken)
+                .contentType(MediaType.APPLICATION_JSON)
+                .content(objectMapper.writeValueAsString(single)))
+                .andExpect(status().isCreated());
+
+        List<Map<String, Object>> batch = new ArrayList<>();
+        batch.add(review(cards.get(0).getId(), 0));
+        batch.add(review(cards.get(1).getId(), 5));
+        mockMvc.perform(post("/api/study-sessions/" + session.getSessionId() + "/reviews/batch")
+                .header("Authorization", "Bearer " + accessToken)
+                .contentType(MediaType.APPLICATION_JSON)
+                .content(objectMapper.writeValueAsString(Map.of("reviews", batch))))
+                .andExpect(status().isCreated());
+
+        // Completing twice counts the session once
+        String completion = objectMapper.writeValueAsString(Map.of(
+                "cardsReviewed", 3, "correctResponses", 2, "incorrectResponses", 1, "totalTimeSeconds", 90));
+        for (int i = 0; i < 2; i++) {
+            mockMvc.perform(put("/api/study-sessions/" + session.getSessionId() + "/complete")
+                    .header("Authorization", "Bearer " + accessToken)
+                    .contentType(MediaType.APPLICATION_JSON)
+                    .content(completion))
+                    .andExpect(status().isOk());
+        }
+
+        mockMvc.perform(get("/api/stats/study-activity")
+                .header("Authorization", "Bearer " + accessToken)
+                .param("days", "30"))
+                .andExpect(status().isOk())
+                .andExpect(jsonPath("$.period", is("30 days")))
+                .andExpect(jsonPath("$.completedSessions", is(1)))
+                .andExpect(jsonPath("$.totalCardsStudied", is(3)))
+                .andExpect(jsonPath("$.correctResponses", is(2)))
+                .andExpect(jsonPath("$.incorrectResponses", is(1)))
+                .andExpect(jsonPath("$.totalTimeSpentSeconds", is(90)))
+                .andExpect(jsonPath("$.newCards", is(2)))
+                .andExpect(jsonPath("$.currentStreak", is(1)))
+                .andExpect(jsonPath("$.daily", hasSize(1)));
+    }
+
+    @Test
+    void submitReview_WhenRollupFails_ShouldNotSaveTheReview() throws Exception {
+        doThrow(new IllegalStateException("Rollup unavailable"))
+                .when(studyStatsService).record(anyLong(), any(StudyStatsService.Tally.class));
+
+        Map<String, Object> single = new HashMap<>();
+        single.put("card", Map.of("id", cards.get(0).getId()));
+        single.put("result", 4);
+        single.put("timeSpentSeconds", 30);
+        assertThrows(Exception.class, () -> mockMvc.perform(
+                post("/api/study-sessions/" + session.getSessionId() + "/reviews")
+                        .header("Authorization", "Bearer " + accessToken)
+                        .contentType(MediaType.APPLICATION_JSON)
+                        .content(objectMapper.writeValueAsString(single))));
+
+        // The review and the card's new schedule were rolled back with the rollup
+        assertEquals(0, cardReviewRepository.count());
+        Card card = cardRepository.findById(cards.get(0).getId()).orElseThrow();
+        assertEquals(0, card.getReviewCount());
+        assertEquals(0, card.getDifficulty());
+    }
+
+    @Test
+    void studyActivity_ShouldReportStreaksWithinTheWindow() throws Exception {
+        LocalDate today = LocalDate.now();
+        // Active today and the two days before, and for two days a week earlier
+        for (int offset : new int[] { 0, 1, 2, 7, 8 }) {
+            userDailyStatsRepository.save(UserDailyStats.builder()
+                    .userId(testUser.getId())
+                    .statDate(today.minusDays(offset))
+                    .reviews(10)
+                    .correctResponses(8)
+                    .incorrectResponses(2)
+                    .timeSpentSeconds(120)
+                    .newCards(1)
+                    .sessionsCompleted(1)
+                    .build());
+        }
+
+        mockMvc.perform(get("/api/stats/study-activity")
+                .header("Authorization", "Bearer " + accessToken)
+                .param("days", "30"))
+                .andExpect(status().isOk())
+                .andExpect(jsonPath("$.totalCardsStudied", is(50)))
+                .andExpect(jsonPath("$.averageCorrectPercentage", is(80.0)))
+                .andExpect(jsonPath("$.totalTimeSpentMinutes", is(10)))
+                .andExpect(jsonPath("$.activeDays", is(5)))
+                .andExpect(jsonPath("$.currentStreak", is(3)))
+                .andExpect(jsonPath("$.longestStreak", is(3)));
+
+        // A seven-day window sees only the current streak
+        mockMvc.perform(get("/api/stats/study-activity")
+                .header("Authorization", "Bearer " + accessToken)
+                .param("days", "7"))
+                .andExpect(status().isOk())
+                .andExpect(jsonPath("$.completedSessions", is(3)))
+                .andExpect(jsonPath("$.daily", hasSize(3)));
+    }
+
+    @Test
+    void studyActivity_DaysOutOfRange_ShouldReturnBadRequest() throws Exception {
+        mockMvc.perform(get("/api/stats/study-activity")
+                .header("Authorization", "Bearer " + accessToken)
+                .param("days", "0"))
+                .andExpect(status().isBadRequest());
+    }
+}
@@ -0,0 +1,106 @@
+package com.flashcardapp.repository;
+
+import com.flashcardapp.models.Card;
+import com.flashcardapp.models.Deck;
+import com.flashcardapp.models.User;
+import com.flashcardapp.repositories.CardRepository;
+import com.flashcardapp.repositories.DeckRepository;
+import com.flashcardapp.repositories.UserRepository;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.Test;
+import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.boot.test.autoconfigure.orm.jpa.DataJpaTest;
+import org.springframework.data.domain.Page;
+import org.springframework.data.domain.PageRequest;
+
+import java.time.LocalDateTime;
+import java.util.List;
+
+import static org.junit.jupiter.api.Assertions.*;
+
+@DataJpaTest
+public class CardRepositoryTest {
+
+    @Autowired
+    private CardRepository cardRepository;
+
+    @Autowired
+    private DeckRepository deckRepository;
+
+    @Autowired
+    private UserRepository userRepository;
+
+    private User owner;
+    private User otherUser;
+    private Deck deck;
+    private Card card;
+
+    @BeforeEach
+    void setUp() {
+        owner = userRepository.save(User.builder()
+                .username("owner")
+                .email("owner@example.com")
+                .password("password")
+                .enabled(true)
+                .build());
+        otherUser = userRepository.save(User.builder()
+                .username("otheruser")
+                .email("other@example.com")
+                .password("password")
+                .enabled(true)
+                .build());
+
+        deck = new Deck();
+        deck.setName("Owned Deck");
+        deck.setUser(owner);
+        deck = deckRepository.save(deck);
+
+        card = new Card();
+        card.setDeck(deck);
+        card.setFront("Front");
+        card.setBack("Back");
+        card = cardRepository.save(card);
+    }
+
+    @Test
+    void findByIdAndDeckIdAndDeckUserId_ShouldOnlyMatchOwner() {
+        assertTrue(cardRepository.findByIdAndDeckIdAndDeckUserId(card.getId(), deck.getId(), owner.getId())
+                .isPresent());
+        assertFalse(cardRepository.findByIdAndDeckIdAndDeckUserId(card.getId(), deck.getId(), otherUser.getId())
+                .isPresent());
+    }
+
+    @Test
+    void findByIdAndDeckIdAndDeckUserId_WrongDeck_ShouldReturnEmpty() {
+        Deck otherDeck = new Deck();
+        otherDeck.setName("Second Deck");
+        otherDeck.setUser(owner);
+        otherDeck = deckRepository.save(otherDeck);
+
+        assertFalse(cardRepository.findByIdAndDeckIdAndDeckUserId(card.getId(), otherDeck.getId(), owner.getId())
+                .isPresent());
+    }
+
+    @Test
+    void findByDeckIdAndDeckUserId_ShouldPageOwnedCards() {
+        Page<Card> owned = cardRepository.findByDeckIdAndDeckUserId(deck.getId(), owner.getId(), PageRequest.of(0, 10));
+        Page<Card> foreign = cardRepository.findByDeckIdAndDeckUserId(deck.getId(), otherUser.getId(),
+                PageRequest.of(0, 10));
+
+        assertEquals(1, owned.getTotalElements());
+        assertTrue(foreign.isEmpty());
+    }
+
+    @Test
+    void findCardsForReview_ShouldBeScopedToOwner() {
+        LocalDateTime later = LocalDateTime.now().plusMinutes(1);
+
+        List<Card> owned = cardRepository.findCardsForReview(deck.getId(), owner.getId(), later, PageRequest.of(0, 10));
+        List<Card> foreign = cardRepository.findCardsForReview(deck.getId(), otherUser.getId(), later,
+                PageRequest.of(0, 10));
+
+        assertEquals(1, owned.size());
+        assertTrue(foreign.isEmpty());
+        assertEquals(1L, cardRepository.countCardsForReview(deck.getId(), later));
+    }
+}
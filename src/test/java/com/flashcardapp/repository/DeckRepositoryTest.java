@@ -1,9 +1,12 @@
 package com.flashcardapp.repository;
 
+import com.flashcardapp.models.Card;
 import com.flashcardapp.models.Deck;
 import com.flashcardapp.models.ERole;
 import com.flashcardapp.models.Role;
 import com.flashcardapp.models.User;
+import com.flashcardapp.payload.response.DeckSummary;
+import com.flashcardapp.repositories.CardRepository;
 import com.flashcardapp.repositories.DeckRepository;
 import com.flashcardapp.repositories.RoleRepository;
 import com.flashcardapp.repositories.UserRepository;
@@ -30,6 +33,9 @@ public class DeckRepositoryTest {
     @Autowired
     private UserRepository userRepository;
 
+    @Autowired
+    private CardRepository cardRepository;
+
     @Autowired
     private RoleRepository roleRepository;
 
@@ -181,4 +187,45 @@ public class DeckRepositoryTest {
         // Assert
         assertFalse(exists);
     }
-}
\ No newline at end of file
+
+    @Test
+    void findSummariesByUserId_ShouldCountCardsAndDueCards() {
+        // Arrange
+        Deck deck = new Deck();
+        deck.setName("Counted Deck");
+        deck.setUser(testUser);
+        deckRepository.save(deck);
+
+        Deck emptyDeck = new Deck();
+        emptyDeck.setName("Empty Deck");
+        emptyDeck.setUser(testUser);
+        deckRepository.save(emptyDeck);
+
+        for (int i = 0; i < 3; i++) {
+            Card card = new Card();
+            card.setDeck(deck);
+            card.setFront("Front " + i);
+            card.setBack("Back " + i);
+            card = cardRepository.save(card);
+            if (i == 0) {
+                // Not due yet
+                card.setNextReviewDate(LocalDateTime.now().plusDays(3));
+                cardRepository.save(card);
+            }
+        }
+
+        // Act
+        List<DeckSummary> summaries = deckRepository.findSummariesByUserId(testUser.getId(),
+                LocalDateTime.now().plusMinutes(1));
+
+        // Assert
+        assertEquals(2, summaries.size());
+        DeckSummary counted = summaries.get(0);
+        assertEquals("Counted Deck", counted.getName());
+        assertEquals(3L, counted.getCardCount());
+        assertEquals(2L, counted.getDueCount());
+        DeckSummary empty = summaries.get(1);
+        assertEquals(0L, empty.getCardCount());
+        assertEquals(0L, empty.getDueCount());
+    }
+}
@@ -0,0 +1,102 @@
+package com.flashcardapp.unit;
+
+import com.flashcardapp.security.services.BoundedPasswordEncoder;
+import com.flashcardapp.security.services.PasswordHashingBusyException;
+import org.junit.jupiter.api.AfterEach;
+import org.junit.jupiter.api.Test;
+import org.springframework.security.crypto.bcrypt.BCryptPasswordEncoder;
+import org.springframework.security.crypto.password.PasswordEncoder;
+
+import java.time.Duration;
+import java.util.concurrent.CompletableFuture;
+import java.util.concurrent.CountDownLatch;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.Executors;
+import java.util.concurrent.TimeUnit;
+
+import static org.junit.jupiter.api.Assertions.*;
+
+public class BoundedPasswordEncoderTest {
+
+    private final CountDownLatch started = new CountDownLatch(1);
+    private final CountDownLatch release = new CountDownLatch(1);
+    private final ExecutorService callers = Executors.newFixedThreadPool(2);
+    private BoundedPasswordEncoder encoder;
+
+    // Holds the pool's thread until the test releases it
+    private final PasswordEncoder blockingEncoder = new PasswordEncoder() {
+        @Override
+        public String encode(CharSequence rawPassword) {
+            started.countDown();
+            try {
+                release.await(10, TimeUnit.SECONDS);
+            } catch (InterruptedException e) {
+                Thread.currentThread().interrupt();
+            }
+            return "hash:" + rawPassword;
+        }
+
+        @Override
+        public boolean matches(CharSequence rawPassword, String encodedPassword) {
+            return encode(rawPassword).equals(encodedPassword);
+        }
+    };
+
+    @AfterEach
+    void tearDown() {
+        release.countDown();
+        encoder.shutdown();
+        callers.shutdownNow();
+    }
+
+    @Test
+    void encodeAndMatches_ShouldDelegate() {
+        encoder = new BoundedPasswordEncoder(new BCryptPasswordEncoder(4), 2, 10, Duration.ofSeconds(10),
+                Duration.ofSeconds(10));
+
+        String hash = encoder.encode("password");
+
+        assertTrue(encoder.matches("password", hash));
+        assertFalse(encoder.matches("wrong", hash));
+        assertEquals(3L, encoder.stats().get("completed"));
+    }
+
+    @Test
+    void encode_WhenQueueIsFull_ShouldRejectImmediately() throws Exception {
+        encoder = new BoundedPasswordEncoder(blockingEncoder, 1, 1, Duration.ofSeconds(10), Duration.ofSeconds(10));
+        CompletableFuture<String> running = CompletableFuture.supplyAsync(() -> encoder.encode("first"), callers);
+        assertTrue(started.await(5, TimeUnit.SECONDS));
+        CompletableFuture<String> queued = CompletableFuture.supplyAsync(() -> encoder.encode("second"), callers);
+        while ((int) encoder.stats().get("queued") == 0) {
+            Thread.sleep(5);
+        }
+
+        assertThrows(PasswordHashingBusyException.class, () -> encoder.encode("third"));
+        assertEquals(1L, encoder.stats().get("rejected"));
+
+        release.countDown();
+        assertEquals("hash:first", running.get(5, TimeUnit.SECONDS));
+        assertEquals("hash:second", queued.get(5, TimeUnit.SECONDS));
+    }
+
+    @Test
+    void encode_WhenNotStartedWithinQueueWait_ShouldShed() throws Exception {
+        encoder = new BoundedPasswordEncoder(blockingEncoder, 1, 1, Duration.ofMillis(50), Duration.ofSeconds(10));
+        CompletableFuture<String> running = CompletableFuture.supplyAsync(() -> encoder.encode("first"), callers);
+        assertTrue(started.await(5, TimeUnit.SECONDS));
+
+        assertThrows(PasswordHashingBusyException.class, () -> encoder.encode("queued"));
+        assertEquals(1L, encoder.stats().get("shed"));
+
+        release.countDown();
+        assertEquals("hash:first", running.get(5, TimeUnit.SECONDS));
+    }
+
+    @Test
+    void encode_WhenNotDoneInTime_ShouldGiveUp() {
+        encoder = new BoundedPasswordEncoder(blockingEncoder, 1, 1, Duration.ofSeconds(10), Duration.ofMillis(50));
+
+        assertThrows(PasswordHashingBusyException.class, () -> encoder.encode("slow"));
+        assertEquals(1L, encoder.stats().get("timedOut"));
+    }
+}
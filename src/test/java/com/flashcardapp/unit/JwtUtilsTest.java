@@ -2,6 +2,7 @@ package com.flashcardapp.unit;
 
 import com.flashcardapp.security.jwt.JwtUtils;
 import com.flashcardapp.security.services.UserDetailsImpl;
+import io.jsonwebtoken.Claims;
 import org.junit.jupiter.api.BeforeEach;
 import org.junit.jupiter.api.Test;
 import org.junit.jupiter.api.extension.ExtendWith;
@@ -14,6 +15,7 @@ import org.springframework.test.util.ReflectionTestUtils;
 
 import java.util.Base64;
 import java.util.Collections;
+import java.util.Optional;
 
 import static org.junit.jupiter.api.Assertions.*;
 import static org.mockito.Mockito.*;
@@ -67,13 +69,25 @@ public class JwtUtilsTest {
     @Test
     void generateRefreshToken_ShouldCreateValidToken() {
         // Act
-        String token = jwtUtils.generateRefreshToken(authentication);
+        String token = jwtUtils.generateRefreshToken(userDetails, "token-id");
 
         // Assert
         assertNotNull(token);
         assertTrue(token.length() > 0);
         assertTrue(jwtUtils.validateJwtToken(token));
         assertEquals("testuser", jwtUtils.getUserNameFromJwtToken(token));
+        Claims claims = jwtUtils.parseClaims(token).orElseThrow();
+        assertEquals("token-id", claims.getId());
+        assertTrue(JwtUtils.isRefreshToken(claims));
+    }
+
+    @Test
+    void generateAccessToken_ShouldNotBeRefreshToken() {
+        String token = jwtUtils.generateAccessToken(authentication);
+
+        Claims claims = jwtUtils.parseClaims(token).orElseThrow();
+        assertFalse(JwtUtils.isRefreshToken(claims));
+        assertNull(claims.getId());
     }
 
     @Test
@@ -88,4 +102,41 @@ public class JwtUtilsTest {
         assertFalse(jwtUtils.validateJwtToken(null));
         assertFalse(jwtUtils.validateJwtToken(""));
     }
-}
\ No newline at end of file
+
+    @Test
+    void parseClaims_ShouldReturnSubjectOfValidToken() {
+        String token = jwtUtils.generateAccessToken(authentication);
+
+        Optional<Claims> claims = jwtUtils.parseClaims(token);
+
+        assertTrue(claims.isPresent());
+        assertEquals("testuser", claims.get().getSubject());
+    }
+
+    @Test
+    void parseClaims_WithTamperedSignature_ShouldReturnEmpty() {
+        String token = jwtUtils.generateAccessToken(authentication);
+        String other = Base64.getEncoder().encodeToString(
+                "ANOTHER_JWT_SECRET_KEY_THAT_IS_ALSO_LONG_ENOUGH_FOR_HMAC_SHA_256_KEYS".getBytes());
+        ReflectionTestUtils.setField(jwtUtils, "jwtSecret", other);
+
+        assertFalse(jwtUtils.parseClaims(token).isPresent());
+        assertFalse(jwtUtils.validateJwtToken(token));
+    }
+
+    @Test
+    void signingKey_ShouldBeBuiltOnceAndRebuiltWhenSecretChanges() {
+        String token = jwtUtils.generateAccessToken(authentication);
+        jwtUtils.validateJwtToken(token);
+        Object first = ReflectionTestUtils.getField(jwtUtils, "signingKey");
+        jwtUtils.validateJwtToken(token);
+
+        assertSame(first, ReflectionTestUtils.getField(jwtUtils, "signingKey"));
+
+        ReflectionTestUtils.setField(jwtUtils, "jwtSecret", Base64.getEncoder().encodeToString(
+                "ANOTHER_JWT_SECRET_KEY_THAT_IS_ALSO_LONG_ENOUGH_FOR_HMAC_SHA_256_KEYS".getBytes()));
+        jwtUtils.generateAccessToken(authentication);
+
+        assertNotSame(first, ReflectionTestUtils.getField(jwtUtils, "signingKey"));
+    }
+}
@@ -0,0 +1,95 @@
+package com.flashcardapp.unit;
+
+import com.flashcardapp.security.jwt.JwtUtils;
+import com.flashcardapp.security.services.UserDetailsImpl;
+import io.jsonwebtoken.Jwts;
+import io.jsonwebtoken.io.Decoders;
+import io.jsonwebtoken.security.Keys;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.Test;
+import org.junit.jupiter.api.condition.EnabledIfSystemProperty;
+import org.springframework.security.authentication.UsernamePasswordAuthenticationToken;
+import org.springframework.security.core.authority.SimpleGrantedAuthority;
+import org.springframework.test.util.ReflectionTestUtils;
+
+import java.security.Key;
+import java.util.Base64;
+import java.util.Collections;
+import java.util.function.Predicate;
+
+import static org.junit.jupiter.api.Assertions.*;
+
+/**
+ * Tokens validated per second on one thread, comparing the per-request work
+ * AuthTokenFilter used to do (decode the secret and build a parser twice,
+ * verifying the signature twice) with the cached single-parse pipeline.
+ *
+ * Skipped by default; run with:
+ * mvn test -Dtest=JwtValidationBenchmarkTest -Dbenchmark=true
+ */
+@EnabledIfSystemProperty(named = "benchmark", matches = "true")
+public class JwtValidationBenchmarkTest {
+
+    private static final int WARMUP_ITERATIONS = 20_000;
+    private static final long MEASURE_NANOS = 3_000_000_000L;
+
+    private JwtUtils jwtUtils;
+    private String secret;
+    private String token;
+
+    @BeforeEach
+    void setUp() {
+        secret = Base64.getEncoder().encodeToString(
+                "TEST_JWT_SECRET_KEY_THAT_IS_SUFFICIENTLY_LONG_FOR_TESTING_PURPOSES_ONLY".getBytes());
+        jwtUtils = new JwtUtils();
+        ReflectionTestUtils.setField(jwtUtils, "jwtSecret", secret);
+        ReflectionTestUtils.setField(jwtUtils, "jwtAccessExpirationMs", 600000);
+        ReflectionTestUtils.setField(jwtUtils, "jwtRefreshExpirationMs", 600000);
+
+        UserDetailsImpl user = new UserDetailsImpl(1L, "benchmark", "benchmark@example.com", "password",
+                Collections.singletonList(new SimpleGrantedAuthority("ROLE_USER")));
+        token = jwtUtils.generateAccessToken(
+                new UsernamePasswordAuthenticationToken(user, null, user.getAuthorities()));
+    }
+
+    @Test
+    void validationThroughput() {
+        Predicate<String> before = jwt -> {
+            Key validateKey = Keys.hmacShaKeyFor(Decoders.BASE64.decode(secret));
+            Jwts.parserBuilder().setSigningKey(validateKey).build().parseClaimsJws(jwt);
+            Key subjectKey = Keys.hmacShaKeyFor(Decoders.BASE64.decode(secret));
+            String subject = Jwts.parserBuilder().setSigningKey(subjectKey).build()
+                    .parseClaimsJws(jwt).getBody().getSubject();
+            return subject != null;
+        };
+        Predicate<String> after = jwt -> jwtUtils.parseClaims(jwt)
+                .map(claims -> claims.getSubject() != null)
+                .orElse(false);
+
+        double beforeRate = measure(before);
+        double afterRate = measure(after);
+
+        System.out.printf("JWT validation, tokens/s on one thread: before %.0f, after %.0f (%.2fx)%n",
+                beforeRate, afterRate, afterRate / beforeRate);
+        assertTrue(afterRate > beforeRate);
+    }
+
+    private double measure(Predicate<String> validate) {
+        for (int i = 0; i < WARMUP_ITERATIONS; i++) {
+            assertTrue(validate.test(token));
+        }
+        long count = 0;
+        long start = System.nanoTime();
+        long elapsed;
+        do {
+            for (int i = 0; i < 1000; i++) {
+                if (!validate.test(token)) {
+                    fail("token rejected");
+                }
+            }
+            count += 1000;
+            elapsed = System.nanoTime() - start;
+        } while (elapsed < MEASURE_NANOS);
+        return count * 1e9 / elapsed;
+    }
+}
@@ -0,0 +1,128 @@
+package com.flashcardapp.unit;
+
+import com.flashcardapp.security.services.PrincipalCache;
+import com.flashcardapp.security.services.UserDetailsImpl;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.Test;
+import org.springframework.security.core.authority.SimpleGrantedAuthority;
+import org.springframework.security.core.userdetails.UsernameNotFoundException;
+
+import java.time.Clock;
+import java.time.Duration;
+import java.time.Instant;
+import java.time.ZoneId;
+import java.time.ZoneOffset;
+import java.util.Collections;
+import java.util.concurrent.atomic.AtomicInteger;
+import java.util.function.Function;
+
+import static org.junit.jupiter.api.Assertions.*;
+
+public class PrincipalCacheTest {
+
+    private MutableClock clock;
+    private PrincipalCache cache;
+    private AtomicInteger loads;
+    private Function<String, UserDetailsImpl> loader;
+
+    @BeforeEach
+    void setUp() {
+        clock = new MutableClock();
+        cache = new PrincipalCache(2, Duration.ofSeconds(60), clock);
+        loads = new AtomicInteger();
+        loader = username -> {
+            loads.incrementAndGet();
+            return new UserDetailsImpl((long) username.hashCode(), username, username + "@example.com",
+                    "password", Collections.singletonList(new SimpleGrantedAuthority("ROLE_USER")));
+        };
+    }
+
+    @Test
+    void get_ShouldLoadOnceAndThenHit() {
+        UserDetailsImpl first = cache.get("alice", loader);
+        UserDetailsImpl second = cache.get("alice", loader);
+
+        assertSame(first, second);
+        assertEquals(1, loads.get());
+        assertEquals(1, cache.getHits());
+        assertEquals(1, cache.getMisses());
+    }
+
+    @Test
+    void get_AfterTtl_ShouldReload() {
+        cache.get("alice", loader);
+        clock.advance(Duration.ofSeconds(61));
+        cache.get("alice", loader);
+
+        assertEquals(2, loads.get());
+        assertEquals(2, cache.getMisses());
+    }
+
+    @Test
+    void get_WhenFull_ShouldDropLeastRecentlyUsed() {
+        cache.get("alice", loader);
+        cache.get("bob", loader);
+        cache.get("alice", loader);
+        cache.get("carol", loader);
+
+        assertEquals(2, cache.size());
+        cache.get("alice", loader);
+        assertEquals(3, loads.get());
+        cache.get("bob", loader);
+        assertEquals(4, loads.get());
+    }
+
+    @Test
+    void evict_ShouldForceReload() {
+        cache.get("alice", loader);
+        cache.evict("alice");
+        cache.get("alice", loader);
+
+        assertEquals(2, loads.get());
+        assertEquals(1L, cache.stats().get("evictions"));
+    }
+
+    @Test
+    void get_LoaderFailure_ShouldNotCache() {
+        Function<String, UserDetailsImpl> missing = username -> {
+            throw new UsernameNotFoundException(username);
+        };
+
+        assertThrows(UsernameNotFoundException.class, () -> cache.get("ghost", missing));
+        assertEquals(0, cache.size());
+    }
+
+    @Test
+    void get_EvictedWhileLoading_ShouldNotStoreStaleValue() {
+        cache.get("alice", username -> {
+            // A user update lands while the old row is being loaded
+            cache.evict(username);
+            return loader.apply(username);
+        });
+
+        assertEquals(0, cache.size());
+    }
+
+    private static class MutableClock extends Clock {
+        private Instant now = Instant.parse("2024-01-01T00:00:00Z");
+
+        void advance(Duration duration) {
+            now = now.plus(duration);
+        }
+
+        @Override
+        public ZoneId getZone() {
+            return ZoneOffset.UTC;
+        }
+
+        @Override
+        public Clock withZone(ZoneId zone) {
+            return this;
+        }
+
+        @Override
+        public Instant instant() {
+            return now;
+        }
+    }
+}
@@ -5,6 +5,7 @@ import com.flashcardapp.models.CardReview;
 import com.flashcardapp.models.Deck;
 import com.flashcardapp.models.StudySession;
 import com.flashcardapp.models.User;
+import com.flashcardapp.services.SpacedRepetitionScheduler;
 import org.junit.jupiter.api.BeforeEach;
 import org.junit.jupiter.api.Test;
 import org.junit.jupiter.params.ParameterizedTest;
@@ -29,6 +30,8 @@ public class SpacedRepetitionAlgorithmTest {
     // Create a fixed reference time for testing
     private static final LocalDateTime REFERENCE_TIME = LocalDateTime.of(2025, 5, 1, 10, 0, 0);
 
+    private final SpacedRepetitionScheduler scheduler = new SpacedRepetitionScheduler();
+
     @BeforeEach
     void setUp() {
         // Create user
@@ -221,4 +224,37 @@ public class SpacedRepetitionAlgorithmTest {
         long daysBetween = ChronoUnit.DAYS.between(testReferenceTime, card.getNextReviewDate());
         assertEquals(30, daysBetween);
     }
-}
\ No newline at end of file
+
+    @ParameterizedTest
+    @MethodSource("provideReviewResultsAndExpectedDifficulty")
+    void scheduler_nextDifficulty_ShouldMatchAlgorithm(int initialDifficulty, int reviewResult,
+            int expectedDifficulty) {
+        assertEquals(expectedDifficulty, scheduler.nextDifficulty(initialDifficulty, reviewResult));
+    }
+
+    @ParameterizedTest
+    @MethodSource("provideReviewResultsAndExpectedNextReviewDates")
+    void scheduler_nextReviewDate_ShouldUseIntervalTable(int difficulty, LocalDateTime expectedRelativeDate) {
+        assertEquals(expectedRelativeDate, scheduler.nextReviewDate(difficulty, REFERENCE_TIME));
+    }
+
+    @Test
+    void scheduler_apply_ShouldUpdateCardAndReview() {
+        // Arrange
+        CardReview cardReview = new CardReview();
+        cardReview.setCard(card);
+        cardReview.setStudySession(studySession);
+        cardReview.setResult(0); // Incorrect answer
+
+        // Act
+        scheduler.apply(card, cardReview, REFERENCE_TIME);
+
+        // Assert
+        assertEquals(3, cardReview.getPreviousDifficulty());
+        assertEquals(5, cardReview.getNewDifficulty());
+        assertEquals(REFERENCE_TIME.plusDays(30), cardReview.getNextReviewDate());
+        assertEquals(5, card.getDifficulty());
+        assertEquals(REFERENCE_TIME.plusDays(30), card.getNextReviewDate());
+        assertEquals(6, card.getReviewCount());
+    }
+}
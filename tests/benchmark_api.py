@@ -0,0 +1,540 @@
+#!/usr/bin/env python3
+"""Endpoint benchmark suite with stored baselines.
+
+Times the endpoints exercised by test_flashcard_api.py against decks seeded
+with fixed numbers of cards, so runs are comparable, and reports the median
+and p95 of each. Results can be saved as a versioned JSON baseline, and a
+later run compared against it fails (exit code 1) when any endpoint's median
+got slower than the threshold allows.
+
+    python benchmark_api.py --save-baseline baselines/main.json
+    python benchmark_api.py --compare baselines/main.json --threshold 0.15
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import string
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Usage")
+)
+
+from flashcard_client import ConnectionPool, FlashcardClient  # noqa: E402
+from mail_tokens import MailHogTokenSource  # noqa: E402
+from smtp_sink import SmtpTokenSink, parse_listen_address  # noqa: E402
+
+BASELINE_SCHEMA_VERSION = 1
+DEFAULT_DECK_SIZES = (10, 100, 1000)
+
+
+class Colors:
+    HEADER = "\033[95m"
+    BLUE = "\033[94m"
+    GREEN = "\033[92m"
+    YELLOW = "\033[93m"
+    RED = "\033[91m"
+    ENDC = "\033[0m"
+    BOLD = "\033[1m"
+
+
+def print_info(text):
+    print(f"{Colors.BLUE}[INFO] {text}{Colors.ENDC}")
+
+
+def print_error(text):
+    print(f"{Colors.RED}[ERROR] {text}{Colors.ENDC}")
+
+
+def random_suffix(length=8):
+    return "".join(random.choice(string.ascii_lowercase) for _ in range(length))
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    rank = max(1, int(round(pct / 100.0 * len(ordered))))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize(samples):
+    ms = [s * 1000 for s in samples]
+    return {
+        "samples": len(ms),
+        "median_ms": round(statistics.median(ms), 3),
+        "p95_ms": round(percentile(ms, 95), 3),
+        "mean_ms": round(statistics.mean(ms), 3),
+        "min_ms": round(min(ms), 3),
+        "stdev_ms": round(statistics.stdev(ms), 3) if len(ms) > 1 else 0.0,
+    }
+
+
+class BenchmarkFailure(Exception):
+    pass
+
+
+class Benchmark:
+    """Runs each timed operation ``warmup + iterations`` times, sequentially."""
+
+    def __init__(self, iterations, warmup):
+        self.iterations = iterations
+        self.warmup = warmup
+        self.results = {}
+
+    async def measure(self, name, operation, prepare=None, expected=(200,)):
+        """Time ``operation``; ``prepare`` runs untimed before each call.
+
+        ``prepare()`` returns the argument passed to ``operation(arg)``. Only
+        the HTTP round trip reported by the client is counted.
+        """
+        samples = []
+        for i in range(self.warmup + self.iterations):
+            arg = await prepare() if prepare else None
+            response = await (operation(arg) if prepare else operation())
+            if response.status not in expected:
+                raise BenchmarkFailure(
+                    f"{name}: expected {expected}, got {response.status} {response.text[:200]}"
+                )
+            if i >= self.warmup:
+                samples.append(response.elapsed)
+        self.results[name] = summarize(samples)
+        result = self.results[name]
+        print(
+            f"  {name:<40} median {result['median_ms']:>8.2f} ms"
+            f"   p95 {result['p95_ms']:>8.2f} ms"
+        )
+
+
+async def create_verified_user(pool, token_source):
+    suffix = random_suffix()
+    username = f"bench_{suffix}"
+    email = f"{username}@example.com"
+    password = f"Password123!{suffix}"
+    client = FlashcardClient(pool)
+    response = await client.signup(username, email, password)
+    if response.status != 201:
+        raise BenchmarkFailure(f"signup failed: {response.status} {response.text}")
+    token = await token_source.wait_for_token(email, "verification")
+    if not token:
+        raise BenchmarkFailure(f"no verification email arrived for {email}")
+    response = await client.verify_email(token)
+    if not response.ok:
+        raise BenchmarkFailure(f"verification failed: {response.status}")
+    return username, password
+
+
+async def seed_deck(client, size, concurrency=20):
+    """Create a deck holding exactly ``size`` cards and return its id and card ids."""
+    response = await client.create_deck(f"Benchmark deck {size}", "benchmark dataset")
+    if response.status != 201:
+        raise BenchmarkFailure(f"could not create dataset deck: {response.status}")
+    deck_id = response.data["id"]
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def create(i):
+        async with semaphore:
+            response = await client.create_card_simple(
+                deck_id, f"Question {i}", f"Answer {i}"
+            )
+            if response.status != 201:
+                raise BenchmarkFailure(f"could not seed card: {response.status}")
+            return response.data["id"]
+
+    card_ids = await asyncio.gather(*(create(i) for i in range(size)))
+    return deck_id, list(card_ids)
+
+
+async def run_auth_benchmarks(bench, pool, username, password):
+    print_info("Authentication")
+
+    async def signup_args():
+        suffix = random_suffix(10)
+        return f"bsu_{suffix}", f"bsu_{suffix}@example.com", f"Password123!{suffix}"
+
+    client = FlashcardClient(pool)
+    await bench.measure(
+        "auth.signup",
+        lambda creds: client.signup(*creds),
+        prepare=signup_args,
+        expected=(201,),
+    )
+
+    await bench.measure(
+        "auth.login", lambda: FlashcardClient(pool).login(username, password)
+    )
+
+    refresher = FlashcardClient(pool)
+    await refresher.login(username, password)
+    await bench.measure("auth.refresh", refresher.refresh)
+
+
+async def run_deck_benchmarks(bench, client):
+    print_info("Decks")
+
+    async def new_deck():
+        response = await client.create_deck(f"Scratch {random_suffix()}", "scratch")
+        return response.data["id"]
+
+    await bench.measure(
+        "decks.create",
+        lambda: client.create_deck(f"Bench {random_suffix()}", "created"),
+        expected=(201,),
+    )
+    await bench.measure("decks.list", client.list_decks)
+    await bench.measure("decks.get", client.get_deck, prepare=new_deck)
+    await bench.measure(
+        "decks.update",
+        lambda deck_id: client.update_deck(deck_id, name="Renamed", description="x"),
+        prepare=new_deck,
+    )
+    await bench.measure("decks.delete", client.delete_deck, prepare=new_deck)
+    batch = [{"front": f"Bench {i}", "back": "Bench back"} for i in range(100)]
+    await bench.measure(
+        "cards.create_batch[size=100]",
+        lambda deck_id: client.create_cards_batch(deck_id, batch),
+        prepare=new_deck,
+        expected=(201,),
+    )
+
+    # Drop the decks left behind so repeated runs see the same deck count
+    response = await client.list_decks()
+    for deck in response.data or []:
+        if deck.get("description") in ("scratch", "created"):
+            await client.delete_deck(deck["id"])
+
+
+async def run_card_benchmarks(bench, client, size, deck_id, card_ids):
+    print_info(f"Cards (deck of {size})")
+    tag = f"[n={size}]"
+    rng = random.Random(size)
+
+    async def pick_card():
+        return rng.choice(card_ids)
+
+    async def scratch_card():
+        response = await client.create_card_simple(deck_id, "Scratch", "Scratch")
+        return response.data["id"]
+
+    await bench.measure(f"cards.list{tag}", lambda: client.list_cards(deck_id, size=10))
+    await bench.measure(
+        f"cards.list_page50{tag}", lambda: client.list_cards(deck_id, size=50)
+    )
+    await bench.measure(
+        f"cards.list_simple{tag}", lambda: client.list_cards_simple(deck_id, size=10)
+    )
+    await bench.measure(
+        f"cards.get{tag}",
+        lambda card_id: client.get_card(deck_id, card_id),
+        prepare=pick_card,
+    )
+    await bench.measure(
+        f"cards.get_simple{tag}",
+        lambda card_id: client.get_card_simple(deck_id, card_id),
+        prepare=pick_card,
+    )
+    await bench.measure(
+        f"cards.create{tag}",
+        lambda: client.create_card(deck_id, "Bench front", "Bench back"),
+        expected=(201,),
+    )
+    await bench.measure(
+        f"cards.create_simple{tag}",
+        lambda: client.create_card_simple(deck_id, "Bench front", "Bench back"),
+        expected=(201,),
+    )
+    await bench.measure(
+        f"cards.update{tag}",
+        lambda card_id: client.update_card(
+            deck_id, card_id, front="Updated front", back="Updated back"
+        ),
+        prepare=scratch_card,
+    )
+    await bench.measure(
+        f"cards.delete{tag}",
+        lambda card_id: client.delete_card(deck_id, card_id),
+        prepare=scratch_card,
+    )
+    await bench.measure(
+        f"cards.review_cards{tag}", lambda: client.review_cards(deck_id, limit=20)
+    )
+
+
+async def run_review_benchmarks(bench, client, size, deck_id, card_ids):
+    print_info(f"Study sessions and reviews (deck of {size})")
+    tag = f"[n={size}]"
+    cards = iter(card_ids * (1 + (bench.warmup + bench.iterations) // len(card_ids)))
+
+    async def new_session():
+        response = await client.start_session(deck_id)
+        return response.data["sessionId"]
+
+    await bench.measure(
+        f"sessions.start{tag}",
+        lambda: client.start_session(deck_id),
+        expected=(201,),
+    )
+
+    session_id = await new_session()
+
+    async def next_card():
+        return next(cards)
+
+    await bench.measure(
+        f"reviews.submit{tag}",
+        lambda card_id: client.submit_review(
+            session_id, card_id, random.randint(0, 5), 5
+        ),
+        prepare=next_card,
+        expected=(200, 201),
+    )
+    await bench.measure(
+        f"sessions.complete{tag}",
+        lambda sid: client.complete_session(sid, 1, 1, 0, 5),
+        prepare=new_session,
+    )
+    await bench.measure(
+        f"reviews.card_history{tag}",
+        lambda card_id: client.card_reviews(card_id),
+        prepare=lambda: asyncio.sleep(0, result=card_ids[0]),
+    )
+
+
+async def run_stats_benchmarks(bench, client):
+    print_info("Statistics")
+    await bench.measure(
+        "stats.study_activity[days=7]", lambda: client.study_activity(7)
+    )
+    await bench.measure(
+        "stats.study_activity[days=30]", lambda: client.study_activity(30)
+    )
+    await bench.measure("sessions.list", client.list_sessions)
+
+
+async def run_suite(args):
+    bench = Benchmark(args.iterations, args.warmup)
+    if args.smtp_sink:
+        token_source = await SmtpTokenSink(
+            *parse_listen_address(args.smtp_sink)
+        ).start()
+    else:
+        token_source = MailHogTokenSource(args.mailhog_url)
+    async with ConnectionPool(args.base_url, max_connections=20) as pool:
+        health = await pool.request("GET", "/health")
+        if not health.ok:
+            raise BenchmarkFailure(f"API at {args.base_url} is not healthy")
+
+        if args.username:
+            username, password = args.username, args.password
+        else:
+            username, password = await create_verified_user(pool, token_source)
+        client = FlashcardClient(pool)
+        response = await client.login(username, password)
+        if not response.ok:
+            raise BenchmarkFailure(f"login failed: {response.status} {response.text}")
+
+        await run_auth_benchmarks(bench, pool, username, password)
+        await run_deck_benchmarks(bench, client)
+
+        datasets = []
+        for size in args.sizes:
+            print_info(f"Seeding deck with {size} cards...")
+            deck_id, card_ids = await seed_deck(client, size)
+            datasets.append(deck_id)
+            await run_card_benchmarks(bench, client, size, deck_id, card_ids)
+            await run_review_benchmarks(bench, client, size, deck_id, card_ids)
+
+        await run_stats_benchmarks(bench, client)
+
+        for deck_id in datasets:
+            await client.delete_deck(deck_id)
+    await token_source.close()
+    return bench.results
+
+
+def git_revision():
+    try:
+        return (
+            subprocess.check_output(
+                ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL
+            )
+            .decode()
+            .strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def build_report(args, results):
+    return {
+        "schemaVersion": BASELINE_SCHEMA_VERSION,
+        "label": args.label or git_revision() or "unlabelled",
+        "createdAt": datetime.now(timezone.utc).isoformat(),
+        "environment": {
+            "baseUrl": args.base_url,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "config": {
+            "iterations": args.iterations,
+            "warmup": args.warmup,
+            "deckSizes": list(args.sizes),
+        },
+        "results": results,
+    }
+
+
+def compare(baseline, current, threshold, min_delta_ms):
+    """Return (rows, regressions) comparing medians of current vs baseline."""
+    rows, regressions = [], []
+    for name, result in sorted(current["results"].items()):
+        base = baseline["results"].get(name)
+        if base is None:
+            rows.append((name, None, result["median_ms"], None, "new"))
+            continue
+        change = (result["median_ms"] - base["median_ms"]) / base["median_ms"]
+        delta = result["median_ms"] - base["median_ms"]
+        if change > threshold and delta > min_delta_ms:
+            status = "REGRESSION"
+            regressions.append(name)
+        elif change < -threshold and -delta > min_delta_ms:
+            status = "faster"
+        else:
+            status = "ok"
+        rows.append((name, base["median_ms"], result["median_ms"], change, status))
+    for name in sorted(set(baseline["results"]) - set(current["results"])):
+        rows.append(
+            (name, baseline["results"][name]["median_ms"], None, None, "missing")
+        )
+    return rows, regressions
+
+
+def print_comparison(rows, baseline, threshold):
+    print(
+        f"\n{Colors.HEADER}{Colors.BOLD}Comparison against baseline "
+        f"'{baseline['label']}' (threshold {threshold:.0%}){Colors.ENDC}"
+    )
+    print(f"{'Benchmark':<40}{'Baseline':>12}{'Current':>12}{'Change':>10}  Status")
+    for name, base, current, change, status in rows:
+        colour = {
+            "REGRESSION": Colors.RED,
+            "faster": Colors.GREEN,
+            "missing": Colors.YELLOW,
+        }.get(status, "")
+        print(
+            f"{colour}{name:<40}"
+            f"{base if base is not None else '-':>12}"
+            f"{current if current is not None else '-':>12}"
+            f"{f'{change:+.1%}' if change is not None else '-':>10}  {status}"
+            f"{Colors.ENDC if colour else ''}"
+        )
+
+
+def write_json(path, data):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Benchmark the Flashcard API")
+    parser.add_argument("--port", type=int, default=3000, help="API server port")
+    parser.add_argument("--base-url", help="Overrides --port when given")
+    parser.add_argument("--mailhog-url", default="http://localhost:8025")
+    parser.add_argument(
+        "--smtp-sink",
+        metavar="[HOST:]PORT",
+        help="Capture email with a built-in SMTP server instead of polling MailHog",
+    )
+    parser.add_argument(
+        "--username", help="Verified user to benchmark with (default: sign one up)"
+    )
+    parser.add_argument("--password")
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument(
+        "--sizes",
+        type=lambda s: [int(x) for x in s.split(",")],
+        default=list(DEFAULT_DECK_SIZES),
+        help="Comma separated card counts for the dataset decks (default: 10,100,1000)",
+    )
+    parser.add_argument("--label", help="Baseline label (default: git revision)")
+    parser.add_argument("--output", help="Write this run's results to a JSON file")
+    parser.add_argument("--save-baseline", help="Write this run as the baseline file")
+    parser.add_argument("--compare", help="Baseline file to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.15,
+        help="Allowed relative slowdown of an endpoint's median (default: 0.15)",
+    )
+    parser.add_argument(
+        "--min-delta-ms",
+        type=float,
+        default=1.0,
+        help="Ignore slowdowns smaller than this many milliseconds (default: 1.0)",
+    )
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.base_url = args.base_url or f"http://localhost:{args.port}"
+    if args.username and not args.password:
+        print_error("--password is required with --username")
+        return 2
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if baseline.get("schemaVersion") != BASELINE_SCHEMA_VERSION:
+            print_error(
+                f"Baseline schema {baseline.get('schemaVersion')} is not supported "
+                f"(expected {BASELINE_SCHEMA_VERSION}); record a new baseline"
+            )
+            return 2
+        if baseline["config"]["deckSizes"] != list(args.sizes):
+            print_error(
+                f"Baseline was recorded with deck sizes {baseline['config']['deckSizes']}; "
+                f"rerun with --sizes {','.join(map(str, baseline['config']['deckSizes']))}"
+            )
+            return 2
+
+    started = time.perf_counter()
+    try:
+        results = asyncio.run(run_suite(args))
+    except BenchmarkFailure as e:
+        print_error(str(e))
+        return 2
+    print_info(f"Benchmark finished in {time.perf_counter() - started:.1f}s")
+
+    report = build_report(args, results)
+    if args.output:
+        write_json(args.output, report)
+    if args.save_baseline:
+        write_json(args.save_baseline, report)
+        print_info(f"Baseline '{report['label']}' saved to {args.save_baseline}")
+
+    if baseline is not None:
+        rows, regressions = compare(baseline, report, args.threshold, args.min_delta_ms)
+        print_comparison(rows, baseline, args.threshold)
+        if regressions:
+            print_error(
+                f"{len(regressions)} endpoint(s) regressed: {', '.join(regressions)}"
+            )
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,500 @@
+#!/usr/bin/env python3
+"""Synthetic dataset generator for scale testing.
+
+Writes users, decks, cards, study sessions, card reviews and the daily stats
+rollups as CSV shards, plus a ``load.sql`` script that bulk loads them into
+the PostgreSQL schema with psql ``\\copy`` (start the application once first
+so Hibernate has created the tables, and load into empty tables or pass
+``--id-base``).
+
+Review history is simulated per user with the same difficulty and interval
+rules as CardReviewController, so difficulty, review counts and
+next_review_date end up distributed the way real usage would leave them.
+Every user is generated from its own seeded RNG, so the output depends only
+on the seed and the sizes, not on how many worker processes were used.
+
+    python dataset_generator.py --profile large --seed 42 --out data/large
+    cd data/large && psql -h localhost -U postgres -d flashcard_db -f load.sql
+
+All generated users share the password ``Password123!`` unless
+``--password-hash`` supplies another BCrypt hash.
+"""
+
+import argparse
+import csv
+import heapq
+import json
+import math
+import multiprocessing
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Usage")
+)
+from review_schedule import next_difficulty, review_interval
+
+PROFILES = {
+    # users, decks per user, cards per deck, days of review history
+    "tiny": {"users": 10, "decks": 2, "cards": 50, "days": 30},
+    "small": {"users": 100, "decks": 5, "cards": 100, "days": 90},
+    "medium": {"users": 1000, "decks": 10, "cards": 200, "days": 365},
+    "large": {"users": 10000, "decks": 20, "cards": 500, "days": 730},
+}
+
+# BCrypt (strength 10) of "Password123!"
+DEFAULT_PASSWORD_HASH = "$2a$10$1vRWiMuf.XZV4KZnPbZIxefGsx.78lNjf8IMRTFqGL3qrCkwPwRbW"
+
+# Tables whose ids come from a Hibernate sequence instead of a serial column
+ID_SEQUENCES = {"cards": "'cards_seq'", "card_reviews": "'card_reviews_seq'"}
+
+# Ids of a user's sessions and reviews are derived from these bounds, so
+# shards can be generated independently without colliding
+MAX_SESSION_REVIEWS = 100
+
+TABLES = {
+    "users": [
+        "id",
+        "username",
+        "email",
+        "password",
+        "enabled",
+        "email_verified",
+        "last_login_date",
+        "created_at",
+        "updated_at",
+    ],
+    "decks": [
+        "id",
+        "name",
+        "description",
+        "user_id",
+        "last_studied",
+        "created_at",
+        "updated_at",
+    ],
+    "cards": [
+        "id",
+        "deck_id",
+        "user_id",
+        "front",
+        "back",
+        "notes",
+        "difficulty",
+        "next_review_date",
+        "review_count",
+        "created_at",
+        "updated_at",
+    ],
+    "study_sessions": [
+        "id",
+        "session_id",
+        "user_id",
+        "deck_id",
+        "cards_reviewed",
+        "correct_responses",
+        "incorrect_responses",
+        "total_time_seconds",
+        "started_at",
+        "completed_at",
+    ],
+    "card_reviews": [
+        "id",
+        "card_id",
+        "study_session_id",
+        "result",
+        "time_spent_seconds",
+        "previous_difficulty",
+        "new_difficulty",
+        "next_review_date",
+        "reviewed_at",
+    ],
+    # Per-day rollups the application keeps for activity statistics
+    "user_daily_stats": [
+        "id",
+        "user_id",
+        "stat_date",
+        "reviews",
+        "correct_responses",
+        "incorrect_responses",
+        "time_spent_seconds",
+        "new_cards",
+        "sessions_completed",
+    ],
+}
+
+SUBJECTS = [
+    "Spanish",
+    "French",
+    "Biology",
+    "Chemistry",
+    "History",
+    "Geography",
+    "Algorithms",
+    "Anatomy",
+    "Music Theory",
+    "Statistics",
+]
+
+
+class Timestamps:
+    """Formats epoch seconds as SQL timestamps, caching the date part per day."""
+
+    def __init__(self):
+        self._days = {}
+
+    def __call__(self, seconds):
+        seconds = int(seconds)
+        day, rest = divmod(seconds, 86400)
+        prefix = self._days.get(day)
+        if prefix is None:
+            prefix = self._days[day] = datetime.utcfromtimestamp(day * 86400).strftime(
+                "%Y-%m-%d "
+            )
+        hours, rest = divmod(rest, 3600)
+        minutes, secs = divmod(rest, 60)
+        return "%s%02d:%02d:%02d" % (prefix, hours, minutes, secs)
+
+
+def answer(rng, difficulty):
+    """Pick a 0-5 result; harder cards are failed more and rated lower."""
+    difficulty = min(difficulty, 5)
+    if rng.random() < 0.08 + 0.07 * difficulty:
+        return 0
+    return min(5, max(1, int(rng.gauss(4.2 - 0.5 * difficulty, 1.0) + 0.5)))
+
+
+def generate_shard(job):
+    """Generate users [first, last) and write one CSV file per table."""
+    shard, first, last, cfg = job
+    out = cfg["out"]
+    stamp = Timestamps()
+    counts = dict.fromkeys(TABLES, 0)
+    id_base = cfg["id_base"]
+    decks_per_user = cfg["decks"]
+    cards_per_deck = cfg["cards"]
+    days = cfg["days"]
+    end = cfg["end"]
+    start = end - days * 86400
+
+    files = {
+        table: open(
+            os.path.join(out, f"{table}_{shard:04d}.csv"),
+            "w",
+            newline="",
+            buffering=1 << 20,
+        )
+        for table in TABLES
+    }
+    writers = {table: csv.writer(f) for table, f in files.items()}
+    for table, writer in writers.items():
+        writer.writerow(TABLES[table])
+
+    write_user = writers["users"].writerow
+    write_deck = writers["decks"].writerow
+    write_card = writers["cards"].writerow
+    write_session = writers["study_sessions"].writerow
+    write_review = writers["card_reviews"].writerow
+    write_daily = writers["user_daily_stats"].writerow
+    password = cfg["password_hash"]
+
+    for user_index in range(first, last):
+        rng = random.Random(cfg["seed"] * 1_000_003 + user_index)
+        user_id = id_base + user_index
+        joined = start - rng.randint(0, 30 * 86400)
+        # How often this user studies and how much per session
+        activity = rng.betavariate(2, 3)
+        session_mu = math.log(max(5, rng.gauss(25, 8)))
+
+        deck_base = (id_base + user_index * decks_per_user) * cards_per_deck
+        deck_ids = [
+            id_base + user_index * decks_per_user + d for d in range(decks_per_user)
+        ]
+        deck_weights = [rng.paretovariate(1.5) for _ in deck_ids]
+        difficulty = [[0] * cards_per_deck for _ in deck_ids]
+        review_count = [[0] * cards_per_deck for _ in deck_ids]
+        # Heap of (next_review_date, card index) per deck; new cards are due at once
+        due = [[(joined, c) for c in range(cards_per_deck)] for _ in deck_ids]
+        last_studied = [None] * decks_per_user
+        last_login = None
+        # Day offset from start -> [reviews, correct, incorrect, time, new, sessions]
+        daily = {}
+
+        for day in range(days):
+            if rng.random() >= activity:
+                continue
+            d = rng.choices(range(decks_per_user), weights=deck_weights)[0]
+            heap = due[d]
+            session_start = start + day * 86400 + int(rng.uniform(7, 23) * 3600)
+            wanted = min(MAX_SESSION_REVIEWS, int(rng.lognormvariate(session_mu, 0.5)))
+            session_pk = id_base + user_index * days + day
+            review_pk = session_pk * MAX_SESSION_REVIEWS
+            clock = session_start
+            reviewed = correct = 0
+            deck_difficulty = difficulty[d]
+            deck_reviews = review_count[d]
+            deck_card_base = deck_base + d * cards_per_deck
+
+            while reviewed < wanted and heap and heap[0][0] <= clock:
+                _, card = heapq.heappop(heap)
+                previous = deck_difficulty[card]
+                result = answer(rng, previous)
+                new = next_difficulty(previous, result)
+                spent = max(
+                    1, int(rng.lognormvariate(2.0 + 0.1 * min(previous, 5), 0.6))
+                )
+                clock += spent
+                next_review = clock + review_interval(new)
+                totals = daily.setdefault((clock - start) // 86400, [0] * 6)
+                totals[0] += 1
+                totals[1 if result > 0 else 2] += 1
+                totals[3] += spent
+                if not deck_reviews[card]:
+                    totals[4] += 1
+                write_review(
+                    (
+                        review_pk + reviewed,
+                        deck_card_base + card,
+                        session_pk,
+                        result,
+                        spent,
+                        previous,
+                        new,
+                        stamp(next_review),
+                        stamp(clock),
+                    )
+                )
+                deck_difficulty[card] = new
+                deck_reviews[card] += 1
+                heapq.heappush(heap, (next_review, card))
+                reviewed += 1
+                if result > 0:
+                    correct += 1
+
+            if not reviewed:
+                continue
+            write_session(
+                (
+                    session_pk,
+                    str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+                    user_id,
+                    deck_ids[d],
+                    reviewed,
+                    correct,
+                    reviewed - correct,
+                    clock - session_start,
+                    stamp(session_start),
+                    stamp(clock),
+                )
+            )
+            daily.setdefault((clock - start) // 86400, [0] * 6)[5] += 1
+            counts["study_sessions"] += 1
+            counts["card_reviews"] += reviewed
+            last_studied[d] = clock
+            last_login = session_start
+
+        created = stamp(joined)
+        write_user(
+            (
+                user_id,
+                f"gen{user_id}",
+                f"gen{user_id}@example.com",
+                password,
+                "true",
+                "true",
+                stamp(last_login) if last_login else "",
+                created,
+                created,
+            )
+        )
+        counts["users"] += 1
+
+        # Sessions can run past midnight of the last day, hence days + 1 slots
+        for offset in sorted(daily):
+            write_daily(
+                (
+                    id_base + user_index * (days + 1) + offset,
+                    user_id,
+                    stamp(start + offset * 86400)[:10],
+                    *daily[offset],
+                )
+            )
+        counts["user_daily_stats"] += len(daily)
+
+        for d, deck_id in enumerate(deck_ids):
+            subject = SUBJECTS[(user_index + d) % len(SUBJECTS)]
+            write_deck(
+                (
+                    deck_id,
+                    f"{subject} {d + 1}",
+                    f"Generated {subject.lower()} deck",
+                    user_id,
+                    stamp(last_studied[d]) if last_studied[d] else "",
+                    created,
+                    created,
+                )
+            )
+            next_due = dict((card, when) for when, card in due[d])
+            card_base = deck_base + d * cards_per_deck
+            deck_difficulty = difficulty[d]
+            deck_reviews = review_count[d]
+            for c in range(cards_per_deck):
+                write_card(
+                    (
+                        card_base + c,
+                        deck_id,
+                        user_id,
+                        f"{subject} question {c + 1}",
+                        f"{subject} answer {c + 1}",
+                        "",
+                        deck_difficulty[c],
+                        stamp(next_due[c]),
+                        deck_reviews[c],
+                        created,
+                        created,
+                    )
+                )
+        counts["decks"] += decks_per_user
+        counts["cards"] += decks_per_user * cards_per_deck
+
+    for f in files.values():
+        f.close()
+    return shard, counts
+
+
+def write_load_script(out, shards, cfg):
+    last_user = cfg["id_base"] + cfg["users"] - 1
+    lines = [
+        "-- Generated by tests/dataset_generator.py; run from this directory:",
+        "--   psql -h localhost -U postgres -d flashcard_db -f load.sql",
+        "\\set ON_ERROR_STOP on",
+        "SET synchronous_commit = off;",
+        "BEGIN;",
+    ]
+    # Parents before children so foreign keys hold at every step
+    for table in TABLES:
+        columns = ", ".join(TABLES[table])
+        for shard in shards:
+            lines.append(
+                f"\\copy {table} ({columns}) FROM '{table}_{shard:04d}.csv' "
+                "WITH (FORMAT csv, HEADER true)"
+            )
+        if table == "users":
+            lines.append(
+                "INSERT INTO user_roles (user_id, role_id) "
+                "SELECT u.id, r.id FROM users u CROSS JOIN roles r "
+                f"WHERE r.name = 'ROLE_USER' AND u.id BETWEEN {cfg['id_base']} AND {last_user};"
+            )
+    for table in TABLES:
+        sequence = ID_SEQUENCES.get(table, f"pg_get_serial_sequence('{table}', 'id')")
+        lines.append(f"SELECT setval({sequence}, (SELECT MAX(id) FROM {table}));")
+    lines.append("COMMIT;")
+    lines.extend(f"ANALYZE {table};" for table in list(TABLES) + ["user_roles"])
+    with open(os.path.join(out, "load.sql"), "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Generate a synthetic flashcard dataset for bulk loading"
+    )
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="small")
+    parser.add_argument("--users", type=int, help="Override the profile's users")
+    parser.add_argument("--decks", type=int, help="Override decks per user")
+    parser.add_argument("--cards", type=int, help="Override cards per deck")
+    parser.add_argument("--days", type=int, help="Override days of review history")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--out", default="dataset", help="Output directory")
+    parser.add_argument(
+        "--id-base",
+        type=int,
+        default=1,
+        help="First id to use, to load alongside existing rows (default: 1)",
+    )
+    parser.add_argument(
+        "--end-date",
+        default=None,
+        help="Date the review history ends, YYYY-MM-DD (default: today)",
+    )
+    parser.add_argument("--password-hash", default=DEFAULT_PASSWORD_HASH)
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="Worker processes"
+    )
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    sizes = dict(PROFILES[args.profile])
+    for key in sizes:
+        if getattr(args, key) is not None:
+            sizes[key] = getattr(args, key)
+
+    end = (
+        datetime.strptime(args.end_date, "%Y-%m-%d")
+        if args.end_date
+        else datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    )
+    os.makedirs(args.out, exist_ok=True)
+    cfg = dict(
+        sizes,
+        seed=args.seed,
+        out=args.out,
+        id_base=args.id_base,
+        password_hash=args.password_hash,
+        end=int((end - datetime(1970, 1, 1)) / timedelta(seconds=1)),
+    )
+
+    # Several shards per worker keeps every process busy until the end
+    shard_size = max(1, math.ceil(sizes["users"] / (args.workers * 4)))
+    jobs = [
+        (shard, first, min(first + shard_size, sizes["users"]), cfg)
+        for shard, first in enumerate(range(0, sizes["users"], shard_size))
+    ]
+
+    print(
+        f"Generating {sizes['users']} users x {sizes['decks']} decks x "
+        f"{sizes['cards']} cards with {sizes['days']} days of history "
+        f"in {len(jobs)} shards on {args.workers} processes..."
+    )
+    started = time.perf_counter()
+    totals = dict.fromkeys(TABLES, 0)
+    with multiprocessing.Pool(args.workers) as pool:
+        for done, (shard, counts) in enumerate(
+            pool.imap_unordered(generate_shard, jobs), 1
+        ):
+            for table, count in counts.items():
+                totals[table] += count
+            print(
+                f"  shard {shard:04d} done ({done}/{len(jobs)}), "
+                f"{totals['card_reviews']:,} reviews so far",
+                end="\r",
+            )
+    elapsed = time.perf_counter() - started
+    print()
+
+    write_load_script(args.out, [job[0] for job in jobs], cfg)
+    manifest = {
+        "profile": args.profile,
+        "seed": args.seed,
+        "sizes": sizes,
+        "idBase": args.id_base,
+        "endDate": end.strftime("%Y-%m-%d"),
+        "rows": totals,
+        "generationSeconds": round(elapsed, 1),
+    }
+    with open(os.path.join(args.out, "manifest.json"), "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    for table, count in totals.items():
+        print(f"  {table:<16}{count:>14,}")
+    print(f"Done in {elapsed:.1f}s; load with: cd {args.out} && psql ... -f load.sql")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
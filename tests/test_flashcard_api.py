@@ -3,71 +3,121 @@ import requests
 import json
 import time
 import os
-import getpass
 from datetime import datetime
 import webbrowser
 import random
 import string
 import argparse
+import statistics
 import sys
-import re
-import socket
-
-# Parse command-line arguments
-parser = argparse.ArgumentParser(description="Test the Flashcard API")
-parser.add_argument(
-    "--port", type=int, default=3000, help="API server port (default: 3000)"
-)
-parser.add_argument(
-    "--mailhog-port", type=int, default=8025, help="MailHog web UI port (default: 8025)"
-)
-parser.add_argument(
-    "--mailhog-host",
-    type=str,
-    default="localhost",
-    help="MailHog host (default: localhost, use 'mailhog' if inside Docker network)",
-)
-parser.add_argument(
-    "--wait-email",
-    type=int,
-    default=5,
-    help="Time to wait for emails to arrive in seconds (default: 5)",
+import threading
+import multiprocessing
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
 )
-parser.add_argument(
-    "--auto", action="store_true", help="Run in automated mode with minimal user input"
-)
-parser.add_argument(
-    "--auto-verify",
-    action="store_true",
-    help="Automatically extract verification token from MailHog (requires --auto)",
-)
-parser.add_argument(
-    "--delay",
-    type=int,
-    default=2,
-    help="Delay between tests in seconds when in auto mode (default: 2)",
-)
-parser.add_argument(
-    "--token-tries",
-    type=int,
-    default=5,
-    help="Number of attempts to extract tokens from emails (default: 5)",
+from queue import Empty
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Usage")
 )
-args = parser.parse_args()
-
-# Configuration
-BASE_URL = f"http://localhost:{args.port}"
-MAILHOG_URL = f"http://{args.mailhog_host}:{args.mailhog_port}"  # MailHog web interface
-MAILHOG_API_URL = f"http://{args.mailhog_host}:{args.mailhog_port}/api/v2/messages"
-AUTH_TOKEN = None
-REFRESH_TOKEN = None
-USER_EMAIL = None
-USER_PASSWORD = None
-USER_ID = None
-USER_USERNAME = None
-TEST_DECK_ID = None
-TEST_CARD_ID = None
-TEST_SESSION_ID = None
+from load_generator import EndpointStats
+from mail_tokens import newest_mailhog_token
+from request_trace import current_trace, enable_trace
+from smtp_sink import ThreadedSmtpTokenSink, parse_listen_address
+
+MAX_RETRIES = 3
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Test the Flashcard API")
+    parser.add_argument(
+        "--port", type=int, default=3000, help="API server port (default: 3000)"
+    )
+    parser.add_argument(
+        "--mailhog-port",
+        type=int,
+        default=8025,
+        help="MailHog web UI port (default: 8025)",
+    )
+    parser.add_argument(
+        "--mailhog-host",
+        type=str,
+        default="localhost",
+        help="MailHog host (default: localhost, use 'mailhog' if inside Docker network)",
+    )
+    parser.add_argument(
+        "--auto",
+        action="store_true",
+        help="Kept for compatibility; runs are automated whenever --auto-verify "
+        "or --smtp-sink provides the email tokens",
+    )
+    parser.add_argument(
+        "--auto-verify",
+        action="store_true",
+        help="Automatically extract verification tokens from MailHog",
+    )
+    parser.add_argument(
+        "--smtp-sink",
+        metavar="[HOST:]PORT",
+        help="Receive email with a built-in SMTP server instead of MailHog "
+        "(start the API with SPRING_MAIL_HOST/SPRING_MAIL_PORT pointing at it)",
+    )
+    parser.add_argument(
+        "--token-timeout",
+        type=int,
+        default=30,
+        help="Seconds to wait for a token email (default: 30)",
+    )
+    parser.add_argument(
+        "--wait-email",
+        type=int,
+        help="Kept for compatibility; token emails are polled for up to "
+        "--token-timeout seconds instead of a fixed wait",
+    )
+    parser.add_argument(
+        "--delay",
+        type=int,
+        help="Kept for compatibility; tests no longer pause between each other",
+    )
+    parser.add_argument(
+        "--token-tries",
+        type=int,
+        help="Kept for compatibility; see --token-timeout",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Isolated workers, each with its own user, tokens and decks "
+        "(default: 4; interactive runs use 1)",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Size of the process pool the workers run on (default: CPU count)",
+    )
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=4,
+        help="Independent tests run concurrently within a worker (default: 4)",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print every worker's full transcript, not only failing ones",
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="FILE",
+        help="Record every request's latency and payload size to a JSONL trace",
+    )
+    return parser
 
 
 # Attempt to detect if we're running inside Docker
@@ -80,13 +130,6 @@ def is_in_docker():
         return False
 
 
-# If inside Docker, adjust URLs
-if is_in_docker():
-    MAILHOG_URL = "http://mailhog:8025"
-    MAILHOG_API_URL = "http://mailhog:8025/api/v2/messages"
-    print("Running inside Docker container, using internal Docker network URLs")
-
-
 # Color codes for terminal output
 class Colors:
     HEADER = "\033[95m"
@@ -99,34 +142,43 @@ class Colors:
     UNDERLINE = "\033[4m"
 
 
+LEVEL_FORMATS = {
+    "header": f"\n{Colors.HEADER}{Colors.BOLD}{'='*80}\n{{}}\n{'='*80}{Colors.ENDC}",
+    "info": f"{Colors.BLUE}[INFO] {{}}{Colors.ENDC}",
+    "success": f"{Colors.GREEN}[SUCCESS] {{}}{Colors.ENDC}",
+    "warning": f"{Colors.YELLOW}[WARNING] {{}}{Colors.ENDC}",
+    "error": f"{Colors.RED}[ERROR] {{}}{Colors.ENDC}",
+    "json": "{}",
+}
+
+
+def format_line(level, text):
+    return LEVEL_FORMATS[level].format(text)
+
+
 def print_header(text):
     """Print a formatted header"""
-    print(f"\n{Colors.HEADER}{Colors.BOLD}{'='*80}\n{text}\n{'='*80}{Colors.ENDC}")
+    print(format_line("header", text))
 
 
 def print_info(text):
     """Print info text"""
-    print(f"{Colors.BLUE}[INFO] {text}{Colors.ENDC}")
+    print(format_line("info", text))
 
 
 def print_success(text):
     """Print success text"""
-    print(f"{Colors.GREEN}[SUCCESS] {text}{Colors.ENDC}")
+    print(format_line("success", text))
 
 
 def print_warning(text):
     """Print warning text"""
-    print(f"{Colors.YELLOW}[WARNING] {text}{Colors.ENDC}")
+    print(format_line("warning", text))
 
 
 def print_error(text):
     """Print error text"""
-    print(f"{Colors.RED}[ERROR] {text}{Colors.ENDC}")
-
-
-def print_json(data):
-    """Print formatted JSON data"""
-    print(json.dumps(data, indent=2))
+    print(format_line("error", text))
 
 
 def generate_random_string(length=8):
@@ -135,24 +187,126 @@ def generate_random_string(length=8):
     return "".join(random.choice(letters) for i in range(length))
 
 
-def save_auth_tokens(response_data):
-    """Save authentication tokens"""
-    global AUTH_TOKEN, REFRESH_TOKEN
-    AUTH_TOKEN = response_data.get("accessToken")
-    REFRESH_TOKEN = response_data.get("refreshToken")
-    print_info("Authentication tokens saved")
+def generate_credentials():
+    """Generate a fresh username, email and password for one worker"""
+    random_suffix = generate_random_string()
+    return {
+        "username": f"testuser_{random_suffix}",
+        "email": f"testuser_{random_suffix}@example.com",
+        "password": f"Password123!{random_suffix}",
+    }
 
 
-def get_auth_header():
-    """Get authorization header"""
-    global AUTH_TOKEN
-    if not AUTH_TOKEN:
-        print_error("No authentication token available. Please log in first.")
-        return None
-    return {"Authorization": f"Bearer {AUTH_TOKEN}"}
+class TestContext:
+    """Everything one worker's tests share: its user, tokens and resources.
+
+    Each worker owns one context, so workers never see each other's state.
+    Output is buffered per worker (and streamed when ``stream`` is set) so
+    transcripts from concurrent workers do not interleave.
+    """
+
+    def __init__(self, worker_id, config, credentials, token_source, stream=False):
+        self.worker_id = worker_id
+        self.base_url = config["base_url"]
+        self.username = credentials["username"]
+        self.email = credentials["email"]
+        self.password = credentials["password"]
+        self.token_source = token_source
+        self.stream = stream
+        self.user_id = None
+        self.access_token = None
+        self.refresh_token = None
+        self.deck_id = None
+        self.card_id = None
+        self.log = []
+        self.endpoints = EndpointStats()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @property
+    def current_test(self):
+        return getattr(self._local, "test", None)
+
+    @current_test.setter
+    def current_test(self, name):
+        self._local.test = name
+
+    def _session(self):
+        # requests.Session is not thread-safe; keep one keep-alive session per thread
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+
+    def emit(self, level, text):
+        with self._lock:
+            self.log.append((level, text))
+        if self.stream:
+            print(format_line(level, text))
+
+    def header(self, text):
+        self.emit("header", text)
+
+    def info(self, text):
+        self.emit("info", text)
+
+    def success(self, text):
+        self.emit("success", text)
+
+    def warning(self, text):
+        self.emit("warning", text)
+
+    def error(self, text):
+        self.emit("error", text)
+
+    def json(self, data):
+        self.emit("json", json.dumps(data, indent=2))
+
+    def auth_header(self):
+        if not self.access_token:
+            self.error("No authentication token available. Please log in first.")
+            return None
+        return {"Authorization": f"Bearer {self.access_token}"}
+
+    def request(self, method, path, route=None, auth=True, **kwargs):
+        """Send a request on this thread's session and record its timing."""
+        kwargs.setdefault("timeout", 30)
+        if auth:
+            kwargs["headers"] = self.auth_header()
+        status = 0
+        response = None
+        started = time.perf_counter()
+        try:
+            response = self._session().request(method, self.base_url + path, **kwargs)
+            status = response.status_code
+            return response
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self.endpoints.add(method, route or path, status, elapsed)
+            trace = current_trace()
+            if trace is not None:
+                self._trace(trace, method, route or path, status, elapsed, response)
+
+    @staticmethod
+    def _trace(trace, method, route, status, elapsed, response):
+        if response is None:
+            trace.record(method, route, status, elapsed)
+            return
+        # requests reports the time until the headers arrived, not how long
+        # the connection took to open
+        trace.record(
+            method,
+            route,
+            status,
+            elapsed,
+            ttfb=response.elapsed.total_seconds(),
+            request_bytes=len(response.request.body or b""),
+            response_bytes=len(response.content),
+        )
 
 
-def handle_response(response, success_msg=None):
+def handle_response(ctx, response, success_msg=None):
     """Handle API response with proper output"""
     try:
         data = response.json()
@@ -161,430 +315,262 @@ def handle_response(response, success_msg=None):
 
     if 200 <= response.status_code < 300:
         if success_msg:
-            print_success(success_msg)
-        print_info(f"Status: {response.status_code}")
-        print_json(data)
+            ctx.success(success_msg)
+        ctx.info(f"Status: {response.status_code}")
+        ctx.json(data)
         return data
     else:
-        print_error(f"Request failed with status: {response.status_code}")
-        print_json(data)
+        ctx.error(f"Request failed with status: {response.status_code}")
+        ctx.json(data)
         return None
 
 
-def open_mailhog():
-    """Open MailHog in the default web browser"""
-    if not args.auto:
-        print_info(f"Opening MailHog at {MAILHOG_URL}")
+def request_with_fallback(ctx, method, simple_path, path, success_msg, **kwargs):
+    """Try the lightweight /simple endpoint, then the standard one with retries.
+
+    Paths are ``(url, route)`` pairs; the route groups timings per endpoint.
+    """
+    try:
+        ctx.info("Attempting to use the simplified endpoint first")
+        response = ctx.request(method, simple_path[0], route=simple_path[1], **kwargs)
+        result = handle_response(ctx, response, f"{success_msg} (simplified endpoint)")
+        if result is not None:
+            ctx.success("Successfully used simplified endpoint")
+            return result
+    except requests.RequestException as e:
+        ctx.warning(
+            f"Simplified endpoint failed: {str(e)}. Falling back to standard endpoint."
+        )
+
+    ctx.info("Using standard endpoint with retry logic")
+    retry_delay = 2
+    for attempt in range(MAX_RETRIES):
         try:
-            webbrowser.open(MAILHOG_URL)
-            print_info("Please check the verification email in MailHog")
-        except:
-            print_warning(
-                f"Failed to open browser. Please manually navigate to {MAILHOG_URL}"
-            )
+            response = ctx.request(method, path[0], route=path[1], **kwargs)
+            return handle_response(ctx, response, success_msg)
+        except (
+            requests.exceptions.ChunkedEncodingError,
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+        ) as e:
+            if attempt < MAX_RETRIES - 1:
+                ctx.warning(f"Connection error on attempt {attempt + 1}: {str(e)}")
+                ctx.info(f"Retrying in {retry_delay} seconds...")
+                time.sleep(retry_delay)
+                retry_delay *= 2  # Exponential backoff
+            else:
+                ctx.error(f"Failed after {MAX_RETRIES} attempts: {str(e)}")
+    return None
 
 
-def extract_token_from_mailhog(email, token_type="verification"):
-    """Extract a token from MailHog for the given email and token type"""
-    print_info(f"Waiting for email to arrive in MailHog for {email}...")
-    # Wait longer for emails to arrive
-    time.sleep(args.wait_email)
+# Token sources. Each returns the token mailed to the worker's user, or None.
 
-    max_attempts = args.token_tries
-    for attempt in range(max_attempts):
-        try:
-            print_info(
-                f"Attempt {attempt+1}/{max_attempts} to fetch emails from MailHog"
-            )
-            # Try connecting to multiple potential MailHog addresses
-            urls_to_try = [
-                MAILHOG_API_URL,  # Try default URL first
-                f"http://localhost:{args.mailhog_port}/api/v2/messages",  # Try localhost explicitly
-                f"http://mailhog:{args.mailhog_port}/api/v2/messages",  # Try Docker service name
-            ]
 
-            for i, url in enumerate(urls_to_try):
-                try:
-                    print_info(f"Trying to connect to MailHog at {url}")
-                    response = requests.get(url, timeout=5)
-                    if response.status_code == 200:
-                        print_success(f"Successfully connected to MailHog at {url}")
-                        break
-                except requests.RequestException as e:
-                    print_warning(f"Could not connect to {url}: {str(e)}")
-                    if i == len(urls_to_try) - 1:
-                        print_error("Failed to connect to any MailHog instance")
-                        time.sleep(2)
-                        continue
-
-            if response.status_code != 200:
-                print_error(f"Failed to fetch emails: {response.status_code}")
-                time.sleep(2)
-                continue
-
-            data = response.json()
-            if not data or "items" not in data:
-                print_error("Invalid response format from MailHog API")
-                print_json(data)  # Print the response for debugging
-                time.sleep(2)
-                continue
-
-            if not data["items"]:
-                print_warning(f"No emails found in MailHog (attempt {attempt+1})")
-                time.sleep(2)
-                continue
-
-            print_info(f"Found {len(data['items'])} emails in MailHog")
-
-            # Find the most recent email for the given address
-            for item in data["items"]:
-                to_addresses = item.get("To", [])
-                recipients = []
-
-                # Handle both string and object formats for recipients
-                for addr in to_addresses:
-                    if isinstance(addr, dict):
-                        recipient = (
-                            f"{addr.get('Mailbox', '')}@{addr.get('Domain', '')}"
-                        )
-                        recipients.append(recipient)
-                    elif isinstance(addr, str):
-                        recipients.append(addr)
-
-                print_info(f"Checking email to: {', '.join(recipients)}")
-
-                # Check if our target email is in the recipients list
-                email_found = any(email.lower() in addr.lower() for addr in recipients)
-                # Also check with relaxed matching (just username part)
-                username = email.split("@")[0] if "@" in email else email
-                relaxed_match = any(
-                    username.lower() in addr.lower() for addr in recipients
+class MailHogTokens:
+    """Polls the MailHog search API for a recipient's newest token mail"""
+
+    def __init__(self, mailhog_url, timeout, poll_interval=0.5):
+        self.mailhog_url = mailhog_url
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+
+    def wait_for_token(self, ctx, kind):
+        ctx.info(f"Waiting for {kind} email to {ctx.email} in MailHog...")
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                response = requests.get(
+                    f"{self.mailhog_url}/api/v2/search",
+                    params={"kind": "to", "query": ctx.email},
+                    timeout=5,
                 )
+                if response.status_code == 200:
+                    token = newest_mailhog_token(response.json(), kind)
+                    if token:
+                        return token
+            except (requests.RequestException, ValueError) as e:
+                ctx.warning(f"Could not query MailHog: {str(e)}")
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(self.poll_interval)
 
-                if email_found or relaxed_match:
-                    # Extract email body
-                    body = ""
-                    content = item.get("Content", {})
-
-                    # Try to get HTML body first
-                    if "Body" in content and isinstance(content["Body"], list):
-                        for part in content["Body"]:
-                            body = part.get("Body", "")
-                            if body:
-                                break
-                    # Fallback to direct Body field
-                    elif "Body" in content and isinstance(content["Body"], str):
-                        body = content["Body"]
-
-                    if "MIME" in content:
-                        print_info(f"Email MIME type: {content['MIME']}")
-
-                    # Print a small part of the body for debugging
-                    if body:
-                        print_info(f"Email body sample: {body[:100]}...")
-                    else:
-                        print_warning("Email body is empty")
-
-                    # Look for token in body
-                    if token_type == "verification":
-                        # Try multiple regex patterns to find the token
-                        patterns = [
-                            r"verification.*?token[^\w]+([\w\-]+)",  # Standard format
-                            r"verify.*?token[^\w]+([\w\-]+)",  # Alternative wording
-                            r"activate.*?token[^\w]+([\w\-]+)",  # Alternative wording
-                            r'href=[\'"].*?token=([\w\-]+)',  # URL with token parameter
-                            r"token[^\w]+([\w\-]+)",  # Generic token mention
-                            r"code[^\w]+([\w\-]+)",  # Code instead of token
-                            r'[\'"][a-zA-Z0-9\-]{20,}[\'"]',  # Long string in quotes (likely token)
-                            r'[\'"][a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}[\'"]',  # UUID pattern
-                        ]
-
-                        for pattern in patterns:
-                            token_match = re.search(pattern, body, re.IGNORECASE)
-                            if token_match:
-                                token = (
-                                    token_match.group(1)
-                                    if "(" in pattern
-                                    else token_match.group(0).strip("'\"")
-                                )
-                                print_success(
-                                    f"Found verification token using pattern '{pattern}': {token}"
-                                )
-                                return token
-
-                    elif token_type == "reset":
-                        # Similar patterns for reset tokens
-                        patterns = [
-                            r"reset.*?token[^\w]+([\w\-]+)",
-                            r"reset.*?password.*?token[^\w]+([\w\-]+)",
-                            r'href=[\'"].*?token=([\w\-]+)',
-                            r"password.*?token[^\w]+([\w\-]+)",
-                            r'[\'"][a-zA-Z0-9\-]{20,}[\'"]',
-                            r'[\'"][a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}[\'"]',
-                        ]
-
-                        for pattern in patterns:
-                            token_match = re.search(pattern, body, re.IGNORECASE)
-                            if token_match:
-                                token = (
-                                    token_match.group(1)
-                                    if "(" in pattern
-                                    else token_match.group(0).strip("'\"")
-                                )
-                                print_success(f"Found reset token: {token}")
-                                return token
-
-            print_warning(f"No {token_type} token found for {email} in this batch")
-            # Wait before trying again
-            time.sleep(2)
-
-        except Exception as e:
-            print_error(f"Error extracting token (attempt {attempt+1}): {str(e)}")
-            time.sleep(2)
-
-    print_error(
-        f"Failed to extract {token_type} token for {email} after {max_attempts} attempts"
-    )
-    return None
 
+class QueueTokens:
+    """Receives tokens the parent's SMTP sink routes to this worker's queue"""
 
-def test_verify_email():
-    """Test email verification"""
-    global USER_EMAIL
+    def __init__(self, queue, timeout):
+        self.queue = queue
+        self.timeout = timeout
+        self.pending = {}
 
-    print_header("Testing Email Verification")
+    def wait_for_token(self, ctx, kind):
+        ctx.info(f"Waiting for {kind} email to {ctx.email} on the SMTP sink...")
+        deadline = time.monotonic() + self.timeout
+        while kind not in self.pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            try:
+                received_kind, token = self.queue.get(timeout=remaining)
+            except Empty:
+                return None
+            self.pending[received_kind] = token
+        return self.pending.pop(kind)
 
-    if args.auto and args.auto_verify and USER_EMAIL:
-        print_info(
-            f"Attempting to automatically extract verification token for {USER_EMAIL}"
-        )
-        token = extract_token_from_mailhog(USER_EMAIL, "verification")
-        if not token:
-            print_error("Could not automatically extract verification token")
-            if not args.auto:
-                token = input("Enter the verification token from the email: ").strip()
-            else:
-                # In full auto mode, let's try one more approach - open MailHog in browser
-                # and give the user a chance to check manually
-                print_warning(
-                    "Auto extraction failed. Check MailHog manually at http://localhost:8025"
-                )
-                open_mailhog()
-                if not args.auto:
-                    token = input(
-                        "Enter the verification token from the email: "
-                    ).strip()
-                else:
-                    return None
-        else:
-            print_success(f"Found verification token: {token}")
-    else:
-        open_mailhog()
-        token = input("Enter the verification token from the email: ").strip()
 
-    data = {"token": token}
+class SinkTokens:
+    """Reads tokens from an SMTP sink running in this process"""
 
-    response = requests.post(f"{BASE_URL}/api/auth/verify-email", json=data)
-    return handle_response(response, "Email verification request sent")
+    def __init__(self, sink, timeout):
+        self.sink = sink
+        self.timeout = timeout
 
+    def wait_for_token(self, ctx, kind):
+        ctx.info(f"Waiting for {kind} email to {ctx.email} on the SMTP sink...")
+        return self.sink.wait_for_token(ctx.email, kind, self.timeout)
 
-def check_server_status():
-    """Check if the server is running by pinging the health endpoint"""
-    try:
-        response = requests.get(f"{BASE_URL}/health", timeout=5)
-        return 200 <= response.status_code < 300
-    except:
-        return False
 
+class PromptTokens:
+    """Opens MailHog and asks the person running the script for the token"""
 
-def wait_for_server(max_attempts=10, delay=3):
-    """Wait for the server to become available"""
-    print_info(f"Checking if server is available at {BASE_URL}...")
-    for attempt in range(max_attempts):
-        if check_server_status():
-            print_success("Server is running and ready for tests!")
-            return True
-        else:
-            print_warning(
-                f"Server not ready, waiting {delay} seconds... (attempt {attempt+1}/{max_attempts})"
+    def __init__(self, mailhog_url):
+        self.mailhog_url = mailhog_url
+
+    def wait_for_token(self, ctx, kind):
+        ctx.info(f"Opening MailHog at {self.mailhog_url}")
+        try:
+            webbrowser.open(self.mailhog_url)
+            ctx.info(f"Please check the {kind} email in MailHog")
+        except:
+            ctx.warning(
+                f"Failed to open browser. Please manually navigate to {self.mailhog_url}"
             )
-            time.sleep(delay)
+        return input(f"Enter the {kind} token from the email: ").strip() or None
 
-    print_error(f"Server did not become available after {max_attempts} attempts")
-    return False
 
+# Tests. Each takes the worker's context and returns the response data on
+# success or None on failure.
 
-def test_health_check():
+
+def test_health_check(ctx):
     """Test the health check endpoint"""
-    print_header("Testing Health Check Endpoint")
-    response = requests.get(f"{BASE_URL}/health")
-    return handle_response(response, "Health check successful")
+    ctx.header("Testing Health Check Endpoint")
+    response = ctx.request("GET", "/health", auth=False)
+    return handle_response(ctx, response, "Health check successful")
 
 
-def test_register_user():
+def test_register_user(ctx):
     """Test user registration"""
-    global USER_EMAIL, USER_PASSWORD, USER_ID, USER_USERNAME
-
-    print_header("Testing User Registration")
+    ctx.header("Testing User Registration")
+    ctx.info(f"Registering user: {ctx.username} with email: {ctx.email}")
 
-    # Generate random username and email for testing
-    random_suffix = generate_random_string()
-    USER_USERNAME = f"testuser_{random_suffix}"
-    USER_EMAIL = f"testuser_{random_suffix}@example.com"
-    USER_PASSWORD = f"Password123!{random_suffix}"
+    data = {"username": ctx.username, "email": ctx.email, "password": ctx.password}
 
-    print_info(f"Registering user: {USER_USERNAME} with email: {USER_EMAIL}")
+    response = ctx.request("POST", "/api/auth/signup", json=data, auth=False)
+    result = handle_response(ctx, response, "User registration request sent")
 
-    data = {"username": USER_USERNAME, "email": USER_EMAIL, "password": USER_PASSWORD}
+    if result is not None:
+        ctx.user_id = result.get("userId")
+        ctx.info("A verification email has been sent.")
 
-    response = requests.post(f"{BASE_URL}/api/auth/signup", json=data)
-    result = handle_response(response, "User registration request sent")
+    return result
 
-    if result:
-        USER_ID = result.get("userId")
 
-        if args.auto:
-            print_info("\nA verification email has been sent.")
-            if args.auto_verify:
-                time.sleep(1)  # Wait for email to arrive
-            else:
-                open_mailhog()
-        else:
-            print_info("\nA verification email has been sent to your inbox.")
-            input(
-                f"{Colors.YELLOW}Press Enter to open MailHog to check the verification email...{Colors.ENDC}"
-            )
-            open_mailhog()
+def test_verify_email(ctx):
+    """Test email verification"""
+    ctx.header("Testing Email Verification")
 
-            print_info("Look for the verification token in the email")
+    token = ctx.token_source.wait_for_token(ctx, "verification")
+    if not token:
+        ctx.error("Could not obtain the verification token")
+        return None
+    ctx.success(f"Found verification token: {token}")
 
-    return result
+    response = ctx.request(
+        "POST", "/api/auth/verify-email", json={"token": token}, auth=False
+    )
+    return handle_response(ctx, response, "Email verification request sent")
 
 
-def test_login():
+def test_login(ctx):
     """Test user login"""
-    global USER_EMAIL, USER_PASSWORD, USER_USERNAME
+    ctx.header("Testing User Login")
 
-    print_header("Testing User Login")
+    data = {"username": ctx.username, "password": ctx.password}
 
-    if not USER_USERNAME or not USER_PASSWORD:
-        if args.auto:
-            print_error("No user credentials available for automated login")
-            return None
-        USER_USERNAME = input("Enter your username: ").strip()
-        USER_PASSWORD = getpass.getpass("Enter your password: ")
-
-    data = {"username": USER_USERNAME, "password": USER_PASSWORD}
+    response = ctx.request("POST", "/api/auth/login", json=data, auth=False)
+    result = handle_response(ctx, response, "Login request sent")
 
-    response = requests.post(f"{BASE_URL}/api/auth/login", json=data)
-    result = handle_response(response, "Login request sent")
-
-    if result:
-        save_auth_tokens(result)
+    if result is not None:
+        ctx.access_token = result.get("accessToken")
+        ctx.refresh_token = result.get("refreshToken")
+        ctx.info("Authentication tokens saved")
 
     return result
 
 
-def test_refresh_token():
+def test_refresh_token(ctx):
     """Test token refresh"""
-    global REFRESH_TOKEN, AUTH_TOKEN
+    ctx.header("Testing Refresh Token")
 
-    print_header("Testing Refresh Token")
+    data = {"refreshToken": ctx.refresh_token}
 
-    if not REFRESH_TOKEN:
-        print_error("No refresh token available. Please log in first.")
-        return None
-
-    data = {"refreshToken": REFRESH_TOKEN}
-
-    # Try with different timeout values to see if it helps with connection issues
     try:
-        response = requests.post(f"{BASE_URL}/api/auth/refresh", json=data, timeout=30)
-        result = handle_response(response, "Token refresh request sent")
+        response = ctx.request("POST", "/api/auth/refresh", json=data, auth=False)
+        result = handle_response(ctx, response, "Token refresh request sent")
 
-        if result:
-            AUTH_TOKEN = result.get("accessToken")
-            print_info("Access token updated")
+        if result is not None and result.get("accessToken"):
+            # Tests running alongside this one keep using the old token until now
+            ctx.access_token = result["accessToken"]
+            ctx.info("Access token updated")
+        if result is not None and result.get("refreshToken"):
+            # Refresh tokens are single-use; keep the rotated one
+            ctx.refresh_token = result["refreshToken"]
 
         return result
     except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
-        print_error(f"Connection error during token refresh: {str(e)}")
-        return None
-    except Exception as e:
-        print_error(f"Unexpected error during token refresh: {str(e)}")
+        ctx.error(f"Connection error during token refresh: {str(e)}")
         return None
 
 
-def test_create_deck():
+def test_create_deck(ctx):
     """Test creating a new deck"""
-    global TEST_DECK_ID
-
-    print_header("Testing Create Deck")
-
-    auth_header = get_auth_header()
-    if not auth_header:
-        return None
-
-    deck_name = f"Test Deck {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+    ctx.header("Testing Create Deck")
 
     data = {
-        "name": deck_name,
+        "name": f"Test Deck {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
         "description": "A test deck created by the API test script",
     }
 
-    response = requests.post(f"{BASE_URL}/api/decks", json=data, headers=auth_header)
-    result = handle_response(response, "Create deck request sent")
+    response = ctx.request("POST", "/api/decks", json=data)
+    result = handle_response(ctx, response, "Create deck request sent")
 
-    if result:
-        TEST_DECK_ID = result.get("id")
-        print_info(f"Created deck with ID: {TEST_DECK_ID}")
+    if result is not None:
+        ctx.deck_id = result.get("id")
+        ctx.info(f"Created deck with ID: {ctx.deck_id}")
 
     return result
 
 
-def test_get_decks():
+def test_get_decks(ctx):
     """Test getting all decks"""
-    print_header("Testing Get All Decks")
-
-    auth_header = get_auth_header()
-    if not auth_header:
-        return None
+    ctx.header("Testing Get All Decks")
+    response = ctx.request("GET", "/api/decks")
+    return handle_response(ctx, response, "Get all decks request sent")
 
-    response = requests.get(f"{BASE_URL}/api/decks", headers=auth_header)
-    return handle_response(response, "Get all decks request sent")
 
-
-def test_get_deck_details():
+def test_get_deck_details(ctx):
     """Test get details for a specific deck"""
-    global TEST_DECK_ID
-
-    print_header("Testing Get Deck Details")
-
-    if not TEST_DECK_ID:
-        print_error("No test deck ID available. Please create a deck first.")
-        return None
-
-    auth_header = get_auth_header()
-    if not auth_header:
-        return None
-
-    response = requests.get(f"{BASE_URL}/api/decks/{TEST_DECK_ID}", headers=auth_header)
-    return handle_response(response, "Get deck details request sent")
+    ctx.header("Testing Get Deck Details")
+    response = ctx.request(
+        "GET", f"/api/decks/{ctx.deck_id}", route="/api/decks/{deckId}"
+    )
+    return handle_response(ctx, response, "Get deck details request sent")
 
 
-def test_create_card():
+def test_create_card(ctx):
     """Test creating a new card"""
-    global TEST_DECK_ID, TEST_CARD_ID
-
-    print_header("Testing Create Card")
-
-    if not TEST_DECK_ID:
-        print_error("No test deck ID available. Please create a deck first.")
-        return None
-
-    auth_header = get_auth_header()
-    if not auth_header:
-        return None
+    ctx.header("Testing Create Card")
 
     data = {
         "front": f"Test Front {datetime.now().strftime('%H:%M:%S')}",
@@ -592,228 +578,289 @@ def test_create_card():
         "notes": "A test card created by the API test script",
     }
 
-    # First try the new simplified endpoint that avoids chunked encoding issues
-    try:
-        print_info("Attempting to use simplified card creation endpoint first")
-        response = requests.post(
-            f"{BASE_URL}/api/decks/{TEST_DECK_ID}/cards/simple",
-            json=data,
-            headers=auth_header,
-            timeout=30,
-        )
-        result = handle_response(
-            response, "Create card request sent (simplified endpoint)"
-        )
-
-        if result:
-            TEST_CARD_ID = result.get("id")
-            print_info(f"Created card with ID: {TEST_CARD_ID}")
-            print_success("Successfully used simplified endpoint")
-            return result
-
-    except Exception as e:
-        print_warning(
-            f"Simplified endpoint failed: {str(e)}. Falling back to standard endpoint."
-        )
-
-    # Fall back to the original endpoint with retry logic if the simplified endpoint fails
-    print_info("Using standard endpoint with retry logic")
-
-    # Add retry logic for handling connection errors
-    max_retries = 3
-    retry_delay = 2
-    for attempt in range(max_retries):
-        try:
-            response = requests.post(
-                f"{BASE_URL}/api/decks/{TEST_DECK_ID}/cards",
-                json=data,
-                headers=auth_header,
-                timeout=30,  # Add a timeout to prevent indefinite hanging
-            )
-            result = handle_response(response, "Create card request sent")
-
-            if result:
-                TEST_CARD_ID = result.get("id")
-                print_info(f"Created card with ID: {TEST_CARD_ID}")
-                return result
-
-        except (
-            requests.exceptions.ChunkedEncodingError,
-            requests.exceptions.ConnectionError,
-            requests.exceptions.Timeout,
-        ) as e:
-            if attempt < max_retries - 1:
-                print_warning(f"Connection error on attempt {attempt + 1}: {str(e)}")
-                print_info(f"Retrying in {retry_delay} seconds...")
-                time.sleep(retry_delay)
-                retry_delay *= 2  # Exponential backoff
-            else:
-                print_error(
-                    f"Failed to create card after {max_retries} attempts: {str(e)}"
-                )
-                return None
+    result = request_with_fallback(
+        ctx,
+        "POST",
+        (
+            f"/api/decks/{ctx.deck_id}/cards/simple",
+            "/api/decks/{deckId}/cards/simple",
+        ),
+        (f"/api/decks/{ctx.deck_id}/cards", "/api/decks/{deckId}/cards"),
+        "Create card request sent",
+        json=data,
+    )
+    if result is not None:
+        ctx.card_id = result.get("id")
+        ctx.info(f"Created card with ID: {ctx.card_id}")
+    return result
 
 
-def test_get_cards():
+def test_get_cards(ctx):
     """Test getting cards in a deck"""
-    global TEST_DECK_ID
+    ctx.header("Testing Get Cards in Deck")
+    return request_with_fallback(
+        ctx,
+        "GET",
+        (
+            f"/api/decks/{ctx.deck_id}/cards/simple",
+            "/api/decks/{deckId}/cards/simple",
+        ),
+        (f"/api/decks/{ctx.deck_id}/cards", "/api/decks/{deckId}/cards"),
+        "Get cards request sent",
+    )
 
-    print_header("Testing Get Cards in Deck")
 
-    if not TEST_DECK_ID:
-        print_error("No test deck ID available. Please create a deck first.")
-        return None
+def test_get_card_details(ctx):
+    """Test get details for a specific card"""
+    ctx.header("Testing Get Card Details")
+    return request_with_fallback(
+        ctx,
+        "GET",
+        (
+            f"/api/decks/{ctx.deck_id}/cards/{ctx.card_id}/simple",
+            "/api/decks/{deckId}/cards/{id}/simple",
+        ),
+        (
+            f"/api/decks/{ctx.deck_id}/cards/{ctx.card_id}",
+            "/api/decks/{deckId}/cards/{id}",
+        ),
+        "Get card details request sent",
+    )
 
-    auth_header = get_auth_header()
-    if not auth_header:
-        return None
 
-    # First try the new simplified endpoint that avoids chunked encoding issues
+# Dependency graph: (name, test, names of the tests that must pass first).
+# Listed in a valid execution order; tests whose dependencies are met run
+# concurrently with each other.
+TEST_GRAPH = [
+    ("health_check", test_health_check, ()),
+    ("register_user", test_register_user, ("health_check",)),
+    ("verify_email", test_verify_email, ("register_user",)),
+    ("login", test_login, ("verify_email",)),
+    ("refresh_token", test_refresh_token, ("login",)),
+    ("create_deck", test_create_deck, ("login",)),
+    ("get_decks", test_get_decks, ("create_deck",)),
+    ("get_deck_details", test_get_deck_details, ("create_deck",)),
+    ("create_card", test_create_card, ("create_deck",)),
+    ("get_cards", test_get_cards, ("create_card",)),
+    ("get_card_details", test_get_card_details, ("create_card",)),
+]
+
+
+def run_test(ctx, name, test):
+    ctx.current_test = name
+    started = time.perf_counter()
     try:
-        print_info("Attempting to use simplified endpoint for retrieving cards")
-        response = requests.get(
-            f"{BASE_URL}/api/decks/{TEST_DECK_ID}/cards/simple",
-            headers=auth_header,
-            timeout=30,
-        )
-        result = handle_response(
-            response, "Get cards request sent (simplified endpoint)"
-        )
-        if result:
-            print_success("Successfully used simplified endpoint")
-            return result
+        passed = test(ctx) is not None
     except Exception as e:
-        print_warning(
-            f"Simplified endpoint failed: {str(e)}. Falling back to standard endpoint."
-        )
+        ctx.error(f"{name} raised {type(e).__name__}: {str(e)}")
+        passed = False
+    return ("passed" if passed else "failed"), time.perf_counter() - started
+
+
+def run_graph(ctx, graph, threads):
+    """Run ``graph`` for one worker, starting each test once its deps passed.
+
+    Tests whose dependencies failed or were skipped are skipped.
+    """
+    outcomes, durations = {}, {}
+    pending = list(graph)
+    running = {}
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        while pending or running:
+            for entry in list(pending):
+                name, test, deps = entry
+                if any(outcomes.get(d) in ("failed", "skipped") for d in deps):
+                    outcomes[name] = "skipped"
+                    pending.remove(entry)
+                elif all(outcomes.get(d) == "passed" for d in deps):
+                    running[pool.submit(run_test, ctx, name, test)] = name
+                    pending.remove(entry)
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                outcomes[name], durations[name] = future.result()
+    return outcomes, durations
+
+
+def build_token_source(config, token_queue=None, sink=None):
+    if token_queue is not None:
+        return QueueTokens(token_queue, config["token_timeout"])
+    if sink is not None:
+        return SinkTokens(sink, config["token_timeout"])
+    if config["auto_verify"]:
+        return MailHogTokens(config["mailhog_url"], config["token_timeout"])
+    return PromptTokens(config["mailhog_url"])
+
+
+def run_worker(worker_id, config, credentials, token_queue=None, sink=None):
+    """Run the whole graph in one isolated context and return a picklable report"""
+    ctx = TestContext(
+        worker_id,
+        config,
+        credentials,
+        build_token_source(config, token_queue, sink),
+        stream=config["stream"],
+    )
+    outcomes, durations = run_graph(ctx, TEST_GRAPH, config["threads"])
+    return {
+        "worker": worker_id,
+        "username": ctx.username,
+        "outcomes": outcomes,
+        "durations": durations,
+        "endpoints": ctx.endpoints.to_json(),
+        "log": ctx.log,
+    }
 
-    # Fall back to the original endpoint with retry logic
-    print_info("Using standard endpoint with retry logic")
 
-    # Add retry logic for handling connection errors
-    max_retries = 3
-    retry_delay = 2
-    for attempt in range(max_retries):
-        try:
-            response = requests.get(
-                f"{BASE_URL}/api/decks/{TEST_DECK_ID}/cards",
-                headers=auth_header,
-                timeout=30,
-            )
-            return handle_response(response, "Get cards request sent")
-        except (
-            requests.exceptions.ChunkedEncodingError,
-            requests.exceptions.ConnectionError,
-            requests.exceptions.Timeout,
-        ) as e:
-            if attempt < max_retries - 1:
-                print_warning(f"Connection error on attempt {attempt + 1}: {str(e)}")
-                print_info(f"Retrying in {retry_delay} seconds...")
-                time.sleep(retry_delay)
-                retry_delay *= 2  # Exponential backoff
-            else:
-                print_error(
-                    f"Failed to get cards after {max_retries} attempts: {str(e)}"
-                )
-                return None
+def check_server_status(base_url):
+    """Check if the server is running by pinging the health endpoint"""
+    try:
+        response = requests.get(f"{base_url}/health", timeout=5)
+        return 200 <= response.status_code < 300
+    except:
+        return False
 
 
-def test_get_card_details():
-    """Test get details for a specific card"""
-    global TEST_DECK_ID, TEST_CARD_ID
+def wait_for_server(base_url, max_attempts=10, delay=3):
+    """Wait for the server to become available"""
+    print_info(f"Checking if server is available at {base_url}...")
+    for attempt in range(max_attempts):
+        if check_server_status(base_url):
+            print_success("Server is running and ready for tests!")
+            return True
+        else:
+            print_warning(
+                f"Server not ready, waiting {delay} seconds... (attempt {attempt+1}/{max_attempts})"
+            )
+            time.sleep(delay)
 
-    print_header("Testing Get Card Details")
+    print_error(f"Server did not become available after {max_attempts} attempts")
+    return False
 
-    if not TEST_CARD_ID or not TEST_DECK_ID:
-        print_error("Card ID or Deck ID not available. Please create them first.")
-        return None
 
-    auth_header = get_auth_header()
-    if not auth_header:
-        return None
+def print_report(reports, elapsed, verbose):
+    """Print failing transcripts, then per-test and per-endpoint summaries"""
+    for report in sorted(reports, key=lambda r: r["worker"]):
+        failed = any(o != "passed" for o in report["outcomes"].values())
+        if len(reports) > 1 and (verbose or failed):
+            print_header(f"Worker {report['worker']} ({report['username']})")
+            for level, text in report["log"]:
+                print(format_line(level, text))
 
-    # First try the simplified endpoint that avoids chunked encoding issues
-    try:
-        print_info("Attempting to use simplified card details endpoint")
-        response = requests.get(
-            f"{BASE_URL}/api/decks/{TEST_DECK_ID}/cards/{TEST_CARD_ID}/simple",
-            headers=auth_header,
-            timeout=30,
+    print_header(f"Results for {len(reports)} worker(s) in {elapsed:.2f}s")
+    print(
+        f"{'Test':<20}{'Passed':>8}{'Failed':>8}{'Skipped':>9}"
+        f"{'Median ms':>12}{'Max ms':>10}"
+    )
+    for name, _, _ in TEST_GRAPH:
+        outcomes = [r["outcomes"].get(name, "skipped") for r in reports]
+        times = [r["durations"][name] for r in reports if name in r["durations"]]
+        colour = (
+            Colors.GREEN if outcomes.count("passed") == len(reports) else Colors.RED
         )
-        result = handle_response(
-            response, "Get card details request sent (simplified endpoint)"
+        print(
+            f"{colour}{name:<20}{outcomes.count('passed'):>8}"
+            f"{outcomes.count('failed'):>8}{outcomes.count('skipped'):>9}"
+            f"{statistics.median(times) * 1000 if times else 0:>12.1f}"
+            f"{max(times) * 1000 if times else 0:>10.1f}{Colors.ENDC}"
         )
-        if result:
-            print_success("Successfully used simplified endpoint")
-            return result
-    except Exception as e:
-        print_warning(
-            f"Simplified endpoint failed: {str(e)}. Falling back to standard endpoint."
+
+    # How each endpoint behaved with every worker hitting the server at once
+    endpoints = EndpointStats()
+    for report in reports:
+        endpoints.merge(EndpointStats.from_json(report["endpoints"]))
+    print(
+        f"\n{'Endpoint':<48}{'Requests':>9}{'Errors':>8}"
+        f"{'p50 ms':>9}{'p95 ms':>9}{'Max ms':>9}"
+    )
+    for row in endpoints.rows(elapsed):
+        print(
+            f"{row['endpoint']:<48}{row['count']:>9}{row['errors']:>8}"
+            f"{row['p50_ms']:>9.1f}{row['p95_ms']:>9.1f}{row['max_ms']:>9.1f}"
         )
 
-    # Fall back to the original endpoint with retry logic
-    print_info("Using standard endpoint with retry logic")
-
-    # Add retry logic for handling connection errors
-    max_retries = 3
-    retry_delay = 2
-    for attempt in range(max_retries):
-        try:
-            response = requests.get(
-                f"{BASE_URL}/api/decks/{TEST_DECK_ID}/cards/{TEST_CARD_ID}",
-                headers=auth_header,
-                timeout=30,
-            )
-            return handle_response(response, "Get card details request sent")
-        except (
-            requests.exceptions.ChunkedEncodingError,
-            requests.exceptions.ConnectionError,
-            requests.exceptions.Timeout,
-        ) as e:
-            if attempt < max_retries - 1:
-                print_warning(f"Connection error on attempt {attempt + 1}: {str(e)}")
-                print_info(f"Retrying in {retry_delay} seconds...")
-                time.sleep(retry_delay)
-                retry_delay *= 2  # Exponential backoff
-            else:
-                print_error(
-                    f"Failed to get card details after {max_retries} attempts: {str(e)}"
-                )
-                return None
 
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.trace:
+        enable_trace(args.trace)
+
+    base_url = f"http://localhost:{args.port}"
+    mailhog_url = f"http://{args.mailhog_host}:{args.mailhog_port}"
+    # If inside Docker, adjust URLs
+    if is_in_docker():
+        mailhog_url = "http://mailhog:8025"
+        print("Running inside Docker container, using internal Docker network URLs")
+
+    # Without an automatic token source somebody has to type the token in,
+    # so only a single worker in this process can run.
+    interactive = not (args.smtp_sink or args.auto_verify)
+    workers = 1 if interactive else max(1, args.workers)
+    config = {
+        "base_url": base_url,
+        "mailhog_url": mailhog_url,
+        "auto_verify": args.auto_verify,
+        "token_timeout": args.token_timeout,
+        "threads": max(1, args.threads),
+        "stream": workers == 1,
+    }
 
-# Main execution block
-if __name__ == "__main__":
     print_header("Flashcard API Testing Tool")
-    print_info(f"Using API at {BASE_URL}")
-    print_info(f"Using MailHog at {MAILHOG_URL}")
+    print_info(f"Using API at {base_url}")
 
-    # Wait for server to be ready
-    if not wait_for_server():
+    if not wait_for_server(base_url):
         print_error("Server not available. Exiting.")
-        sys.exit(1)
+        return 1
+
+    sink = None
+    manager = None
+    credentials = [generate_credentials() for _ in range(workers)]
+    token_queues = [None] * workers
+    if args.smtp_sink:
+        sink = ThreadedSmtpTokenSink(*parse_listen_address(args.smtp_sink)).start()
+        print_info(f"Capturing email with the SMTP sink on port {sink.port}")
+        if workers > 1:
+            # Worker processes get their tokens through managed queues
+            manager = multiprocessing.Manager()
+            token_queues = [manager.Queue() for _ in range(workers)]
+            for creds, queue in zip(credentials, token_queues):
+                sink.subscribe(creds["email"], queue)
+    else:
+        print_info(f"Using MailHog at {mailhog_url}")
 
-    # Run basic health check
-    if not test_health_check():
-        print_error(
-            "Health check failed. Server might be running but not working correctly."
-        )
-        if not args.auto:
-            input("Press Enter to continue anyway or Ctrl+C to exit...")
-
-    # Authentication flow
-    test_register_user()
-    test_verify_email()
-    test_login()
-    test_refresh_token()
-
-    # Deck and card operations
-    test_create_deck()
-    test_get_decks()
-    test_get_deck_details()
-    test_create_card()
-    test_get_cards()
-    test_get_card_details()
+    processes = min(workers, max(1, args.processes))
+    print_info(f"Running {workers} worker(s) on {processes} process(es)")
+    started = time.perf_counter()
+    if workers == 1:
+        reports = [run_worker(0, config, credentials[0], sink=sink)]
+    else:
+        reports = []
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            futures = [
+                pool.submit(run_worker, i, config, credentials[i], token_queues[i])
+                for i in range(workers)
+            ]
+            for future in as_completed(futures):
+                reports.append(future.result())
+    elapsed = time.perf_counter() - started
+
+    print_report(reports, elapsed, args.verbose)
+
+    if manager is not None:
+        manager.shutdown()
+    if sink is not None:
+        sink.close()
 
     print_header("Testing Complete")
+    if any(o != "passed" for r in reports for o in r["outcomes"].values()):
+        print_error("Some tests failed or were skipped")
+        return 1
     print_success("All tests have been executed")
+    return 0
+
+
+# Main execution block
+if __name__ == "__main__":
+    sys.exit(main())